@@ -2,7 +2,7 @@ import logging
 import os
 import uuid
 
-from flask import Flask, request
+from flask import Flask, Response, request
 
 from agent.common.errors import api_response
 from agent.common.logging import JsonFormatter, set_correlation_id
@@ -34,6 +34,31 @@ def configure_audit_logger() -> None:
     audit_logger.propagate = False
 
 
+def _apply_json_etag(response: Response) -> Response:
+    """Tag buffered JSON GET responses and answer a matching If-None-Match with 304.
+
+    Polling clients such as the operator TUI revalidate their cached lists this
+    way instead of downloading them again. Streams and ``no-store`` responses
+    are left alone.
+    """
+    if (
+        request.method != "GET"
+        or response.status_code != 200
+        or response.mimetype != "application/json"
+        or response.is_streamed
+        or response.direct_passthrough
+        or "ETag" in response.headers
+        or "no-store" in str(response.headers.get("Cache-Control") or "")
+    ):
+        return response
+    response.add_etag()
+    etag, _weak = response.get_etag()
+    if etag and request.if_none_match.contains_weak(etag):
+        response.status_code = 304
+        response.set_data(b"")
+    return response
+
+
 def register_request_hooks(app: Flask) -> None:
     from agent.bootstrap.audit_middleware import register_audit_middleware
 
@@ -82,4 +107,8 @@ def register_request_hooks(app: Flask) -> None:
             response.headers.setdefault("Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload")
         return response
 
+    @app.after_request
+    def add_conditional_etag(response):
+        return _apply_json_etag(response)
+
     register_audit_middleware(app)
@@ -1,11 +1,16 @@
+import heapq
+import itertools
 import logging
 import math
+import socket
 import threading
 import time
 from typing import Any, Callable, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
 
 HttpTimeout = float | int | tuple[float, float]
@@ -120,115 +125,289 @@ def _request_tracking_context() -> tuple[Any, Any, Any, Any]:
         return None, None, None, None
 
 
+class _RequestAbortHandle:
+    """Abort switch for one guarded request.
+
+    Registered in the LM Studio request registry in place of a session, so a
+    goal/task cancellation calls ``close()`` and the deadline watcher calls
+    ``abort("deadline")``.  Either shuts down the socket of the connection the
+    request is currently using; the blocked send on the caller's thread then
+    fails immediately instead of after the next poll.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._connections: set[Any] = set()
+        self.reason: str | None = None
+        self.done = False
+
+    def attach(self, conn: Any) -> None:
+        with self._lock:
+            if self.reason is not None:
+                raise ConnectionAbortedError(self.reason)
+            if not self.done:
+                self._connections.add(conn)
+
+    def detach(self, conn: Any) -> None:
+        with self._lock:
+            self._connections.discard(conn)
+
+    def check(self, conn: Any) -> None:
+        """Called after a connect: an abort that raced the connect still wins."""
+        with self._lock:
+            if self.reason is not None:
+                _shutdown_connection(conn)
+
+    def abort(self, reason: str) -> bool:
+        with self._lock:
+            if self.done or self.reason is not None:
+                return False
+            self.reason = reason
+            # Under the lock, so a connection cannot return to the pool
+            # (and be reused by another request) mid-shutdown.
+            for conn in self._connections:
+                _shutdown_connection(conn)
+            return True
+
+    def close(self) -> None:
+        self.abort("cancelled")
+
+    def finish(self) -> None:
+        with self._lock:
+            self.done = True
+            self._connections.clear()
+
+
+def _shutdown_connection(conn: Any) -> None:
+    sock = getattr(conn, "sock", None)
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+_current_abort_handle = threading.local()
+
+
+class _GuardedConnectionMixin:
+    _ananta_abort_handle: _RequestAbortHandle | None = None
+
+    def connect(self) -> None:
+        super().connect()
+        handle = self._ananta_abort_handle
+        if handle is not None:
+            handle.check(self)
+
+
+class _GuardedHTTPConnection(_GuardedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _GuardedHTTPSConnection(_GuardedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _GuardedPoolMixin:
+    def _get_conn(self, timeout: float | None = None) -> Any:
+        # Attach before urllib3 connects: for HTTPS ``_validate_conn`` runs
+        # the TCP connect and TLS handshake ahead of ``request()``.
+        conn = super()._get_conn(timeout)
+        handle = getattr(_current_abort_handle, "handle", None)
+        conn._ananta_abort_handle = handle
+        if handle is not None:
+            try:
+                handle.attach(conn)
+            except ConnectionAbortedError:
+                self._put_conn(conn)
+                raise
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        handle = getattr(conn, "_ananta_abort_handle", None)
+        if handle is not None:
+            handle.detach(conn)
+            conn._ananta_abort_handle = None
+        super()._put_conn(conn)
+
+
+class _GuardedHTTPConnectionPool(_GuardedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _GuardedHTTPConnection
+
+
+class _GuardedHTTPSConnectionPool(_GuardedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _GuardedHTTPSConnection
+
+
+_GUARDED_POOL_CLASSES = {
+    "http": _GuardedHTTPConnectionPool,
+    "https": _GuardedHTTPSConnectionPool,
+}
+
+
+class _GuardedHTTPAdapter(HTTPAdapter):
+    """Pooled adapter whose connections report to the active abort handle."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = dict(_GUARDED_POOL_CLASSES)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        # SOCKS managers bring their own pool classes; HTTP(S) proxies use the
+        # plain ones and would otherwise bypass the abort handle.
+        if not proxy.lower().startswith("socks"):
+            manager.pool_classes_by_scheme = dict(_GUARDED_POOL_CLASSES)
+        return manager
+
+
+def create_guarded_session(pool_maxsize: int = 128) -> requests.Session:
+    """Keep-alive session for tracked/deadline requests; never retries a send."""
+    session = requests.Session()
+    adapter = _GuardedHTTPAdapter(pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class _DeadlineWatcher:
+    """One daemon thread that aborts guarded requests at their deadline."""
+
+    _COMPACT_AT = 4096
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int, _RequestAbortHandle]] = []
+        self._seq = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, deadline_monotonic: float, handle: _RequestAbortHandle) -> None:
+        with self._cond:
+            if len(self._heap) >= self._COMPACT_AT:
+                self._heap = [item for item in self._heap if not item[2].done]
+                heapq.heapify(self._heap)
+            heapq.heappush(self._heap, (deadline_monotonic, next(self._seq), handle))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="http-deadline-watcher",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _next_expired(self) -> _RequestAbortHandle:
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0][2].done:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                remaining = self._heap[0][0] - time.monotonic()
+                if remaining <= 0:
+                    return heapq.heappop(self._heap)[2]
+                self._cond.wait(timeout=remaining)
+
+    def _run(self) -> None:
+        while True:
+            self._next_expired().abort("deadline")
+
+
+_deadline_watcher = _DeadlineWatcher()
+
+
+def _deadline_bounded_timeout(
+    timeout: HttpTimeout,
+    deadline_monotonic: float | None,
+) -> HttpTimeout:
+    """Cap every socket wait at the time left before the deadline."""
+    if deadline_monotonic is None:
+        return timeout
+    remaining = max(0.001, float(deadline_monotonic) - time.monotonic())
+    if isinstance(timeout, tuple):
+        return (min(float(timeout[0]), remaining), min(float(timeout[1]), remaining))
+    return min(float(timeout), remaining)
+
+
 def _execute_guarded_request(
     *,
     send: Callable[[], Any],
-    session: requests.Session,
+    handle: _RequestAbortHandle,
     goal_id: Any,
     task_id: Any,
     is_cancelled: Any,
     deadline_monotonic: float | None,
 ) -> Any:
-    """Run one request with cancellation and a total wall-clock deadline."""
+    """Run one request on the calling thread with cancellation and a total deadline."""
+
+    def _cancelled() -> bool:
+        if handle.reason == "cancelled":
+            return True
+        return bool(callable(is_cancelled) and is_cancelled(goal_id, task_id))
+
+    def _deadline_passed() -> bool:
+        return handle.reason == "deadline" or (
+            deadline_monotonic is not None
+            and time.monotonic() >= float(deadline_monotonic)
+        )
 
-    request_box: dict[str, Any] = {
-        "response": None,
-        "error": None,
-    }
-    completed = threading.Event()
-    abandoned = threading.Event()
-    result_lock = threading.Lock()
+    if _cancelled():
+        return _CANCELLED_REQUEST
+    if deadline_monotonic is not None:
+        _deadline_watcher.watch(float(deadline_monotonic), handle)
+    _current_abort_handle.handle = handle
+    try:
+        response = send()
+    except Exception as exc:
+        if _cancelled():
+            return _CANCELLED_REQUEST
+        if _deadline_passed():
+            raise HttpTransportDeadlineExceeded(
+                "http_transport_deadline_exceeded"
+            ) from exc
+        # Propagate exactly once.  A state-changing POST must never be repeated
+        # outside tracking after a genuine transport exception.
+        raise
+    finally:
+        _current_abort_handle.handle = None
 
-    def _close_response(response: Any) -> None:
+    if _deadline_passed():
         close = getattr(response, "close", None)
         if callable(close):
             try:
                 close()
             except Exception:
                 pass
-
-    def _abandon_request() -> None:
-        with result_lock:
-            abandoned.set()
-            response = request_box["response"]
-            request_box["response"] = None
-        _close_response(response)
-
-    def _do_request() -> None:
-        try:
-            response = send()
-            with result_lock:
-                if abandoned.is_set():
-                    close_late_response = True
-                else:
-                    request_box["response"] = response
-                    close_late_response = False
-            if close_late_response:
-                _close_response(response)
-        except Exception as exc:
-            with result_lock:
-                if not abandoned.is_set():
-                    request_box["error"] = exc
-        finally:
-            completed.set()
-
-    threading.Thread(target=_do_request, daemon=True).start()
-    while not completed.is_set():
-        if callable(is_cancelled) and is_cancelled(goal_id, task_id):
-            _abandon_request()
-            session.close()
-            return _CANCELLED_REQUEST
-        wait_seconds = 0.2
-        if deadline_monotonic is not None:
-            remaining = float(deadline_monotonic) - time.monotonic()
-            if remaining <= 0:
-                _abandon_request()
-                session.close()
-                raise HttpTransportDeadlineExceeded(
-                    "http_transport_deadline_exceeded"
-                )
-            wait_seconds = min(wait_seconds, max(0.001, remaining))
-        completed.wait(timeout=wait_seconds)
-
-    if (
-        deadline_monotonic is not None
-        and time.monotonic() >= float(deadline_monotonic)
-    ):
-        _abandon_request()
-        session.close()
         raise HttpTransportDeadlineExceeded(
             "http_transport_deadline_exceeded"
         )
-    if request_box["error"] is not None:
-        # Propagate exactly once.  A state-changing POST must never be repeated
-        # outside tracking after a genuine transport exception.
-        raise request_box["error"]
-    return request_box["response"]
+    return response
+
+
+def _release_abort_handle(tracked_key: Any, handle: _RequestAbortHandle) -> None:
+    try:
+        from agent.common.lmstudio_request_registry import release_session
+
+        release_session(tracked_key, handle)
+    except Exception:
+        pass
+    handle.finish()
 
 
 def close_http_response(response: Any) -> None:
-    """Close a response and its optional deadline/cancellation session."""
+    """Close a response and release its optional deadline/cancellation handle."""
 
-    session = getattr(response, "_ananta_request_session", None)
+    handle = getattr(response, "_ananta_abort_handle", None)
     tracked_key = getattr(response, "_ananta_tracked_key", None)
     try:
         close = getattr(response, "close", None)
         if callable(close):
             close()
     finally:
-        if session is not None:
-            try:
-                from agent.common.lmstudio_request_registry import (
-                    release_session,
-                )
-
-                release_session(tracked_key, session)
-            except Exception:
-                pass
-            try:
-                session.close()
-            except Exception:
-                pass
+        if handle is not None:
+            _release_abort_handle(tracked_key, handle)
 
 
 def _classify_status(code: int) -> str:
@@ -259,6 +438,8 @@ class HttpClient:
         self.timeout = timeout
         self.retries = retries
         self.session = create_session(retries=retries)
+        # Shared by all goal/task-tracked and deadline-governed posts.
+        self.guarded_session = create_guarded_session()
 
     def head(self, url: str, timeout: Optional[int] = None) -> Any:
         try:
@@ -351,7 +532,7 @@ class HttpClient:
         raise_on_transport_error: bool = False,
     ) -> Any:
         tracked_key = None
-        tracked_session = None
+        abort_handle = None
         response_handed_off = False
         try:
             headers = (headers or {}).copy()
@@ -392,14 +573,18 @@ class HttpClient:
                 goal_id or task_id or deadline_monotonic is not None
             )
             if guarded_request:
-                tracked_session = requests.Session()
-                request_session = tracked_session
+                abort_handle = _RequestAbortHandle()
+                request_session = self.guarded_session
+                effective_timeout = _deadline_bounded_timeout(
+                    effective_timeout,
+                    deadline_monotonic,
+                )
                 if callable(register_existing_session) and (
                     goal_id or task_id
                 ):
                     try:
                         tracked_key = register_existing_session(
-                            tracked_session
+                            abort_handle
                         )
                     except Exception:
                         # Registry bookkeeping is best-effort and happens
@@ -407,7 +592,7 @@ class HttpClient:
                         tracked_key = None
                 r = _execute_guarded_request(
                     send=_send_once,
-                    session=request_session,
+                    handle=abort_handle,
                     goal_id=goal_id,
                     task_id=task_id,
                     is_cancelled=is_cancelled,
@@ -423,12 +608,9 @@ class HttpClient:
             else:
                 r = _send_once()
             if return_response:
-                if stream and tracked_session is not None:
-                    setattr(
-                        r,
-                        "_ananta_request_session",
-                        tracked_session,
-                    )
+                if stream and abort_handle is not None:
+                    # Cancellation and the deadline keep covering the body.
+                    setattr(r, "_ananta_abort_handle", abort_handle)
                     setattr(r, "_ananta_tracked_key", tracked_key)
                     response_handed_off = True
                 return r
@@ -514,17 +696,8 @@ class HttpClient:
                     logging.error(f"HTTP POST Fehler: {url} - {e}")
             return None
         finally:
-            if tracked_session is not None and not response_handed_off:
-                try:
-                    from agent.common.lmstudio_request_registry import release_session
-
-                    release_session(tracked_key, tracked_session)
-                except Exception:
-                    pass
-                try:
-                    tracked_session.close()
-                except Exception:
-                    pass
+            if abort_handle is not None and not response_handed_off:
+                _release_abort_handle(tracked_key, abort_handle)
 
 
 # Singleton-Instanz mit Standardwerten
@@ -93,6 +93,7 @@ def _purge_expired_non_recovery_archives(
     archived_task_repo,
     *,
     cutoff: float,
+    task_repo=None,
 ) -> int:
     """Retention never destroys Hub-owned Recovery lineage records."""
 
@@ -116,6 +117,7 @@ def _purge_expired_non_recovery_archives(
 
     deleted = 0
     for task in archived_tasks:
+        task_id = str(_task_value(task, "id") or "")
         archived_at = float(
             _task_value(task, "archived_at")
             or _task_value(task, "updated_at")
@@ -124,11 +126,11 @@ def _purge_expired_non_recovery_archives(
         if (
             archived_at < cutoff
             and not _is_recovery_related_task(task)
-            and archived_task_repo.delete(
-                str(_task_value(task, "id") or "")
-            )
+            and archived_task_repo.delete(task_id)
         ):
             deleted += 1
+            if task_repo is not None:
+                task_repo.purge_events(task_id)
     return deleted
 
 
@@ -226,6 +228,7 @@ def archive_old_tasks(tasks_path: str):
         _purge_expired_non_recovery_archives(
             archived_task_repo,
             cutoff=cutoff_archive,
+            task_repo=task_repo,
         )
         old_tasks = task_repo.get_old_tasks(cutoff_active)
         all_tasks = task_repo.get_all()
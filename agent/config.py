@@ -490,6 +490,10 @@ class Settings(BaseSettings):
     rag_agentic_max_commands: int = Field(default=3, validation_alias="RAG_AGENTIC_MAX_COMMANDS")
     rag_agentic_timeout_seconds: int = Field(default=8, validation_alias="RAG_AGENTIC_TIMEOUT_SECONDS")
     rag_semantic_persist_dir: str = Field(default=".rag/llamaindex", validation_alias="RAG_SEMANTIC_PERSIST_DIR")
+    rag_repository_map_cache_path: str = Field(
+        default=".rag/repository_map/parse_cache.json", validation_alias="RAG_REPOSITORY_MAP_CACHE_PATH"
+    )
+    rag_repository_map_parse_workers: int = Field(default=0, validation_alias="RAG_REPOSITORY_MAP_PARSE_WORKERS")
     rag_redact_sensitive: bool = Field(default=True, validation_alias="RAG_REDACT_SENSITIVE")
     rag_route_quota_code_repo: int = Field(default=12, validation_alias="RAG_ROUTE_QUOTA_CODE_REPO")
     rag_route_quota_code_semantic: int = Field(default=2, validation_alias="RAG_ROUTE_QUOTA_CODE_SEMANTIC")
@@ -536,6 +540,7 @@ class Settings(BaseSettings):
     rag_iterative_summary_chars: int = Field(default=600, validation_alias="RAG_ITERATIVE_SUMMARY_CHARS")
     rag_iterative_initial_min_files: int = Field(default=3, validation_alias="RAG_ITERATIVE_INITIAL_MIN_FILES")
     rag_iterative_initial_max_files: int = Field(default=8, validation_alias="RAG_ITERATIVE_INITIAL_MAX_FILES")
+    wiki_import_parallel_workers: int = Field(default=1, validation_alias="WIKI_IMPORT_PARALLEL_WORKERS")
     codecompass_wiki_index_path: str = Field(
         default="",
         validation_alias="CODECOMPASS_WIKI_INDEX_PATH",
@@ -794,6 +799,14 @@ class Settings(BaseSettings):
 
     # Database
     database_url: Optional[str] = Field(default=None, validation_alias="DATABASE_URL")
+    # File SQLite engine mode: "nullpool" opens a fresh connection per session,
+    # "pooled" keeps a serialized writer pool plus a read-only reader pool.
+    sqlite_engine_mode: str = Field(default="nullpool", validation_alias="SQLITE_ENGINE_MODE")
+    sqlite_writer_pool_size: int = Field(default=1, validation_alias="SQLITE_WRITER_POOL_SIZE")
+    sqlite_reader_pool_size: int = Field(default=4, validation_alias="SQLITE_READER_POOL_SIZE")
+    sqlite_pool_timeout_seconds: float = Field(default=30.0, validation_alias="SQLITE_POOL_TIMEOUT_SECONDS")
+    sqlite_mmap_size_bytes: int = Field(default=268435456, validation_alias="SQLITE_MMAP_SIZE_BYTES")
+    sqlite_cache_size_kib: int = Field(default=65536, validation_alias="SQLITE_CACHE_SIZE_KIB")
 
     @property
     def effective_database_url(self) -> str:
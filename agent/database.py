@@ -1,12 +1,13 @@
 import logging
 import os
+import threading
 import time
 from typing import Any
 
 import portalocker
 from sqlalchemy import event, inspect, text
 from sqlalchemy.exc import IntegrityError, OperationalError
-from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from agent.config import settings
@@ -14,6 +15,8 @@ from agent.config import settings
 # Datenbank-URL aus zentralen Einstellungen beziehen
 DATABASE_URL = settings.effective_database_url
 
+SQLITE_ENGINE_MODE_POOLED = "pooled"
+
 connect_args = {}
 engine_kwargs = {
     "echo": False,
@@ -21,26 +24,131 @@ engine_kwargs = {
     "pool_recycle": 3600,
     "connect_args": connect_args,
 }
-if DATABASE_URL.startswith("sqlite"):
-    connect_args["check_same_thread"] = False
-    if DATABASE_URL == "sqlite:///:memory:":
-        # Share the in-memory test database across repository sessions.
-        engine_kwargs["poolclass"] = StaticPool
-    else:
-        # SQLite file DBs under high parallel E2E load can exhaust QueuePool and return 500s.
-        # NullPool avoids connection checkout starvation by opening short-lived connections.
-        engine_kwargs["poolclass"] = NullPool
 
-engine = create_engine(DATABASE_URL, **engine_kwargs)
 
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for a free connection."""
+
+    wait_label = "default"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _record_pool_wait(self.wait_label, time.perf_counter() - started)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_label = self.wait_label
+        return pool
+
+
+_pool_wait_lock = threading.Lock()
+_pool_wait_stats: dict[str, dict[str, float]] = {}
+
+
+def _record_pool_wait(label: str, seconds: float) -> None:
+    from agent.metrics import DB_POOL_WAIT_SECONDS
 
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
+    DB_POOL_WAIT_SECONDS.labels(pool=label).observe(seconds)
+    with _pool_wait_lock:
+        stats = _pool_wait_stats.setdefault(label, {"checkouts": 0, "wait_seconds_total": 0.0, "wait_seconds_max": 0.0})
+        stats["checkouts"] += 1
+        stats["wait_seconds_total"] += seconds
+        stats["wait_seconds_max"] = max(stats["wait_seconds_max"], seconds)
+
+
+def pool_wait_stats() -> dict[str, dict[str, float]]:
+    """Per-pool checkout wait totals for the pooled SQLite mode."""
+
+    with _pool_wait_lock:
+        return {label: dict(stats) for label, stats in _pool_wait_stats.items()}
+
+
+def _is_pooled_sqlite_file(url: str) -> bool:
+    return (
+        url.startswith("sqlite")
+        and not url.startswith("sqlite:///:memory:")
+        and str(settings.sqlite_engine_mode or "").strip().lower() == SQLITE_ENGINE_MODE_POOLED
+    )
+
+
+def _create_timed_pool_engine(url: str, *, label: str, pool_size: int, read_only: bool):
+    engine_ = create_engine(
+        url,
+        echo=False,
+        poolclass=TimedQueuePool,
+        pool_size=max(1, int(pool_size)),
+        max_overflow=0,
+        pool_timeout=max(0.1, float(settings.sqlite_pool_timeout_seconds)),
+        connect_args={"check_same_thread": False},
+    )
+    engine_.pool.wait_label = label
+
+    @event.listens_for(engine_, "connect")
+    def _configure(dbapi_connection, connection_record):
+        configure_sqlite_connection(dbapi_connection, tuned=True, read_only=read_only)
+
+    return engine_
+
+
+def create_sqlite_engines(url: str):
+    """Build the (writer, reader) engine pair for pooled file SQLite.
+
+    SQLite admits one writer at a time, so the writer pool defaults to a
+    single connection and callers queue on it instead of on the database
+    lock. Readers use their own bounded pool of ``query_only`` connections,
+    which WAL lets run alongside the writer. Pragmas run once per physical
+    connection in both pools.
+    """
+
+    writer = _create_timed_pool_engine(
+        url, label="sqlite_writer", pool_size=settings.sqlite_writer_pool_size, read_only=False
+    )
+    reader = _create_timed_pool_engine(
+        url, label="sqlite_reader", pool_size=settings.sqlite_reader_pool_size, read_only=True
+    )
+    return writer, reader
+
+
+read_engine = None
+if _is_pooled_sqlite_file(DATABASE_URL):
+    engine, read_engine = create_sqlite_engines(DATABASE_URL)
+else:
     if DATABASE_URL.startswith("sqlite"):
-        configure_sqlite_connection(dbapi_connection)
+        connect_args["check_same_thread"] = False
+        if DATABASE_URL == "sqlite:///:memory:":
+            # Share the in-memory test database across repository sessions.
+            engine_kwargs["poolclass"] = StaticPool
+        else:
+            # SQLite file DBs under high parallel E2E load can exhaust QueuePool and return 500s.
+            # NullPool avoids connection checkout starvation by opening short-lived connections.
+            engine_kwargs["poolclass"] = NullPool
+
+    engine = create_engine(DATABASE_URL, **engine_kwargs)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        if DATABASE_URL.startswith("sqlite"):
+            configure_sqlite_connection(dbapi_connection)
+
+
+def reader_engine(primary=None):
+    """Engine for short read-only repository calls.
+
+    Returns the reader pool in pooled SQLite mode and the primary engine
+    otherwise (including when tests swap ``agent.database.engine``).
+    Repositories pass their own ``primary`` so a swapped repository engine
+    is also honoured.
+    """
+
+    if read_engine is not None:
+        return read_engine
+    return primary if primary is not None else engine
 
 
-def configure_sqlite_connection(dbapi_connection) -> None:
+def configure_sqlite_connection(dbapi_connection, *, tuned: bool = False, read_only: bool = False) -> None:
     """Enable SQLite integrity controls on every production connection."""
 
     cursor = dbapi_connection.cursor()
@@ -50,8 +158,15 @@ def configure_sqlite_connection(dbapi_connection) -> None:
         enabled = cursor.fetchone()
         if not enabled or int(enabled[0]) != 1:
             raise RuntimeError("sqlite_foreign_keys_not_enabled")
-        cursor.execute("PRAGMA journal_mode=WAL")
+        if not read_only:
+            cursor.execute("PRAGMA journal_mode=WAL")
         cursor.execute("PRAGMA synchronous=NORMAL")
+        if tuned:
+            cursor.execute(f"PRAGMA busy_timeout={int(max(0.1, float(settings.sqlite_pool_timeout_seconds)) * 1000)}")
+            cursor.execute(f"PRAGMA mmap_size={max(0, int(settings.sqlite_mmap_size_bytes))}")
+            cursor.execute(f"PRAGMA cache_size=-{max(0, int(settings.sqlite_cache_size_kib))}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
     finally:
         cursor.close()
 
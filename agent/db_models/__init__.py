@@ -308,9 +308,11 @@ from .speech_reconciliation import (
     SpeechReconciliationMutationDB,
 )
 from .tasks import (
+    TASK_HISTORY_PROJECTION_LIMIT,
     ArchivedTaskDB,
     ConfigDB,
     TaskDB,
+    TaskEventDB,
     archive_task_record,
     restore_task_record,
 )
@@ -401,6 +403,7 @@ __all__ = [
     "ArchivedTaskDB",
     "archive_task_record",
     "restore_task_record",
+    "TASK_HISTORY_PROJECTION_LIMIT",
     "ApprovalRequestDB",
     "AuditLogDB",
     "BannedIPDB",
@@ -620,6 +623,7 @@ __all__ = [
     "SourceRefMappingDB",
     "SourceRevisionDB",
     "TaskDB",
+    "TaskEventDB",
     "TextQualityCriteriaSetDB",
     "TextQualityEvaluationDB",
     "TeamBlueprintDB",
@@ -285,6 +285,22 @@ def restore_task_record(task: ArchivedTaskDB) -> TaskDB:
     return TaskDB(**{field_name: getattr(task, field_name) for field_name in _TASK_ARCHIVE_FIELDS})
 
 
+TASK_HISTORY_PROJECTION_LIMIT = 200
+
+
+class TaskEventDB(SQLModel, table=True):
+    """Append-only task history; ``TaskDB.history`` only keeps the newest events."""
+
+    __tablename__ = "task_events"
+    __table_args__ = (sa.UniqueConstraint("task_id", "seq", name="uq_task_events_task_seq"),)
+    id: Optional[int] = Field(default=None, primary_key=True)
+    task_id: str = Field(max_length=191)
+    seq: int
+    event_type: Optional[str] = None
+    timestamp: float = Field(default_factory=time.time)
+    payload: dict = Field(default_factory=dict, sa_column=Column(JSON))
+
+
 class ConfigDB(SQLModel, table=True):
     __tablename__ = "config"
     key: str = Field(primary_key=True)
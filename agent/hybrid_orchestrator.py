@@ -111,7 +111,11 @@ class HybridOrchestrator:
         self.redact_sensitive = redact_sensitive
 
         persist_dir = Path(semantic_persist_dir) if semantic_persist_dir else (self.repo_root / ".rag" / "llamaindex")
-        self.repository_engine = RepositoryMapEngine(self.repo_root)
+        repository_map_cache = str(getattr(settings, "rag_repository_map_cache_path", "") or "").strip()
+        self.repository_engine = RepositoryMapEngine(
+            self.repo_root,
+            cache_path=(self.repo_root / repository_map_cache) if repository_map_cache else None,
+        )
         self.agentic_engine = AgenticSearchEngine(
             self.repo_root,
             max_commands=agentic_max_commands,
@@ -0,0 +1,652 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+SEGMENT_SECONDS = 86400
+LATENCY_SKETCH_GAMMA = 2 ** (1 / 8)
+_LOG_GAMMA = math.log(LATENCY_SKETCH_GAMMA)
+
+_STORES: dict[str, "BenchmarkSampleStore"] = {}
+_STORES_LOCK = threading.Lock()
+
+_AGGREGATE_FIELDS = ("total", "success", "quality_pass", "latency_ms_total", "tokens_total", "cost_units_total")
+
+
+def latency_bucket(latency_ms: int) -> int:
+    """Log-scale sketch bucket; bucket ``i`` covers ``(gamma**(i-1), gamma**i]`` ms."""
+    value = max(0, int(latency_ms or 0))
+    if value <= 1:
+        return 0
+    return int(math.ceil(math.log(value) / _LOG_GAMMA - 1e-9))
+
+
+def sketch_quantile(sketch: dict[str, int], quantile: float, *, max_value: int | None = None) -> int | None:
+    """Nearest-rank quantile from a latency sketch, reported as the bucket upper bound."""
+    buckets = sorted((int(key), int(count)) for key, count in (sketch or {}).items() if int(count) > 0)
+    total = sum(count for _, count in buckets)
+    if total <= 0:
+        return None
+    rank = max(0, min(total - 1, int(round((total - 1) * float(quantile)))))
+    seen = 0
+    for bucket, count in buckets:
+        seen += count
+        if seen > rank:
+            upper = int(math.ceil(LATENCY_SKETCH_GAMMA**bucket)) if bucket > 0 else 1
+            return min(upper, int(max_value)) if max_value is not None else upper
+    return None
+
+
+def merge_sketch(target: dict[str, int], other: dict[str, int]) -> dict[str, int]:
+    for key, count in (other or {}).items():
+        target[str(key)] = int(target.get(str(key)) or 0) + int(count or 0)
+    return target
+
+
+def empty_aggregate() -> dict[str, Any]:
+    return {
+        "total": 0,
+        "success": 0,
+        "quality_pass": 0,
+        "latency_ms_total": 0,
+        "latency_ms_max": 0,
+        "tokens_total": 0,
+        "cost_units_total": 0.0,
+        "last_seen": None,
+        "latency_sketch": {},
+    }
+
+
+def _fold(target: dict[str, Any], row: sqlite3.Row | dict[str, Any]) -> dict[str, Any]:
+    for name in _AGGREGATE_FIELDS:
+        target[name] = target[name] + row[name]
+    target["latency_ms_max"] = max(int(target["latency_ms_max"]), int(row["latency_ms_max"] or 0))
+    if row["last_seen"] is not None:
+        target["last_seen"] = max(int(target["last_seen"] or 0), int(row["last_seen"]))
+    merge_sketch(target["latency_sketch"], json.loads(row["latency_sketch"] or "{}"))
+    return target
+
+
+class BenchmarkSampleStore:
+    """Append-only benchmark samples with per-day rolling aggregates.
+
+    Every recorded sample is one ``INSERT`` into ``samples`` plus one upsert of
+    the matching ``aggregates`` row keyed by (scope, entity, task_kind, role,
+    template, segment), where a segment is one UTC day. Aggregates carry
+    counts, token/cost sums and a log-scale latency sketch, so recommendations
+    fold a handful of aggregate rows instead of rescoring raw samples.
+    Retention drops whole segments from both tables.
+
+    A legacy ``llm_model_benchmarks.json`` next to the database is imported
+    (and re-imported whenever the file changes) without touching samples that
+    were recorded natively; removing the file keeps what was imported.
+    """
+
+    DB_FILENAME = "llm_model_benchmarks.sqlite3"
+    LEGACY_FILENAME = "llm_model_benchmarks.json"
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS samples (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        segment INTEGER NOT NULL,
+        scope TEXT NOT NULL,
+        entity TEXT NOT NULL,
+        task_kind TEXT NOT NULL,
+        role_name TEXT NOT NULL DEFAULT '',
+        template_name TEXT NOT NULL DEFAULT '',
+        ts INTEGER NOT NULL,
+        success INTEGER NOT NULL,
+        quality_passed INTEGER,
+        latency_ms INTEGER NOT NULL,
+        tokens_total INTEGER NOT NULL,
+        cost_units REAL NOT NULL,
+        context TEXT,
+        legacy INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS idx_llm_bench_samples_bucket
+        ON samples (scope, entity, task_kind, segment);
+    CREATE INDEX IF NOT EXISTS idx_llm_bench_samples_segment ON samples (segment);
+    CREATE TABLE IF NOT EXISTS aggregates (
+        scope TEXT NOT NULL,
+        entity TEXT NOT NULL,
+        task_kind TEXT NOT NULL,
+        role_name TEXT NOT NULL,
+        template_name TEXT NOT NULL,
+        segment INTEGER NOT NULL,
+        total INTEGER NOT NULL,
+        success INTEGER NOT NULL,
+        quality_pass INTEGER NOT NULL,
+        latency_ms_total INTEGER NOT NULL,
+        latency_ms_max INTEGER NOT NULL,
+        tokens_total INTEGER NOT NULL,
+        cost_units_total REAL NOT NULL,
+        last_seen INTEGER,
+        latency_sketch TEXT NOT NULL,
+        PRIMARY KEY (scope, entity, task_kind, role_name, template_name, segment)
+    );
+    CREATE TABLE IF NOT EXISTS entities (
+        scope TEXT NOT NULL,
+        entity TEXT NOT NULL,
+        provider TEXT NOT NULL,
+        model TEXT NOT NULL,
+        profile_id TEXT,
+        PRIMARY KEY (scope, entity)
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    """
+
+    def __init__(self, data_dir: str) -> None:
+        self.data_dir = data_dir
+        self.path = os.path.join(data_dir, self.DB_FILENAME)
+        self.legacy_path = os.path.join(data_dir, self.LEGACY_FILENAME)
+        self._lock = threading.Lock()
+        self._legacy_fingerprint: str | None = None
+        os.makedirs(data_dir, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(self._SCHEMA)
+
+    @classmethod
+    def for_data_dir(cls, data_dir: str) -> "BenchmarkSampleStore":
+        key = os.path.abspath(data_dir)
+        with _STORES_LOCK:
+            store = _STORES.get(key)
+            if store is None or not os.path.exists(store.path):
+                store = cls(data_dir)
+                _STORES[key] = store
+            return store
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # ── writes ──────────────────────────────────────────────────────────────
+
+    def record(
+        self,
+        *,
+        provider: str,
+        model: str,
+        task_kind: str,
+        success: bool,
+        quality_passed: bool | None,
+        latency_ms: int,
+        tokens_total: int,
+        cost_units: float,
+        context: dict[str, str] | None = None,
+        profile_id: str | None = None,
+        now: int | None = None,
+        retention: dict[str, int] | None = None,
+    ) -> None:
+        now = int(now if now is not None else time.time())
+        self.sync_legacy()
+        with self._lock, self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            self._upsert_entity(connection, "model", f"{provider}:{model}", provider, model, profile_id or None)
+            targets = [("model", f"{provider}:{model}")]
+            if profile_id:
+                self._upsert_entity(connection, "profile", profile_id, provider, model, profile_id)
+                targets.append(("profile", profile_id))
+            sample = {
+                "ts": now,
+                "success": bool(success),
+                "quality_passed": quality_passed,
+                "latency_ms": max(0, int(latency_ms or 0)),
+                "tokens_total": max(0, int(tokens_total or 0)),
+                "cost_units": max(0.0, float(cost_units or 0.0)),
+            }
+            for scope, entity in targets:
+                self._insert_sample(connection, scope, entity, task_kind, sample, context or {}, legacy=False)
+            self._set_meta(connection, "updated_at", str(now))
+            if retention is not None:
+                self._prune_if_due(connection, now=now, retention=retention)
+
+    @staticmethod
+    def _upsert_entity(
+        connection: sqlite3.Connection, scope: str, entity: str, provider: str, model: str, profile_id: str | None
+    ) -> None:
+        connection.execute(
+            """
+            INSERT INTO entities (scope, entity, provider, model, profile_id) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (scope, entity) DO UPDATE SET
+                provider = excluded.provider,
+                model = excluded.model,
+                profile_id = COALESCE(excluded.profile_id, entities.profile_id)
+            """,
+            (scope, entity, provider, model, profile_id),
+        )
+
+    def _insert_sample(
+        self,
+        connection: sqlite3.Connection,
+        scope: str,
+        entity: str,
+        task_kind: str,
+        sample: dict[str, Any],
+        context: dict[str, str],
+        *,
+        legacy: bool,
+    ) -> None:
+        ts = int(sample["ts"])
+        segment = ts // SEGMENT_SECONDS
+        role_name = str(context.get("role_name") or "").strip().lower()
+        template_name = str(context.get("template_name") or "").strip().lower()
+        quality = sample.get("quality_passed")
+        connection.execute(
+            """
+            INSERT INTO samples (segment, scope, entity, task_kind, role_name, template_name, ts, success,
+                                 quality_passed, latency_ms, tokens_total, cost_units, context, legacy)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                segment, scope, entity, task_kind, role_name, template_name, ts, int(bool(sample["success"])),
+                None if quality is None else int(bool(quality)), sample["latency_ms"], sample["tokens_total"],
+                sample["cost_units"], json.dumps(context, sort_keys=True) if context else None, int(legacy),
+            ),
+        )
+        key = (scope, entity, task_kind, role_name, template_name, segment)
+        row = connection.execute(
+            """
+            SELECT total, success, quality_pass, latency_ms_total, latency_ms_max, tokens_total,
+                   cost_units_total, last_seen, latency_sketch
+            FROM aggregates
+            WHERE scope = ? AND entity = ? AND task_kind = ? AND role_name = ? AND template_name = ? AND segment = ?
+            """,
+            key,
+        ).fetchone()
+        aggregate = _fold(empty_aggregate(), row) if row is not None else empty_aggregate()
+        latency = int(sample["latency_ms"])
+        aggregate["total"] += 1
+        aggregate["success"] += int(bool(sample["success"]))
+        aggregate["quality_pass"] += int(bool(quality))
+        aggregate["latency_ms_total"] += latency
+        aggregate["latency_ms_max"] = max(aggregate["latency_ms_max"], latency)
+        aggregate["tokens_total"] += int(sample["tokens_total"])
+        aggregate["cost_units_total"] += float(sample["cost_units"])
+        aggregate["last_seen"] = max(int(aggregate["last_seen"] or 0), ts)
+        merge_sketch(aggregate["latency_sketch"], {str(latency_bucket(latency)): 1})
+        connection.execute(
+            """
+            INSERT OR REPLACE INTO aggregates (scope, entity, task_kind, role_name, template_name, segment,
+                total, success, quality_pass, latency_ms_total, latency_ms_max, tokens_total, cost_units_total,
+                last_seen, latency_sketch)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                *key, aggregate["total"], aggregate["success"], aggregate["quality_pass"],
+                aggregate["latency_ms_total"], aggregate["latency_ms_max"], aggregate["tokens_total"],
+                aggregate["cost_units_total"], aggregate["last_seen"],
+                json.dumps(aggregate["latency_sketch"], separators=(",", ":")),
+            ),
+        )
+
+    @staticmethod
+    def _get_meta(connection: sqlite3.Connection, key: str) -> str | None:
+        row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row["value"]
+
+    @staticmethod
+    def _set_meta(connection: sqlite3.Connection, key: str, value: str) -> None:
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # ── retention ───────────────────────────────────────────────────────────
+
+    def _prune_if_due(self, connection: sqlite3.Connection, *, now: int, retention: dict[str, int]) -> None:
+        marker = f"{now // SEGMENT_SECONDS}:{int(retention['max_days'])}:{int(retention['max_samples'])}"
+        if self._get_meta(connection, "pruned") == marker:
+            return
+        self._prune(connection, now=now, retention=retention)
+        self._set_meta(connection, "pruned", marker)
+
+    def prune(self, *, now: int | None = None, retention: dict[str, int]) -> None:
+        with self._lock, self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            self._prune(connection, now=int(now if now is not None else time.time()), retention=retention)
+
+    @staticmethod
+    def _prune(connection: sqlite3.Connection, *, now: int, retention: dict[str, int]) -> None:
+        """Drop expired segments, then the oldest segments of over-full buckets."""
+        cutoff = (now - int(retention["max_days"]) * 86400) // SEGMENT_SECONDS
+        connection.execute("DELETE FROM samples WHERE segment < ?", (cutoff,))
+        connection.execute("DELETE FROM aggregates WHERE segment < ?", (cutoff,))
+        max_samples = int(retention["max_samples"])
+        rows = connection.execute(
+            """
+            SELECT scope, entity, task_kind, segment, SUM(total) AS total
+            FROM aggregates GROUP BY scope, entity, task_kind, segment
+            ORDER BY scope, entity, task_kind, segment DESC
+            """
+        ).fetchall()
+        kept: dict[tuple[str, str, str], int] = {}
+        for row in rows:
+            bucket = (row["scope"], row["entity"], row["task_kind"])
+            if kept.get(bucket, 0) >= max_samples:
+                params = (*bucket, row["segment"])
+                where = "scope = ? AND entity = ? AND task_kind = ? AND segment = ?"
+                connection.execute(f"DELETE FROM samples WHERE {where}", params)
+                connection.execute(f"DELETE FROM aggregates WHERE {where}", params)
+                continue
+            kept[bucket] = kept.get(bucket, 0) + int(row["total"])
+
+    # ── legacy import ───────────────────────────────────────────────────────
+
+    def sync_legacy(self) -> None:
+        """Import ``llm_model_benchmarks.json`` when it appeared or changed.
+
+        Imported samples belong to the store: when the file is removed it is
+        simply no longer tracked and its samples stay.
+        """
+        try:
+            stat = os.stat(self.legacy_path)
+        except OSError:
+            self._legacy_fingerprint = None
+            return
+        fingerprint = f"{stat.st_mtime_ns}:{stat.st_size}"
+        if fingerprint == self._legacy_fingerprint:
+            return
+        with self._lock, self._connect() as connection:
+            if self._get_meta(connection, "legacy_fingerprint") == fingerprint:
+                self._legacy_fingerprint = fingerprint
+                return
+            try:
+                with open(self.legacy_path, "r", encoding="utf-8") as fh:
+                    payload = json.load(fh)
+            except Exception as exc:
+                logging.warning("Failed reading legacy benchmark file '%s': %s", self.legacy_path, exc)
+                payload = {}
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM samples WHERE legacy = 1")
+            connection.execute("DELETE FROM aggregates")
+            self._import_legacy(connection, payload if isinstance(payload, dict) else {}, default_ts=int(stat.st_mtime))
+            self._rebuild_aggregates(connection)
+            self._set_meta(connection, "legacy_fingerprint", fingerprint)
+        self._legacy_fingerprint = fingerprint
+
+    def _import_legacy(self, connection: sqlite3.Connection, payload: dict[str, Any], *, default_ts: int) -> None:
+        # Legacy samples carry no bucket identity of their own, so they are
+        # inserted raw and ``aggregates`` is rebuilt afterwards.
+        for scope, section in (("model", "models"), ("profile", "profiles")):
+            for entity, entry in (payload.get(section) or {}).items():
+                if not isinstance(entry, dict):
+                    continue
+                provider = str(entry.get("provider") or "").strip().lower()
+                model = str(entry.get("model") or "").strip()
+                if not provider or not model:
+                    continue
+                profile_id = str(entry.get("profile_id") or "").strip() or (entity if scope == "profile" else None)
+                self._upsert_entity(connection, scope, str(entity), provider, model, profile_id)
+                buckets = {
+                    str(kind): bucket
+                    for kind, bucket in (entry.get("task_kinds") or {}).items()
+                    if isinstance(bucket, dict) and isinstance(bucket.get("samples"), list)
+                }
+                if not buckets and isinstance((entry.get("overall") or {}).get("samples"), list):
+                    buckets = {"": entry["overall"]}
+                for task_kind, bucket in buckets.items():
+                    for raw in bucket["samples"]:
+                        if not isinstance(raw, dict):
+                            continue
+                        kind = task_kind or str(raw.get("task_kind") or "analysis").strip().lower()
+                        context = raw.get("context") if isinstance(raw.get("context"), dict) else {}
+                        quality = raw.get("quality_passed")
+                        connection.execute(
+                            """
+                            INSERT INTO samples (segment, scope, entity, task_kind, role_name, template_name, ts,
+                                                 success, quality_passed, latency_ms, tokens_total, cost_units,
+                                                 context, legacy)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+                            """,
+                            (
+                                (int(raw.get("ts") or default_ts)) // SEGMENT_SECONDS, scope, str(entity), kind,
+                                str(context.get("role_name") or "").strip().lower(),
+                                str(context.get("template_name") or "").strip().lower(),
+                                int(raw.get("ts") or default_ts), int(bool(raw.get("success"))),
+                                None if quality is None else int(bool(quality)),
+                                max(0, int(raw.get("latency_ms") or 0)), max(0, int(raw.get("tokens_total") or 0)),
+                                max(0.0, float(raw.get("cost_units") or 0.0)),
+                                json.dumps(context, sort_keys=True) if context else None,
+                            ),
+                        )
+        if payload.get("updated_at") is not None and self._get_meta(connection, "updated_at") is None:
+            self._set_meta(connection, "updated_at", str(payload["updated_at"]))
+
+    @staticmethod
+    def _rebuild_aggregates(connection: sqlite3.Connection) -> None:
+        grouped: dict[tuple, dict[str, Any]] = {}
+        for row in connection.execute(
+            """
+            SELECT scope, entity, task_kind, role_name, template_name, segment, ts, success, quality_passed,
+                   latency_ms, tokens_total, cost_units
+            FROM samples
+            """
+        ):
+            key = (
+                row["scope"], row["entity"], row["task_kind"], row["role_name"], row["template_name"], row["segment"]
+            )
+            aggregate = grouped.setdefault(key, empty_aggregate())
+            aggregate["total"] += 1
+            aggregate["success"] += int(row["success"])
+            aggregate["quality_pass"] += int(row["quality_passed"] or 0)
+            aggregate["latency_ms_total"] += int(row["latency_ms"])
+            aggregate["latency_ms_max"] = max(aggregate["latency_ms_max"], int(row["latency_ms"]))
+            aggregate["tokens_total"] += int(row["tokens_total"])
+            aggregate["cost_units_total"] += float(row["cost_units"])
+            aggregate["last_seen"] = max(int(aggregate["last_seen"] or 0), int(row["ts"]))
+            merge_sketch(aggregate["latency_sketch"], {str(latency_bucket(int(row["latency_ms"]))): 1})
+        connection.executemany(
+            """
+            INSERT INTO aggregates (scope, entity, task_kind, role_name, template_name, segment, total, success,
+                quality_pass, latency_ms_total, latency_ms_max, tokens_total, cost_units_total, last_seen,
+                latency_sketch)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    *key, agg["total"], agg["success"], agg["quality_pass"], agg["latency_ms_total"],
+                    agg["latency_ms_max"], agg["tokens_total"], agg["cost_units_total"], agg["last_seen"],
+                    json.dumps(agg["latency_sketch"], separators=(",", ":")),
+                )
+                for key, agg in grouped.items()
+            ],
+        )
+
+    # ── reads ───────────────────────────────────────────────────────────────
+
+    def entities(self, scope: str) -> dict[str, dict[str, Any]]:
+        self.sync_legacy()
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT entity, provider, model, profile_id FROM entities WHERE scope = ? ORDER BY entity", (scope,)
+            ).fetchall()
+        return {
+            row["entity"]: {"provider": row["provider"], "model": row["model"], "profile_id": row["profile_id"]}
+            for row in rows
+        }
+
+    def aggregates(
+        self,
+        scope: str,
+        *,
+        task_kind: str | None = None,
+        role_name: str | None = None,
+        template_name: str | None = None,
+        entity: str | None = None,
+        by_task_kind: bool = False,
+    ) -> dict[Any, dict[str, Any]]:
+        """Fold segment aggregates per entity (or per ``(entity, task_kind)``)."""
+        self.sync_legacy()
+        clauses, params = ["scope = ?"], [scope]
+        for column, value in (
+            ("task_kind", task_kind),
+            ("role_name", role_name),
+            ("template_name", template_name),
+            ("entity", entity),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT entity, task_kind, total, success, quality_pass, latency_ms_total, latency_ms_max,
+                       tokens_total, cost_units_total, last_seen, latency_sketch
+                FROM aggregates WHERE {' AND '.join(clauses)}
+                """,
+                params,
+            ).fetchall()
+        folded: dict[Any, dict[str, Any]] = {}
+        for row in rows:
+            key = (row["entity"], row["task_kind"]) if by_task_kind else row["entity"]
+            _fold(folded.setdefault(key, empty_aggregate()), row)
+        return folded
+
+    def samples(
+        self,
+        scope: str,
+        entity: str,
+        *,
+        task_kind: str | None = None,
+        role_name: str | None = None,
+        template_name: str | None = None,
+        min_ts: int | None = None,
+    ) -> list[dict[str, Any]]:
+        self.sync_legacy()
+        clauses, params = ["scope = ?", "entity = ?"], [scope, entity]
+        for column, value in (("task_kind", task_kind), ("role_name", role_name), ("template_name", template_name)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if min_ts is not None:
+            clauses.append("ts >= ?")
+            params.append(int(min_ts))
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT task_kind, ts, success, quality_passed, latency_ms, tokens_total, cost_units, context
+                FROM samples WHERE {' AND '.join(clauses)} ORDER BY ts, id
+                """,
+                params,
+            ).fetchall()
+        return [self._sample_dict(row) for row in rows]
+
+    @staticmethod
+    def _sample_dict(row: sqlite3.Row) -> dict[str, Any]:
+        sample: dict[str, Any] = {"ts": int(row["ts"]), "success": bool(row["success"])}
+        if row["quality_passed"] is not None:
+            sample["quality_passed"] = bool(row["quality_passed"])
+        sample.update(
+            latency_ms=int(row["latency_ms"]),
+            tokens_total=int(row["tokens_total"]),
+            cost_units=float(row["cost_units"]),
+        )
+        if row["context"]:
+            sample["context"] = json.loads(row["context"])
+        return sample
+
+    def latency_quantile(self, scope: str, entity: str, task_kind: str, quantile: float) -> tuple[int | None, int]:
+        """Return ``(latency_ms, sample_count)`` for a bucket from its sketch."""
+        aggregate = self.aggregates(scope, task_kind=task_kind, entity=entity).get(entity) or empty_aggregate()
+        value = sketch_quantile(aggregate["latency_sketch"], quantile, max_value=aggregate["latency_ms_max"])
+        return value, int(aggregate["total"])
+
+    def updated_at(self) -> int | None:
+        self.sync_legacy()
+        with self._connect() as connection:
+            value = self._get_meta(connection, "updated_at")
+        return int(float(value)) if value else None
+
+    def snapshot(self, *, include_samples: bool = False) -> dict[str, Any]:
+        """Materialize the legacy ``{"models", "profiles", "updated_at"}`` document.
+
+        Bucket totals are summed in SQL from the segment aggregates; raw
+        samples are only read when ``include_samples`` is set.
+        """
+        db: dict[str, Any] = {"models": {}, "updated_at": self.updated_at()}
+        for scope, section in (("model", "models"), ("profile", "profiles")):
+            entities = self.entities(scope)
+            if not entities:
+                continue
+            with self._connect() as connection:
+                overall = {
+                    row["entity"]: row
+                    for row in connection.execute(self._BUCKET_TOTALS_SQL.format(group="entity"), (scope,))
+                }
+                per_kind = connection.execute(
+                    self._BUCKET_TOTALS_SQL.format(group="entity, task_kind"), (scope,)
+                ).fetchall()
+                rows = (
+                    connection.execute(
+                        """
+                        SELECT entity, task_kind, ts, success, quality_passed, latency_ms, tokens_total, cost_units,
+                               context
+                        FROM samples WHERE scope = ? ORDER BY ts, id
+                        """,
+                        (scope,),
+                    ).fetchall()
+                    if include_samples
+                    else []
+                )
+            samples: dict[tuple[str, str], list[dict[str, Any]]] = {}
+            for row in rows:
+                samples.setdefault((row["entity"], row["task_kind"]), []).append(self._sample_dict(row))
+            entries = db.setdefault(section, {})
+            for entity, identity in entities.items():
+                entry: dict[str, Any] = {"provider": identity["provider"], "model": identity["model"]}
+                if identity.get("profile_id"):
+                    entry["profile_id"] = identity["profile_id"]
+                entry["overall"] = self._legacy_bucket(overall.get(entity))
+                entry["task_kinds"] = {}
+                entries[entity] = entry
+            for row in per_kind:
+                entry = entries.get(row["entity"])
+                if entry is not None:
+                    entry["task_kinds"][row["task_kind"]] = self._legacy_bucket(row)
+            if include_samples:
+                for entity, entry in entries.items():
+                    kinds = entry["task_kinds"]
+                    for kind, bucket in kinds.items():
+                        bucket["samples"] = samples.get((entity, kind), [])
+                    entry["overall"]["samples"] = sorted(
+                        (sample for kind in kinds for sample in samples.get((entity, kind), [])),
+                        key=lambda sample: sample["ts"],
+                    )
+        return db
+
+    _BUCKET_TOTALS_SQL = """
+        SELECT {group}, SUM(total) AS total, SUM(success) AS success, SUM(quality_pass) AS quality_pass,
+               SUM(latency_ms_total) AS latency_ms_total, SUM(tokens_total) AS tokens_total,
+               SUM(cost_units_total) AS cost_units_total, MAX(last_seen) AS last_seen
+        FROM aggregates WHERE scope = ? GROUP BY {group}
+    """
+
+    @staticmethod
+    def _legacy_bucket(row: sqlite3.Row | None) -> dict[str, Any]:
+        total = int(row["total"] or 0) if row is not None else 0
+        success = int(row["success"] or 0) if row is not None else 0
+        quality_pass = int(row["quality_pass"] or 0) if row is not None else 0
+        return {
+            "total": total,
+            "success": success,
+            "failed": total - success,
+            "quality_pass": quality_pass,
+            "quality_fail": total - quality_pass,
+            "latency_ms_total": int(row["latency_ms_total"] or 0) if row is not None else 0,
+            "tokens_total": int(row["tokens_total"] or 0) if row is not None else 0,
+            "cost_units_total": float(row["cost_units_total"] or 0.0) if row is not None else 0.0,
+            "last_seen": row["last_seen"] if row is not None else None,
+        }
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import json
 import os
-import time
 from typing import Any
 
+from agent.llm_benchmark_store import BenchmarkSampleStore, sketch_quantile
 from agent.model_selection import normalize_legacy_model_name
 
 
@@ -83,63 +82,27 @@ def default_metric_bucket() -> dict[str, Any]:
     }
 
 
-def load_benchmarks(data_dir: str) -> dict[str, Any]:
-    path = benchmarks_path(data_dir)
-    try:
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-            if isinstance(data, dict):
-                return data
-    except Exception:
-        pass
-    return {"models": {}, "updated_at": None}
+def benchmark_store(data_dir: str) -> BenchmarkSampleStore:
+    return BenchmarkSampleStore.for_data_dir(data_dir)
 
 
-def save_benchmarks(data_dir: str, data: dict[str, Any]) -> None:
-    path = benchmarks_path(data_dir)
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, ensure_ascii=False, indent=2)
+def load_benchmarks(data_dir: str, *, include_samples: bool = False) -> dict[str, Any]:
+    """Legacy document view of the sample store; raw samples only on request."""
+    try:
+        return benchmark_store(data_dir).snapshot(include_samples=include_samples)
+    except Exception:
+        return {"models": {}, "updated_at": None}
 
 
-def append_sample(
-    target: dict[str, Any],
-    *,
-    now: int,
-    success: bool,
-    quality_passed: bool,
-    latency_ms: int,
-    tokens_total: int,
-    cost_units: float,
-    retention: dict[str, int],
-    context_tags: dict[str, Any] | None = None,
-) -> None:
-    min_ts = int(now) - (int(retention["max_days"]) * 86400)
-    samples = target.setdefault("samples", [])
-    if not isinstance(samples, list):
-        samples = []
-        target["samples"] = samples
-    else:
-        samples[:] = [s for s in samples if int((s or {}).get("ts") or 0) >= min_ts]
-    sample = {
-        "ts": int(now),
-        "success": bool(success),
-        "quality_passed": bool(quality_passed),
-        "latency_ms": max(0, int(latency_ms or 0)),
-        "tokens_total": max(0, int(tokens_total or 0)),
-        "cost_units": max(0.0, float(cost_units or 0.0)),
-    }
-    normalized_context: dict[str, Any] = {}
+def normalize_context_tags(context_tags: dict[str, Any] | None) -> dict[str, str]:
+    normalized_context: dict[str, str] = {}
     if isinstance(context_tags, dict):
         for key, value in context_tags.items():
             norm_key = str(key or "").strip().lower()
             norm_value = str(value or "").strip()
             if norm_key and norm_value:
                 normalized_context[norm_key] = norm_value
-    if normalized_context:
-        sample["context"] = normalized_context
-    samples.append(sample)
-    if len(samples) > int(retention["max_samples"]):
-        del samples[: len(samples) - int(retention["max_samples"])]
+    return normalized_context
 
 
 def record_benchmark_sample(
@@ -165,66 +128,20 @@ def record_benchmark_sample(
     if task_kind not in BENCH_TASK_KINDS:
         task_kind = "analysis"
 
-    db = load_benchmarks(data_dir)
-    models = db.setdefault("models", {})
-    model_key = f"{provider}:{model}"
-    entry = models.setdefault(
-        model_key,
-        {"provider": provider, "model": model, "overall": default_metric_bucket(), "task_kinds": {}},
+    benchmark_store(data_dir).record(
+        provider=provider,
+        model=model,
+        task_kind=task_kind,
+        success=bool(success),
+        quality_passed=bool(quality_gate_passed),
+        latency_ms=latency_ms,
+        tokens_total=tokens_total,
+        cost_units=cost_units,
+        context=normalize_context_tags(context_tags),
+        profile_id=str(profile_id or "").strip() or None,
+        retention=benchmark_retention_config(agent_cfg),
     )
-    normalized_profile_id = str(profile_id or "").strip()
-    if normalized_profile_id:
-        entry["profile_id"] = normalized_profile_id
-        profiles = db.setdefault("profiles", {})
-        profile_entry = profiles.setdefault(
-            normalized_profile_id,
-            {
-                "profile_id": normalized_profile_id,
-                "provider": provider,
-                "model": model,
-                "overall": default_metric_bucket(),
-                "task_kinds": {},
-            },
-        )
-        profile_entry["provider"] = provider
-        profile_entry["model"] = model
-    else:
-        profile_entry = None
-    bucket = (entry.setdefault("task_kinds", {})).setdefault(task_kind, default_metric_bucket())
-    retention = benchmark_retention_config(agent_cfg)
-    now = int(time.time())
-
-    def _apply(target: dict[str, Any]) -> None:
-        target["total"] = int(target.get("total") or 0) + 1
-        target["success"] = int(target.get("success") or 0) + (1 if success else 0)
-        target["failed"] = int(target.get("failed") or 0) + (0 if success else 1)
-        target["quality_pass"] = int(target.get("quality_pass") or 0) + (1 if quality_gate_passed else 0)
-        target["quality_fail"] = int(target.get("quality_fail") or 0) + (0 if quality_gate_passed else 1)
-        target["latency_ms_total"] = int(target.get("latency_ms_total") or 0) + max(0, int(latency_ms or 0))
-        target["tokens_total"] = int(target.get("tokens_total") or 0) + max(0, int(tokens_total or 0))
-        target["cost_units_total"] = float(target.get("cost_units_total") or 0.0) + float(cost_units or 0.0)
-        target["last_seen"] = now
-        append_sample(
-            target,
-            now=now,
-            success=success,
-            quality_passed=quality_gate_passed,
-            latency_ms=latency_ms,
-            tokens_total=tokens_total,
-            cost_units=cost_units,
-            retention=retention,
-            context_tags=context_tags,
-        )
-
-    _apply(bucket)
-    _apply(entry.setdefault("overall", default_metric_bucket()))
-    if profile_entry is not None:
-        profile_bucket = (profile_entry.setdefault("task_kinds", {})).setdefault(task_kind, default_metric_bucket())
-        _apply(profile_bucket)
-        _apply(profile_entry.setdefault("overall", default_metric_bucket()))
-    db["updated_at"] = now
-    save_benchmarks(data_dir, db)
-    return {"recorded": True, "model_key": model_key, "task_kind": task_kind, "db": db}
+    return {"recorded": True, "model_key": f"{provider}:{model}", "task_kind": task_kind}
 
 
 def recommend_profiles_for_context(
@@ -243,17 +160,16 @@ def recommend_profiles_for_context(
     normalized_task_kind = str(task_kind or "").strip().lower()
     if normalized_task_kind not in BENCH_TASK_KINDS:
         normalized_task_kind = "analysis"
-    db = load_benchmarks(data_dir)
+    store = benchmark_store(data_dir)
+    aggregates = store.aggregates("profile", task_kind=normalized_task_kind)
     rows: list[dict[str, Any]] = []
-    for profile_id, entry in (db.get("profiles") or {}).items():
-        profile_id = str(profile_id or "").strip()
-        if profile_id not in allowed_set or not isinstance(entry, dict):
+    for profile_id, entry in store.entities("profile").items():
+        aggregate = aggregates.get(profile_id)
+        if profile_id not in allowed_set or aggregate is None:
             continue
-        bucket = (entry.get("task_kinds") or {}).get(normalized_task_kind) or {}
-        samples = list(bucket.get("samples") or [])
-        if len(samples) < max(1, int(min_samples or 1)):
+        if int(aggregate["total"]) < max(1, int(min_samples or 1)):
             continue
-        score = score_bucket(bucket)
+        score = score_bucket(aggregate)
         rows.append(
             {
                 "profile_id": profile_id,
@@ -319,54 +235,42 @@ def recommend_models_for_context(
     template_match = str(template_name or "").strip().lower()
     provider_match = str(provider or "").strip().lower()
     excluded = {str(item or "").strip() for item in list(exclude_models or []) if str(item or "").strip()}
-    db = load_benchmarks(data_dir)
+    store = benchmark_store(data_dir)
+    aggregates = store.aggregates(
+        "model", task_kind=normalized_task_kind, role_name=role_match, template_name=template_match
+    )
     candidates: list[dict[str, Any]] = []
 
-    for _model_key, entry in (db.get("models") or {}).items():
-        if not isinstance(entry, dict):
-            continue
+    for model_key, entry in store.entities("model").items():
+        aggregate = aggregates.get(model_key)
         provider = str(entry.get("provider") or "").strip().lower()
         model = normalize_legacy_model_name(str(entry.get("model") or "").strip(), provider=provider)
-        if not provider or not model or model in excluded:
+        if aggregate is None or not provider or not model or model in excluded:
             continue
         if provider_match and provider != provider_match:
             continue
-        bucket = (entry.get("task_kinds") or {}).get(normalized_task_kind) or {}
-        samples = list(bucket.get("samples") or [])
-        if not isinstance(samples, list) or not samples:
-            continue
-        filtered = []
-        for sample in samples:
-            if not isinstance(sample, dict):
-                continue
-            context = sample.get("context") if isinstance(sample.get("context"), dict) else {}
-            sample_role = str(context.get("role_name") or "").strip().lower()
-            sample_template = str(context.get("template_name") or "").strip().lower()
-            if role_match and sample_role != role_match:
-                continue
-            if template_match and sample_template != template_match:
-                continue
-            filtered.append(sample)
-        if len(filtered) < max(1, int(min_samples or 1)):
+        if int(aggregate["total"]) < max(1, int(min_samples or 1)):
             continue
-        aggregate = {
-            "total": len(filtered),
-            "success": sum(1 for s in filtered if bool(s.get("success"))),
-            "quality_pass": sum(1 for s in filtered if bool(s.get("quality_passed"))),
-            "latency_ms_total": sum(max(0, int(s.get("latency_ms") or 0)) for s in filtered),
-            "tokens_total": sum(max(0, int(s.get("tokens_total") or 0)) for s in filtered),
-            "cost_units_total": sum(max(0.0, float(s.get("cost_units") or 0.0)) for s in filtered),
-        }
         scored = score_bucket(aggregate)
         candidate = {
             "provider": provider,
             "model": model,
             "task_kind": normalized_task_kind,
-            "sample_count": aggregate["total"],
+            "sample_count": int(aggregate["total"]),
             "score": scored,
+            "latency_p95_ms": sketch_quantile(
+                aggregate["latency_sketch"], 0.95, max_value=aggregate["latency_ms_max"]
+            ),
         }
         if include_bayesian:
             from agent.services.bayesian_benchmark_estimator import estimate_bayesian_for_samples
+            filtered = store.samples(
+                "model",
+                model_key,
+                task_kind=normalized_task_kind,
+                role_name=role_match,
+                template_name=template_match,
+            )
             bayes = estimate_bayesian_for_samples(
                 filtered, source="llm_benchmark", provider=provider, model=model
             )
@@ -459,26 +363,23 @@ def benchmark_rows(
     normalized_task_kind = str(task_kind or "").strip().lower()
     if normalized_task_kind not in BENCH_TASK_KINDS:
         normalized_task_kind = ""
-    db = load_benchmarks(data_dir)
+    store = benchmark_store(data_dir)
+    overall_aggregates = store.aggregates("model")
+    kind_aggregates = store.aggregates("model", by_task_kind=True)
     rows: list[dict[str, Any]] = []
-    for key, entry in (db.get("models") or {}).items():
-        if not isinstance(entry, dict):
-            continue
-        overall = score_bucket(entry.get("overall") or {})
+    for key, entry in store.entities("model").items():
+        overall = score_bucket(overall_aggregates.get(key) or {})
         row = {
             "id": key,
             "provider": str(entry.get("provider") or "").strip().lower(),
             "model": str(entry.get("model") or "").strip(),
             "overall": overall,
-            "task_kinds": {kind: score_bucket(((entry.get("task_kinds") or {}).get(kind) or {})) for kind in BENCH_TASK_KINDS},
+            "task_kinds": {kind: score_bucket(kind_aggregates.get((key, kind)) or {}) for kind in BENCH_TASK_KINDS},
         }
         row["focus"] = row["task_kinds"].get(normalized_task_kind, score_bucket({})) if normalized_task_kind else overall
         if include_bayesian:
             from agent.services.bayesian_benchmark_estimator import estimate_bayesian_for_samples
-            focus_bucket = (
-                (entry.get("task_kinds") or {}).get(normalized_task_kind) if normalized_task_kind else None
-            ) or entry.get("overall") or {}
-            samples = list(focus_bucket.get("samples") or [])
+            samples = store.samples("model", key, task_kind=normalized_task_kind or None)
             row["bayesian_estimate"] = estimate_bayesian_for_samples(
                 samples,
                 source="llm_benchmark",
@@ -492,7 +393,7 @@ def benchmark_rows(
         rows = rows[:top_n]
     for row in rows:
         row.pop("_sort_score", None)
-    return rows, db
+    return rows, {"updated_at": store.updated_at()}
 
 
 def timeseries_from_samples(samples: list[dict[str, Any]], bucket: str = "day") -> list[dict[str, Any]]:
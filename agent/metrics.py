@@ -88,6 +88,11 @@ EVOLUTION_PROVIDER_HEALTH_TOTAL = Counter(
     "Total Evolution provider health checks grouped by provider and status",
     ["provider", "status"],
 )
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    ["pool"],
+)
 SHELL_POOL_SIZE = Gauge("shell_pool_size", "Total size of the shell pool")
 SHELL_POOL_BUSY = Gauge("shell_pool_busy", "Number of busy shells in the pool")
 SHELL_POOL_FREE = Gauge("shell_pool_free", "Number of free shells in the pool")
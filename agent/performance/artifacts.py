@@ -11,6 +11,13 @@ from pathlib import Path
 from statistics import median
 from typing import Any
 
+from agent.performance.sample_stats import (
+    bootstrap_relative_delta_ci,
+    mann_whitney_u,
+    minimum_detectable_effect_percent,
+    relative_delta_percent,
+)
+
 
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -122,7 +129,29 @@ def build_performance_comparison_artifact(
     metric: str = "wall_time",
     min_relative_improvement_percent: float = 5.0,
     regression_passed: bool = True,
+    min_samples: int = 5,
+    alpha: float = 0.05,
+    seed: int = 0,
 ) -> dict[str, Any]:
+    """Compare one primary metric; lower values are better.
+
+    With at least ``min_samples`` repeated samples on both sides the verdict comes
+    from the sample statistics (see ``_statistical_verdict``); otherwise the medians
+    are compared against the fixed relative threshold.
+    """
+    baseline_samples = metric_samples(baseline_run, metric)
+    candidate_samples = metric_samples(candidate_run, metric)
+    if min(len(baseline_samples), len(candidate_samples)) >= max(2, int(min_samples)):
+        return _build_statistical_comparison_artifact(
+            baseline_run=baseline_run,
+            candidate_run=candidate_run,
+            metric=metric,
+            min_relative_improvement_percent=min_relative_improvement_percent,
+            regression_passed=regression_passed,
+            min_samples=max(2, int(min_samples)),
+            alpha=alpha,
+            seed=seed,
+        )
     baseline_value = metric_value(baseline_run, metric)
     candidate_value = metric_value(candidate_run, metric)
     caveats: list[str] = []
@@ -179,6 +208,124 @@ def build_performance_comparison_artifact(
     }
 
 
+def metric_statistics(
+    baseline_samples: list[float],
+    candidate_samples: list[float],
+    *,
+    alpha: float = 0.05,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Per-metric delta with bootstrap CI, Mann-Whitney U and minimum detectable effect."""
+    baseline_value = float(median(baseline_samples))
+    candidate_value = float(median(candidate_samples))
+    stats: dict[str, Any] = {
+        "baseline": baseline_value,
+        "candidate": candidate_value,
+        "absolute_delta": candidate_value - baseline_value,
+        "relative_delta_percent": None,
+        "samples": {"baseline": len(baseline_samples), "candidate": len(candidate_samples)},
+        "ci_relative_delta_percent": None,
+        "mann_whitney_u": None,
+        "p_value": None,
+        "mde_percent": None,
+    }
+    if baseline_value <= 0:
+        return stats
+    stats["relative_delta_percent"] = relative_delta_percent(baseline_value, candidate_value)
+    ci = bootstrap_relative_delta_ci(baseline_samples, candidate_samples, confidence=1.0 - alpha, seed=seed)
+    stats["ci_relative_delta_percent"] = list(ci) if ci else None
+    stats["mann_whitney_u"], stats["p_value"] = mann_whitney_u(baseline_samples, candidate_samples)
+    stats["mde_percent"] = minimum_detectable_effect_percent(baseline_samples, candidate_samples, alpha=alpha)
+    return stats
+
+
+def _statistical_verdict(
+    stats: dict[str, Any],
+    *,
+    min_relative_improvement_percent: float,
+    alpha: float,
+) -> tuple[str, str]:
+    ci = stats.get("ci_relative_delta_percent")
+    p_value = stats.get("p_value")
+    if ci is None or p_value is None:
+        return "inconclusive", "missing_comparable_metric"
+    low, high = ci
+    threshold = abs(min_relative_improvement_percent)
+    significant = p_value < alpha
+    if significant and low > 0:
+        return "rejected", "performance_regressed"
+    if significant and high <= -threshold:
+        return "passed", "improvement_above_threshold"
+    mde = stats.get("mde_percent")
+    # The samples cannot resolve a change of the size we gate on: more repetitions
+    # or a quieter host are needed, not a verdict.
+    if mde is None or mde > threshold:
+        return "inconclusive", "variance_too_high"
+    return "inconclusive", "delta_below_threshold" if significant else "no_significant_delta"
+
+
+def _build_statistical_comparison_artifact(
+    *,
+    baseline_run: dict[str, Any],
+    candidate_run: dict[str, Any],
+    metric: str,
+    min_relative_improvement_percent: float,
+    regression_passed: bool,
+    min_samples: int,
+    alpha: float,
+    seed: int,
+) -> dict[str, Any]:
+    metric_deltas: dict[str, Any] = {}
+    baseline_metrics = dict(baseline_run.get("metrics") or {})
+    candidate_metrics = dict(candidate_run.get("metrics") or {})
+    for name in [metric, *sorted(set(baseline_metrics) & set(candidate_metrics) - {metric})]:
+        baseline_samples = metric_samples(baseline_run, name)
+        candidate_samples = metric_samples(candidate_run, name)
+        if min(len(baseline_samples), len(candidate_samples)) >= min_samples:
+            metric_deltas[name] = metric_statistics(baseline_samples, candidate_samples, alpha=alpha, seed=seed)
+    primary = metric_deltas[metric]
+    caveats: list[str] = []
+    if not regression_passed:
+        pass_fail, reason_code = "rejected", "regression_failed"
+        caveats.append("regression gate did not pass")
+    else:
+        pass_fail, reason_code = _statistical_verdict(
+            primary, min_relative_improvement_percent=min_relative_improvement_percent, alpha=alpha
+        )
+    if reason_code == "variance_too_high":
+        caveats.append(
+            f"minimum detectable effect {primary['mde_percent']:.1f}% exceeds the "
+            f"{abs(min_relative_improvement_percent):.1f}% gate; collect more samples"
+            if primary.get("mde_percent") is not None
+            else "not enough spread information to detect the gated effect"
+        )
+    p_value = primary.get("p_value")
+    ci = primary.get("ci_relative_delta_percent")
+    comparison_id = f"cmp-{stable_hash([baseline_run.get('run_id'), candidate_run.get('run_id'), time.time_ns()])[:16]}"
+    return {
+        "schema": "performance_comparison_artifact.v1",
+        "comparison_id": comparison_id,
+        "baseline_run_id": baseline_run.get("run_id"),
+        "candidate_run_id": candidate_run.get("run_id"),
+        "metric_deltas": metric_deltas,
+        "confidence": round(1.0 - p_value, 4) if p_value is not None else 0.0,
+        "noise_estimate": {
+            "method": "bootstrap_median_ci",
+            "value": (ci[1] - ci[0]) / 2.0 if ci else None,
+            "alpha": alpha,
+            "mde_percent": primary.get("mde_percent"),
+        },
+        "pass_fail": pass_fail,
+        "reason_code": reason_code,
+        "code_delta": candidate_run.get("code_delta", {}),
+        "config_delta": candidate_run.get("config_delta", {}),
+        "data_delta": candidate_run.get("data_delta", {}),
+        "hardware_delta": {},
+        "caveats": caveats,
+        "created_at": utc_now(),
+    }
+
+
 def build_optimization_hypothesis_artifact(
     *,
     hypothesis_id: str,
@@ -0,0 +1,124 @@
+"""Noise-aware statistics for repeated benchmark samples (stdlib only)."""
+
+from __future__ import annotations
+
+import math
+import random
+from statistics import NormalDist, fmean, median, stdev
+from typing import Sequence
+
+# Exact Mann-Whitney null distribution up to this many (n1 * n2) pairs, normal approximation above.
+_EXACT_U_MAX_PAIRS = 400
+
+
+def relative_delta_percent(baseline: float, candidate: float) -> float:
+    return (candidate - baseline) / baseline * 100.0
+
+
+def bootstrap_relative_delta_ci(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    *,
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> tuple[float, float] | None:
+    """Percentile bootstrap CI for the relative change of the median, in percent."""
+    if not baseline or not candidate:
+        return None
+    rng = random.Random(seed)
+    deltas: list[float] = []
+    for _ in range(max(1, int(resamples))):
+        base = median(rng.choices(baseline, k=len(baseline)))
+        if base <= 0:
+            continue
+        deltas.append(relative_delta_percent(base, median(rng.choices(candidate, k=len(candidate)))))
+    if not deltas:
+        return None
+    deltas.sort()
+    tail = (1.0 - confidence) / 2.0
+    low = deltas[min(len(deltas) - 1, int(math.floor(tail * len(deltas))))]
+    high = deltas[min(len(deltas) - 1, int(math.ceil((1.0 - tail) * len(deltas))) - 1)]
+    return low, high
+
+
+def mann_whitney_u(baseline: Sequence[float], candidate: Sequence[float]) -> tuple[float, float]:
+    """Return (U of the baseline sample, two-sided p-value).
+
+    Exact for small samples without ties, otherwise the tie-corrected normal
+    approximation with continuity correction.
+    """
+    n1, n2 = len(baseline), len(candidate)
+    if not n1 or not n2:
+        return 0.0, 1.0
+    ranks, tie_groups = _ranks([*baseline, *candidate])
+    u1 = sum(ranks[:n1]) - n1 * (n1 + 1) / 2.0
+    mean_u = n1 * n2 / 2.0
+    if not tie_groups and n1 * n2 <= _EXACT_U_MAX_PAIRS:
+        counts = _exact_u_counts(n1, n2)
+        total = sum(counts)
+        extreme = min(u1, n1 * n2 - u1)
+        tail = sum(counts[: int(extreme) + 1]) / total
+        return u1, min(1.0, 2.0 * tail)
+    n = n1 + n2
+    tie_term = sum(t**3 - t for t in tie_groups) / (n * (n - 1))
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term)
+    if variance <= 0:
+        return u1, 1.0
+    z = (abs(u1 - mean_u) - 0.5) / math.sqrt(variance)
+    return u1, min(1.0, 2.0 * (1.0 - NormalDist().cdf(max(0.0, z))))
+
+
+def minimum_detectable_effect_percent(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    *,
+    alpha: float = 0.05,
+    power: float = 0.8,
+) -> float | None:
+    """Smallest relative change (percent of the baseline mean) these sample sizes detect reliably."""
+    if len(baseline) < 2 or len(candidate) < 2:
+        return None
+    base_mean = fmean(baseline)
+    if base_mean <= 0:
+        return None
+    z = NormalDist().inv_cdf(1.0 - alpha / 2.0) + NormalDist().inv_cdf(power)
+    spread = math.sqrt(stdev(baseline) ** 2 / len(baseline) + stdev(candidate) ** 2 / len(candidate))
+    return z * spread / base_mean * 100.0
+
+
+def _ranks(values: Sequence[float]) -> tuple[list[float], list[int]]:
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    tie_groups: list[int] = []
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        rank = (start + end) / 2.0 + 1.0
+        for position in range(start, end + 1):
+            ranks[order[position]] = rank
+        if end > start:
+            tie_groups.append(end - start + 1)
+        start = end + 1
+    return ranks, tie_groups
+
+
+def _exact_u_counts(n1: int, n2: int) -> list[int]:
+    """counts[u] = number of rank arrangements with U == u under H0."""
+    # table[j][u] for the current number of baseline items i and j candidate items.
+    table = [[1] for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        row = [[1]]
+        for j in range(1, n2 + 1):
+            # Last item is a baseline item (contributes j to U) or a candidate item.
+            with_base = [0] * j + table[j]
+            without = row[j - 1]
+            size = max(len(with_base), len(without))
+            row.append([
+                (with_base[u] if u < len(with_base) else 0) + (without[u] if u < len(without) else 0)
+                for u in range(size)
+            ])
+        table = row
+    return table[n2]
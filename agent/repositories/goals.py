@@ -2,6 +2,7 @@ from typing import List, Optional
 
 from sqlmodel import Session, select
 
+from agent.database import reader_engine
 from agent.db_models import GoalDB, PlanDB, PlanNodeDB
 
 _TERMINAL_GOAL_STATUSES = {
@@ -22,11 +23,11 @@ def _engine():
 
 class GoalRepository:
     def get_all(self):
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             return session.exec(select(GoalDB).order_by(GoalDB.created_at.desc())).all()
 
     def get_by_id(self, goal_id: str) -> Optional[GoalDB]:
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             return session.get(GoalDB, goal_id)
 
     def save(self, goal: GoalDB):
@@ -84,11 +85,11 @@ class GoalRepository:
 
 class PlanRepository:
     def get_by_id(self, plan_id: str) -> Optional[PlanDB]:
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             return session.get(PlanDB, plan_id)
 
     def get_by_goal_id(self, goal_id: str) -> List[PlanDB]:
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             statement = select(PlanDB).where(PlanDB.goal_id == goal_id).order_by(PlanDB.created_at.desc())
             return session.exec(statement).all()
 
@@ -102,11 +103,11 @@ class PlanRepository:
 
 class PlanNodeRepository:
     def get_by_id(self, node_id: str) -> Optional[PlanNodeDB]:
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             return session.get(PlanNodeDB, node_id)
 
     def get_by_plan_id(self, plan_id: str) -> List[PlanNodeDB]:
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             statement = select(PlanNodeDB).where(PlanNodeDB.plan_id == plan_id).order_by(PlanNodeDB.position.asc())
             return session.exec(statement).all()
 
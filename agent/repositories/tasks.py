@@ -1,19 +1,23 @@
 import copy
+import json
 import logging
 import math
 import time
 from dataclasses import dataclass
 from typing import Any, Callable, List, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import func, insert, or_
 from sqlmodel import Session, delete, select
 
+from agent.database import reader_engine
 from agent.db_models import (
+    TASK_HISTORY_PROJECTION_LIMIT,
     AgentSessionDB,
     ArchivedTaskDB,
     GoalDB,
     PolicySnapshotDB,
     TaskDB,
+    TaskEventDB,
     ToolCallDB,
 )
 from agent.repositories.task_auxiliary_repositories import (
@@ -1948,6 +1952,73 @@ def _preserve_bound_knowledge_index_context(
     return candidate
 
 
+def _history_event_key(event: Any) -> str:
+    return json.dumps(event, sort_keys=True, default=str)
+
+
+def _new_history_events(previous: list, incoming: list) -> list:
+    """Return the events ``incoming`` appended on top of ``previous``.
+
+    Writers append to ``task.history`` and may trim its head to the
+    projection limit, so the incoming list normally starts with a suffix of
+    the persisted one. Rewritten histories fall back to a membership diff.
+    """
+
+    if not incoming:
+        return []
+    if not previous:
+        return list(incoming)
+    previous_keys: list[str | None] = [None] * len(previous)
+
+    def previous_key(index: int) -> str:
+        if previous_keys[index] is None:
+            previous_keys[index] = _history_event_key(previous[index])
+        return previous_keys[index]
+
+    incoming_keys = [_history_event_key(event) for event in incoming]
+    for overlap in range(min(len(previous), len(incoming)), 0, -1):
+        start = len(previous) - overlap
+        if previous_key(len(previous) - 1) != incoming_keys[overlap - 1]:
+            continue
+        if all(previous_key(start + offset) == incoming_keys[offset] for offset in range(overlap)):
+            return list(incoming[overlap:])
+    known = {previous_key(index) for index in range(len(previous))}
+    return [event for event, key in zip(incoming, incoming_keys) if key not in known]
+
+
+def _log_task_history(session: Session, task_id: str, previous_history: list, task: TaskDB) -> None:
+    """Append new history events to ``task_events`` and bound the row projection."""
+
+    history = list(task.history or [])
+    new_events = _new_history_events(previous_history, history)
+    if len(history) > TASK_HISTORY_PROJECTION_LIMIT:
+        task.history = history[-TASK_HISTORY_PROJECTION_LIMIT:]
+    if not new_events:
+        return
+    # seq is computed inside each INSERT, so concurrent appenders never pick
+    # the same number from a stale max(seq) read.
+    next_seq = (
+        select(func.coalesce(func.max(TaskEventDB.seq), 0) + 1)
+        .where(TaskEventDB.task_id == task_id)
+        .scalar_subquery()
+    )
+    for event in new_events:
+        payload = event if isinstance(event, dict) else {"value": event}
+        try:
+            timestamp = float(payload.get("timestamp") or time.time())
+        except (TypeError, ValueError):
+            timestamp = time.time()
+        session.execute(
+            insert(TaskEventDB).values(
+                task_id=task_id,
+                seq=next_seq,
+                event_type=str(payload.get("event_type") or payload.get("type") or "") or None,
+                timestamp=timestamp,
+                payload=payload,
+            )
+        )
+
+
 def _engine():
     from agent.database import engine
 
@@ -1956,11 +2027,11 @@ def _engine():
 
 class TaskRepository:
     def get_all(self):
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             return session.exec(select(TaskDB)).all()
 
     def get_by_id(self, task_id: str) -> Optional[TaskDB]:
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             return session.get(TaskDB, task_id)
 
     def list_stale_reserved_unsloth_cleanup(
@@ -1984,7 +2055,7 @@ class TaskRepository:
             return list(session.exec(statement).all())
 
     def get_by_goal_id(self, goal_id: str) -> List[TaskDB]:
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             return session.exec(select(TaskDB).where(TaskDB.goal_id == goal_id)).all()
 
     def save(self, task: TaskDB):
@@ -2032,10 +2103,12 @@ class TaskRepository:
                         task,
                         session=session,
                     )
+                    _log_task_history(session, task_id, [], task)
                     persisted = session.merge(task)
                     session.commit()
                     session.refresh(persisted)
                     return persisted
+                previous_history = list(authoritative.history or [])
                 prepared = _prepare_existing_task_write(
                     authoritative,
                     task,
@@ -2046,6 +2119,7 @@ class TaskRepository:
                 if prepared is None:
                     return authoritative
                 task = prepared
+                _log_task_history(session, task_id, previous_history, task)
 
                 persisted = session.merge(task)
                 session.commit()
@@ -2347,6 +2421,7 @@ class TaskRepository:
                 # CAS policy can compare it.  The detached copy preserves the
                 # exact row values without copying SQLAlchemy Session state;
                 # closed delta checks still reject unauthorized mutation.
+                previous_history = list(authoritative.history or [])
                 candidate = _detached_task_row_copy(authoritative)
                 candidate.status = normalized_target
                 mutation_timestamp = time.time()
@@ -2373,6 +2448,7 @@ class TaskRepository:
                         task=authoritative,
                         previous_status=previous_status,
                     )
+                _log_task_history(session, normalized_task_id, previous_history, prepared)
                 persisted = session.merge(prepared)
                 session.commit()
                 session.refresh(persisted)
@@ -2391,6 +2467,34 @@ class TaskRepository:
                 return True
             return False
 
+    def purge_events(self, task_id: str) -> int:
+        """Drop the event log of a task; archiving keeps it, only real purges call this."""
+
+        with Session(_engine()) as session:
+            result = session.exec(delete(TaskEventDB).where(TaskEventDB.task_id == task_id))
+            session.commit()
+            return int(result.rowcount or 0)
+
+    def list_events(self, task_id: str, *, after_seq: int = 0, limit: int = 100) -> List[TaskEventDB]:
+        """Page through the append-only history of one task in ``seq`` order."""
+
+        bounded = max(1, min(int(limit), 1000))
+        with Session(reader_engine(_engine())) as session:
+            statement = (
+                select(TaskEventDB)
+                .where(TaskEventDB.task_id == task_id, TaskEventDB.seq > int(after_seq))
+                .order_by(TaskEventDB.seq.asc())
+                .limit(bounded)
+            )
+            return list(session.exec(statement).all())
+
+    def last_event_seq(self, task_id: str) -> int:
+        with Session(reader_engine(_engine())) as session:
+            last_seq = session.exec(
+                select(func.max(TaskEventDB.seq)).where(TaskEventDB.task_id == task_id)
+            ).one()
+            return int(last_seq or 0)
+
     def clear_team_assignments(self, team_id: str) -> int:
         with Session(_engine()) as session:
             statement = select(TaskDB).where(TaskDB.team_id == team_id)
@@ -2427,7 +2531,7 @@ class TaskRepository:
         tenant_id: str | None = None,
         project_id: str | None = None,
     ):
-        with Session(_engine()) as session:
+        with Session(reader_engine(_engine())) as session:
             statement = select(TaskDB)
             if status:
                 statement = statement.where(TaskDB.status == status)
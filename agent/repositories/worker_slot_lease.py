@@ -3,12 +3,18 @@ from __future__ import annotations
 import time
 from typing import List
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
 from agent.database import engine
 from agent.db_models import WorkerSlotLeaseDB
 
 
+def _worker_filter(worker_id: str | None):
+    if worker_id is None:
+        return WorkerSlotLeaseDB.worker_id.is_(None)
+    return WorkerSlotLeaseDB.worker_id == worker_id
+
+
 class WorkerSlotLeaseRepository:
     def get_by_id(self, lease_id: str) -> WorkerSlotLeaseDB | None:
         with Session(engine) as session:
@@ -36,6 +42,53 @@ class WorkerSlotLeaseRepository:
             stmt = select(WorkerSlotLeaseDB).where(WorkerSlotLeaseDB.status == "queued").order_by(WorkerSlotLeaseDB.acquired_at.asc())
             return session.exec(stmt).all()
 
+    def list_open(self) -> List[WorkerSlotLeaseDB]:
+        with Session(engine) as session:
+            stmt = (
+                select(WorkerSlotLeaseDB)
+                .where(WorkerSlotLeaseDB.status.in_(["active", "queued"]))
+                .order_by(WorkerSlotLeaseDB.acquired_at.asc())
+            )
+            return session.exec(stmt).all()
+
+    def list_open_for_worker(self, worker_id: str | None) -> List[WorkerSlotLeaseDB]:
+        with Session(engine) as session:
+            stmt = (
+                select(WorkerSlotLeaseDB)
+                .where(WorkerSlotLeaseDB.status.in_(["active", "queued"]))
+                .where(_worker_filter(worker_id))
+                .order_by(WorkerSlotLeaseDB.acquired_at.asc())
+            )
+            return session.exec(stmt).all()
+
+    def count_open_for_worker(self, worker_id: str | None) -> dict[str, int]:
+        with Session(engine) as session:
+            stmt = (
+                select(WorkerSlotLeaseDB.status, func.count(WorkerSlotLeaseDB.id))
+                .where(WorkerSlotLeaseDB.status.in_(["active", "queued"]))
+                .where(_worker_filter(worker_id))
+                .group_by(WorkerSlotLeaseDB.status)
+            )
+            return {str(status): int(count) for status, count in session.exec(stmt).all()}
+
+    def count_by_status(self) -> dict[str, int]:
+        with Session(engine) as session:
+            stmt = (
+                select(WorkerSlotLeaseDB.status, func.count(WorkerSlotLeaseDB.id))
+                .group_by(WorkerSlotLeaseDB.status)
+            )
+            return {str(status): int(count) for status, count in session.exec(stmt).all()}
+
+    def count_active_by_worker(self) -> dict[str, int]:
+        with Session(engine) as session:
+            stmt = (
+                select(WorkerSlotLeaseDB.worker_id, func.count(WorkerSlotLeaseDB.id))
+                .where(WorkerSlotLeaseDB.status == "active")
+                .where(WorkerSlotLeaseDB.worker_id.is_not(None))
+                .group_by(WorkerSlotLeaseDB.worker_id)
+            )
+            return {str(worker_id): int(count) for worker_id, count in session.exec(stmt).all() if worker_id}
+
     def list_rejected(self) -> List[WorkerSlotLeaseDB]:
         with Session(engine) as session:
             stmt = select(WorkerSlotLeaseDB).where(WorkerSlotLeaseDB.status == "rejected").order_by(WorkerSlotLeaseDB.acquired_at.asc())
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+import threading
 import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -14,6 +18,11 @@ from agent.codecompass.file_type_telemetry import (
 from agent.codecompass.parser_limits import ParserGuardViolation, ParserLimits
 from agent.config import settings
 from agent.hybrid_repository_scan import tracked_code_files, tracked_registry_files
+from agent.repository_map_index import (
+    REPOSITORY_MAP_PARSER_VERSION,
+    RepositoryMapParseCache,
+    SymbolTrigramIndex,
+)
 from agent.repository_map_tree_sitter import resolve_tree_sitter_parser
 
 _LEGACY_CODE_EXTENSIONS = {
@@ -53,6 +62,52 @@ class ContextChunk:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class _ParseOutcome:
+    rel: str
+    state: tuple[float, int]
+    outcome: str
+    duration_seconds: float
+    symbols: list[str] = field(default_factory=list)
+    fallback_reason: str | None = None
+    diagnostic: dict[str, object] | None = None
+    diagnostics: tuple[str, ...] = ()
+
+
+_PARSE_WORKER_ENGINE: "RepositoryMapEngine | None" = None
+
+
+def _init_parse_worker(repo_root: str, max_files: int, max_symbols_per_file: int, limits: ParserLimits) -> None:
+    global _PARSE_WORKER_ENGINE
+    _PARSE_WORKER_ENGINE = RepositoryMapEngine(
+        repo_root,
+        max_files=max_files,
+        max_symbols_per_file=max_symbols_per_file,
+        limits=limits,
+        parse_workers=1,
+    )
+
+
+def _parse_in_worker(item: tuple[str, str, tuple[float, int]]) -> _ParseOutcome:
+    file_path, rel, state = item
+    assert _PARSE_WORKER_ENGINE is not None
+    return _PARSE_WORKER_ENGINE._parse_file(Path(file_path), rel, state)
+
+
+def _run_worktree_probe(engine_ref: "weakref.ref[RepositoryMapEngine]", interval: float) -> None:
+    # Only a weak reference, so the thread ends once its engine is collected.
+    while True:
+        time.sleep(interval)
+        engine = engine_ref()
+        if engine is None:
+            return
+        try:
+            engine.probe_worktree()
+        except Exception as exc:
+            logging.debug(f"Repository-map worktree probe failed: {exc}")
+        del engine
+
+
 class RepositoryMapEngine:
     """Aider-style repository symbol map with incremental cache invalidation."""
 
@@ -87,6 +142,11 @@ class RepositoryMapEngine:
         "struct_item",
         "impl_item",
     }
+    # Below this many changed files the process-pool start-up costs more than
+    # it saves; warm restarts with a parse cache stay sequential.
+    PARALLEL_PARSE_MIN_FILES = 200
+    # Files stat()ed by the worktree probe before it yields the GIL.
+    WORKTREE_PROBE_SLICE = 512
     VERIFIED_REGEX_FALLBACK_EXTENSIONS = {
         ".py",
         ".js",
@@ -102,11 +162,28 @@ class RepositoryMapEngine:
         *,
         limits: ParserLimits | None = None,
         telemetry: FileTypeTelemetryPort | None = None,
+        cache_path: str | Path | None = None,
+        parse_workers: int | None = None,
+        rescan_interval_seconds: float = 30.0,
+        worktree_probe_interval_seconds: float = 5.0,
     ) -> None:
         self.repo_root = Path(repo_root).resolve()
         self.max_files = max_files
         self.max_symbols_per_file = max_symbols_per_file
+        self.parse_workers = parse_workers
+        self.rescan_interval_seconds = max(0.0, float(rescan_interval_seconds))
+        self.worktree_probe_interval_seconds = max(0.0, float(worktree_probe_interval_seconds))
         self._symbol_graph: dict[str, list[str]] = {}
+        self._symbol_index = SymbolTrigramIndex()
+        self._path_roots_cache: tuple[int, dict[str, tuple[str, str]]] | None = None
+        self._parse_cache = (
+            RepositoryMapParseCache(
+                cache_path,
+                parser_version=f"{REPOSITORY_MAP_PARSER_VERSION}:{max_symbols_per_file}",
+            )
+            if cache_path
+            else None
+        )
         self._file_state: dict[str, tuple[float, int]] = {}
         self._tree_sitter_parser_cache: dict[str, object | None] = {}
         self._file_type_registry = _load_repository_file_type_registry(self.repo_root)
@@ -114,6 +191,10 @@ class RepositoryMapEngine:
         self._telemetry = telemetry or observe_file_type_parser_result
         self._parser_diagnostics: dict[str, dict[str, object]] = {}
         self._last_scan_ts = 0.0
+        self._scan_signature: tuple | None = None
+        self._stale = True
+        self._git_dir = self._find_git_dir(self.repo_root)
+        self._probe_thread: threading.Thread | None = None
 
     def parser_diagnostics(self) -> tuple[dict[str, object], ...]:
         """Return deterministic, bounded diagnostics from the latest file states."""
@@ -303,23 +384,46 @@ class RepositoryMapEngine:
     def _normalize_path_label(value: str) -> str:
         return re.sub(r"[^a-z0-9]+", "-", str(value or "").lower()).strip("-")
 
-    def _path_focus_for_query(self, query: str, paths: list[str]) -> dict[str, object] | None:
-        query_label = self._normalize_path_label(query)
-        if not query_label:
-            return None
-        candidate_roots: dict[str, int] = {}
+    @classmethod
+    def _path_roots(cls, paths) -> dict[str, tuple[str, str]]:
+        """Map depth-1/2 directory roots to their (label, basename label)."""
+
+        roots: dict[str, tuple[str, str]] = {}
         for rel_path in paths:
             parts = [part for part in str(rel_path or "").replace("\\", "/").split("/") if part]
             for depth in (1, 2):
                 if len(parts) < depth:
                     continue
                 root = "/".join(parts[:depth])
-                label = self._normalize_path_label(root)
-                basename_label = self._normalize_path_label(parts[depth - 1])
+                if root in roots:
+                    continue
+                label = cls._normalize_path_label(root)
+                basename_label = cls._normalize_path_label(parts[depth - 1])
                 if not label or len(basename_label) < 4:
                     continue
-                if label in query_label or basename_label in query_label:
-                    candidate_roots[root] = max(candidate_roots.get(root, 0), len(label))
+                roots[root] = (label, basename_label)
+        return roots
+
+    def _indexed_path_roots(self) -> dict[str, tuple[str, str]]:
+        generation = self._symbol_index.generation
+        if self._path_roots_cache is None or self._path_roots_cache[0] != generation:
+            self._path_roots_cache = (generation, self._path_roots(self._symbol_graph))
+        return self._path_roots_cache[1]
+
+    def _path_focus_for_query(
+        self,
+        query: str,
+        paths: list[str],
+        *,
+        roots: dict[str, tuple[str, str]] | None = None,
+    ) -> dict[str, object] | None:
+        query_label = self._normalize_path_label(query)
+        if not query_label:
+            return None
+        candidate_roots: dict[str, int] = {}
+        for root, (label, basename_label) in (roots if roots is not None else self._path_roots(paths)).items():
+            if label in query_label or basename_label in query_label:
+                candidate_roots[root] = len(label)
         # Apply configurable alias expansion: if a known alias keyword appears in the
         # query label, treat the mapped path prefixes as if they were named in the query.
         # Configured via settings.rag_path_focus_aliases (dict[str, list[str]]).
@@ -390,13 +494,235 @@ class RepositoryMapEngine:
         normalized = str(path or "").replace("\\", "/")
         return any(normalized == str(prefix).rstrip("/") or normalized.startswith(str(prefix)) for prefix in prefixes)
 
-    def build(self, force: bool = False) -> None:
-        now = time.time()
-        if not force and (now - self._last_scan_ts < 1.0):
+    def _parse_file(self, file_path: Path, rel: str, state: tuple[float, int]) -> _ParseOutcome:
+        """Extract symbols for one file without touching engine state.
+
+        Runs in the calling process or inside a parse worker; the caller
+        applies the outcome so diagnostics and telemetry stay in one place.
+        """
+
+        parse_started = time.perf_counter()
+        fallback_reason: str | None = None
+        try:
+            with file_path.open("rb") as handle:
+                raw = handle.read(self._limits.max_file_bytes + 1)
+            text = raw.decode("utf-8")
+            self._limits.preflight(path=rel, content=text)
+            budget = self._limits.budget()
+            if file_path.suffix.lower() in {".jsonl", ".json"}:
+                symbols = self._extract_symbols_jsonl(text)
+            else:
+                symbols = self._extract_symbols_tree_sitter(file_path, text)
+                if not symbols:
+                    symbols = self._extract_symbols_regex(text)
+                    fallback_reason = "parser_fallback"
+            budget.check_time()
+            budget.check_record_count(len(symbols))
+        except ParserGuardViolation as exc:
+            logging.debug("Skipping repository-map input '%s': %s", file_path, exc)
+            return _ParseOutcome(
+                rel=rel,
+                state=state,
+                outcome="failed" if exc.diagnostic_code == "parser_timeout" else "excluded",
+                duration_seconds=time.perf_counter() - parse_started,
+                diagnostic=exc.as_diagnostic(path=rel),
+                diagnostics=(exc.diagnostic_code,),
+            )
+        except Exception as e:
+            logging.debug(f"Failed reading source file '{file_path}': {e}")
+            return _ParseOutcome(
+                rel=rel,
+                state=state,
+                outcome="failed",
+                duration_seconds=time.perf_counter() - parse_started,
+                diagnostic={
+                    "severity": "warning",
+                    "code": "file_read_failed",
+                    "reason_code": type(e).__name__,
+                    "message": "Repository-map source could not be read safely.",
+                    "path": rel,
+                    "line": None,
+                },
+                diagnostics=("file_read_failed",),
+            )
+        return _ParseOutcome(
+            rel=rel,
+            state=state,
+            outcome="indexed",
+            duration_seconds=time.perf_counter() - parse_started,
+            symbols=symbols,
+            fallback_reason=fallback_reason,
+        )
+
+    def _apply_parse_outcome(self, result: _ParseOutcome) -> None:
+        rel = result.rel
+        if result.diagnostic is not None:
+            self._parser_diagnostics[rel] = result.diagnostic
+            self._set_symbols(rel, [])
+            if self._parse_cache is not None:
+                self._parse_cache.discard(rel)
+        else:
+            self._parser_diagnostics.pop(rel, None)
+            self._set_symbols(rel, result.symbols)
+            if self._parse_cache is not None:
+                self._parse_cache.put(rel, result.state, result.symbols)
+        self._observe_parser_result(
+            path=rel,
+            duration_seconds=result.duration_seconds,
+            byte_size=result.state[1],
+            outcome=result.outcome,
+            symbol_count=len(result.symbols),
+            fallback_reason=result.fallback_reason,
+            diagnostics=result.diagnostics,
+        )
+
+    def _set_symbols(self, rel: str, symbols: list[str]) -> None:
+        self._sync_symbol_index()
+        if symbols:
+            self._symbol_graph[rel] = symbols
+            self._symbol_index.update(rel, symbols)
+        else:
+            self._symbol_graph.pop(rel, None)
+            self._symbol_index.remove(rel)
+
+    def _sync_symbol_index(self) -> None:
+        # Callers (and tests) may swap ``_symbol_graph`` wholesale; rebuild the
+        # postings whenever the index no longer describes the current dict.
+        if self._symbol_index.source is not self._symbol_graph:
+            self._symbol_index.rebuild(self._symbol_graph)
+
+    def _parse_pending(self, pending: list[tuple[Path, str, tuple[float, int]]]) -> list[_ParseOutcome]:
+        workers = self._effective_parse_workers(len(pending))
+        if workers <= 1:
+            return [self._parse_file(file_path, rel, state) for file_path, rel, state in pending]
+        chunksize = max(1, len(pending) // (workers * 8))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_parse_worker,
+                initargs=(str(self.repo_root), self.max_files, self.max_symbols_per_file, self._limits),
+            ) as pool:
+                return list(
+                    pool.map(
+                        _parse_in_worker,
+                        [(str(file_path), rel, state) for file_path, rel, state in pending],
+                        chunksize=chunksize,
+                    )
+                )
+        except Exception as exc:
+            logging.warning("Parallel repository-map parse failed; parsing sequentially: %s", exc)
+            return [self._parse_file(file_path, rel, state) for file_path, rel, state in pending]
+
+    def _effective_parse_workers(self, pending_count: int) -> int:
+        if pending_count < self.PARALLEL_PARSE_MIN_FILES:
+            return 1
+        configured = self.parse_workers
+        if configured is None:
+            configured = int(getattr(settings, "rag_repository_map_parse_workers", 0) or 0)
+        if configured <= 0:
+            configured = os.cpu_count() or 1
+        # Keep at least ~100 files per worker so pool start-up cost amortises.
+        return max(1, min(configured, pending_count // 100))
+
+    @staticmethod
+    def _find_git_dir(repo_root: Path) -> Path | None:
+        for candidate in (repo_root, *repo_root.parents):
+            marker = candidate / ".git"
+            if marker.is_dir():
+                return marker
+            if marker.is_file():  # worktrees and submodules point at their git dir
+                try:
+                    text = marker.read_text(encoding="utf-8").strip()
+                except OSError:
+                    return None
+                if text.startswith("gitdir:"):
+                    return (candidate / text.split(":", 1)[1].strip()).resolve()
+                return None
+        return None
+
+    def _change_signature(self) -> tuple | None:
+        """Stat of the git index and HEAD: two stat() calls instead of a tree sweep.
+
+        ``git add``/``commit``/``checkout``/``pull`` and ``git status`` all
+        rewrite the index, so a changed signature is a cheap hint that the
+        tracked file set or its contents moved.
+        """
+        if self._git_dir is None:
+            return None
+        signature = []
+        for name in ("index", "HEAD"):
+            try:
+                stat = (self._git_dir / name).stat()
+            except OSError:
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def probe_worktree(self) -> bool:
+        """Mark the map stale if an indexed file was edited or removed.
+
+        Runs on the background probe thread (see ``worktree_probe_interval_seconds``)
+        so unstaged edits are noticed without a per-query stat() sweep; it
+        yields between slices to keep the sweep from starving searches.
+        """
+        if self._stale:
+            return True
+        snapshot = list(self._file_state.items())
+        for start in range(0, len(snapshot), self.WORKTREE_PROBE_SLICE):
+            for rel, state in snapshot[start : start + self.WORKTREE_PROBE_SLICE]:
+                try:
+                    stat = (self.repo_root / rel).stat()
+                except OSError:
+                    self._stale = True
+                    return True
+                if (stat.st_mtime, stat.st_size) != state:
+                    self._stale = True
+                    return True
+            time.sleep(0)
+        return False
+
+    def _ensure_worktree_probe(self) -> None:
+        if self.worktree_probe_interval_seconds <= 0:
+            return
+        if self._probe_thread is not None and self._probe_thread.is_alive():
             return
-        self._last_scan_ts = now
+        self._probe_thread = threading.Thread(
+            target=_run_worktree_probe,
+            args=(weakref.ref(self), self.worktree_probe_interval_seconds),
+            name="repository-map-worktree-probe",
+            daemon=True,
+        )
+        self._probe_thread.start()
+
+    def invalidate(self) -> None:
+        """Make the next :meth:`search` rescan, e.g. after writing files."""
+        self._stale = True
+
+    def _refresh(self) -> None:
+        signature = self._change_signature()
+        if (
+            self._stale
+            or signature != self._scan_signature
+            or time.time() - self._last_scan_ts >= self.rescan_interval_seconds
+        ):
+            self.build()
+
+    def build(self, force: bool = False) -> None:
+        """Rescan tracked files; ``force`` also re-parses unchanged ones.
+
+        :meth:`search` only calls this on the first query, when the git
+        index or HEAD changed, after :meth:`invalidate` or a worktree probe
+        saw an edited or removed file, or once ``rescan_interval_seconds``
+        passed as a safety net for newly created files.
+        """
+        self._last_scan_ts = time.time()
+        self._scan_signature = self._change_signature()
+        self._stale = False
+        self._sync_symbol_index()
 
         active: set[str] = set()
+        pending: list[tuple[Path, str, tuple[float, int]]] = []
         for file_path in self._tracked_files():
             rel = str(file_path.relative_to(self.repo_root))
             active.add(rel)
@@ -409,81 +735,31 @@ class RepositoryMapEngine:
             if not force and self._file_state.get(rel) == state:
                 continue
             self._file_state[rel] = state
-            parse_started = time.perf_counter()
-            fallback_reason: str | None = None
-            try:
-                with file_path.open("rb") as handle:
-                    raw = handle.read(self._limits.max_file_bytes + 1)
-                text = raw.decode("utf-8")
-                self._limits.preflight(path=rel, content=text)
-                budget = self._limits.budget()
-                if file_path.suffix.lower() in {".jsonl", ".json"}:
-                    symbols = self._extract_symbols_jsonl(text)
-                else:
-                    symbols = self._extract_symbols_tree_sitter(file_path, text)
-                    if not symbols:
-                        symbols = self._extract_symbols_regex(text)
-                        fallback_reason = "parser_fallback"
-                budget.check_time()
-                budget.check_record_count(len(symbols))
-            except ParserGuardViolation as exc:
-                logging.debug("Skipping repository-map input '%s': %s", file_path, exc)
-                self._parser_diagnostics[rel] = exc.as_diagnostic(path=rel)
-                self._symbol_graph.pop(rel, None)
-                self._observe_parser_result(
-                    path=rel,
-                    started=parse_started,
-                    byte_size=stat.st_size,
-                    outcome=(
-                        "failed" if exc.diagnostic_code == "parser_timeout" else "excluded"
-                    ),
-                    diagnostics=(exc.diagnostic_code,),
-                )
-                continue
-            except Exception as e:
-                logging.debug(f"Failed reading source file '{file_path}': {e}")
-                self._parser_diagnostics[rel] = {
-                    "severity": "warning",
-                    "code": "file_read_failed",
-                    "reason_code": type(e).__name__,
-                    "message": "Repository-map source could not be read safely.",
-                    "path": rel,
-                    "line": None,
-                }
-                self._symbol_graph.pop(rel, None)
-                self._observe_parser_result(
-                    path=rel,
-                    started=parse_started,
-                    byte_size=stat.st_size,
-                    outcome="failed",
-                    diagnostics=("file_read_failed",),
-                )
+            cached = self._parse_cache.get(rel, state) if self._parse_cache is not None and not force else None
+            if cached is not None:
+                self._parser_diagnostics.pop(rel, None)
+                self._set_symbols(rel, cached)
                 continue
-            self._parser_diagnostics.pop(rel, None)
-            if symbols:
-                self._symbol_graph[rel] = symbols
-            else:
-                self._symbol_graph.pop(rel, None)
-            self._observe_parser_result(
-                path=rel,
-                started=parse_started,
-                byte_size=stat.st_size,
-                outcome="indexed",
-                symbol_count=len(symbols),
-                fallback_reason=fallback_reason,
-            )
+            pending.append((file_path, rel, state))
+
+        for result in self._parse_pending(pending):
+            self._apply_parse_outcome(result)
 
         removed = set(self._file_state.keys()) - active
         for rel in removed:
             self._file_state.pop(rel, None)
-            self._symbol_graph.pop(rel, None)
+            self._set_symbols(rel, [])
             self._parser_diagnostics.pop(rel, None)
+        if self._parse_cache is not None:
+            self._parse_cache.retain(active)
+            self._parse_cache.flush()
+        self._ensure_worktree_probe()
 
     def _observe_parser_result(
         self,
         *,
         path: str,
-        started: float,
+        duration_seconds: float,
         byte_size: int,
         outcome: str,
         symbol_count: int = 0,
@@ -495,7 +771,7 @@ class RepositoryMapEngine:
             pipeline="repository_map",
             path=path,
             outcome=outcome,
-            duration_seconds=time.perf_counter() - started,
+            duration_seconds=duration_seconds,
             byte_size=byte_size,
             symbol_count=symbol_count,
             edge_count=0,
@@ -565,28 +841,35 @@ class RepositoryMapEngine:
         top_k: int = 5,
         allowed_paths: list[str] | None = None,
     ) -> list[ContextChunk]:
-        self.build()
+        self._refresh()
         if not self._symbol_graph:
             return []
+        self._sync_symbol_index()
+        tokens = {
+            t.lower() for t in re.findall(r"[A-Za-z0-9_]+", query)
+            if len(t) >= 3 and t.lower() not in self._REPO_STOP_TOKENS
+        }
+        # Only files whose path or symbols can contain a query token are
+        # scored; the trigram index yields a superset that the exact substring
+        # checks below narrow down.
+        candidate_paths = self._symbol_index.candidates_for_tokens(tokens)
         # CCRDS-009: with an active domain scope only candidates inside the
         # allowed paths are scored at all; without scope nothing changes.
-        symbol_items = list(self._symbol_graph.items())
         if allowed_paths is not None:
             from agent.codecompass.domain_scope import is_path_within
-            symbol_items = [
-                (rel, syms) for rel, syms in symbol_items
-                if is_path_within(rel, allowed_paths)
-            ]
-            if not symbol_items:
+            scoped_paths = [rel for rel in self._symbol_graph if is_path_within(rel, allowed_paths)]
+            if not scoped_paths:
                 return []
-        tokens = {
-            t.lower() for t in re.findall(r"[A-Za-z0-9_]+", query)
-            if len(t) >= 3 and t.lower() not in self._REPO_STOP_TOKENS
-        }
-        path_focus = self._path_focus_for_query(
-            query,
-            [str(path) for path, _symbols in symbol_items],
-        )
+            scoped = set(scoped_paths)
+            candidate_paths &= scoped
+            path_focus = self._path_focus_for_query(query, scoped_paths)
+        else:
+            path_focus = self._path_focus_for_query(
+                query,
+                list(self._symbol_graph),
+                roots=self._indexed_path_roots(),
+            )
+        symbol_items = [(rel, self._symbol_graph[rel]) for rel in sorted(candidate_paths)]
         # Source-First Selector: when a query contains a domain-like token
         # (a non-stopword token of length ≥ 4), source files whose filename
         # stem contains that token outrank test files that merely mention
@@ -744,7 +1027,7 @@ class RepositoryMapEngine:
                 for path in list(path_focus.get("anchor_paths") or [])
                 if str(path).strip()
             ]
-            symbol_by_path = dict(symbol_items)
+            symbol_by_path = self._symbol_graph
             max_score = max([chunk.score for chunk in candidates], default=1.0)
             anchor_score = max_score * 0.72
             alias_anchor_set = set(path_focus.get("alias_anchor_paths") or [])
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+# Bump whenever symbol extraction changes in a way that invalidates cached
+# parse results (node types, qualification rules, fallback patterns).
+REPOSITORY_MAP_PARSER_VERSION = 1
+
+
+def _trigrams(value: str) -> set[str]:
+    return {value[index : index + 3] for index in range(len(value) - 2)}
+
+
+class SymbolTrigramIndex:
+    """Trigram postings over lower-cased repository paths and symbols.
+
+    The index answers "which files can contain this token as a substring" so
+    that ``RepositoryMapEngine.search`` only scores plausible files. Results are
+    a superset of the exact matches; callers still verify with ``in``.
+    """
+
+    MIN_TOKEN_LENGTH = 3
+
+    def __init__(self) -> None:
+        self._postings: dict[str, set[str]] = {}
+        self._file_trigrams: dict[str, set[str]] = {}
+        self.generation = 0
+        self.source: object | None = None
+
+    def __len__(self) -> int:
+        return len(self._file_trigrams)
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._file_trigrams.clear()
+        self.generation += 1
+
+    def rebuild(self, symbol_graph: dict[str, list[str]]) -> None:
+        self.clear()
+        for rel_path, symbols in symbol_graph.items():
+            self.update(rel_path, symbols)
+        self.source = symbol_graph
+
+    def update(self, rel_path: str, symbols: Iterable[str]) -> None:
+        self.remove(rel_path)
+        grams = _trigrams(rel_path.lower())
+        for symbol in symbols:
+            grams |= _trigrams(str(symbol).lower())
+        self._file_trigrams[rel_path] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(rel_path)
+        self.generation += 1
+
+    def remove(self, rel_path: str) -> None:
+        grams = self._file_trigrams.pop(rel_path, None)
+        if grams is None:
+            return
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(rel_path)
+            if not posting:
+                del self._postings[gram]
+        self.generation += 1
+
+    def candidates(self, token: str) -> set[str]:
+        """Return files whose path or symbols may contain ``token``."""
+
+        grams = _trigrams(token.lower())
+        if not grams:
+            return set(self._file_trigrams)
+        postings = sorted((self._postings.get(gram) for gram in grams), key=lambda item: len(item or ()))
+        if not postings or not postings[0]:
+            return set()
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting  # type: ignore[operator]
+            if not result:
+                break
+        return result
+
+    def candidates_for_tokens(self, tokens: Iterable[str]) -> set[str]:
+        result: set[str] = set()
+        for token in tokens:
+            result |= self.candidates(token)
+        return result
+
+
+class RepositoryMapParseCache:
+    """JSON-backed symbol cache keyed by ``(path, mtime, size, parser version)``.
+
+    The cache survives process restarts so a warm start only re-parses files
+    whose stat signature changed. A parser-version or configuration mismatch
+    discards the whole file instead of mixing incompatible symbol lists.
+    """
+
+    def __init__(self, path: str | Path, *, parser_version: str) -> None:
+        self.path = Path(path)
+        self.parser_version = str(parser_version)
+        self._entries: dict[str, tuple[float, int, list[str]]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logging.debug("Ignoring unreadable repository-map parse cache '%s': %s", self.path, exc)
+            return
+        if not isinstance(payload, dict) or str(payload.get("parser_version")) != self.parser_version:
+            self._dirty = True
+            return
+        for rel_path, entry in dict(payload.get("entries") or {}).items():
+            try:
+                mtime, size, symbols = entry
+                self._entries[str(rel_path)] = (float(mtime), int(size), [str(item) for item in symbols])
+            except (TypeError, ValueError):
+                self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, rel_path: str, state: tuple[float, int]) -> list[str] | None:
+        entry = self._entries.get(rel_path)
+        if entry is None or (entry[0], entry[1]) != state:
+            return None
+        return list(entry[2])
+
+    def put(self, rel_path: str, state: tuple[float, int], symbols: list[str]) -> None:
+        entry = (float(state[0]), int(state[1]), list(symbols))
+        if self._entries.get(rel_path) == entry:
+            return
+        self._entries[rel_path] = entry
+        self._dirty = True
+
+    def discard(self, rel_path: str) -> None:
+        if self._entries.pop(rel_path, None) is not None:
+            self._dirty = True
+
+    def retain(self, rel_paths: set[str]) -> None:
+        stale = set(self._entries) - rel_paths
+        for rel_path in stale:
+            del self._entries[rel_path]
+        if stale:
+            self._dirty = True
+
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+        payload = {
+            "parser_version": self.parser_version,
+            "entries": {rel: [mtime, size, symbols] for rel, (mtime, size, symbols) in self._entries.items()},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=".parse_cache.", dir=str(self.path.parent))
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_name, self.path)
+            self._dirty = False
+        except Exception as exc:
+            logging.debug("Failed writing repository-map parse cache '%s': %s", self.path, exc)
@@ -7,7 +7,7 @@ from flask import Blueprint, current_app, request
 from agent.auth import admin_required, check_auth
 from agent.common.audit import log_audit
 from agent.common.errors import api_response
-from agent.llm_benchmarks import load_benchmarks, record_benchmark_sample, timeseries_from_samples
+from agent.llm_benchmarks import benchmark_store, record_benchmark_sample, timeseries_from_samples
 from agent.llm_integration import _load_lmstudio_history
 
 from . import shared
@@ -83,21 +83,21 @@ def get_llm_benchmarks_timeseries():
     retention = shared.benchmark_retention_settings()
     min_ts = int(time.time()) - (days * 86400)
     effective_min_ts = max(min_ts, int(time.time()) - (retention["max_days"] * 86400))
-    db = load_benchmarks(current_app.config.get("DATA_DIR") or "data")
+    store = benchmark_store(current_app.config.get("DATA_DIR") or "data")
     items = []
-    for key, entry in (db.get("models") or {}).items():
-        if not isinstance(entry, dict):
-            continue
+    for key, entry in store.entities("model").items():
         entry_provider = str(entry.get("provider") or "").strip().lower()
         entry_model = str(entry.get("model") or "").strip()
         if provider and entry_provider != provider:
             continue
         if model and entry_model != model:
             continue
-        source_bucket = entry.get("overall") or {}
-        if task_kind in shared._BENCH_TASK_KINDS:
-            source_bucket = (entry.get("task_kinds") or {}).get(task_kind) or {}
-        samples = [sample for sample in (source_bucket.get("samples") or []) if int((sample or {}).get("ts") or 0) >= effective_min_ts]
+        samples = store.samples(
+            "model",
+            key,
+            task_kind=task_kind if task_kind in shared._BENCH_TASK_KINDS else None,
+            min_ts=effective_min_ts,
+        )
         items.append(
             {
                 "id": key,
@@ -108,7 +108,9 @@ def get_llm_benchmarks_timeseries():
                 "points": timeseries_from_samples(samples, bucket=bucket),
             }
         )
-    return api_response(data={"updated_at": db.get("updated_at"), "days": days, "bucket": bucket, "retention": retention, "items": items})
+    return api_response(
+        data={"updated_at": store.updated_at(), "days": days, "bucket": bucket, "retention": retention, "items": items}
+    )
 
 
 @benchmarks_bp.route("/llm/benchmarks/config", methods=["GET"])
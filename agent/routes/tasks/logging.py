@@ -4,11 +4,12 @@ import os
 from queue import Empty, Queue
 
 import portalocker
-from flask import Blueprint, Response, current_app
+from flask import Blueprint, Response, current_app, request
 
 from agent.auth import check_auth
 from agent.common.errors import api_response
-from agent.routes.tasks.utils import _get_local_task_status, _subscribers_lock, _task_subscribers
+from agent.routes.tasks.utils import _get_local_task_status, _subscribers_lock, _task_subscribers, task_repo
+from agent.services.repository_registry import get_repository_registry
 
 logging_bp = Blueprint("tasks_logging", __name__)
 
@@ -65,6 +66,55 @@ def task_logs(tid):
     return api_response(data=task.get("history", []))
 
 
+def _event_entry(event) -> dict:
+    entry = dict(event.payload or {})
+    entry["seq"] = event.seq
+    return entry
+
+
+@logging_bp.route("/tasks/<tid>/events", methods=["GET"])
+@check_auth
+def task_events(tid):
+    """
+    Vollständige Task-Historie seitenweise abrufen
+    ---
+    parameters:
+      - name: tid
+        in: path
+        type: string
+        required: true
+      - name: after_seq
+        in: query
+        type: integer
+        required: false
+      - name: limit
+        in: query
+        type: integer
+        required: false
+    responses:
+      200:
+        description: Ereignisse mit seq > after_seq und Cursor für die nächste Seite
+    """
+    # Archivierte Tasks behalten ihr vollständiges Ereignis-Log.
+    task = _get_local_task_status(tid) or get_repository_registry().archived_task_repo.get_by_id(tid)
+    if not task:
+        return api_response(status="error", message="not_found", code=404)
+    try:
+        after_seq = max(0, int(request.args.get("after_seq", 0)))
+        limit = max(1, min(int(request.args.get("limit", 100)), 1000))
+    except (TypeError, ValueError):
+        return api_response(status="error", message="invalid_paging", code=400)
+    events = task_repo.list_events(tid, after_seq=after_seq, limit=limit + 1)
+    page = events[:limit]
+    return api_response(
+        data={
+            "items": [_event_entry(event) for event in page],
+            "next_after_seq": page[-1].seq if page else after_seq,
+            "has_more": len(events) > limit,
+        }
+    )
+
+
 @logging_bp.route("/tasks/<tid>/stream-logs", methods=["GET"])
 @check_auth
 def stream_task_logs(tid):
@@ -87,17 +137,21 @@ def stream_task_logs(tid):
             _task_subscribers.append((tid, q))
 
         try:
-            last_idx = 0
+            # Replay the bounded projection once, then follow the append-only
+            # event log so the stream keeps going past the projection cap.
+            last_seq = task_repo.last_event_seq(tid)
+            task = _get_local_task_status(tid)
+            if task:
+                for entry in task.get("history", []):
+                    yield f"data: {json.dumps(entry)}\n\n"
             while True:
                 task = _get_local_task_status(tid)
                 if not task:
                     break
 
-                history = task.get("history", [])
-                if len(history) > last_idx:
-                    for i in range(last_idx, len(history)):
-                        yield f"data: {json.dumps(history[i])}\n\n"
-                    last_idx = len(history)
+                for event in task_repo.list_events(tid, after_seq=last_seq, limit=1000):
+                    yield f"data: {json.dumps(event.payload or {})}\n\n"
+                    last_seq = event.seq
 
                 if task.get("status") in ("completed", "failed"):
                     break
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import shutil
+import tempfile
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from agent.hybrid_context_support import build_file_manifest, read_manifest, write_manifest
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+def tokenize(text: str, stop_tokens: frozenset[str] = frozenset()) -> list[str]:
+    return [
+        token
+        for token in (raw.lower() for raw in _TOKEN_RE.findall(text))
+        if len(token) >= 3 and token not in stop_tokens
+    ]
+
+
+def split_chunks(text: str, chunk_chars: int) -> list[str]:
+    """Split text into roughly ``chunk_chars`` sized chunks at whitespace."""
+
+    chunks: list[str] = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(length, start + chunk_chars)
+        if end < length:
+            cut = text.rfind("\n", start + chunk_chars // 2, end)
+            if cut < 0:
+                cut = text.rfind(" ", start + chunk_chars // 2, end)
+            if cut > start:
+                end = cut + 1
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = end
+    return chunks
+
+
+@dataclass(frozen=True, slots=True)
+class Bm25Hit:
+    source: str
+    content: str
+    score: float
+    chunk_no: int
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_name, path)
+    except Exception:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class _Run:
+    """One immutable merged run: term dictionary, chunk metadata and mmaps."""
+
+    def __init__(self, directory: Path, dead: Iterable[str]) -> None:
+        meta = json.loads((directory / "index.json").read_text(encoding="utf-8"))
+        self.terms = {term: (int(entry[0]), int(entry[1])) for term, entry in dict(meta.get("terms") or {}).items()}
+        self.chunks = [tuple(item) for item in list(meta.get("chunks") or [])]
+        dead_sources = set(dead)
+        # Chunks of sources that were re-tokenized into a newer run stay in
+        # the postings until the run is merged away; queries skip them.
+        self.live = bytearray(0 if chunk[0] in dead_sources else 1 for chunk in self.chunks)
+        self.postings_mm = Bm25FallbackIndex._map(directory / "postings.bin")
+        self.text_mm = Bm25FallbackIndex._map(directory / "chunks.bin")
+
+    def close(self) -> None:
+        for handle in (self.postings_mm, self.text_mm):
+            if handle is not None:
+                handle.close()
+        self.postings_mm = None
+        self.text_mm = None
+
+
+class Bm25FallbackIndex:
+    """Disk-backed BM25 index over document chunks.
+
+    Each source file is tokenized once into a per-file segment; segments are
+    only rebuilt for files whose manifest entry (mtime/size) changed. Changed
+    files are merged into a new run of flat ``uint32`` ``(chunk_id,
+    term_frequency)`` postings that is read through ``mmap`` at query time,
+    and their chunks in older runs are marked dead. A tiered merge policy
+    combines ``MERGE_FACTOR`` runs of the same size tier, or rewrites a run
+    that is mostly dead, so a sync only re-reads the segments of the runs it
+    selects instead of the whole corpus.
+    """
+
+    FORMAT_VERSION = 2
+    MERGE_FACTOR = 4
+
+    def __init__(
+        self,
+        index_dir: str | Path,
+        *,
+        chunk_chars: int = 2000,
+        max_chars_per_file: int = 2_000_000,
+        stop_tokens: frozenset[str] = frozenset(),
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        self.index_dir = Path(index_dir)
+        self.chunk_chars = max(200, int(chunk_chars))
+        self.max_chars_per_file = max_chars_per_file
+        self.stop_tokens = stop_tokens
+        self.k1 = k1
+        self.b = b
+        self._runs: list[_Run] | None = None
+        self._live_chunks = 0
+        self._avg_length = 0.0
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.index_dir / "manifest.json"
+
+    @property
+    def _catalog_path(self) -> Path:
+        return self.index_dir / "index.json"
+
+    @property
+    def _segments_dir(self) -> Path:
+        return self.index_dir / "segments"
+
+    @property
+    def _runs_dir(self) -> Path:
+        return self.index_dir / "runs"
+
+    def _segment_path(self, source: str) -> Path:
+        return self._segments_dir / f"{hashlib.sha1(source.encode('utf-8', errors='ignore')).hexdigest()}.json"
+
+    def _run_dir(self, run_id: int) -> Path:
+        return self._runs_dir / f"run-{int(run_id):06d}"
+
+    def sync(self, files: list[Path]) -> int:
+        """Bring the index in line with ``files``; return re-tokenized file count."""
+
+        current = build_file_manifest(files)
+        previous = read_manifest(self._manifest_path)
+        if (
+            previous.get("fingerprint") == current.get("fingerprint")
+            and previous.get("format_version") == self.FORMAT_VERSION
+            and self._catalog_path.exists()
+        ):
+            self._open()
+            return 0
+
+        self.close()
+        rebuild = previous.get("format_version") != self.FORMAT_VERSION or not self._catalog_path.exists()
+        previous_files = {} if rebuild else dict(previous.get("files") or {})
+        current_files = dict(current.get("files") or {})
+        if rebuild:
+            catalog: dict = {"format_version": self.FORMAT_VERSION, "next_run": 1, "runs": []}
+            shutil.rmtree(self._runs_dir, ignore_errors=True)
+            for name in ("postings.bin", "chunks.bin"):  # single-run layout of format 1
+                (self.index_dir / name).unlink(missing_ok=True)
+        else:
+            catalog = self._read_catalog()
+        self._segments_dir.mkdir(parents=True, exist_ok=True)
+        changed: list[str] = []
+        for source, entry in current_files.items():
+            if previous_files.get(source) == entry and self._segment_path(source).exists():
+                continue
+            self._write_segment(Path(source))
+            changed.append(source)
+        removed = set(previous_files) - set(current_files)
+        for source in removed:
+            self._segment_path(source).unlink(missing_ok=True)
+
+        stale = set(changed) | removed
+        for run in catalog["runs"]:
+            run["dead"] = sorted(set(run["dead"]) | (stale & set(run["sources"])))
+        if changed:
+            catalog["runs"].append(self._write_run(catalog, sorted(changed)))
+        self._compact(catalog)
+        _atomic_write_bytes(self._catalog_path, json.dumps(catalog, separators=(",", ":")).encode("utf-8"))
+        write_manifest(self._manifest_path, {**current, "format_version": self.FORMAT_VERSION})
+        self._open()
+        return len(changed)
+
+    def _read_catalog(self) -> dict:
+        return json.loads(self._catalog_path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def _live_stats(run: dict) -> tuple[int, int]:
+        dead = set(run["dead"])
+        chunks = length = 0
+        for source, (chunk_count, total_length) in run["sources"].items():
+            if source not in dead:
+                chunks += int(chunk_count)
+                length += int(total_length)
+        return chunks, length
+
+    def _merge_selection(self, runs: list[dict]) -> list[dict]:
+        tiers: dict[int, list[dict]] = {}
+        for run in runs:
+            live, _length = self._live_stats(run)
+            tier = 0
+            while live >= self.MERGE_FACTOR:
+                live //= self.MERGE_FACTOR
+                tier += 1
+            tiers.setdefault(tier, []).append(run)
+        for tier in sorted(tiers):
+            if len(tiers[tier]) >= self.MERGE_FACTOR:
+                return tiers[tier][: self.MERGE_FACTOR]
+        for run in runs:
+            total = sum(int(chunk_count) for chunk_count, _length in run["sources"].values())
+            if run["dead"] and self._live_stats(run)[0] * 2 < total:
+                return [run]
+        return []
+
+    def _compact(self, catalog: dict) -> None:
+        runs: list[dict] = []
+        for run in catalog["runs"]:
+            if set(run["sources"]) <= set(run["dead"]):
+                shutil.rmtree(self._run_dir(run["id"]), ignore_errors=True)
+            else:
+                runs.append(run)
+        while selection := self._merge_selection(runs):
+            sources = sorted(
+                source for run in selection for source in run["sources"] if source not in set(run["dead"])
+            )
+            merged = self._write_run(catalog, sources)
+            position = runs.index(selection[0])
+            runs = [run for run in runs if run not in selection]
+            runs.insert(position, merged)
+            for run in selection:
+                shutil.rmtree(self._run_dir(run["id"]), ignore_errors=True)
+        catalog["runs"] = runs
+
+    def _write_segment(self, path: Path) -> None:
+        try:
+            text = path.read_text(encoding="utf-8", errors="ignore")[: self.max_chars_per_file]
+        except Exception as exc:
+            logging.debug("Failed reading fallback semantic file '%s': %s", path, exc)
+            text = ""
+        chunks = []
+        for chunk in split_chunks(text, self.chunk_chars):
+            tokens = tokenize(chunk, self.stop_tokens)
+            if tokens:
+                chunks.append({"text": chunk, "length": len(tokens), "tf": dict(Counter(tokens))})
+        payload = json.dumps({"source": str(path), "chunks": chunks}, separators=(",", ":"))
+        _atomic_write_bytes(self._segment_path(str(path)), payload.encode("utf-8"))
+
+    def _iter_segments(self, sources: Iterable[str]):
+        for source in sources:
+            try:
+                payload = json.loads(self._segment_path(source).read_text(encoding="utf-8"))
+            except Exception as exc:
+                logging.debug("Skipping unreadable BM25 segment for '%s': %s", source, exc)
+                continue
+            yield source, list(payload.get("chunks") or [])
+
+    def _write_run(self, catalog: dict, sources: list[str]) -> dict:
+        run_id = int(catalog["next_run"])
+        catalog["next_run"] = run_id + 1
+        postings: dict[str, array] = {}
+        chunk_meta: list[list] = []
+        text_parts: list[bytes] = []
+        text_offset = 0
+        source_stats: dict[str, list[int]] = {source: [0, 0] for source in sources}
+        for source, chunks in self._iter_segments(sources):
+            for chunk_no, chunk in enumerate(chunks):
+                chunk_id = len(chunk_meta)
+                encoded = str(chunk.get("text") or "").encode("utf-8")
+                length = int(chunk.get("length") or 0)
+                chunk_meta.append([source, text_offset, len(encoded), length, chunk_no])
+                text_parts.append(encoded)
+                text_offset += len(encoded)
+                source_stats[source][0] += 1
+                source_stats[source][1] += length
+                for term, frequency in dict(chunk.get("tf") or {}).items():
+                    postings.setdefault(term, array("I")).extend((chunk_id, int(frequency)))
+
+        terms: dict[str, list[int]] = {}
+        blob = array("I")
+        for term in sorted(postings):
+            entry = postings[term]
+            terms[term] = [len(blob), len(entry) // 2]
+            blob.extend(entry)
+
+        directory = self._run_dir(run_id)
+        directory.mkdir(parents=True, exist_ok=True)
+        _atomic_write_bytes(directory / "postings.bin", blob.tobytes())
+        _atomic_write_bytes(directory / "chunks.bin", b"".join(text_parts))
+        meta = {"chunks": chunk_meta, "terms": terms}
+        _atomic_write_bytes(directory / "index.json", json.dumps(meta, separators=(",", ":")).encode("utf-8"))
+        return {"id": run_id, "sources": source_stats, "dead": []}
+
+    @staticmethod
+    def _map(path: Path) -> mmap.mmap | None:
+        try:
+            with path.open("rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    return None
+                return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as exc:
+            logging.debug("Failed mapping BM25 file '%s': %s", path, exc)
+            return None
+
+    def _open(self) -> None:
+        if self._runs is not None:
+            return
+        self._runs = []
+        try:
+            catalog = self._read_catalog()
+            live_chunks = total_length = 0
+            for run in list(catalog.get("runs") or []):
+                self._runs.append(_Run(self._run_dir(run["id"]), run["dead"]))
+                chunks, length = self._live_stats(run)
+                live_chunks += chunks
+                total_length += length
+        except Exception as exc:
+            logging.warning("Failed loading BM25 fallback index from '%s': %s", self.index_dir, exc)
+            self.close()
+            self._runs = []
+            return
+        self._live_chunks = live_chunks
+        self._avg_length = (total_length / live_chunks) if live_chunks else 0.0
+
+    def close(self) -> None:
+        for run in self._runs or []:
+            run.close()
+        self._runs = None
+        self._live_chunks = 0
+
+    def __len__(self) -> int:
+        self._open()
+        return self._live_chunks
+
+    def search(self, query_tokens: Iterable[str], top_k: int = 4) -> list[Bm25Hit]:
+        """Score chunks with BM25 and return the best chunk per source."""
+
+        self._open()
+        runs = [run for run in self._runs or [] if run.postings_mm is not None]
+        if not runs or not self._live_chunks:
+            return []
+        total_chunks = self._live_chunks
+        avg_length = self._avg_length or 1.0
+        scores: dict[tuple[int, int], float] = {}
+        views = [memoryview(run.postings_mm).cast("I") for run in runs]
+        try:
+            for token in set(query_tokens):
+                entries = [(position, run.terms[token]) for position, run in enumerate(runs) if token in run.terms]
+                if not entries:
+                    continue
+                # Document frequency counts dead chunks until their run is merged.
+                count_all = sum(count for _position, (_offset, count) in entries)
+                idf = math.log(1.0 + max(0.0, total_chunks - count_all + 0.5) / (count_all + 0.5))
+                for position, (offset, count) in entries:
+                    run = runs[position]
+                    pairs = views[position][offset : offset + count * 2]
+                    for index in range(0, count * 2, 2):
+                        chunk_id = pairs[index]
+                        if not run.live[chunk_id]:
+                            continue
+                        frequency = pairs[index + 1]
+                        length = run.chunks[chunk_id][3]
+                        norm = frequency + self.k1 * (1.0 - self.b + self.b * length / avg_length)
+                        key = (position, chunk_id)
+                        scores[key] = scores.get(key, 0.0) + idf * frequency * (self.k1 + 1.0) / norm
+        finally:
+            for view in views:
+                view.release()
+
+        best_per_source: dict[str, tuple[float, tuple[int, int]]] = {}
+        for key, score in scores.items():
+            source = runs[key[0]].chunks[key[1]][0]
+            if source not in best_per_source or score > best_per_source[source][0]:
+                best_per_source[source] = (score, key)
+        ranked = sorted(best_per_source.values(), key=lambda item: (-item[0], item[1]))[:top_k]
+        return [self._hit(runs[key[0]], key[1], score) for score, key in ranked]
+
+    @staticmethod
+    def _hit(run: _Run, chunk_id: int, score: float) -> Bm25Hit:
+        source, text_offset, text_length, _length, chunk_no = run.chunks[chunk_id]
+        content = ""
+        if run.text_mm is not None:
+            content = run.text_mm[text_offset : text_offset + text_length].decode("utf-8", errors="ignore")
+        return Bm25Hit(source=source, content=content, score=score, chunk_no=chunk_no)
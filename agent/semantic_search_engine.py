@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 from pathlib import Path
 
 from agent.repository_map_engine import ContextChunk
@@ -12,6 +11,7 @@ from agent.hybrid_context_support import (
     read_manifest,
     write_manifest,
 )
+from agent.semantic_fallback_index import Bm25FallbackIndex, tokenize
 
 try:
     from llama_index.core import StorageContext, VectorStoreIndex, load_index_from_storage
@@ -49,7 +49,12 @@ class SemanticSearchEngine:
         self.persist_dir = Path(persist_dir).resolve()
         self.max_total_bytes = max_total_bytes
         self._index = None
-        self._fallback_docs: list[tuple[str, str]] = []
+        # Without embeddings, retrieval is served from a disk-backed BM25 index
+        # next to the LlamaIndex store instead of holding documents in memory.
+        self._fallback_index = Bm25FallbackIndex(
+            self.persist_dir / "fallback_bm25",
+            stop_tokens=self._FALLBACK_STOP_TOKENS,
+        )
         self._built = False
         self._manifest_path = self.persist_dir / "manifest.json"
 
@@ -127,14 +132,10 @@ class SemanticSearchEngine:
         files = self._iter_candidate_files()
         self._load_or_build_index(files)
         if self._index is None:
-            for file_path in files:
-                try:
-                    text = file_path.read_text(encoding="utf-8", errors="ignore")
-                except Exception as e:
-                    logging.debug(f"Failed reading fallback semantic file '{file_path}': {e}")
-                    continue
-                if text:
-                    self._fallback_docs.append((str(file_path), text[:12000]))
+            try:
+                self._fallback_index.sync(files)
+            except Exception as e:
+                logging.warning(f"Failed building BM25 fallback index in '{self._fallback_index.index_dir}': {e}")
         self._built = True
 
     def search(self, query: str, top_k: int = 4) -> list[ContextChunk]:
@@ -161,22 +162,14 @@ class SemanticSearchEngine:
             except Exception as e:
                 logging.warning(f"LlamaIndex semantic search failed for query '{query[:50]}...': {e}")
 
-        tokens = [
-            t.lower() for t in re.findall(r"[A-Za-z0-9_]+", query)
-            if len(t) >= 3 and t.lower() not in self._FALLBACK_STOP_TOKENS
-        ]
-        fallback: list[ContextChunk] = []
-        for source, text in self._fallback_docs:
-            lower = text.lower()
-            score = sum(lower.count(token) for token in tokens)
-            if score <= 0:
-                continue
-            fallback.append(
-                ContextChunk(
-                    engine="semantic_search",
-                    source=source,
-                    content=text[:2000],
-                    score=float(score),
-                )
+        tokens = tokenize(query, self._FALLBACK_STOP_TOKENS)
+        return [
+            ContextChunk(
+                engine="semantic_search",
+                source=hit.source,
+                content=hit.content[:2000],
+                score=float(hit.score),
+                metadata={"chunk": str(hit.chunk_no), "ranking": "bm25"},
             )
-        return sorted(fallback, key=lambda c: c.score, reverse=True)[:top_k]
+            for hit in self._fallback_index.search(tokens, top_k=top_k)
+        ]
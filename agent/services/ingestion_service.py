@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import bz2
+import functools
 import gzip
 import hashlib
 import json
@@ -31,8 +32,9 @@ from agent.services.extraction_service import get_extraction_service
 from agent.services.wiki_import_checkpoint_service import WikiImportCheckpointService
 from agent.services.wiki_import_reporter import build_wiki_import_stats
 from agent.services.wiki_mediawiki_xml_parser import MediaWikiXmlDumpParser
-from agent.services.wiki_normalizer import WikiRecordNormalizer
+from agent.services.wiki_normalizer import WikiRecordNormalizer, normalize_block_items, renumber_wiki_records
 from agent.services.wiki_record_writer import sort_wiki_records, write_wiki_jsonl_cache
+from agent.services.wiki_zim_parser import ZimParser
 
 logger = logging.getLogger(__name__)
 
@@ -300,6 +302,7 @@ class IngestionService:
         cancel_check=None,
         max_chunks_per_article: int = 3,
         min_content_chars: int = 1,
+        parallel_workers: int | None = None,
     ) -> dict[str, object]:
         path = Path(str(corpus_path or "").strip()).expanduser().resolve()
         detected_format = self._infer_wiki_format(corpus_path=path, import_format=import_format)
@@ -321,9 +324,19 @@ class IngestionService:
                 cancel_check=cancel_check,
                 max_chunks_per_article=max_chunks_per_article,
                 min_content_chars=min_content_chars,
+                parallel_workers=parallel_workers,
             )
         if detected_format == "zim":
-            raise ValueError("wiki_zim_import_not_supported")
+            return self.import_wiki_zim(
+                corpus_path=str(path),
+                source_id=source_id,
+                default_language=default_language,
+                strict=strict,
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,
+                max_chunks_per_article=max_chunks_per_article,
+                min_content_chars=min_content_chars,
+            )
         raise ValueError("wiki_corpus_unknown_format")
 
     # Fields stripped from records before writing to save space.
@@ -343,6 +356,233 @@ class IngestionService:
         cancel_check=None,
         max_chunks_per_article: int = 3,
         min_content_chars: int = 1,
+        parallel_workers: int | None = None,
+    ) -> dict[str, object]:
+        return self._import_wiki_dump(
+            source_format="xml",
+            corpus_path=corpus_path,
+            index_path=index_path,
+            source_id=source_id,
+            default_language=default_language,
+            strict=strict,
+            write_jsonl_cache=write_jsonl_cache,
+            progress_callback=progress_callback,
+            cancel_check=cancel_check,
+            max_chunks_per_article=max_chunks_per_article,
+            min_content_chars=min_content_chars,
+            parallel_workers=parallel_workers,
+        )
+
+    def import_wiki_zim(
+        self,
+        *,
+        corpus_path: str,
+        source_id: str | None = None,
+        default_language: str = "en",
+        strict: bool = False,
+        write_jsonl_cache: bool = True,
+        progress_callback=None,
+        cancel_check=None,
+        max_chunks_per_article: int = 3,
+        min_content_chars: int = 1,
+    ) -> dict[str, object]:
+        """Import a Kiwix ZIM file through the same chunking path as XML dumps.
+
+        Items are read cluster by cluster, so each cluster is decompressed once;
+        checkpoints are written at cluster boundaries.
+        """
+        return self._import_wiki_dump(
+            source_format="zim",
+            corpus_path=corpus_path,
+            source_id=source_id,
+            default_language=default_language,
+            strict=strict,
+            write_jsonl_cache=write_jsonl_cache,
+            progress_callback=progress_callback,
+            cancel_check=cancel_check,
+            max_chunks_per_article=max_chunks_per_article,
+            min_content_chars=min_content_chars,
+        )
+
+    @staticmethod
+    def _load_resume_chunk_counts(
+        *,
+        checkpoint: dict,
+        partial_paths: tuple[Path, Path],
+        chunks_cache_path: Path,
+    ) -> tuple[int, dict[str, int]]:
+        """Return ``(resume_from_item, chunks_per_article)`` for a partial import.
+
+        Chunk counts come from the sidecar when it is at least as new as the
+        checkpoint, otherwise from one scan of the partial cache (which then
+        refreshes the sidecar). Without a checkpoint the partial files are
+        dropped and the import starts over.
+        """
+        partial_cache_path, partial_links_path = partial_paths
+        prior_items = int(checkpoint.get("processed_items") or 0)
+        if prior_items <= 0:
+            partial_cache_path.unlink(missing_ok=True)
+            partial_links_path.unlink(missing_ok=True)
+            chunks_cache_path.unlink(missing_ok=True)
+            return 0, {}
+        chunks_per_article: dict[str, int] = {}
+        # Fast path: load chunks_per_article from sidecar if it matches checkpoint
+        if chunks_cache_path.exists():
+            try:
+                _cache = json.loads(chunks_cache_path.read_text(encoding="utf-8"))
+                if int(_cache.get("at_item") or 0) >= prior_items:
+                    chunks_per_article = dict(_cache.get("chunks") or {})
+                    logger.info(
+                        "import_wiki_xml: loaded chunks_per_article from sidecar (%d articles, at_item=%d)",
+                        len(chunks_per_article),
+                        prior_items,
+                    )
+            except Exception as _e:
+                logger.warning("import_wiki_xml: chunks sidecar load failed (%s), falling back to scan", _e)
+                chunks_per_article = {}
+        if chunks_per_article:
+            return prior_items, chunks_per_article
+        # Slow path: scan partial.jsonl only if sidecar missing/stale
+        logger.info(
+            "import_wiki_xml: resuming from item %d — scanning partial cache for chunk counts", prior_items
+        )
+        with partial_cache_path.open("r", encoding="utf-8") as _fh:
+            for _line in _fh:
+                _line = _line.strip()
+                if not _line:
+                    continue
+                try:
+                    _t = str(json.loads(_line).get("article_title") or "")
+                except json.JSONDecodeError:
+                    continue
+                chunks_per_article[_t] = chunks_per_article.get(_t, 0) + 1
+        logger.info("import_wiki_xml: resume scan done — %d articles, saving sidecar", len(chunks_per_article))
+        try:
+            chunks_cache_path.write_text(
+                json.dumps({"at_item": prior_items, "chunks": chunks_per_article}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+        except Exception as _e:
+            logger.warning("import_wiki_xml: could not write chunks sidecar: %s", _e)
+        return prior_items, chunks_per_article
+
+    def _wiki_item_stream(
+        self,
+        *,
+        source_format: str,
+        path: Path,
+        index_path: Path | None,
+        source_id: str,
+        default_language: str,
+        start_block: int,
+        workers: int,
+        zim_parser: ZimParser,
+    ):
+        """Yield ``(block_index, item, prepared)`` for the dump's reader.
+
+        Multistream dumps fast-seek to ``start_block``; with several workers
+        items carry pre-normalized ``(records, issue)`` from the process pool.
+        ZIM cluster numbers act as blocks, so checkpoints land on cluster
+        boundaries.
+        """
+        if index_path is not None and workers > 1:
+            block_handler = functools.partial(
+                normalize_block_items,
+                source_path=path,
+                source_id=source_id,
+                default_language=default_language,
+                source_format="xml",
+            )
+            return (
+                (block_index, {"kind": kind}, (records, issue))
+                for block_index, block in self._wiki_parser.iter_blocks_parallel(
+                    corpus_path=path,
+                    index_path=index_path,
+                    resume_block_index=start_block,
+                    max_workers=workers,
+                    block_handler=block_handler,
+                )
+                for kind, records, issue in block
+            )
+        if index_path is not None:
+            return (
+                (block_index, item, None)
+                for block_index, item in self._wiki_parser.iter_pages_with_block(
+                    corpus_path=path, index_path=index_path, resume_block_index=start_block
+                )
+            )
+        if source_format == "zim":
+            return (
+                (cluster_number, item, None)
+                for cluster_number, item in zim_parser.iter_items_with_cluster(corpus_path=path)
+            )
+        return ((0, item, None) for item in self._wiki_parser.iter_items(corpus_path=path))
+
+    def _write_compact_records(
+        self,
+        records: list[dict],
+        *,
+        chunks_per_article: dict[str, int],
+        min_content_chars: int,
+        max_chunks_per_article: int,
+        cache_fh,
+        links_fh,
+        in_memory_records: list[dict],
+        max_report_records: int,
+    ) -> tuple[int, int]:
+        """Apply the compact filter and write the kept records; returns ``(records, links)`` written."""
+        written = links_written = 0
+        for rec in records:
+            title   = str(rec.get("article_title") or "")
+            content = str(rec.get("content") or "")
+
+            # Inline compact filter: skip short content and over-quota chunks
+            if len(content) < min_content_chars:
+                continue
+            if chunks_per_article.get(title, 0) >= max_chunks_per_article:
+                continue
+            chunks_per_article[title] = chunks_per_article.get(title, 0) + 1
+
+            # Write inter-article links compact (one line per article, max 60 targets)
+            if links_fh and chunks_per_article[title] == 1:
+                targets = []
+                for lt in rec.get("links") or []:
+                    lt = str(lt or "").strip()
+                    if lt and lt != title:
+                        targets.append(lt)
+                        if len(targets) >= 60:
+                            break
+                if targets:
+                    links_fh.write(json.dumps({"from": title, "to": targets}, ensure_ascii=False) + "\n")
+                    links_written += len(targets)
+
+            # Strip bulky fields from stored record
+            slim = {k: v for k, v in rec.items() if k not in self._RECORD_STRIP_FIELDS}
+
+            if cache_fh:
+                cache_fh.write(json.dumps(slim, ensure_ascii=False) + "\n")
+                written += 1
+                if len(in_memory_records) < max_report_records:
+                    in_memory_records.append(dict(rec))
+            else:
+                in_memory_records.append(slim)
+        return written, links_written
+
+    def _import_wiki_dump(
+        self,
+        *,
+        source_format: str,
+        corpus_path: str,
+        index_path: str | None = None,
+        source_id: str | None = None,
+        default_language: str = "en",
+        strict: bool = False,
+        write_jsonl_cache: bool = True,
+        progress_callback=None,
+        cancel_check=None,
+        max_chunks_per_article: int = 3,
+        min_content_chars: int = 1,
+        parallel_workers: int | None = None,
     ) -> dict[str, object]:
         path = Path(str(corpus_path or "").strip()).expanduser().resolve()
         if not path.exists():
@@ -367,47 +607,15 @@ class IngestionService:
             corpus_path=str(path),
             index_path=str(resolved_index_path) if resolved_index_path else None,
         ) or {}
-        resume_from_item = 0
-        chunks_per_article: dict[str, int] = {}
-        if write_jsonl_cache and partial_cache_path.exists():
-            prior_items = int(checkpoint.get("processed_items") or 0)
-            if prior_items > 0:
-                resume_from_item = prior_items
-                # Fast path: load chunks_per_article from sidecar if it matches checkpoint
-                if chunks_cache_path.exists():
-                    try:
-                        _cache = json.loads(chunks_cache_path.read_text(encoding="utf-8"))
-                        if int(_cache.get("at_item") or 0) >= prior_items:
-                            chunks_per_article = dict(_cache.get("chunks") or {})
-                            logger.info("import_wiki_xml: loaded chunks_per_article from sidecar (%d articles, at_item=%d)", len(chunks_per_article), prior_items)
-                    except Exception as _e:
-                        logger.warning("import_wiki_xml: chunks sidecar load failed (%s), falling back to scan", _e)
-                        chunks_per_article = {}
-                # Slow path: scan partial.jsonl only if sidecar missing/stale
-                if not chunks_per_article:
-                    logger.info("import_wiki_xml: resuming from item %d — scanning partial cache for chunk counts", resume_from_item)
-                    with partial_cache_path.open("r", encoding="utf-8") as _fh:
-                        for _line in _fh:
-                            _line = _line.strip()
-                            if _line:
-                                try:
-                                    _r = json.loads(_line)
-                                    _t = str(_r.get("article_title") or "")
-                                    chunks_per_article[_t] = chunks_per_article.get(_t, 0) + 1
-                                except json.JSONDecodeError:
-                                    pass
-                    logger.info("import_wiki_xml: resume scan done — %d articles, saving sidecar", len(chunks_per_article))
-                    try:
-                        chunks_cache_path.write_text(
-                            json.dumps({"at_item": prior_items, "chunks": chunks_per_article}, ensure_ascii=False),
-                            encoding="utf-8",
-                        )
-                    except Exception as _e:
-                        logger.warning("import_wiki_xml: could not write chunks sidecar: %s", _e)
-            else:
-                partial_cache_path.unlink(missing_ok=True)
-                partial_links_path.unlink(missing_ok=True)
-                chunks_cache_path.unlink(missing_ok=True)
+        resume_from_item, chunks_per_article = (
+            self._load_resume_chunk_counts(
+                checkpoint=checkpoint,
+                partial_paths=(partial_cache_path, partial_links_path),
+                chunks_cache_path=chunks_cache_path,
+            )
+            if write_jsonl_cache and partial_cache_path.exists()
+            else (0, {})
+        )
 
         issues: list[dict] = []
         page_count   = int(checkpoint.get("page_count")  or 0) if resume_from_item else 0
@@ -417,10 +625,18 @@ class IngestionService:
         link_count   = int(checkpoint.get("link_count")  or 0) if resume_from_item else 0
         current_block_index = 0
         prev_block_index    = -1
-        # resume_block_index+1 = first unprocessed block (blocks 0..resume_block_index are done)
-        resume_block_index  = int(checkpoint.get("block_index") or 0) if resume_from_item else 0
-        # When using block seek, start FROM the next block (resume_block_index was fully written)
-        start_block = (resume_block_index + 1) if (_use_blocks := resolved_index_path is not None) and resume_block_index > 0 else 0
+        _use_blocks = resolved_index_path is not None
+        # When using block seek, start FROM the first block not yet fully written
+        start_block = (
+            self._wiki_checkpoint_service.next_block_index(checkpoint) if _use_blocks and resume_from_item else 0
+        )
+        if start_block > 0:
+            # Blocks before start_block hold exactly resume_from_item items, so
+            # ordinals (and record ids) continue as in an uninterrupted run.
+            item_ordinal = resume_from_item
+        workers = max(
+            1, int(parallel_workers if parallel_workers is not None else settings.wiki_import_parallel_workers)
+        )
 
         cache_fh = links_fh = None
         if write_jsonl_cache:
@@ -432,13 +648,18 @@ class IngestionService:
         in_memory_records: list[dict] = []
         max_report_records = 1000
 
-        # Block-aware multistream: fast-seek to start_block, no item-level skip needed after
-        _item_stream = (
-            self._wiki_parser.iter_pages_with_block(
-                corpus_path=path, index_path=resolved_index_path, resume_block_index=start_block
-            )
-            if _use_blocks
-            else ((0, item) for item in self._wiki_parser.iter_items(corpus_path=path))
+        # Per call: the cluster cache, issue list and zstd decompressor must
+        # not be shared between concurrent imports on the service singleton.
+        zim_parser = ZimParser()
+        _item_stream = self._wiki_item_stream(
+            source_format=source_format,
+            path=path,
+            index_path=resolved_index_path,
+            source_id=normalized_source_id,
+            default_language=default_language,
+            start_block=start_block,
+            workers=workers,
+            zim_parser=zim_parser,
         )
 
         def _save_checkpoint() -> None:
@@ -450,6 +671,7 @@ class IngestionService:
                     "phase": "normalizing",
                     "processed_items": item_ordinal,
                     "block_index": prev_block_index if prev_block_index >= 0 else 0,
+                    "completed_blocks": prev_block_index + 1 if prev_block_index >= 0 else start_block,
                     "normalized_records": record_count,
                     "link_count": link_count,
                     "page_count": page_count,
@@ -459,7 +681,7 @@ class IngestionService:
             )
 
         try:
-            for current_block_index, item in _item_stream:
+            for current_block_index, item, prepared in _item_stream:
                 # Checkpoint at block boundary (prev block is now fully written)
                 if current_block_index != prev_block_index and prev_block_index >= 0:
                     if cache_fh:
@@ -493,61 +715,41 @@ class IngestionService:
                 if resume_from_item and not _use_blocks and item_ordinal <= resume_from_item:
                     continue
 
-                normalized_batch, issue = self._wiki_normalizer.normalize_item(
-                    item=item,
-                    source_path=path,
-                    source_id=normalized_source_id,
-                    ordinal=item_ordinal,
-                    default_language=default_language,
-                    source_format="xml",
-                )
+                if prepared is None:
+                    normalized_batch, issue = self._wiki_normalizer.normalize_item(
+                        item=item,
+                        source_path=path,
+                        source_id=normalized_source_id,
+                        ordinal=item_ordinal,
+                        default_language=default_language,
+                        source_format=source_format,
+                    )
+                else:
+                    normalized_batch, issue = renumber_wiki_records(*prepared, ordinal=item_ordinal)
                 if issue:
                     issues.append(issue)
                     if strict:
                         raise ValueError("wiki_corpus_invalid_record")
 
-                for rec in (normalized_batch or []):
-                    title   = str(rec.get("article_title") or "")
-                    content = str(rec.get("content") or "")
-
-                    # Inline compact filter: skip short content and over-quota chunks
-                    if len(content) < min_content_chars:
-                        continue
-                    if chunks_per_article.get(title, 0) >= max_chunks_per_article:
-                        continue
-                    chunks_per_article[title] = chunks_per_article.get(title, 0) + 1
-
-                    # Write inter-article links compact (one line per article, max 60 targets)
-                    if links_fh and chunks_per_article[title] == 1:
-                        raw_links = rec.get("links") or []
-                        targets = []
-                        for lt in raw_links:
-                            lt = str(lt or "").strip()
-                            if lt and lt != title:
-                                targets.append(lt)
-                                if len(targets) >= 60:
-                                    break
-                        if targets:
-                            links_fh.write(json.dumps({"from": title, "to": targets}, ensure_ascii=False) + "\n")
-                            link_count += len(targets)
-
-                    # Strip bulky fields from stored record
-                    slim = {k: v for k, v in rec.items() if k not in self._RECORD_STRIP_FIELDS}
-
-                    if cache_fh:
-                        cache_fh.write(json.dumps(slim, ensure_ascii=False) + "\n")
-                        record_count += 1
-                        if len(in_memory_records) < max_report_records:
-                            in_memory_records.append(dict(rec))
-                    else:
-                        in_memory_records.append(slim)
-                        record_count = len(in_memory_records)
+                written, links_written = self._write_compact_records(
+                    normalized_batch or [],
+                    chunks_per_article=chunks_per_article,
+                    min_content_chars=min_content_chars,
+                    max_chunks_per_article=max_chunks_per_article,
+                    cache_fh=cache_fh,
+                    links_fh=links_fh,
+                    in_memory_records=in_memory_records,
+                    max_report_records=max_report_records,
+                )
+                record_count = record_count + written if cache_fh else len(in_memory_records)
+                link_count += links_written
 
                 # Progress callback (non-blocking, every 500 items)
                 if item_ordinal % 500 == 0 and progress_callback:
                     progress_callback(item_ordinal, record_count)
 
         except Exception:
+            _item_stream.close()  # stops the block pool promptly on cancel/strict failures
             if cache_fh:
                 cache_fh.close()
             if links_fh:
@@ -597,7 +799,8 @@ class IngestionService:
             "issues": issues,
             "stats": stats,
             "deterministic_order": "parse_order_compact_filtered",
-            "format": "xml",
+            "format": source_format,
+            "parser_issues": zim_parser.issues if source_format == "zim" else [],
             "multistream_index": {
                 "enabled": resolved_index_path is not None,
                 "path": str(resolved_index_path) if resolved_index_path else None,
@@ -761,6 +964,7 @@ class IngestionService:
         progress_callback=None,
         max_chunks_per_article: int = 3,
         min_content_chars: int = 1,
+        parallel_workers: int | None = None,
     ) -> dict[str, object]:
         url = str(corpus_url or "").strip()
         if not url:
@@ -909,6 +1113,7 @@ class IngestionService:
                 cancel_check=cancel_check,
                 max_chunks_per_article=max_chunks_per_article,
                 min_content_chars=min_content_chars,
+                parallel_workers=parallel_workers,
             )
         report["download"] = {
             "url": url,
@@ -86,15 +86,7 @@ class JmapClient:
                 retry_after_ms=result.retry_after_ms,
                 details=result.details,
             )
-        response = result.value[0]
-        if response.is_error:
-            return MailProviderResult(
-                ok=False,
-                reason_code=_method_error_reason(response.error_type),
-                retryable=response.error_type == "rateLimit",
-                details={"method_error_type": response.error_type},
-            )
-        return MailProviderResult(ok=True, reason_code="ok", value=response)
+        return method_response_result(result.value[0])
 
     def call_many(
         self,
@@ -263,9 +255,21 @@ class JmapClient:
         return MailProviderResult(ok=True, reason_code="ok", value=tuple(collected))
 
 
+def method_response_result(response: JmapMethodResponse) -> MailProviderResult[JmapMethodResponse]:
+    """Map one entry of a ``call_many`` response like ``call`` maps its single response."""
+    if response.is_error:
+        return MailProviderResult(
+            ok=False,
+            reason_code=_method_error_reason(response.error_type),
+            retryable=response.error_type == "rateLimit",
+            details={"method_error_type": response.error_type},
+        )
+    return MailProviderResult(ok=True, reason_code="ok", value=response)
+
+
 def _method_error_reason(value: str) -> str:
     clean = str(value or "unknown").replace("_", "-")
     return f"jmap_method_{clean.lower()}"
 
 
-__all__ = ["JmapClient"]
+__all__ = ["JmapClient", "method_response_result"]
@@ -4,8 +4,12 @@ from dataclasses import fields, replace
 from datetime import UTC, datetime, timedelta
 from typing import Any, Callable, Mapping, Sequence
 
-from agent.services.jmap_client_service import JmapClient
-from agent.services.jmap_contract_service import JmapMethodResponse
+from agent.services.jmap_client_service import JmapClient, method_response_result
+from agent.services.jmap_contract_service import (
+    JmapMethodCall,
+    JmapMethodResponse,
+    JmapResultReference,
+)
 from agent.services.mail_contract_service import stable_mail_ref_id
 from agent.services.mail_domain_mapper import MailDomainMapper
 from agent.services.mail_feature_policy import JmapRuntimeLimits
@@ -42,6 +46,12 @@ _SYNC_PROPERTIES = (
     "htmlBody",
     "attachments",
 )
+_METADATA_ONLY_GET = {
+    "fetchTextBodyValues": False,
+    "fetchHTMLBodyValues": False,
+    "fetchAllBodyValues": False,
+}
+_CHANGED_ID_PATHS = (("created", "/created"), ("updated", "/updated"))
 
 
 class JmapSyncService:
@@ -128,19 +138,47 @@ class JmapSyncService:
         created: set[str] = set()
         updated: set[str] = set()
         destroyed: set[str] = set()
+        fetched: dict[str, Mapping[str, Any]] = {}
+        requested: set[str] = set()
+        first_responses: dict[str, JmapMethodResponse] = {}
         state = checkpoint.email_state
-        for _page in range(self._limits.maximum_change_pages):
-            result = self._client.call(
-                "Email/changes",
-                {
-                    "accountId": self._client.session.provider_account_id,
-                    "sinceState": state,
-                    "maxChanges": min(
-                        self._limits.maximum_query_page_size,
-                        max(1, int(policy.get("maximum_changes") or self._limits.maximum_query_page_size)),
-                    ),
-                },
-            )
+        session_limits = self._client.session.limits
+        # Each page carries Email/changes plus one Email/get per id list, chained
+        # through result references; the first page also carries the first
+        # Email/queryChanges and Mailbox/changes call when the call limit allows.
+        pipelined = session_limits.maximum_calls_per_request >= 1 + len(_CHANGED_ID_PATHS)
+        maximum_changes = min(
+            self._limits.maximum_query_page_size,
+            max(1, int(policy.get("maximum_changes") or self._limits.maximum_query_page_size)),
+        )
+        if pipelined:
+            maximum_changes = min(maximum_changes, session_limits.maximum_objects_per_get)
+        for page in range(self._limits.maximum_change_pages):
+            calls = [
+                JmapMethodCall(
+                    "Email/changes",
+                    {
+                        "accountId": self._client.session.provider_account_id,
+                        "sinceState": state,
+                        "maxChanges": maximum_changes,
+                    },
+                    "changes",
+                )
+            ]
+            if pipelined:
+                calls.extend(self._changed_get_calls())
+            if page == 0:
+                side_calls = self._first_page_side_calls(checkpoint, filters=filters, sort=sort)
+                calls.extend(side_calls[: max(0, session_limits.maximum_calls_per_request - len(calls))])
+            batch = self._client.call_many(tuple(calls))
+            if not batch.ok or batch.value is None:
+                return _failure_from(batch)
+            responses = {response.call_id: response for response in batch.value}
+            if page == 0:
+                first_responses = {
+                    key: responses[key] for key in ("query_changes", "mailbox") if key in responses
+                }
+            result = method_response_result(responses["changes"])
             if not result.ok:
                 if result.reason_code.endswith("cannotcalculatechanges"):
                     if not bool(policy.get("allow_rebuild", True)):
@@ -153,9 +191,22 @@ class JmapSyncService:
             parsed = _parse_changes(response)
             if parsed is None:
                 return MailProviderResult(ok=False, reason_code="jmap_changes_response_invalid")
+            if pipelined:
+                for key, _path in _CHANGED_ID_PATHS:
+                    rows = _referenced_get_rows(
+                        responses.get(f"get_{key}"),
+                        expected_ids=parsed[key],
+                        limit=session_limits.maximum_objects_per_get,
+                    )
+                    if not rows.ok or rows.value is None:
+                        return _failure_from(rows)
+                    requested.update(parsed[key])
+                    fetched.update((str(row["id"]), row) for row in rows.value)
             created.update(parsed["created"])
             updated.update(parsed["updated"])
             destroyed.update(parsed["destroyed"])
+            for email_id in parsed["destroyed"]:
+                fetched.pop(email_id, None)
             if len(created | updated | destroyed) > self._limits.maximum_rebuild_objects:
                 return MailProviderResult(ok=False, reason_code="jmap_sync_object_limit_exceeded")
             state = parsed["new_state"]
@@ -169,6 +220,7 @@ class JmapSyncService:
             checkpoint.query_state,
             filters=filters,
             sort=sort,
+            first=first_responses.get("query_changes"),
         )
         if not query_state_result.ok or query_state_result.value is None:
             if query_state_result.reason_code == "jmap_query_changes_rebuild_required":
@@ -178,10 +230,26 @@ class JmapSyncService:
         updated.update(query_added)
         destroyed.update(query_removed)
         updated.difference_update(created)
-        fetched = self._fetch_messages(tuple(sorted(created | updated)))
-        if not fetched.ok or fetched.value is None:
-            return _failure_from(fetched)
-        mailbox_state_result = self._advance_mailbox_state(checkpoint.mailbox_state)
+        wanted = tuple(sorted(created | updated))
+        missing = tuple(email_id for email_id in wanted if email_id not in requested)
+        if missing:
+            remaining = self._client.get_objects(
+                object_type="Email",
+                provider_account_id=self._client.session.provider_account_id,
+                ids=missing,
+                properties=_SYNC_PROPERTIES,
+                extra_arguments=_METADATA_ONLY_GET,
+            )
+            if not remaining.ok or remaining.value is None:
+                return _failure_from(remaining)
+            fetched.update((str(row["id"]), row) for row in remaining.value)
+        mapped = self._map_messages(tuple(fetched[email_id] for email_id in wanted if email_id in fetched))
+        if not mapped.ok or mapped.value is None:
+            return _failure_from(mapped)
+        mailbox_state_result = self._advance_mailbox_state(
+            checkpoint.mailbox_state,
+            first=first_responses.get("mailbox"),
+        )
         if not mailbox_state_result.ok or mailbox_state_result.value is None:
             return _failure_from(mailbox_state_result)
         next_checkpoint = replace(
@@ -193,8 +261,8 @@ class JmapSyncService:
             revision=checkpoint.revision + 1,
         )
         delta = _delta(
-            created=tuple(message for message in fetched.value if _email_id(message) in created),
-            updated=tuple(message for message in fetched.value if _email_id(message) in updated),
+            created=tuple(message for message in mapped.value if _email_id(message) in created),
+            updated=tuple(message for message in mapped.value if _email_id(message) in updated),
             destroyed=tuple(sorted(destroyed)),
             cursor=_cursor(next_checkpoint),
             rebuilt=False,
@@ -213,12 +281,79 @@ class JmapSyncService:
             return MailProviderResult(ok=False, reason_code="mail_sync_concurrent_update", retryable=True)
         return MailProviderResult(ok=True, reason_code="ok", value=delta)
 
+    def _changed_get_calls(self) -> list[JmapMethodCall]:
+        return [
+            JmapMethodCall.build(
+                name="Email/get",
+                arguments={
+                    "accountId": self._client.session.provider_account_id,
+                    "properties": list(_SYNC_PROPERTIES),
+                    **_METADATA_ONLY_GET,
+                },
+                call_id=f"get_{key}",
+                result_references={
+                    "ids": JmapResultReference(result_of="changes", name="Email/changes", path=path),
+                },
+            )
+            for key, path in _CHANGED_ID_PATHS
+        ]
+
+    def _first_page_side_calls(
+        self,
+        checkpoint: JmapSyncCheckpoint,
+        *,
+        filters: Mapping[str, Any],
+        sort: Sequence[Mapping[str, Any]],
+    ) -> list[JmapMethodCall]:
+        calls: list[JmapMethodCall] = []
+        if checkpoint.query_state:
+            calls.append(
+                JmapMethodCall(
+                    "Email/queryChanges",
+                    self._query_changes_arguments(checkpoint.query_state, filters=filters, sort=sort),
+                    "query_changes",
+                )
+            )
+        name, arguments = self._mailbox_state_call(checkpoint.mailbox_state)
+        calls.append(JmapMethodCall(name, arguments, "mailbox"))
+        return calls
+
+    def _query_changes_arguments(
+        self,
+        state: str,
+        *,
+        filters: Mapping[str, Any],
+        sort: Sequence[Mapping[str, Any]],
+    ) -> dict[str, Any]:
+        return {
+            "accountId": self._client.session.provider_account_id,
+            "filter": dict(filters),
+            "sort": [dict(item) for item in sort],
+            "sinceQueryState": state,
+            "maxChanges": self._limits.maximum_query_page_size,
+            "calculateTotal": True,
+        }
+
+    def _mailbox_state_call(self, current_state: str) -> tuple[str, dict[str, Any]]:
+        if not current_state:
+            return "Mailbox/get", {
+                "accountId": self._client.session.provider_account_id,
+                "ids": [],
+                "properties": ["id"],
+            }
+        return "Mailbox/changes", {
+            "accountId": self._client.session.provider_account_id,
+            "sinceState": current_state,
+            "maxChanges": self._limits.maximum_query_page_size,
+        }
+
     def _advance_query_state(
         self,
         current_state: str,
         *,
         filters: Mapping[str, Any],
         sort: Sequence[Mapping[str, Any]],
+        first: JmapMethodResponse | None = None,
     ) -> MailProviderResult[tuple[str, set[str], set[str]]]:
         if not current_state:
             return MailProviderResult(
@@ -228,18 +363,14 @@ class JmapSyncService:
         state = current_state
         added: set[str] = set()
         removed: set[str] = set()
-        for _page in range(self._limits.maximum_change_pages):
-            result = self._client.call(
-                "Email/queryChanges",
-                {
-                    "accountId": self._client.session.provider_account_id,
-                    "filter": dict(filters),
-                    "sort": [dict(item) for item in sort],
-                    "sinceQueryState": state,
-                    "maxChanges": self._limits.maximum_query_page_size,
-                    "calculateTotal": True,
-                },
-            )
+        for page in range(self._limits.maximum_change_pages):
+            if page == 0 and first is not None:
+                result = method_response_result(first)
+            else:
+                result = self._client.call(
+                    "Email/queryChanges",
+                    self._query_changes_arguments(state, filters=filters, sort=sort),
+                )
             if not result.ok or result.value is None:
                 if result.reason_code.endswith("cannotcalculatechanges"):
                     return MailProviderResult(
@@ -267,16 +398,17 @@ class JmapSyncService:
                 return MailProviderResult(ok=True, reason_code="ok", value=(state, added, removed))
         return MailProviderResult(ok=False, reason_code="jmap_query_change_page_limit_exceeded")
 
-    def _advance_mailbox_state(self, current_state: str) -> MailProviderResult[str]:
+    def _advance_mailbox_state(
+        self,
+        current_state: str,
+        *,
+        first: JmapMethodResponse | None = None,
+    ) -> MailProviderResult[str]:
         if not current_state:
-            result = self._client.call(
-                "Mailbox/get",
-                {
-                    "accountId": self._client.session.provider_account_id,
-                    "ids": [],
-                    "properties": ["id"],
-                },
-            )
+            if first is not None:
+                result = method_response_result(first)
+            else:
+                result = self._client.call(*self._mailbox_state_call(""))
             if not result.ok or result.value is None:
                 return _failure_from(result)
             state = str(result.value.arguments.get("state") or "")
@@ -286,15 +418,11 @@ class JmapSyncService:
                 else MailProviderResult(ok=False, reason_code="jmap_mailbox_state_missing")
             )
         state = current_state
-        for _page in range(self._limits.maximum_change_pages):
-            result = self._client.call(
-                "Mailbox/changes",
-                {
-                    "accountId": self._client.session.provider_account_id,
-                    "sinceState": state,
-                    "maxChanges": self._limits.maximum_query_page_size,
-                },
-            )
+        for page in range(self._limits.maximum_change_pages):
+            if page == 0 and first is not None:
+                result = method_response_result(first)
+            else:
+                result = self._client.call(*self._mailbox_state_call(state))
             if not result.ok or result.value is None:
                 if result.reason_code.endswith("cannotcalculatechanges"):
                     return self._advance_mailbox_state("")
@@ -401,14 +529,13 @@ class JmapSyncService:
             provider_account_id=self._client.session.provider_account_id,
             ids=ids,
             properties=_SYNC_PROPERTIES,
-            extra_arguments={
-                "fetchTextBodyValues": False,
-                "fetchHTMLBodyValues": False,
-                "fetchAllBodyValues": False,
-            },
+            extra_arguments=_METADATA_ONLY_GET,
         )
         if not fetched.ok or fetched.value is None:
             return _failure_from(fetched)
+        return self._map_messages(fetched.value)
+
+    def _map_messages(self, rows: Sequence[Mapping[str, Any]]) -> MailProviderResult[tuple[MailMessage, ...]]:
         try:
             messages = tuple(
                 self._mapper.map_message(
@@ -416,7 +543,7 @@ class JmapSyncService:
                     local_account_id=self._local_account_id,
                     provider_account_id=self._client.session.provider_account_id,
                 )
-                for raw in fetched.value
+                for raw in rows
             )
         except (TypeError, ValueError):
             return MailProviderResult(ok=False, reason_code="jmap_message_invalid")
@@ -456,6 +583,33 @@ def _parse_changes(response: JmapMethodResponse) -> dict[str, Any] | None:
     }
 
 
+def _referenced_get_rows(
+    response: JmapMethodResponse | None,
+    *,
+    expected_ids: Sequence[str],
+    limit: int,
+) -> MailProviderResult[tuple[Mapping[str, Any], ...]]:
+    """Validate an ``Email/get`` whose ids came from an ``Email/changes`` back-reference."""
+    if response is None:
+        return MailProviderResult(ok=False, reason_code="jmap_get_response_missing")
+    result = method_response_result(response)
+    if not result.ok or result.value is None:
+        return _failure_from(result)
+    rows = result.value.arguments.get("list")
+    if not isinstance(rows, list) or any(not isinstance(row, Mapping) for row in rows):
+        return MailProviderResult(ok=False, reason_code="jmap_get_list_invalid")
+    if len(rows) > len(expected_ids) or len(rows) > limit:
+        return MailProviderResult(ok=False, reason_code="jmap_get_object_limit_exceeded")
+    response_ids = [str(row.get("id") or "") for row in rows]
+    if (
+        any(not value for value in response_ids)
+        or len(set(response_ids)) != len(response_ids)
+        or not set(response_ids).issubset(set(expected_ids))
+    ):
+        return MailProviderResult(ok=False, reason_code="jmap_get_response_ids_invalid")
+    return MailProviderResult(ok=True, reason_code="ok", value=tuple(dict(row) for row in rows))
+
+
 def _email_id(message: MailMessage) -> str:
     return str(message.message_ref.protocol_locator.get("email_id") or "")
 
@@ -45,6 +45,10 @@ class UpstreamConfig(BaseModel):
     trust_level: Literal["local", "cloud"] = "local"
     allowed_models: list[str] = Field(default_factory=list)
     timeout_seconds: int = 60
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+    # 0 = no cap on in-flight requests to this upstream
+    max_concurrency: int = 0
 
     @field_validator("id")
     @classmethod
@@ -77,11 +81,27 @@ class UpstreamConfig(BaseModel):
             raise ValueError("upstream.timeout_seconds must be in range 1..600")
         return value
 
+    @field_validator("pool_connections", "pool_maxsize")
+    @classmethod
+    def _validate_pool_size(cls, value: int) -> int:
+        if value < 1 or value > 256:
+            raise ValueError("upstream pool sizes must be in range 1..256")
+        return value
+
+    @field_validator("max_concurrency")
+    @classmethod
+    def _validate_max_concurrency(cls, value: int) -> int:
+        if value < 0 or value > 1024:
+            raise ValueError("upstream.max_concurrency must be in range 0..1024")
+        return value
+
 
 class RoutingRuleConfig(BaseModel):
     when: dict[str, Any] = Field(default_factory=dict)
     upstream: str
     model: str | None = None
+    # Tried in order when the rule's upstream is unhealthy or fails; same trust level only.
+    fallback_upstreams: list[str] = Field(default_factory=list)
 
 
 class RoutingConfig(BaseModel):
@@ -180,6 +200,9 @@ class LlmInterceptorConfig(BaseModel):
         for rule in value.rules:
             if rule.upstream not in known_ids:
                 raise ValueError(f"routing rule upstream {rule.upstream!r} not found in upstream list")
+            for fallback in rule.fallback_upstreams:
+                if fallback not in known_ids:
+                    raise ValueError(f"routing rule fallback upstream {fallback!r} not found in upstream list")
         return value
 
 
@@ -145,16 +145,27 @@ class OpenAICompatInterceptorServer:
 
             if bool(payload.get("stream", False)):
                 try:
-                    raw_iter = self._router.forward_chat_stream(payload=forwarded, envelope=envelope.as_dict())
+                    validate_chunks = self.cfg.response_validation.validate_stream_chunks
+                    raw_iter, upstream, routed_model = self._router.forward_chat_stream(
+                        payload=forwarded,
+                        envelope=envelope.as_dict(),
+                        passthrough=not validate_chunks,
+                    )
                     def _validated():
-                        for chunk in raw_iter:
-                            ok, reason = self._validator.validate_stream_chunk(chunk.strip())
-                            if not ok:
-                                yield "data: {\"error\":\"invalid_stream_chunk\"}\n\n"
-                                yield "data: [DONE]\n\n"
-                                break
-                            yield chunk
-                    stream_iter = _validated()
+                        try:
+                            for chunk in raw_iter:
+                                ok, reason = self._validator.validate_stream_chunk(chunk.strip())
+                                if not ok:
+                                    yield "data: {\"error\":\"invalid_stream_chunk\"}\n\n"
+                                    yield "data: [DONE]\n\n"
+                                    break
+                                yield chunk
+                        finally:
+                            close = getattr(raw_iter, "close", None)
+                            if callable(close):
+                                close()
+                    # Without chunk validation the upstream SSE bytes are relayed untouched.
+                    stream_iter = _validated() if validate_chunks else raw_iter
                 except ValueError as exc:
                     return _error_response(str(exc), code="upstream_error", status=502)
                 logger.info(
@@ -166,12 +177,17 @@ class OpenAICompatInterceptorServer:
                 )
                 return Response(stream_with_context(stream_iter), mimetype="text/event-stream")
             try:
-                result = self._router.forward_chat(payload=forwarded, envelope=envelope.as_dict())
+                # Failover may have served the request from a later candidate.
+                result, upstream, routed_model = self._router.forward_chat(
+                    payload=forwarded, envelope=envelope.as_dict()
+                )
                 valid, reason = self._validator.validate_chat_completion(result)
                 if not valid:
                     repaired, repair_reason = self._repair.repair_chat_completion(result, model=routed_model)
                     if repaired is None:
-                        return _error_response(f"response_validation_failed:{reason}", code="response_validation_failed", status=502)
+                        return _error_response(
+                            f"response_validation_failed:{reason}", code="response_validation_failed", status=502
+                        )
                     result = repaired
                     logger.info("llm_interceptor_repair request_id=%s reason=%s", envelope.request_id, repair_reason)
                 event = self._audit.build_event(
@@ -1,11 +1,77 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+import logging
+import os
+import threading
+import time
+from typing import Any, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from agent.services.llm_interceptor.config_schema import LlmInterceptorConfig, UpstreamConfig
 
+logger = logging.getLogger(__name__)
+
+# Consecutive failures before an upstream is skipped, and for how long.
+_UNHEALTHY_AFTER_FAILURES = 3
+_UNHEALTHY_COOLDOWN_SECONDS = 30.0
+_FAILOVER_STATUS = frozenset({429})
+
+
+class _UpstreamTransport:
+    """Pooled keep-alive session, concurrency cap and health state of one upstream."""
+
+    def __init__(self, upstream: UpstreamConfig) -> None:
+        self.upstream = upstream
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=upstream.pool_connections,
+            pool_maxsize=upstream.pool_maxsize,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
+        if upstream.api_key_env:
+            key = str(os.getenv(upstream.api_key_env) or "").strip()
+            if key:
+                self.session.headers["Authorization"] = f"Bearer {key}"
+        self._slots = threading.BoundedSemaphore(upstream.max_concurrency) if upstream.max_concurrency else None
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._unhealthy_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        with self._lock:
+            return time.monotonic() >= self._unhealthy_until
+
+    def acquire(self, *, wait: bool) -> bool:
+        if self._slots is None:
+            return True
+        if not wait:
+            return self._slots.acquire(blocking=False)
+        return self._slots.acquire(timeout=self.upstream.timeout_seconds)
+
+    def release(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._unhealthy_until = 0.0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= _UNHEALTHY_AFTER_FAILURES:
+                self._unhealthy_until = time.monotonic() + _UNHEALTHY_COOLDOWN_SECONDS
+
+    def close(self) -> None:
+        self.session.close()
+
 
 class ProviderRouter:
     """Routes and forwards normalized chat requests to configured upstreams."""
@@ -13,6 +79,28 @@ class ProviderRouter:
     def __init__(self, cfg: LlmInterceptorConfig) -> None:
         self.cfg = cfg
         self._by_id = {u.id: u for u in cfg.upstreams}
+        self._transports: dict[str, _UpstreamTransport] = {}
+        self._transports_lock = threading.Lock()
+
+    def _transport(self, upstream: UpstreamConfig) -> _UpstreamTransport:
+        transport = self._transports.get(upstream.id)
+        if transport is None:
+            with self._transports_lock:
+                transport = self._transports.get(upstream.id)
+                if transport is None:
+                    transport = _UpstreamTransport(upstream)
+                    self._transports[upstream.id] = transport
+        return transport
+
+    def upstream_health(self) -> dict[str, bool]:
+        return {upstream_id: transport.healthy for upstream_id, transport in dict(self._transports).items()}
+
+    def close(self) -> None:
+        """Drop pooled connections; the next request builds fresh sessions (and re-reads API keys)."""
+        with self._transports_lock:
+            transports, self._transports = self._transports, {}
+        for transport in transports.values():
+            transport.close()
 
     def _matches_when(self, when: dict[str, Any], meta: dict[str, Any]) -> bool:
         for key, value in dict(when or {}).items():
@@ -28,6 +116,12 @@ class ProviderRouter:
         return True
 
     def resolve_route(self, *, payload: dict[str, Any], envelope: dict[str, Any] | None = None) -> tuple[UpstreamConfig, str]:
+        return self.route_candidates(payload=payload, envelope=envelope)[0]
+
+    def route_candidates(
+        self, *, payload: dict[str, Any], envelope: dict[str, Any] | None = None
+    ) -> list[tuple[UpstreamConfig, str]]:
+        """Primary (upstream, model) first, then failover targets of the same trust level."""
         env = dict(envelope or {})
         caller = dict(env.get("caller_metadata") or payload.get("caller") or {})
         task = dict(env.get("task_metadata") or payload.get("task") or {})
@@ -38,61 +132,168 @@ class ProviderRouter:
             "requires_cloud": bool(task.get("requires_cloud", False)),
             "context_class": str(task.get("context_class") or "").lower(),
         }
-        chosen_upstream_id = self.cfg.routing.default_upstream
         requested_model = str(payload.get("model") or self.cfg.routing.default_model).strip()
-        chosen_model = str(self.cfg.routing.model_aliases.get(requested_model) or requested_model)
-        for rule in self.cfg.routing.rules:
-            if self._matches_when(rule.when, route_meta):
-                chosen_upstream_id = rule.upstream
-                if rule.model:
-                    chosen_model = rule.model
-                break
-        upstream = self._by_id[chosen_upstream_id]
-        # Worker-supplied model is mapped through allowlist, not blindly trusted.
-        if upstream.allowed_models and chosen_model not in upstream.allowed_models:
-            chosen_model = upstream.allowed_models[0]
-        return upstream, chosen_model
+        default_model = str(self.cfg.routing.model_aliases.get(requested_model) or requested_model)
+        matched = [rule for rule in self.cfg.routing.rules if self._matches_when(rule.when, route_meta)]
+        if matched:
+            first = matched[0]
+            entries = [(first.upstream, first.model or default_model)]
+            entries += [(upstream_id, first.model or default_model) for upstream_id in first.fallback_upstreams]
+            entries += [(rule.upstream, rule.model or default_model) for rule in matched[1:]]
+        else:
+            entries = [(self.cfg.routing.default_upstream, default_model)]
+        primary = self._by_id[entries[0][0]]
+        candidates: list[tuple[UpstreamConfig, str]] = []
+        seen: set[str] = set()
+        for upstream_id, chosen_model in entries:
+            upstream = self._by_id[upstream_id]
+            # Policy and redaction were decided for the primary's trust level.
+            if upstream_id in seen or upstream.trust_level != primary.trust_level:
+                continue
+            seen.add(upstream_id)
+            # Worker-supplied model is mapped through allowlist, not blindly trusted.
+            if upstream.allowed_models and chosen_model not in upstream.allowed_models:
+                chosen_model = upstream.allowed_models[0]
+            candidates.append((upstream, chosen_model))
+        return candidates
 
     def _enforce_model_allowlist(self, upstream: UpstreamConfig, model: str) -> None:
         if upstream.allowed_models and model not in upstream.allowed_models:
             raise ValueError("model_not_allowed_for_upstream")
 
-    def forward_chat(self, *, payload: dict[str, Any], envelope: dict[str, Any] | None = None) -> dict[str, Any]:
-        upstream, model = self.resolve_route(payload=payload, envelope=envelope)
-        self._enforce_model_allowlist(upstream, model)
-        target = f"{upstream.base_url}/chat/completions"
-        headers = {"Content-Type": "application/json"}
-        if upstream.api_key_env:
-            import os
+    def _failover_order(self, candidates: list[tuple[UpstreamConfig, str]]) -> list[tuple[UpstreamConfig, str]]:
+        healthy = [item for item in candidates if self._transport(item[0]).healthy]
+        return healthy + [item for item in candidates if item not in healthy]
 
-            key = str(os.getenv(upstream.api_key_env) or "").strip()
-            if key:
-                headers["Authorization"] = f"Bearer {key}"
-        body = dict(payload)
-        body["model"] = model
-        resp = requests.post(target, json=body, headers=headers, timeout=upstream.timeout_seconds)
-        if resp.status_code >= 400:
-            raise ValueError(f"upstream_error:{resp.status_code}")
+    def _post(self, *, payload: dict[str, Any], envelope: dict[str, Any] | None, stream: bool):
+        """Send to the first usable candidate; returns (response, transport, upstream, model).
+
+        Connection errors, timeouts, 5xx and 429 move on to the next candidate. For
+        streams the slot stays acquired until the caller releases it.
+        """
+        candidates = self._failover_order(self.route_candidates(payload=payload, envelope=envelope))
+        last_error = "upstream_unavailable"
+        for index, (upstream, model) in enumerate(candidates):
+            self._enforce_model_allowlist(upstream, model)
+            transport = self._transport(upstream)
+            if not transport.acquire(wait=index == len(candidates) - 1):
+                last_error = "upstream_saturated"
+                continue
+            body = dict(payload)
+            body["model"] = model
+            if stream:
+                body["stream"] = True
+            try:
+                resp = transport.session.post(
+                    f"{upstream.base_url}/chat/completions",
+                    json=body,
+                    timeout=upstream.timeout_seconds,
+                    stream=stream,
+                )
+            except requests.RequestException as exc:
+                transport.release()
+                transport.record_failure()
+                last_error = "upstream_unreachable"
+                logger.warning("llm_interceptor_upstream_failed upstream=%s error=%s", upstream.id, type(exc).__name__)
+                continue
+            if resp.status_code >= 500 or resp.status_code in _FAILOVER_STATUS:
+                resp.close()
+                transport.release()
+                transport.record_failure()
+                last_error = f"upstream_error:{resp.status_code}"
+                logger.warning("llm_interceptor_upstream_failed upstream=%s status=%s", upstream.id, resp.status_code)
+                continue
+            transport.record_success()
+            if resp.status_code >= 400:
+                resp.close()
+                transport.release()
+                raise ValueError(f"upstream_error:{resp.status_code}")
+            if index:
+                logger.info("llm_interceptor_failover primary=%s upstream=%s", candidates[0][0].id, upstream.id)
+            if not stream:
+                transport.release()
+            return resp, transport, upstream, model
+        raise ValueError(last_error)
+
+    def forward_chat(
+        self, *, payload: dict[str, Any], envelope: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], UpstreamConfig, str]:
+        """Return the completion with the (upstream, model) that actually served it."""
+        resp, _transport, upstream, model = self._post(payload=payload, envelope=envelope, stream=False)
         try:
-            return dict(resp.json())
+            return dict(resp.json()), upstream, model
         except ValueError as exc:
             raise ValueError("upstream_invalid_json") from exc
 
-    def forward_chat_stream(self, *, payload: dict[str, Any], envelope: dict[str, Any] | None = None) -> Iterable[str]:
-        upstream, model = self.resolve_route(payload=payload, envelope=envelope)
-        self._enforce_model_allowlist(upstream, model)
-        target = f"{upstream.base_url}/chat/completions"
-        headers = {"Content-Type": "application/json"}
-        body = dict(payload)
-        body["model"] = model
-        body["stream"] = True
-        resp = requests.post(target, json=body, headers=headers, timeout=upstream.timeout_seconds, stream=True)
-        if resp.status_code >= 400:
-            raise ValueError(f"upstream_error:{resp.status_code}")
-        for line in resp.iter_lines(decode_unicode=True):
+    def forward_chat_stream(
+        self,
+        *,
+        payload: dict[str, Any],
+        envelope: dict[str, Any] | None = None,
+        passthrough: bool = False,
+    ) -> tuple[UpstreamStream, UpstreamConfig, str]:
+        """Open the upstream stream now (errors raise here) and relay it lazily.
+
+        With ``passthrough`` the SSE bytes are relayed as received, without
+        splitting them into lines.
+        """
+        resp, transport, upstream, model = self._post(payload=payload, envelope=envelope, stream=True)
+        return UpstreamStream(resp, transport, passthrough=passthrough), upstream, model
+
+
+class UpstreamStream:
+    """Iterator over one open upstream stream that owns its concurrency slot.
+
+    The response and slot are released when the stream is exhausted, fails,
+    is closed, or is garbage collected; the last case covers clients that
+    disconnect before the first chunk, when no generator ``finally`` would run.
+    """
+
+    def __init__(self, resp, transport: _UpstreamTransport, *, passthrough: bool) -> None:
+        self._resp = resp
+        self._transport = transport
+        self._passthrough = passthrough
+        self._chunks: Iterator[str | bytes] | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __iter__(self) -> UpstreamStream:
+        return self
+
+    def __next__(self) -> str | bytes:
+        if self._chunks is None:
+            if self._closed:
+                raise StopIteration
+            self._chunks = self._relay()
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def _relay(self) -> Iterator[str | bytes]:
+        if self._passthrough:
+            for chunk in self._resp.iter_content(chunk_size=None):
+                if chunk:
+                    yield chunk
+            return
+        for line in self._resp.iter_lines(decode_unicode=True):
             if line is None:
                 continue
             text = str(line).strip()
             if not text:
                 continue
             yield f"{text}\n\n"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._resp.close()
+        finally:
+            self._transport.release()
+
+    def __del__(self) -> None:
+        self.close()
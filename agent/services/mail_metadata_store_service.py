@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import json
 import os
-import tempfile
+import sqlite3
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Mapping, TypeVar
+from typing import Any, Callable, Iterable, Mapping
 
 from agent.services.mail_contract_service import (
     MAIL_METADATA_STORE_SCHEMA,
@@ -15,18 +14,10 @@ from agent.services.mail_contract_service import (
     MailMessageRefV2,
 )
 from agent.services.mail_provider_ports import MailSyncCursor, VerifiedMailContentAccess
-from agent.services.mail_migration_journal import MailFileLock
 
-R = TypeVar("R")
-
-
-def _locked(method: Callable[..., R]) -> Callable[..., R]:
-    @wraps(method)
-    def wrapped(self: MailMetadataStore, *args: Any, **kwargs: Any) -> R:
-        with MailFileLock(path=self._lock_path):
-            return method(self, *args, **kwargs)
-
-    return wrapped
+_SQLITE_SUFFIXES = {".sqlite3", ".sqlite", ".db"}
+_BODY_SCOPES = ("body_excerpt", "full_body")
+_ROW_COLUMNS = "message_ref_json, metadata_json, stale, body_json, body_scope, attachments_json, updated_at"
 
 
 @dataclass(frozen=True, slots=True)
@@ -76,26 +67,37 @@ def locator_alias_for_ref(message_ref: MailMessageRefV2, *, alias_version: int =
     )
 
 
+def metadata_database_path(store_path: str | Path) -> Path:
+    """SQLite file that backs the store configured with ``store_path``."""
+    path = Path(store_path).resolve()
+    return path if path.suffix.lower() in _SQLITE_SUFFIXES else path.with_suffix(".sqlite3")
+
+
 def _now_iso() -> str:
     return datetime.now(UTC).isoformat().replace("+00:00", "Z")
 
 
-def _atomic_write(path: Path, payload: Mapping[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    descriptor, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+def _json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _date_epoch(value: Any) -> float | None:
     try:
-        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
-            json.dump(dict(payload), handle, ensure_ascii=False, indent=2)
-            handle.write("\n")
-            handle.flush()
-            os.fsync(handle.fileno())
-        os.replace(temp_name, path)
-    except BaseException:
-        try:
-            os.unlink(temp_name)
-        except FileNotFoundError:
-            pass
-        raise
+        parsed = datetime.fromisoformat(str(value or "").replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+def _like_pattern(value: Any) -> str:
+    escaped = str(value).lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _body_text(body: Mapping[str, Any]) -> str:
+    return f"{body.get('text', '')} {body.get('html', '')}".lower()
 
 
 def _require_access(
@@ -118,103 +120,118 @@ def _require_access(
 
 
 class MailMetadataStore:
-    def __init__(self, *, store_path: str | Path) -> None:
-        self._path = Path(store_path).resolve()
-        self._lock_path = self._path.with_suffix(f"{self._path.suffix}.lock")
-
-    def _load(self) -> dict[str, Any]:
-        if not self._path.exists():
-            return {"schema": MAIL_METADATA_STORE_SCHEMA, "messages": [], "sync_cursors": [], "locator_aliases": []}
-        payload = json.loads(self._path.read_text(encoding="utf-8"))
-        if not isinstance(payload, dict) or payload.get("schema") != MAIL_METADATA_STORE_SCHEMA:
-            raise ValueError("mail_metadata_store_schema_unsupported")
-        payload.setdefault("messages", [])
-        payload.setdefault("sync_cursors", [])
-        payload.setdefault("locator_aliases", [])
-        return payload
+    """Mail metadata, bodies, sync cursors and locator aliases in one SQLite file.
+
+    Sender, recipients, subject, date and read/flag state are kept in indexed
+    columns next to the JSON payloads, mailbox membership in its own table and
+    released bodies in an FTS5 trigram table, so :meth:`search_messages` is a
+    single SQL query. A JSON store at ``store_path`` (written by the migration
+    service or an older build) is imported whenever that file changes.
+    """
+
+    def __init__(self, *, store_path: str | Path, busy_timeout_seconds: float = 10.0) -> None:
+        path = Path(store_path).resolve()
+        self._path = metadata_database_path(path)
+        self._legacy_path: Path | None = None if self._path == path else path
+        self._busy_timeout_ms = int(max(1.0, min(float(busy_timeout_seconds), 60.0)) * 1000)
+        self._legacy_seen: str | None = None
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connect()
+        try:
+            self._fts5 = self._initialize(connection)
+        finally:
+            connection.close()
+        os.chmod(self._path, 0o600)
 
-    def _save(self, payload: Mapping[str, Any]) -> None:
-        _atomic_write(self._path, payload)
+    @property
+    def database_path(self) -> Path:
+        return self._path
 
-    @_locked
     def upsert_message(
         self,
         *,
         message_ref: MailMessageRefV2,
         metadata: MailMessageMetadata,
     ) -> dict[str, Any]:
-        payload = self._load()
-        rows = [dict(item) for item in payload["messages"] if isinstance(item, dict)]
-        existing = next(
-            (row for row in rows if str(dict(row.get("message_ref") or {}).get("mail_ref_id") or "") == message_ref.mail_ref_id),
-            None,
-        )
-        row = {
-            "message_ref": message_ref.to_dict(),
-            "metadata": metadata.to_dict(),
-            "stale": False,
-            "body": dict(existing.get("body") or {}) if existing else {},
-            "body_scope": str(existing.get("body_scope") or "metadata_only") if existing else "metadata_only",
-            "attachments": list(existing.get("attachments") or []) if existing else [],
-            "updated_at": _now_iso(),
-        }
-        rows = [
-            item
-            for item in rows
-            if str(dict(item.get("message_ref") or {}).get("mail_ref_id") or "") != message_ref.mail_ref_id
-        ]
-        rows.append(row)
-        payload["messages"] = rows
-        aliases = [dict(item) for item in payload["locator_aliases"] if isinstance(item, dict)]
-        alias = locator_alias_for_ref(message_ref)
-        target_key = _locator_key(
-            account_id=alias.account_id,
-            protocol=alias.protocol,
-            locator=alias.protocol_locator,
-            locator_version=alias.locator_version,
+        return self._write(
+            lambda connection: self._upsert(connection, message_ref=message_ref, metadata=metadata)
         )
-        collisions = [
-            item
-            for item in aliases
-            if _locator_key(
-                account_id=str(item.get("account_id") or ""),
-                protocol=str(item.get("protocol") or ""),
-                locator=dict(item.get("protocol_locator") or {}),
-                locator_version=int(item.get("locator_version") or 1),
-            )
-            == target_key
-        ]
-        if any(str(item.get("mail_ref_id") or "") != alias.mail_ref_id for item in collisions):
-            raise ValueError("mail_locator_alias_conflict")
-        if not any(str(item.get("mail_ref_id") or "") == alias.mail_ref_id for item in collisions):
-            next_version = max([int(item.get("alias_version") or 0) for item in aliases] or [0]) + 1
-            aliases.append(locator_alias_for_ref(message_ref, alias_version=next_version).to_dict())
-        payload["locator_aliases"] = aliases
-        self._save(payload)
-        return dict(row)
-
-    @_locked
+
+    def upsert_many(self, items: Iterable[tuple[MailMessageRefV2, MailMessageMetadata]]) -> int:
+        """Upsert a sync batch in one transaction; a conflicting alias rolls back the whole batch."""
+
+        def upsert(connection: sqlite3.Connection) -> int:
+            count = 0
+            for message_ref, metadata in items:
+                self._upsert(connection, message_ref=message_ref, metadata=metadata, fetch=False)
+                count += 1
+            return count
+
+        return self._write(upsert)
+
     def get_by_mail_ref_id(self, mail_ref_id: str) -> dict[str, Any] | None:
-        target = str(mail_ref_id)
-        for row in self._load()["messages"]:
-            if not isinstance(row, dict):
-                continue
-            if str(dict(row.get("message_ref") or {}).get("mail_ref_id") or "") == target:
-                return dict(row)
-        return None
+        row = self._read(lambda connection: self._message_row(connection, str(mail_ref_id)))
+        return self._row_mapping(row) if row is not None else None
 
-    @_locked
     def list_messages(self, *, account_id: str | None = None) -> list[dict[str, Any]]:
-        rows = [dict(item) for item in self._load()["messages"] if isinstance(item, dict)]
         if account_id is None:
-            return rows
-        return [
-            row
-            for row in rows
-            if str(dict(row.get("message_ref") or {}).get("account_id") or "") == str(account_id)
-        ]
+            sql, values = f"SELECT {_ROW_COLUMNS} FROM mail_messages ORDER BY seq", ()
+        else:
+            sql = f"SELECT {_ROW_COLUMNS} FROM mail_messages WHERE account_id = ? ORDER BY seq"
+            values = (str(account_id),)
+        rows = self._read(lambda connection: connection.execute(sql, values).fetchall())
+        return [self._row_mapping(row) for row in rows]
+
+    def search_messages(
+        self,
+        *,
+        filters: Mapping[str, Any] | None = None,
+        body_contains: str = "",
+        include_body_search: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Rows matching ``filters`` in store order; see ``mail_search_service`` for the filter keys."""
+        query = dict(filters or {})
+        body_query = str(body_contains).strip().lower()
+        if body_query and not include_body_search:
+            return []
+        clauses: list[str] = []
+        values: list[Any] = []
+        if query.get("account_id"):
+            clauses.append("account_id = ?")
+            values.append(str(query["account_id"]))
+        for key, column in (("from", "from_address"), ("to", "to_addresses"), ("subject", "subject")):
+            if query.get(key):
+                clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+                values.append(_like_pattern(query[key]))
+        if query.get("mailbox"):
+            clauses.append("id IN (SELECT message_id FROM mail_message_mailboxes WHERE mailbox_ref_id = ?)")
+            values.append(str(query["mailbox"]))
+        for key in ("unread", "starred"):
+            if query.get(key) is not None:
+                clauses.append(f"{key} = ?")
+                values.append(int(bool(query[key])))
+        for key, operator in (("date_from", ">="), ("date_to", "<=")):
+            bound = _date_epoch(query.get(key)) if query.get(key) else None
+            if bound is not None:
+                clauses.append(f"(date_epoch IS NULL OR date_epoch {operator} ?)")
+                values.append(bound)
+        if body_query:
+            clauses.append(f"body_scope IN ({', '.join('?' for _ in _BODY_SCOPES)})")
+            values.extend(_BODY_SCOPES)
+            if self._fts5 and len(body_query) >= 3:
+                phrase = '"' + body_query.replace('"', '""') + '"'
+                clauses.append(
+                    "id IN (SELECT rowid FROM mail_body_fts WHERE mail_body_fts MATCH ? AND instr(body, ?) > 0)"
+                )
+                values.extend((phrase, body_query))
+            else:
+                clauses.append("id IN (SELECT rowid FROM mail_body_fts WHERE instr(body, ?) > 0)")
+                values.append(body_query)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT {_ROW_COLUMNS} FROM mail_messages{where} ORDER BY seq"
+        rows = self._read(lambda connection: connection.execute(sql, values).fetchall())
+        return [self._row_mapping(row) for row in rows]
 
-    @_locked
     def store_body(
         self,
         *,
@@ -223,29 +240,24 @@ class MailMetadataStore:
         html_body: str,
         access: VerifiedMailContentAccess,
     ) -> dict[str, Any]:
-        payload = self._load()
-        rows = [dict(item) for item in payload["messages"] if isinstance(item, dict)]
-        for index, row in enumerate(rows):
-            ref = dict(row.get("message_ref") or {})
-            if str(ref.get("mail_ref_id") or "") != str(mail_ref_id):
-                continue
+        def update(connection: sqlite3.Connection) -> dict[str, Any]:
+            message_id, account_id = self._require_message(connection, mail_ref_id)
             _require_access(
                 access,
-                account_id=str(ref.get("account_id") or ""),
+                account_id=account_id,
                 mail_ref_id=str(mail_ref_id),
-                allowed_scopes={"body_excerpt", "full_body"},
+                allowed_scopes=set(_BODY_SCOPES),
             )
-            updated = dict(row)
-            updated["body"] = {"text": str(text_body), "html": str(html_body)}
-            updated["body_scope"] = access.release_scope
-            updated["updated_at"] = _now_iso()
-            rows[index] = updated
-            payload["messages"] = rows
-            self._save(payload)
-            return updated
-        raise ValueError("mail_message_not_found")
-
-    @_locked
+            body = {"text": str(text_body), "html": str(html_body)}
+            connection.execute(
+                "UPDATE mail_messages SET body_json = ?, body_scope = ?, updated_at = ? WHERE id = ?",
+                (_json(body), access.release_scope, _now_iso(), message_id),
+            )
+            self._index_body(connection, message_id, body)
+            return self._row_mapping(self._message_row(connection, str(mail_ref_id)))
+
+        return self._write(update)
+
     def store_attachments(
         self,
         *,
@@ -253,125 +265,129 @@ class MailMetadataStore:
         attachments: list[Mapping[str, Any]],
         access: VerifiedMailContentAccess,
     ) -> dict[str, Any]:
-        payload = self._load()
-        rows = [dict(item) for item in payload["messages"] if isinstance(item, dict)]
-        for index, row in enumerate(rows):
-            ref = dict(row.get("message_ref") or {})
-            if str(ref.get("mail_ref_id") or "") != str(mail_ref_id):
-                continue
+        def update(connection: sqlite3.Connection) -> dict[str, Any]:
+            message_id, account_id = self._require_message(connection, mail_ref_id)
             _require_access(
                 access,
-                account_id=str(ref.get("account_id") or ""),
+                account_id=account_id,
                 mail_ref_id=str(mail_ref_id),
                 allowed_scopes={"attachment_ref"},
             )
-            updated = dict(row)
-            updated["attachments"] = [dict(item) for item in attachments]
-            updated["updated_at"] = _now_iso()
-            rows[index] = updated
-            payload["messages"] = rows
-            self._save(payload)
-            return updated
-        raise ValueError("mail_message_not_found")
-
-    @_locked
+            connection.execute(
+                "UPDATE mail_messages SET attachments_json = ?, updated_at = ? WHERE id = ?",
+                (_json([dict(item) for item in attachments]), _now_iso(), message_id),
+            )
+            return self._row_mapping(self._message_row(connection, str(mail_ref_id)))
+
+        return self._write(update)
+
     def mark_stale(self, *, mail_ref_id: str, stale: bool = True) -> dict[str, Any]:
-        payload = self._load()
-        rows = [dict(item) for item in payload["messages"] if isinstance(item, dict)]
-        for index, row in enumerate(rows):
-            if str(dict(row.get("message_ref") or {}).get("mail_ref_id") or "") == str(mail_ref_id):
-                updated = dict(row)
-                updated["stale"] = bool(stale)
-                updated["updated_at"] = _now_iso()
-                rows[index] = updated
-                payload["messages"] = rows
-                self._save(payload)
-                return updated
-        raise ValueError("mail_message_not_found")
-
-    @_locked
+        def update(connection: sqlite3.Connection) -> dict[str, Any]:
+            message_id, _account_id = self._require_message(connection, mail_ref_id)
+            connection.execute(
+                "UPDATE mail_messages SET stale = ?, updated_at = ? WHERE id = ?",
+                (int(bool(stale)), _now_iso(), message_id),
+            )
+            return self._row_mapping(self._message_row(connection, str(mail_ref_id)))
+
+        return self._write(update)
+
     def delete_message(self, *, mail_ref_id: str) -> bool:
-        payload = self._load()
-        rows = [dict(item) for item in payload["messages"] if isinstance(item, dict)]
-        kept = [
-            row
-            for row in rows
-            if str(dict(row.get("message_ref") or {}).get("mail_ref_id") or "") != str(mail_ref_id)
-        ]
-        if len(kept) == len(rows):
-            return False
-        payload["messages"] = kept
-        self._save(payload)
-        return True
+        return self.delete_many([mail_ref_id]) > 0
+
+    def delete_many(self, mail_ref_ids: Iterable[str]) -> int:
+        """Delete messages in one transaction; locator aliases are kept."""
+
+        def delete(connection: sqlite3.Connection) -> int:
+            deleted = 0
+            for mail_ref_id in mail_ref_ids:
+                row = connection.execute(
+                    "SELECT id FROM mail_messages WHERE mail_ref_id = ?", (str(mail_ref_id),)
+                ).fetchone()
+                if row is None:
+                    continue
+                connection.execute("DELETE FROM mail_body_fts WHERE rowid = ?", (row[0],))
+                connection.execute("DELETE FROM mail_messages WHERE id = ?", (row[0],))
+                deleted += 1
+            return deleted
+
+        return self._write(delete)
 
-    @_locked
     def save_sync_cursor(self, cursor: MailSyncCursor) -> MailSyncCursor:
-        payload = self._load()
-        cursors = [dict(item) for item in payload["sync_cursors"] if isinstance(item, dict)]
-        key = (cursor.account_id, cursor.protocol, cursor.scope)
-        cursors = [
-            item
-            for item in cursors
-            if (str(item.get("account_id")), str(item.get("protocol")), str(item.get("scope") or "default")) != key
-        ]
-        cursors.append(
-            {
-                "account_id": cursor.account_id,
-                "protocol": cursor.protocol,
-                "scope": cursor.scope,
-                "mailbox_state": cursor.mailbox_state,
-                "email_state": cursor.email_state,
-                "query_state": cursor.query_state,
-            }
-        )
-        payload["sync_cursors"] = cursors
-        self._save(payload)
-        return cursor
+        def save(connection: sqlite3.Connection) -> MailSyncCursor:
+            self._save_cursor(
+                connection,
+                {
+                    "account_id": cursor.account_id,
+                    "protocol": cursor.protocol,
+                    "scope": cursor.scope,
+                    "mailbox_state": cursor.mailbox_state,
+                    "email_state": cursor.email_state,
+                    "query_state": cursor.query_state,
+                },
+            )
+            return cursor
+
+        return self._write(save)
 
-    @_locked
     def get_sync_cursor(self, *, account_id: str, protocol: str, scope: str = "default") -> MailSyncCursor | None:
         key = (str(account_id), str(protocol), str(scope))
-        for item in self._load()["sync_cursors"]:
-            if not isinstance(item, dict):
-                continue
-            if (str(item.get("account_id")), str(item.get("protocol")), str(item.get("scope") or "default")) == key:
-                return MailSyncCursor(
-                    account_id=key[0],
-                    protocol=key[1],
-                    scope=key[2],
-                    mailbox_state=str(item.get("mailbox_state") or ""),
-                    email_state=str(item.get("email_state") or ""),
-                    query_state=str(item.get("query_state") or ""),
-                )
-        return None
+        row = self._read(
+            lambda connection: connection.execute(
+                """
+                SELECT mailbox_state, email_state, query_state
+                  FROM mail_sync_cursors
+                 WHERE account_id = ? AND protocol = ? AND scope = ?
+                """,
+                key,
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        return MailSyncCursor(
+            account_id=key[0],
+            protocol=key[1],
+            scope=key[2],
+            mailbox_state=str(row[0] or ""),
+            email_state=str(row[1] or ""),
+            query_state=str(row[2] or ""),
+        )
 
-    @_locked
     def list_locator_aliases(
         self,
         *,
         account_id: str | None = None,
         mail_ref_id: str | None = None,
     ) -> list[MailLocatorAlias]:
-        aliases = [
+        clauses: list[str] = []
+        values: list[str] = []
+        if account_id is not None:
+            clauses.append("account_id = ?")
+            values.append(str(account_id))
+        if mail_ref_id is not None:
+            clauses.append("mail_ref_id = ?")
+            values.append(str(mail_ref_id))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._read(
+            lambda connection: connection.execute(
+                "SELECT alias_id, mail_ref_id, account_id, protocol, locator_json, locator_version, alias_version"
+                f" FROM mail_locator_aliases{where} ORDER BY rowid",
+                values,
+            ).fetchall()
+        )
+        return [
             MailLocatorAlias(
-                alias_id=str(item.get("alias_id") or ""),
-                mail_ref_id=str(item.get("mail_ref_id") or ""),
-                account_id=str(item.get("account_id") or ""),
-                protocol=str(item.get("protocol") or ""),
-                protocol_locator=dict(item.get("protocol_locator") or {}),
-                locator_version=int(item.get("locator_version") or 1),
-                alias_version=int(item.get("alias_version") or 1),
+                alias_id=str(row[0]),
+                mail_ref_id=str(row[1]),
+                account_id=str(row[2]),
+                protocol=str(row[3]),
+                protocol_locator=dict(json.loads(row[4])),
+                locator_version=int(row[5]),
+                alias_version=int(row[6]),
             )
-            for item in self._load()["locator_aliases"]
-            if isinstance(item, dict)
+            for row in rows
         ]
-        if account_id is not None:
-            aliases = [item for item in aliases if item.account_id == str(account_id)]
-        if mail_ref_id is not None:
-            aliases = [item for item in aliases if item.mail_ref_id == str(mail_ref_id)]
-        return aliases
 
-    @_locked
     def resolve_locator(
         self,
         *,
@@ -380,25 +396,399 @@ class MailMetadataStore:
         protocol_locator: Mapping[str, Any],
         locator_version: int,
     ) -> str | None:
-        target = _locator_key(
+        key = _locator_key(
             account_id=str(account_id),
             protocol=str(protocol),
             locator=protocol_locator,
             locator_version=int(locator_version),
         )
-        matches = [
-            item
-            for item in self._load()["locator_aliases"]
-            if isinstance(item, dict)
-            and _locator_key(
-                account_id=str(item.get("account_id") or ""),
-                protocol=str(item.get("protocol") or ""),
-                locator=dict(item.get("protocol_locator") or {}),
-                locator_version=int(item.get("locator_version") or 1),
-            )
-            == target
-        ]
-        ids = {str(item.get("mail_ref_id") or "") for item in matches}
+        rows = self._read(
+            lambda connection: connection.execute(
+                "SELECT mail_ref_id FROM mail_locator_aliases WHERE locator_key = ?", (key,)
+            ).fetchall()
+        )
+        ids = {str(row[0]) for row in rows}
         if len(ids) > 1:
             raise ValueError("mail_locator_alias_ambiguous")
         return next(iter(ids), None)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            timeout=self._busy_timeout_ms / 1000.0,
+            isolation_level=None,
+        )
+        connection.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = FULL")
+        return connection
+
+    @staticmethod
+    def _initialize(connection: sqlite3.Connection) -> bool:
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS mail_messages (
+                id INTEGER PRIMARY KEY,
+                mail_ref_id TEXT NOT NULL UNIQUE,
+                account_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                message_ref_json TEXT NOT NULL,
+                metadata_json TEXT NOT NULL,
+                stale INTEGER NOT NULL DEFAULT 0,
+                body_json TEXT NOT NULL DEFAULT '{}',
+                body_scope TEXT NOT NULL DEFAULT 'metadata_only',
+                attachments_json TEXT NOT NULL DEFAULT '[]',
+                updated_at TEXT NOT NULL,
+                from_address TEXT NOT NULL DEFAULT '',
+                to_addresses TEXT NOT NULL DEFAULT '',
+                subject TEXT NOT NULL DEFAULT '',
+                date_epoch REAL,
+                unread INTEGER NOT NULL DEFAULT 1,
+                starred INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS mail_messages_seq ON mail_messages(seq);
+            CREATE INDEX IF NOT EXISTS mail_messages_account_seq ON mail_messages(account_id, seq);
+            CREATE INDEX IF NOT EXISTS mail_messages_account_date ON mail_messages(account_id, date_epoch);
+            CREATE INDEX IF NOT EXISTS mail_messages_account_flags ON mail_messages(account_id, unread, starred);
+            CREATE INDEX IF NOT EXISTS mail_messages_from ON mail_messages(from_address);
+            CREATE INDEX IF NOT EXISTS mail_messages_subject ON mail_messages(subject);
+            CREATE TABLE IF NOT EXISTS mail_message_mailboxes (
+                mailbox_ref_id TEXT NOT NULL,
+                message_id INTEGER NOT NULL REFERENCES mail_messages(id) ON DELETE CASCADE,
+                PRIMARY KEY (mailbox_ref_id, message_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS mail_message_mailboxes_message ON mail_message_mailboxes(message_id);
+            CREATE TABLE IF NOT EXISTS mail_locator_aliases (
+                alias_id TEXT NOT NULL,
+                locator_key TEXT NOT NULL UNIQUE,
+                mail_ref_id TEXT NOT NULL,
+                account_id TEXT NOT NULL,
+                protocol TEXT NOT NULL,
+                locator_json TEXT NOT NULL,
+                locator_version INTEGER NOT NULL,
+                alias_version INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS mail_locator_aliases_ref ON mail_locator_aliases(mail_ref_id);
+            CREATE TABLE IF NOT EXISTS mail_sync_cursors (
+                account_id TEXT NOT NULL,
+                protocol TEXT NOT NULL,
+                scope TEXT NOT NULL,
+                mailbox_state TEXT NOT NULL,
+                email_state TEXT NOT NULL,
+                query_state TEXT NOT NULL,
+                PRIMARY KEY (account_id, protocol, scope)
+            );
+            CREATE TABLE IF NOT EXISTS mail_store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        try:
+            connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS mail_body_fts USING fts5(body, tokenize='trigram')"
+            )
+        except sqlite3.OperationalError:
+            # SQLite without FTS5/trigram: same table name, body search scans it.
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS mail_body_fts (message_id INTEGER PRIMARY KEY, body TEXT NOT NULL)"
+            )
+        row = connection.execute("SELECT sql FROM sqlite_master WHERE name = 'mail_body_fts'").fetchone()
+        return bool(row and "fts5" in str(row[0]).lower())
+
+    def _read(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        self._sync_legacy_json()
+        connection = self._connect()
+        try:
+            return operation(connection)
+        finally:
+            connection.close()
+
+    def _write(self, operation: Callable[[sqlite3.Connection], Any], *, sync_legacy: bool = True) -> Any:
+        if sync_legacy:
+            self._sync_legacy_json()
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            result = operation(connection)
+            connection.commit()
+            return result
+        except BaseException:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def _sync_legacy_json(self) -> None:
+        if self._legacy_path is None:
+            return
+        try:
+            stat = self._legacy_path.stat()
+        except FileNotFoundError:
+            return
+        fingerprint = f"{stat.st_mtime_ns}:{stat.st_size}"
+        if fingerprint == self._legacy_seen:
+            return
+        self._write(lambda connection: self._import_legacy_json(connection, fingerprint), sync_legacy=False)
+        self._legacy_seen = fingerprint
+
+    def _import_legacy_json(self, connection: sqlite3.Connection, fingerprint: str) -> None:
+        row = connection.execute("SELECT value FROM mail_store_meta WHERE key = 'legacy_json_fingerprint'").fetchone()
+        if row is not None and str(row[0]) == fingerprint:
+            return
+        assert self._legacy_path is not None
+        payload = json.loads(self._legacy_path.read_text(encoding="utf-8"))
+        if not isinstance(payload, dict) or payload.get("schema") != MAIL_METADATA_STORE_SCHEMA:
+            raise ValueError("mail_metadata_store_schema_unsupported")
+        for item in payload.get("messages") or []:
+            if isinstance(item, dict):
+                self._import_row(connection, item)
+        for item in payload.get("sync_cursors") or []:
+            if isinstance(item, dict):
+                self._save_cursor(connection, item)
+        for item in payload.get("locator_aliases") or []:
+            if not isinstance(item, dict):
+                continue
+            locator = dict(item.get("protocol_locator") or {})
+            connection.execute(
+                """
+                INSERT OR IGNORE INTO mail_locator_aliases(
+                    alias_id, locator_key, mail_ref_id, account_id, protocol,
+                    locator_json, locator_version, alias_version
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    str(item.get("alias_id") or ""),
+                    _locator_key(
+                        account_id=str(item.get("account_id") or ""),
+                        protocol=str(item.get("protocol") or ""),
+                        locator=locator,
+                        locator_version=int(item.get("locator_version") or 1),
+                    ),
+                    str(item.get("mail_ref_id") or ""),
+                    str(item.get("account_id") or ""),
+                    str(item.get("protocol") or ""),
+                    _json(locator),
+                    int(item.get("locator_version") or 1),
+                    int(item.get("alias_version") or 1),
+                ),
+            )
+        connection.execute(
+            "INSERT OR REPLACE INTO mail_store_meta(key, value) VALUES ('legacy_json_fingerprint', ?)",
+            (fingerprint,),
+        )
+
+    def _import_row(self, connection: sqlite3.Connection, item: Mapping[str, Any]) -> None:
+        ref = dict(item.get("message_ref") or {})
+        mail_ref_id = str(ref.get("mail_ref_id") or "")
+        if not mail_ref_id:
+            return
+        existing = connection.execute(
+            "SELECT updated_at FROM mail_messages WHERE mail_ref_id = ?", (mail_ref_id,)
+        ).fetchone()
+        # An undated JSON row counts as the oldest version: it may seed a new row
+        # but never overwrite one the SQLite store already holds.
+        if existing is not None and (not item.get("updated_at") or str(existing[0]) > str(item["updated_at"])):
+            return
+        updated_at = str(item.get("updated_at") or _now_iso())
+        body = dict(item.get("body") or {})
+        message_id = self._write_row(
+            connection,
+            message_ref=ref,
+            metadata=dict(item.get("metadata") or {}),
+            stale=bool(item.get("stale")),
+            body=body,
+            body_scope=str(item.get("body_scope") or "metadata_only"),
+            attachments=list(item.get("attachments") or []),
+            updated_at=updated_at,
+        )
+        self._index_body(connection, message_id, body)
+
+    def _upsert(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        message_ref: MailMessageRefV2,
+        metadata: MailMessageMetadata,
+        fetch: bool = True,
+    ) -> dict[str, Any] | None:
+        alias = locator_alias_for_ref(message_ref)
+        key = _locator_key(
+            account_id=alias.account_id,
+            protocol=alias.protocol,
+            locator=alias.protocol_locator,
+            locator_version=alias.locator_version,
+        )
+        collision = connection.execute(
+            "SELECT mail_ref_id FROM mail_locator_aliases WHERE locator_key = ?", (key,)
+        ).fetchone()
+        if collision is not None and str(collision[0]) != alias.mail_ref_id:
+            raise ValueError("mail_locator_alias_conflict")
+        existing = connection.execute(
+            "SELECT body_json, body_scope, attachments_json FROM mail_messages WHERE mail_ref_id = ?",
+            (message_ref.mail_ref_id,),
+        ).fetchone()
+        self._write_row(
+            connection,
+            message_ref=message_ref.to_dict(),
+            metadata=metadata.to_dict(),
+            stale=False,
+            body=json.loads(existing[0]) if existing else {},
+            body_scope=str(existing[1]) if existing else "metadata_only",
+            attachments=json.loads(existing[2]) if existing else [],
+            updated_at=_now_iso(),
+        )
+        if collision is None:
+            next_version = int(
+                connection.execute("SELECT COALESCE(MAX(alias_version), 0) FROM mail_locator_aliases").fetchone()[0]
+            ) + 1
+            versioned = locator_alias_for_ref(message_ref, alias_version=next_version)
+            connection.execute(
+                """
+                INSERT INTO mail_locator_aliases(
+                    alias_id, locator_key, mail_ref_id, account_id, protocol,
+                    locator_json, locator_version, alias_version
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    versioned.alias_id,
+                    key,
+                    versioned.mail_ref_id,
+                    versioned.account_id,
+                    versioned.protocol,
+                    _json(dict(versioned.protocol_locator)),
+                    versioned.locator_version,
+                    versioned.alias_version,
+                ),
+            )
+        if not fetch:
+            return None
+        return self._row_mapping(self._message_row(connection, message_ref.mail_ref_id))
+
+    @staticmethod
+    def _write_row(
+        connection: sqlite3.Connection,
+        *,
+        message_ref: Mapping[str, Any],
+        metadata: Mapping[str, Any],
+        stale: bool,
+        body: Mapping[str, Any],
+        body_scope: str,
+        attachments: list[Any],
+        updated_at: str,
+    ) -> int:
+        """Insert or replace one message row; an upsert moves it to the end of the list order."""
+        keywords = {str(item) for item in list(metadata.get("keywords") or [])}
+        seq = int(connection.execute("SELECT COALESCE(MAX(seq), 0) FROM mail_messages").fetchone()[0]) + 1
+        message_id = int(
+            connection.execute(
+                """
+                INSERT INTO mail_messages(
+                    mail_ref_id, account_id, seq, message_ref_json, metadata_json,
+                    stale, body_json, body_scope, attachments_json, updated_at,
+                    from_address, to_addresses, subject, date_epoch, unread, starred
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(mail_ref_id) DO UPDATE SET
+                    account_id = excluded.account_id,
+                    seq = excluded.seq,
+                    message_ref_json = excluded.message_ref_json,
+                    metadata_json = excluded.metadata_json,
+                    stale = excluded.stale,
+                    body_json = excluded.body_json,
+                    body_scope = excluded.body_scope,
+                    attachments_json = excluded.attachments_json,
+                    updated_at = excluded.updated_at,
+                    from_address = excluded.from_address,
+                    to_addresses = excluded.to_addresses,
+                    subject = excluded.subject,
+                    date_epoch = excluded.date_epoch,
+                    unread = excluded.unread,
+                    starred = excluded.starred
+                RETURNING id
+                """,
+                (
+                    str(message_ref.get("mail_ref_id") or ""),
+                    str(message_ref.get("account_id") or ""),
+                    seq,
+                    _json(dict(message_ref)),
+                    _json(dict(metadata)),
+                    int(bool(stale)),
+                    _json(dict(body)),
+                    body_scope,
+                    _json(list(attachments)),
+                    updated_at,
+                    str(metadata.get("from") or "").lower(),
+                    " ".join(str(item) for item in list(metadata.get("to") or [])).lower(),
+                    str(metadata.get("subject") or "").lower(),
+                    _date_epoch(metadata.get("date")),
+                    int("$seen" not in keywords),
+                    int("$flagged" in keywords),
+                ),
+            ).fetchone()[0]
+        )
+        mailboxes = {str(item) for item in list(metadata.get("mailbox_ref_ids") or [])}
+        connection.execute("DELETE FROM mail_message_mailboxes WHERE message_id = ?", (message_id,))
+        connection.executemany(
+            "INSERT INTO mail_message_mailboxes(mailbox_ref_id, message_id) VALUES (?, ?)",
+            [(mailbox, message_id) for mailbox in sorted(mailboxes)],
+        )
+        return message_id
+
+    @staticmethod
+    def _index_body(connection: sqlite3.Connection, message_id: int, body: Mapping[str, Any]) -> None:
+        connection.execute("DELETE FROM mail_body_fts WHERE rowid = ?", (message_id,))
+        if body:
+            connection.execute(
+                "INSERT INTO mail_body_fts(rowid, body) VALUES (?, ?)",
+                (message_id, _body_text(body)),
+            )
+
+    @staticmethod
+    def _save_cursor(connection: sqlite3.Connection, cursor: Mapping[str, Any]) -> None:
+        connection.execute(
+            """
+            INSERT INTO mail_sync_cursors(
+                account_id, protocol, scope, mailbox_state, email_state, query_state
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(account_id, protocol, scope) DO UPDATE SET
+                mailbox_state = excluded.mailbox_state,
+                email_state = excluded.email_state,
+                query_state = excluded.query_state
+            """,
+            (
+                str(cursor.get("account_id") or ""),
+                str(cursor.get("protocol") or ""),
+                str(cursor.get("scope") or "default"),
+                str(cursor.get("mailbox_state") or ""),
+                str(cursor.get("email_state") or ""),
+                str(cursor.get("query_state") or ""),
+            ),
+        )
+
+    @staticmethod
+    def _require_message(connection: sqlite3.Connection, mail_ref_id: str) -> tuple[int, str]:
+        row = connection.execute(
+            "SELECT id, account_id FROM mail_messages WHERE mail_ref_id = ?", (str(mail_ref_id),)
+        ).fetchone()
+        if row is None:
+            raise ValueError("mail_message_not_found")
+        return int(row[0]), str(row[1])
+
+    @staticmethod
+    def _message_row(connection: sqlite3.Connection, mail_ref_id: str) -> tuple[Any, ...] | None:
+        return connection.execute(
+            f"SELECT {_ROW_COLUMNS} FROM mail_messages WHERE mail_ref_id = ?", (mail_ref_id,)
+        ).fetchone()
+
+    @staticmethod
+    def _row_mapping(row: tuple[Any, ...]) -> dict[str, Any]:
+        return {
+            "message_ref": json.loads(row[0]),
+            "metadata": json.loads(row[1]),
+            "stale": bool(row[2]),
+            "body": json.loads(row[3]),
+            "body_scope": str(row[4]),
+            "attachments": json.loads(row[5]),
+            "updated_at": str(row[6]),
+        }
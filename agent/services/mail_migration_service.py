@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import json
 import shutil
+import sqlite3
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping
@@ -10,7 +11,11 @@ from typing import Any, Mapping
 from agent.services.mail_account_mapper import MailAccountMapper
 from agent.services.mail_contract_service import MailMessageMetadata, MailMessageRefV2
 from agent.services.mail_legacy_mapper import LegacyMailRecord, MailLegacyMapper
-from agent.services.mail_metadata_store_service import locator_alias_for_ref
+from agent.services.mail_metadata_store_service import (
+    MailMetadataStore,
+    locator_alias_for_ref,
+    metadata_database_path,
+)
 from agent.services.mail_migration_journal import MailFileLock, MailMigrationJournal, MailMultiFileTransaction
 
 
@@ -147,12 +152,37 @@ class MailMigrationService:
                 "existed": existed,
                 "sha256": MailMigrationService._hash(destination) if existed else "",
             }
+        database = metadata_database_path(target_paths["metadata"])
+        snapshot = root / "preimage-metadata.sqlite3"
+        existed = database.exists()
+        if existed:
+            MailMigrationService._copy_database(database, snapshot)
+        manifest["databases"] = {
+            "metadata": {
+                "path": str(database),
+                "preimage": str(snapshot),
+                "existed": existed,
+                "sha256": MailMigrationService._hash(snapshot) if existed else "",
+            }
+        }
         (root / "manifest.json").write_text(
             json.dumps(manifest, ensure_ascii=False, indent=2) + "\n",
             encoding="utf-8",
         )
         return root, source_hashes, backup_hashes
 
+    @staticmethod
+    def _copy_database(source: Path, destination: Path) -> None:
+        # The online backup API copies a consistent image including pages that
+        # still live in the -wal file, and writes through the target's WAL.
+        source_connection = sqlite3.connect(source)
+        destination_connection = sqlite3.connect(destination)
+        try:
+            source_connection.backup(destination_connection)
+        finally:
+            destination_connection.close()
+            source_connection.close()
+
     @staticmethod
     def _load_target(path: Path, *, schema: str, defaults: Mapping[str, Any]) -> dict[str, Any]:
         if not path.exists():
@@ -260,6 +290,11 @@ class MailMigrationService:
                 schema="mail_metadata_store.v2",
                 defaults={"messages": [], "sync_cursors": [], "locator_aliases": []},
             )
+            # Messages and aliases live in the store's SQLite file; the JSON
+            # document only hands new rows over and is imported by the store.
+            metadata_store = MailMetadataStore(store_path=target_paths["metadata"])
+            stored_messages = metadata_store.list_messages()
+            known_aliases = [alias.to_dict() for alias in metadata_store.list_locator_aliases()]
             artifacts_payload = self._load_target(
                 target_paths["artifacts"],
                 schema="ananta.mail-artifacts.v2",
@@ -291,8 +326,7 @@ class MailMigrationService:
                     MailMessageRefV2.from_mapping(dict(item.get("message_ref") or {})),
                     MailMessageMetadata.from_mapping(dict(item.get("metadata") or {})),
                 )
-                for item in metadata_payload["messages"]
-                if isinstance(item, dict)
+                for item in stored_messages
             ]
             strong_counts: dict[str, int] = {}
             for record in mapped_messages:
@@ -343,14 +377,15 @@ class MailMigrationService:
                         record.message_ref.thread_ref_id,
                     )
                 )
-                next_version = max([int(item.get("alias_version") or 0) for item in aliases] or [0]) + 1
+                next_version = max([int(item.get("alias_version") or 0) for item in known_aliases] or [0]) + 1
                 alias = locator_alias_for_ref(alias_ref, alias_version=next_version).to_dict()
                 if not any(
                     str(item.get("mail_ref_id")) == alias["mail_ref_id"]
                     and dict(item.get("protocol_locator") or {}) == alias["protocol_locator"]
-                    for item in aliases
+                    for item in known_aliases
                 ):
                     aliases.append(alias)
+                    known_aliases.append(alias)
                 accepted_records.append(LegacyMailRecord(alias_ref, record.metadata))
             metadata_payload["messages"] = message_rows
             metadata_payload["locator_aliases"] = aliases
@@ -441,11 +476,26 @@ class MailMigrationService:
                         reason_code="backup_content_hash_mismatch",
                     )
                 restore_files[target] = json.loads(preimage.read_text(encoding="utf-8"))
+            databases = [dict(item) for item in dict(manifest.get("databases") or {}).values()]
+            for item in databases:
+                expected_hash = str(item.get("sha256") or "")
+                if bool(item.get("existed")) and self._hash(Path(str(item["preimage"]))) != expected_hash:
+                    return MailMigrationReport(
+                        migration_id, "restore_failed", False, 0, 0, 0, 1,
+                        reason_code="backup_content_hash_mismatch",
+                    )
             transaction = MailMultiFileTransaction(
                 transaction_root=command.target_accounts_path.parent / ".mail-transactions",
                 transaction_id=f"restore-{migration_id}",
             )
             target_hashes = transaction.commit(restore_files)
+            for item in databases:
+                database = Path(str(item["path"]))
+                if bool(item.get("existed")):
+                    self._copy_database(Path(str(item["preimage"])), database)
+                    continue
+                for suffix in ("", "-wal", "-shm"):
+                    Path(f"{database}{suffix}").unlink(missing_ok=True)
         return MailMigrationReport(
             migration_id=migration_id,
             status="restored",
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import sqlite3
 import tempfile
 from pathlib import Path
 from typing import Any, Mapping, Sequence
@@ -44,6 +45,7 @@ class MailMetadataSyncDeltaApplier:
                 message.message_ref.mail_ref_id
                 for message in (*delta.created, *delta.updated)
             }
+            stale_ids: list[str] = []
             if replace_scope:
                 for row in self._metadata.list_messages(account_id=account_id):
                     raw_ref = row.get("message_ref")
@@ -61,16 +63,16 @@ class MailMetadataSyncDeltaApplier:
                     )
                     mail_ref_id = str(raw_ref.get("mail_ref_id") or "")
                     if same_provider and mail_ref_id and mail_ref_id not in incoming:
-                        self._metadata.delete_message(mail_ref_id=mail_ref_id)
-            for mail_ref_id in delta.destroyed_mail_ref_ids:
-                self._metadata.delete_message(mail_ref_id=str(mail_ref_id))
-            for message in (*delta.created, *delta.updated):
-                self._metadata.upsert_message(
-                    message_ref=message.message_ref,
-                    metadata=message.metadata,
-                )
+                        stale_ids.append(mail_ref_id)
+            stale_ids.extend(str(mail_ref_id) for mail_ref_id in delta.destroyed_mail_ref_ids)
+            if stale_ids:
+                self._metadata.delete_many(stale_ids)
+            self._metadata.upsert_many(
+                (message.message_ref, message.metadata)
+                for message in (*delta.created, *delta.updated)
+            )
             self._metadata.save_sync_cursor(delta.cursor)
-        except (OSError, TypeError, ValueError):
+        except (OSError, sqlite3.Error, TypeError, ValueError):
             return MailProviderResult.failure(
                 "mail_sync_metadata_projection_failed",
                 retryable=True,
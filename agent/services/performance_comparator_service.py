@@ -16,7 +16,16 @@ class PerformanceComparatorService:
         metric: str = "wall_time",
         min_relative_improvement_percent: float = 5.0,
         regression_result: dict[str, Any] | None = None,
+        min_samples: int = 5,
+        alpha: float = 0.05,
+        seed: int = 0,
     ) -> dict[str, Any]:
+        """Compare runs on ``metric`` (lower is better).
+
+        Runs with ``min_samples`` or more repeated samples are judged statistically
+        (bootstrap CI, Mann-Whitney U, minimum detectable effect) and come back
+        "inconclusive" / "variance_too_high" when the noise hides the gated effect.
+        """
         if not baseline_run or not candidate_run:
             return {
                 "schema": "performance_comparison_artifact.v1",
@@ -41,6 +50,9 @@ class PerformanceComparatorService:
             metric=metric,
             min_relative_improvement_percent=min_relative_improvement_percent,
             regression_passed=regression_passed,
+            min_samples=min_samples,
+            alpha=alpha,
+            seed=seed,
         )
 
 
@@ -2,9 +2,121 @@
 
 from __future__ import annotations
 
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
+from agent.services.codecompass_symbol_context_service import _DETAIL_KINDS, _detail_output_dir, _iter_jsonl
+
+_MAX_CANDIDATE_FILES = 5
+_SKIPPED_SCAN_DIRS = frozenset({".git", ".hg", ".svn", "__pycache__"})
+# Back-to-back analyses (baseline, candidate, regression) reuse one tree walk.
+_SCAN_CACHE_SECONDS = 30.0
+_SCAN_CACHE_LIMIT = 8
+
+_scan_cache: dict[str, tuple[float, tuple[str, ...]]] = {}
+_scan_cache_lock = threading.Lock()
+
+
+def _scan_workspace_files(root: Path) -> tuple[str, ...]:
+    """Relative file paths below root in a stable order, from one cached walk."""
+    key = str(root.resolve())
+    now = time.monotonic()
+    with _scan_cache_lock:
+        cached = _scan_cache.get(key)
+        if cached is not None and now - cached[0] < _SCAN_CACHE_SECONDS:
+            return cached[1]
+    files: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name not in _SKIPPED_SCAN_DIRS)
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in sorted(filenames):
+            files.append(name if rel_dir == "." else os.path.join(rel_dir, name))
+    scanned = tuple(files)
+    with _scan_cache_lock:
+        if len(_scan_cache) >= _SCAN_CACHE_LIMIT:
+            _scan_cache.pop(min(_scan_cache, key=lambda item: _scan_cache[item][0]), None)
+        _scan_cache[key] = (now, scanned)
+    return scanned
+
+
+def clear_hotspot_scan_cache() -> None:
+    with _scan_cache_lock:
+        _scan_cache.clear()
+
+
+class HotspotSourceIndex:
+    """Path and symbol lookup for one workspace, built once per hotspot analysis.
+
+    Symbol definitions come from CodeCompass detail output when the workspace has
+    it; file-name matches come from a single cached filesystem scan. Lookups are
+    memoised per token, so many hotspots never walk the tree again.
+    """
+
+    def __init__(self, file_paths: tuple[str, ...], symbol_files: dict[str, list[str]]) -> None:
+        self._file_paths = file_paths
+        self._names = [os.path.basename(path).lower() for path in file_paths]
+        self._symbol_files = symbol_files
+        self._name_matches: dict[str, list[str]] = {}
+
+    @property
+    def source(self) -> str:
+        return "codecompass" if self._symbol_files else "filesystem_scan"
+
+    @classmethod
+    def build(cls, workspace_dir: str | Path) -> HotspotSourceIndex:
+        root = Path(workspace_dir)
+        return cls(_scan_workspace_files(root), cls._codecompass_symbols(root))
+
+    @staticmethod
+    def _codecompass_symbols(root: Path) -> dict[str, list[str]]:
+        details_dir = _detail_output_dir(root) / "details_by_kind"
+        symbol_files: dict[str, list[str]] = {}
+        if not details_dir.is_dir():
+            return symbol_files
+        for kind in _DETAIL_KINDS:
+            for record in _iter_jsonl(details_dir / f"{kind}.jsonl"):
+                file_path = str(record.get("file") or "").strip()
+                if not file_path:
+                    continue
+                for key in ("name", "class_name"):
+                    name = str(record.get(key) or "").strip().lower()
+                    if not name:
+                        continue
+                    files = symbol_files.setdefault(name, [])
+                    if file_path not in files:
+                        files.append(file_path)
+        return symbol_files
+
+    def candidate_files(self, symbol: str, limit: int = _MAX_CANDIDATE_FILES) -> list[str]:
+        token = symbol.split(":")[0].split(".")[0].strip()
+        if not token:
+            return []
+        matches: list[str] = []
+        leaf = symbol.split(":")[-1].split(".")[-1].strip().lower()
+        for name in dict.fromkeys((leaf, token.lower())):
+            for path in self._symbol_files.get(name, ()):
+                if path not in matches:
+                    matches.append(path)
+        for path in self._files_named_like(token.lower()):
+            if path not in matches:
+                matches.append(path)
+        return matches[:limit]
+
+    def _files_named_like(self, token: str) -> list[str]:
+        cached = self._name_matches.get(token)
+        if cached is None:
+            cached = []
+            for index, name in enumerate(self._names):
+                if token in name:
+                    cached.append(self._file_paths[index])
+                    if len(cached) >= _MAX_CANDIDATE_FILES:
+                        break
+            self._name_matches[token] = cached
+        return cached
+
 
 class PerformanceHotspotService:
     def resolve_hotspots(
@@ -13,11 +125,16 @@ class PerformanceHotspotService:
         profile_observation: dict[str, Any],
         workspace_dir: str | Path = ".",
         max_hotspots: int = 10,
+        source_index: HotspotSourceIndex | None = None,
     ) -> dict[str, Any]:
+        items = list(profile_observation.get("hotspots") or [])[:max_hotspots]
+        lookup = source_index
+        if lookup is None and items:
+            lookup = HotspotSourceIndex.build(workspace_dir)
         hotspots = []
-        for index, item in enumerate(list(profile_observation.get("hotspots") or [])[:max_hotspots], start=1):
+        for index, item in enumerate(items, start=1):
             symbol = str(item.get("symbol") or item.get("name") or f"hotspot-{index}")
-            affected_files = self._candidate_files(symbol, workspace_dir)
+            affected_files = lookup.candidate_files(symbol) if lookup is not None else []
             hotspots.append({
                 "hotspot_id": f"hotspot-{index}",
                 "symbol": symbol,
@@ -29,29 +146,15 @@ class PerformanceHotspotService:
                 "affected_files": affected_files,
             })
         status = "completed" if hotspots else "degraded"
-        return {
+        report = {
             "schema": "performance_hotspot_report.v1",
             "status": status,
             "reason_code": "success" if hotspots else "codecompass_index_unavailable",
             "hotspots": hotspots,
         }
-
-    @staticmethod
-    def _candidate_files(symbol: str, workspace_dir: str | Path) -> list[str]:
-        root = Path(workspace_dir)
-        token = symbol.split(":")[0].split(".")[0].strip()
-        if not token:
-            return []
-        matches = []
-        for path in root.rglob("*"):
-            if len(matches) >= 5:
-                break
-            if path.is_file() and token.lower() in path.name.lower():
-                try:
-                    matches.append(str(path.relative_to(root)))
-                except ValueError:
-                    matches.append(str(path))
-        return matches
+        if lookup is not None:
+            report["source_index"] = lookup.source
+        return report
 
     @staticmethod
     def _suspected_layer(symbol: str) -> str:
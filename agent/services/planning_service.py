@@ -1329,6 +1329,7 @@ class PlanningService:
         for task_id in created_ids:
             try:
                 repos.task_repo.delete(task_id)
+                repos.task_repo.purge_events(task_id)
             except Exception:
                 current_app.logger.warning("Failed to rollback task %s after materialization failure", task_id)
         for node in nodes:
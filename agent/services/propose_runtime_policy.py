@@ -5,7 +5,8 @@ from typing import Any
 
 from flask import current_app, has_app_context
 
-from agent.llm_benchmarks import load_benchmarks
+from agent.llm_benchmark_store import BenchmarkSampleStore
+from agent.llm_benchmarks import benchmark_store
 from agent.model_selection import normalize_legacy_model_name
 
 
@@ -34,22 +35,18 @@ def _calibrated_timeout_from_benchmarks(
     floor_seconds: int,
     ceiling_seconds: int,
 ) -> int | None:
-    path = os.path.join(data_dir, "llm_model_benchmarks.json")
-    if not os.path.exists(path):
+    if not any(
+        os.path.exists(os.path.join(data_dir, name))
+        for name in (BenchmarkSampleStore.DB_FILENAME, BenchmarkSampleStore.LEGACY_FILENAME)
+    ):
         return None
-    db = load_benchmarks(data_dir)
-    model_key = f"{provider}:{model}"
-    entry = ((db.get("models") or {}).get(model_key) or {})
-    task_bucket = ((entry.get("task_kinds") or {}).get(task_kind) or {})
-    samples = [s for s in list(task_bucket.get("samples") or []) if isinstance(s, dict)]
-    if len(samples) < 3:
-        return None
-    latencies = sorted(max(0, int(s.get("latency_ms") or 0)) for s in samples)
-    if not latencies:
+    # Robust local calibration: p95 latency * 2.5 + 8s floor buffer. The p95
+    # comes from the bucket's latency sketch (upper bucket bound, capped at max).
+    p95_ms, sample_count = benchmark_store(data_dir).latency_quantile(
+        "model", f"{provider}:{model}", task_kind, 0.95
+    )
+    if sample_count < 3 or p95_ms is None:
         return None
-    # Robust local calibration: p95 latency * 2.5 + 8s floor buffer.
-    idx = max(0, min(len(latencies) - 1, int(round((len(latencies) - 1) * 0.95))))
-    p95_ms = latencies[idx]
     calibrated = int((p95_ms / 1000.0) * 2.5) + 8
     return max(floor_seconds, min(calibrated, ceiling_seconds))
 
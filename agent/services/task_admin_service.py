@@ -602,6 +602,8 @@ class TaskAdminService(
                             task.status = "todo"
                         repos.task_repo.save(task)
                     repos.archived_task_repo.delete(task_id)
+                    if action != "restore":
+                        repos.task_repo.purge_events(task_id)
                     return True
             if not retry_fence:
                 break
@@ -749,6 +751,8 @@ class TaskAdminService(
                 if archive:
                     repos.archived_task_repo.save(archive_task_record(refreshed))
                 repos.task_repo.delete(task_id)
+                if not archive:
+                    repos.task_repo.purge_events(task_id)
         except _RetryTaskAdminFence:
             if _fence_attempt >= 7:
                 raise RuntimeError(
@@ -39,6 +39,23 @@ class WikiImportCheckpointService:
         checkpoint: dict[str, Any],
     ) -> Path:
         path = self.path_for(source_id=source_id, corpus_path=corpus_path, index_path=index_path)
-        path.write_text(json.dumps(dict(checkpoint or {}), ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        # Written at every multistream block boundary; replace atomically so a
+        # crash mid-write never leaves a truncated checkpoint behind.
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(dict(checkpoint or {}), ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        tmp.replace(path)
         return path
 
+    @staticmethod
+    def next_block_index(checkpoint: dict[str, Any] | None) -> int:
+        """First multistream block that still has to be imported.
+
+        ``completed_blocks`` counts the blocks whose records are fully written;
+        older checkpoints only carry the last finished ``block_index``.
+        """
+        payload = dict(checkpoint or {})
+        if "completed_blocks" in payload:
+            return max(0, int(payload.get("completed_blocks") or 0))
+        block_index = int(payload.get("block_index") or 0)
+        return block_index + 1 if block_index > 0 else 0
+
@@ -179,6 +179,7 @@ class WikiImportJobService:
 
         _max_chunks = int(request.get("max_chunks_per_article") or 3)
         _min_chars  = int(request.get("min_content_chars") or 300)
+        _workers    = int(request["parallel_workers"]) if request.get("parallel_workers") else None
 
         try:
             if _is_cancelled():
@@ -195,6 +196,7 @@ class WikiImportJobService:
                     progress_callback=_on_parse_progress,
                     max_chunks_per_article=_max_chunks,
                     min_content_chars=_min_chars,
+                    parallel_workers=_workers,
                 )
             else:
                 report = self._ingestion.import_wiki_corpus(
@@ -208,6 +210,7 @@ class WikiImportJobService:
                     progress_callback=_on_parse_progress,
                     max_chunks_per_article=_max_chunks,
                     min_content_chars=_min_chars,
+                    parallel_workers=_workers,
                 )
             current = self.get_job(job_id) or {}
             if bool(current.get("cancel_requested")):
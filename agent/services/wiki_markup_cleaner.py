@@ -1,22 +1,58 @@
 from __future__ import annotations
 
 import re
+from operator import itemgetter
+
+# All patterns are compiled once; each pass is skipped when its marker is
+# absent. Group-only replacements use itemgetter(1), which re.sub calls
+# without building a template per match.
+_TAG_RE = re.compile(
+    r"<(?:!--.*?--"
+    r"|[Rr][Ee][Ff]\b[^>/]*>.*?</[Rr][Ee][Ff]\s*"
+    r"|[Rr][Ee][Ff]\b[^>]*/"
+    r"|/?[A-Za-z][^>]*)>",
+    re.DOTALL,
+)
+# File and category links may carry one level of nested links in the caption.
+# Single-character steps keep the repetition linear on unclosed links.
+_DROPPED_LINK_RE = re.compile(
+    r"\[\[(?i:Kategorie|Category|Datei|File|Bild|Image):(?:[^\[\]]|\[\[[^\[\]]*\]\])*\]\]"
+)
+_INNERMOST_TEMPLATE_RE = re.compile(r"\{\{[^{}]*\}\}")
+_LINK_RE = re.compile(r"\[\[(?:[^|\[\]]*\|)?([^\[\]]+)\]\]")
+_EXTERNAL_LINK_RE = re.compile(r"\[https?://[^\s\]]+\s+([^\]]+)\]")
+_HEADING_RE = re.compile(r"==+\s*([^=\n]+?)\s*==+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_FIRST_GROUP = itemgetter(1)
+
+
+def _heading_text(match: re.Match[str]) -> str:
+    return f" {match.group(1)} "
 
 
 def clean_wiki_markup(raw_text: str) -> str:
+    """Strip wikitext markup for retrieval.
+
+    Comments, refs and HTML tags go first, then file/category links, then
+    templates innermost-first until no ``{{...}}`` is left, so nested
+    templates no longer leak into chunks. Links keep their label (or
+    target), external links their label and headings their text.
+    """
     text = str(raw_text or "")
     if not text:
         return ""
-    text = re.sub(r"\{\{[^{}]{0,4000}\}\}", " ", text)
-    text = re.sub(r"\[\[Kategorie:[^\]]+\]\]", " ", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[\[Datei:[^\]]+\]\]", " ", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[\[([^|\]]+)\|([^\]]+)\]\]", r"\2", text)
-    text = re.sub(r"\[\[([^\]]+)\]\]", r"\1", text)
-    text = re.sub(r"\[https?://[^\s\]]+\s+([^\]]+)\]", r"\1", text)
-    text = re.sub(r"<ref[^>/]*>.*?</ref>", " ", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"<ref[^>]*/>", " ", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"==+\s*([^=\n]+?)\s*==+", r" \1 ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
-
+    if "<" in text:
+        text = _TAG_RE.sub(" ", text)
+    if "[[" in text:
+        text = _DROPPED_LINK_RE.sub(" ", text)
+    while "{{" in text:
+        text, removed = _INNERMOST_TEMPLATE_RE.subn(" ", text)
+        if not removed:
+            break
+    if "[[" in text:
+        text = _LINK_RE.sub(_FIRST_GROUP, text)
+    if "[http" in text:
+        text = _EXTERNAL_LINK_RE.sub(_FIRST_GROUP, text)
+    if "==" in text:
+        text = _HEADING_RE.sub(_heading_text, text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
@@ -4,9 +4,11 @@ import bz2
 import gzip
 import logging
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,57 @@ def _open_text_lines(path: Path):
     return path.open("rt", encoding="utf-8", errors="replace")
 
 
+def _parse_page_element(elem) -> dict[str, Any]:
+    redirect = elem.find(".//{*}redirect")
+    redirect_title = str(redirect.attrib.get("title") or "").strip() if redirect is not None else None
+    return {
+        "kind": "page",
+        "title": str(elem.findtext(".//{*}title") or "").strip(),
+        "namespace": int(str(elem.findtext(".//{*}ns") or "0").strip() or 0),
+        "text": str(elem.findtext(".//{*}revision/{*}text") or "").strip(),
+        "is_redirect": bool(redirect is not None),
+        "redirect_title": redirect_title or None,
+    }
+
+
+def _parse_block_pages(compressed_block: bytes, *, offset: int) -> list[dict[str, Any]]:
+    """Decompress one independent multistream bz2 block and parse its pages."""
+    try:
+        xml_fragment = bz2.decompress(compressed_block)
+    except OSError as exc:
+        logger.warning(
+            "Wiki multistream block could not be decompressed",
+            extra={"offset": offset, "error": str(exc)},
+        )
+        return []
+    wrapped = b"<mediawiki>" + xml_fragment + b"</mediawiki>"
+    pages: list[dict[str, Any]] = []
+    try:
+        context = ET.iterparse(BytesIO(wrapped), events=("end",))
+        for _event, elem in context:
+            if _tag_local_name(elem.tag) != "page":
+                continue
+            pages.append(_parse_page_element(elem))
+            elem.clear()
+    except ET.ParseError as exc:
+        logger.warning("Wiki multistream block has invalid XML (skipping block at offset %d): %s", offset, exc)
+    return pages
+
+
+def _process_block(
+    corpus_path: str,
+    offset: int,
+    length: int,
+    block_handler: Callable[[list[dict[str, Any]]], Any] | None,
+) -> Any:
+    """Pool worker: read, decompress and parse one block, then apply ``block_handler``."""
+    with open(corpus_path, "rb") as source:
+        source.seek(offset)
+        compressed_block = source.read(length)
+    pages = _parse_block_pages(compressed_block, offset=offset) if compressed_block else []
+    return block_handler(pages) if block_handler is not None else pages
+
+
 class MediaWikiXmlDumpParser:
     def _read_offsets(self, index_path: Path) -> list[int]:
         offsets: set[int] = set()
@@ -38,9 +91,10 @@ class MediaWikiXmlDumpParser:
                     continue
         return sorted(offsets)
 
-    def _iter_multistream_pages(
+    def _block_spans(
         self, *, corpus_path: Path, index_path: Path, resume_block_index: int = 0
-    ) -> Iterable[dict[str, Any]]:
+    ) -> list[tuple[int, int, int]]:
+        """Return ``(block_index, offset, length)`` for every block from ``resume_block_index`` on."""
         offsets = self._read_offsets(index_path)
         if not offsets:
             raise ValueError("wiki_multistream_index_empty")
@@ -51,47 +105,73 @@ class MediaWikiXmlDumpParser:
         start = max(0, resume_block_index)
         if start > 0:
             logger.info("wiki_parser: fast-seeking to block %d / %d (skipping %d blocks)", start, len(offsets), start)
+        spans: list[tuple[int, int, int]] = []
+        for position in range(start, len(offsets)):
+            offset = offsets[position]
+            next_offset = offsets[position + 1] if position + 1 < len(offsets) else file_size
+            if next_offset > offset:
+                spans.append((position, offset, next_offset - offset))
+        return spans
+
+    def _iter_multistream_pages(
+        self, *, corpus_path: Path, index_path: Path, resume_block_index: int = 0
+    ) -> Iterable[tuple[int, dict[str, Any]]]:
+        spans = self._block_spans(corpus_path=corpus_path, index_path=index_path, resume_block_index=resume_block_index)
         with corpus_path.open("rb") as source:
-            for position, offset in enumerate(offsets):
-                if position < start:
-                    continue  # fast-skip without decompression
-                next_offset = offsets[position + 1] if position + 1 < len(offsets) else file_size
-                if next_offset <= offset:
-                    continue
+            for position, offset, length in spans:
                 source.seek(offset)
-                compressed_block = source.read(next_offset - offset)
+                compressed_block = source.read(length)
                 if not compressed_block:
                     continue
-                try:
-                    xml_fragment = bz2.decompress(compressed_block)
-                except OSError as exc:
-                    logger.warning(
-                        "Wiki multistream block could not be decompressed",
-                        extra={"offset": offset, "error": str(exc)},
+                for page in _parse_block_pages(compressed_block, offset=offset):
+                    yield position, page
+
+    def iter_blocks_parallel(
+        self,
+        *,
+        corpus_path: Path,
+        index_path: Path,
+        resume_block_index: int = 0,
+        max_workers: int = 2,
+        block_handler: Callable[[list[dict[str, Any]]], Any] | None = None,
+        max_in_flight: int | None = None,
+    ) -> Iterator[tuple[int, Any]]:
+        """Yield ``(block_index, result)`` for multistream blocks processed in a process pool.
+
+        Workers read, decompress and parse their block and apply
+        ``block_handler`` (a picklable callable taking the block's pages) so
+        cleanup and chunking run off the importing process as well. Results
+        come back strictly in block order, so downstream output is identical
+        to the sequential parser; at most ``max_in_flight`` blocks (default
+        ``4 * max_workers``) are pending at once to bound memory.
+        """
+        spans = self._block_spans(corpus_path=corpus_path, index_path=index_path, resume_block_index=resume_block_index)
+        workers = max(1, int(max_workers))
+        window = max(workers, int(max_in_flight or workers * 4))
+        pending: deque[tuple[int, Future]] = deque()
+        remaining = iter(spans)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            try:
+                for position, offset, length in remaining:
+                    pending.append(
+                        (position, pool.submit(_process_block, str(corpus_path), offset, length, block_handler))
                     )
-                    continue
-                wrapped = b"<mediawiki>" + xml_fragment + b"</mediawiki>"
-                try:
-                    context = ET.iterparse(BytesIO(wrapped), events=("end",))
-                    for _event, elem in context:
-                        if _tag_local_name(elem.tag) != "page":
-                            continue
-                        yield position, self._parse_page(elem)
-                        elem.clear()
-                except ET.ParseError as exc:
-                    logger.warning("Wiki multistream block has invalid XML (skipping block at offset %d): %s", offset, exc)
+                    if len(pending) >= window:
+                        break
+                while pending:
+                    position, future = pending.popleft()
+                    result = future.result()
+                    for next_position, offset, length in remaining:
+                        future = pool.submit(_process_block, str(corpus_path), offset, length, block_handler)
+                        pending.append((next_position, future))
+                        break
+                    yield position, result
+            finally:
+                for _position, future in pending:
+                    future.cancel()
 
     def _parse_page(self, elem) -> dict[str, Any]:
-        redirect = elem.find(".//{*}redirect")
-        redirect_title = str(redirect.attrib.get("title") or "").strip() if redirect is not None else None
-        return {
-            "kind": "page",
-            "title": str(elem.findtext(".//{*}title") or "").strip(),
-            "namespace": int(str(elem.findtext(".//{*}ns") or "0").strip() or 0),
-            "text": str(elem.findtext(".//{*}revision/{*}text") or "").strip(),
-            "is_redirect": bool(redirect is not None),
-            "redirect_title": redirect_title or None,
-        }
+        return _parse_page_element(elem)
 
     def _parse_doc(self, elem) -> dict[str, Any]:
         return {
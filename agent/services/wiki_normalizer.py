@@ -173,3 +173,45 @@ class WikiRecordNormalizer:
             )
         return normalized
 
+
+def normalize_block_items(
+    items: list[dict[str, Any]],
+    *,
+    source_path: Path,
+    source_id: str,
+    default_language: str,
+    source_format: str = "xml",
+) -> list[tuple[str, list[dict[str, Any]], dict[str, Any] | None]]:
+    """Normalize one parsed multistream block inside an import worker.
+
+    The global item ordinal is only known once blocks are reassembled in
+    order, so records are built with ordinal ``0`` and the importer fixes
+    them up with :func:`renumber_wiki_records`.
+    """
+    normalizer = WikiRecordNormalizer()
+    results: list[tuple[str, list[dict[str, Any]], dict[str, Any] | None]] = []
+    for item in items:
+        records, issue = normalizer.normalize_item(
+            item=item,
+            source_path=source_path,
+            source_id=source_id,
+            ordinal=0,
+            default_language=default_language,
+            source_format=source_format,
+        )
+        results.append((str(item.get("kind") or ""), records, issue))
+    return results
+
+
+def renumber_wiki_records(
+    records: list[dict[str, Any]], issue: dict[str, Any] | None, *, ordinal: int
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+    """Stamp the importer's item ``ordinal`` onto records built by :func:`normalize_block_items`."""
+    for record in records:
+        record["id"] = f"{record['wiki_article_id']}:{ordinal}:{record['chunk_ordinal']}"
+        metadata = record.get("import_metadata")
+        if isinstance(metadata, dict):
+            metadata["source_line"] = ordinal
+    if issue is not None:
+        issue["item"] = ordinal
+    return records, issue
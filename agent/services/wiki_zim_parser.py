@@ -10,6 +10,10 @@ collected in .issues rather than causing silent failures or crashes.
 ZSTD decompression (the dominant compression in modern ZIM files) requires
 the optional `zstandard` package.  Without it, ZSTD clusters are skipped and
 the issue "zstd_compression_requires_zstandard_package" is reported.
+
+Articles are streamed in cluster order, so every cluster is read and
+decompressed once; a small LRU of decompressed clusters serves the remaining
+out-of-order reads.
 """
 
 from __future__ import annotations
@@ -18,8 +22,9 @@ import html
 import logging
 import re
 import struct
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +61,10 @@ _ENTRY_REDIRECT = struct.Struct("<I")   # redirectIndex
 # ZIM article namespaces that map to MediaWiki namespace 0
 _ARTICLE_NAMESPACES = frozenset(("A", "C"))
 
+_MAX_CLUSTER_BYTES = 256 * 1024 * 1024
+_CLUSTER_CACHE_MAX_CLUSTERS = 8
+_CLUSTER_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
 
 def _strip_html(text: str) -> str:
     text = re.sub(r"<style[^>]*>.*?</style>", " ", text, flags=re.DOTALL | re.IGNORECASE)
@@ -74,6 +83,65 @@ def _read_cstring(f: Any) -> str:
         buf += ch
 
 
+class _Cluster:
+    """Blob offset table plus either decompressed bytes or a file window."""
+
+    def __init__(self, offsets: tuple[int, ...], data: bytes | None = None, f: Any = None, base: int = 0) -> None:
+        self.offsets = offsets
+        self._data = data
+        self._f = f
+        self._base = base
+
+    @property
+    def blob_count(self) -> int:
+        return max(0, len(self.offsets) - 1)
+
+    @property
+    def size(self) -> int:
+        return len(self._data) if self._data is not None else len(self.offsets) * 8
+
+    def blob(self, number: int) -> bytes:
+        start, end = self.offsets[number], self.offsets[number + 1]
+        if end <= start:
+            return b""
+        if self._data is not None:
+            return self._data[start:end]
+        self._f.seek(self._base + start)
+        return self._f.read(end - start)
+
+
+class _ClusterCache:
+    """LRU of loaded clusters, bounded by count and decompressed bytes."""
+
+    def __init__(
+        self,
+        max_clusters: int = _CLUSTER_CACHE_MAX_CLUSTERS,
+        max_bytes: int = _CLUSTER_CACHE_MAX_BYTES,
+    ) -> None:
+        self._max_clusters = max(1, max_clusters)
+        self._max_bytes = max_bytes
+        self._clusters: OrderedDict[int, _Cluster] = OrderedDict()
+        self._bytes = 0
+        self.loads = 0
+
+    def get(self, number: int) -> _Cluster | None:
+        cluster = self._clusters.get(number)
+        if cluster is not None:
+            self._clusters.move_to_end(number)
+        return cluster
+
+    def put(self, number: int, cluster: _Cluster) -> None:
+        self.loads += 1
+        self._clusters[number] = cluster
+        self._bytes += cluster.size
+        # The newest cluster always stays, even if it alone exceeds the byte budget.
+        while len(self._clusters) > 1 and (
+            len(self._clusters) > self._max_clusters or self._bytes > self._max_bytes
+        ):
+            _, evicted = self._clusters.popitem(last=False)
+            self._bytes -= evicted.size
+
+
 class ZimParser:
     """
     Pure-Python ZIM reader that implements the WikiDumpParser protocol.
@@ -90,6 +158,8 @@ class ZimParser:
 
     def __init__(self) -> None:
         self._issues: list[str] = []
+        self._cluster_cache = _ClusterCache()
+        self._zstd: Any = None
 
     @property
     def issues(self) -> list[str]:
@@ -198,13 +268,19 @@ class ZimParser:
     # Cluster / blob reading
     # ------------------------------------------------------------------
 
-    def _read_blob(
-        self,
-        f: Any,
-        cluster_offset: int,
-        blob_number: int,
-        next_cluster_offset: int,
-    ) -> bytes | None:
+    def _read_entry_location(self, f: Any, offset: int) -> tuple[int, int, int] | None:
+        """(mimeTypeIndex, clusterNumber, blobNumber) of an entry; skips its strings."""
+        f.seek(offset)
+        data = f.read(_ENTRY_BASE.size + _ENTRY_ARTICLE.size)
+        if len(data) < _ENTRY_BASE.size:
+            return None
+        mime_idx = _ENTRY_BASE.unpack_from(data)[0]
+        if mime_idx in (_MIME_REDIRECT, _MIME_DELETED) or len(data) < _ENTRY_BASE.size + _ENTRY_ARTICLE.size:
+            return mime_idx, 0, 0
+        cluster_number, blob_number = _ENTRY_ARTICLE.unpack_from(data, _ENTRY_BASE.size)
+        return mime_idx, cluster_number, blob_number
+
+    def _load_cluster(self, f: Any, cluster_offset: int, next_cluster_offset: int) -> _Cluster | None:
         f.seek(cluster_offset)
         compress_byte = f.read(1)
         if not compress_byte:
@@ -220,44 +296,34 @@ class ZimParser:
             if len(first_raw) < offset_size:
                 return None
             first_offset = struct.unpack(f"<{offset_fmt}", first_raw)[0]
-            n_blobs = first_offset // offset_size - 1
-            if blob_number >= n_blobs:
-                self._report(f"blob_number_out_of_range:{blob_number}>={n_blobs}")
+            n_offsets = first_offset // offset_size
+            rest = f.read(max(0, n_offsets - 1) * offset_size)
+            if len(rest) < max(0, n_offsets - 1) * offset_size:
                 return None
-            f.seek(cluster_offset + 1 + blob_number * offset_size)
-            pair_raw = f.read(offset_size * 2)
-            if len(pair_raw) < offset_size * 2:
-                return None
-            start, end = struct.unpack(f"<{offset_fmt}{offset_fmt}", pair_raw)
-            if end <= start:
-                return b""
-            f.seek(cluster_offset + 1 + start)
-            return f.read(end - start)
+            offsets = (first_offset, *struct.unpack(f"<{max(0, n_offsets - 1)}{offset_fmt}", rest))
+            return _Cluster(offsets, f=f, base=cluster_offset + 1)
 
         if compress_type == _COMPRESS_ZSTD:
-            try:
-                import zstandard  # type: ignore[import-untyped]
-            except ImportError:
-                self._report("zstd_compression_requires_zstandard_package")
-                return None
+            if self._zstd is None:
+                try:
+                    import zstandard  # type: ignore[import-untyped]
+                except ImportError:
+                    self._report("zstd_compression_requires_zstandard_package")
+                    return None
+                self._zstd = zstandard.ZstdDecompressor()
             cluster_data_size = next_cluster_offset - cluster_offset - 1
             compressed = f.read(cluster_data_size)
             try:
-                decompressed = zstandard.ZstdDecompressor().decompress(
-                    compressed, max_output_size=256 * 1024 * 1024
-                )
+                decompressed = self._zstd.decompress(compressed, max_output_size=_MAX_CLUSTER_BYTES)
             except Exception as exc:
                 self._report(f"zstd_decompression_failed:{exc}")
                 return None
-            first_offset = struct.unpack_from(f"<{offset_fmt}", decompressed, 0)[0]
-            n_blobs = first_offset // offset_size - 1
-            if blob_number >= n_blobs:
-                self._report(f"blob_number_out_of_range:{blob_number}>={n_blobs}")
+            if len(decompressed) < offset_size:
                 return None
-            start, end = struct.unpack_from(
-                f"<{offset_fmt}{offset_fmt}", decompressed, blob_number * offset_size
-            )
-            return decompressed[start:end]
+            first_offset = struct.unpack_from(f"<{offset_fmt}", decompressed, 0)[0]
+            n_offsets = min(first_offset, len(decompressed)) // offset_size
+            offsets = struct.unpack_from(f"<{n_offsets}{offset_fmt}", decompressed, 0)
+            return _Cluster(offsets, data=decompressed)
 
         if compress_type == _COMPRESS_LZ4:
             self._report("lz4_compression_not_supported")
@@ -266,6 +332,26 @@ class ZimParser:
         self._report(f"unknown_compression_type:{compress_type}")
         return None
 
+    def _read_blob(
+        self,
+        f: Any,
+        cluster_offset: int,
+        blob_number: int,
+        next_cluster_offset: int,
+        cluster_number: int | None = None,
+    ) -> bytes | None:
+        cluster = self._cluster_cache.get(cluster_number) if cluster_number is not None else None
+        if cluster is None:
+            cluster = self._load_cluster(f, cluster_offset, next_cluster_offset)
+            if cluster is None:
+                return None
+            if cluster_number is not None:
+                self._cluster_cache.put(cluster_number, cluster)
+        if blob_number >= cluster.blob_count:
+            self._report(f"blob_number_out_of_range:{blob_number}>={cluster.blob_count}")
+            return None
+        return cluster.blob(blob_number)
+
     # ------------------------------------------------------------------
     # Public interface (WikiDumpParser protocol)
     # ------------------------------------------------------------------
@@ -289,46 +375,60 @@ class ZimParser:
                 "is_redirect": bool,
                 "redirect_title": str | None,
             }
+
+        Articles come in cluster order, redirects follow in URL order.
+        """
+        for _cluster_number, item in self.iter_items_with_cluster(corpus_path=corpus_path, index_path=index_path):
+            yield item
+
+    def iter_items_with_cluster(
+        self,
+        *,
+        corpus_path: Path,
+        index_path: Path | None = None,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Like iter_items, paired with the cluster number each item was read from.
+
+        Redirects carry no blob and are reported after the last cluster
+        (cluster number == clusterCount), which keeps the sequence monotonic
+        for block-style checkpointing.
         """
         self._issues = []
+        self._cluster_cache = _ClusterCache()
         if index_path is not None:
             self._report("zim_index_path_ignored:zim_is_self_contained")
         file_size = corpus_path.stat().st_size
-        with corpus_path.open("rb") as f:
+        # Directory entries and cluster data live in different regions; separate
+        # handles keep both buffered reads sequential.
+        with corpus_path.open("rb") as f, corpus_path.open("rb") as clusters_f:
             header = self._read_header(f)
             mime_list = self._read_mime_list(f, header["mime_list_pos"])
             url_ptrs = self._read_ptr_list_64(f, header["url_ptr_pos"], header["article_count"])
             cluster_ptrs = self._read_ptr_list_64(f, header["cluster_ptr_pos"], header["cluster_count"])
 
-            for entry_offset in url_ptrs:
-                entry = self._read_dir_entry(f, entry_offset)
-
-                if entry["is_deleted"]:
+            # One light pass over the directory: sort keys only, strings are read at yield time.
+            article_keys: list[int] = []
+            redirect_indices: list[int] = []
+            for url_index, entry_offset in enumerate(url_ptrs):
+                location = self._read_entry_location(f, entry_offset)
+                if location is None:
                     continue
-
-                ns = entry["namespace"]
-                title = entry["title"]
-                mw_namespace = 0 if ns in _ARTICLE_NAMESPACES else -1
-
-                if entry["is_redirect"]:
-                    redirect_idx = entry.get("redirect_idx", 0)
-                    redirect_title: str | None = None
-                    if 0 <= redirect_idx < len(url_ptrs):
-                        try:
-                            target = self._read_dir_entry(f, url_ptrs[redirect_idx])
-                            redirect_title = target["title"] or None
-                        except Exception as exc:
-                            logger.debug("Failed to resolve redirect target: %s", exc)
-                    yield {
-                        "kind": "page",
-                        "title": title,
-                        "namespace": mw_namespace,
-                        "text": "",
-                        "is_redirect": True,
-                        "redirect_title": redirect_title,
-                    }
+                mime_idx, cluster_number, blob_number = location
+                if mime_idx == _MIME_DELETED:
+                    continue
+                if mime_idx == _MIME_REDIRECT:
+                    redirect_indices.append(url_index)
+                    continue
+                if cluster_number >= len(cluster_ptrs):
+                    self._report(f"invalid_cluster_number:{cluster_number}")
                     continue
+                article_keys.append((cluster_number << 64) | (blob_number << 32) | url_index)
+            article_keys.sort()
 
+            for key in article_keys:
+                url_index = key & 0xFFFFFFFF
+                cluster_number = key >> 64
+                entry = self._read_dir_entry(f, url_ptrs[url_index])
                 mime_idx = entry["mime_idx"]
                 if mime_idx < len(mime_list):
                     mime = mime_list[mime_idx]
@@ -336,21 +436,19 @@ class ZimParser:
                     self._report(f"unknown_mime_index:{mime_idx}")
                     mime = ""
 
-                cluster_number = entry["cluster_number"]
-                blob_number = entry["blob_number"]
-
-                if cluster_number >= len(cluster_ptrs):
-                    self._report(f"invalid_cluster_number:{cluster_number}")
-                    continue
-
                 cluster_offset = cluster_ptrs[cluster_number]
                 next_cluster_offset = (
                     cluster_ptrs[cluster_number + 1]
                     if cluster_number + 1 < len(cluster_ptrs)
                     else file_size
                 )
-
-                raw = self._read_blob(f, cluster_offset, blob_number, next_cluster_offset)
+                raw = self._read_blob(
+                    clusters_f,
+                    cluster_offset,
+                    entry["blob_number"],
+                    next_cluster_offset,
+                    cluster_number=cluster_number,
+                )
                 if raw is None:
                     continue
 
@@ -361,11 +459,30 @@ class ZimParser:
                 if not text.strip():
                     continue
 
-                yield {
+                yield cluster_number, {
                     "kind": "page",
-                    "title": title,
-                    "namespace": mw_namespace,
+                    "title": entry["title"],
+                    "namespace": 0 if entry["namespace"] in _ARTICLE_NAMESPACES else -1,
                     "text": text,
                     "is_redirect": False,
                     "redirect_title": None,
                 }
+
+            for url_index in redirect_indices:
+                entry = self._read_dir_entry(f, url_ptrs[url_index])
+                redirect_idx = entry.get("redirect_idx", 0)
+                redirect_title: str | None = None
+                if 0 <= redirect_idx < len(url_ptrs):
+                    try:
+                        target = self._read_dir_entry(f, url_ptrs[redirect_idx])
+                        redirect_title = target["title"] or None
+                    except Exception as exc:
+                        logger.debug("Failed to resolve redirect target: %s", exc)
+                yield len(cluster_ptrs), {
+                    "kind": "page",
+                    "title": entry["title"],
+                    "namespace": 0 if entry["namespace"] in _ARTICLE_NAMESPACES else -1,
+                    "text": "",
+                    "is_redirect": True,
+                    "redirect_title": redirect_title,
+                }
@@ -10,6 +10,87 @@ from agent.repository import worker_slot_lease_repo
 from agent.services.autopilot_wake_service import request_autopilot_wake
 from agent.services.ollama_parallel_runtime_service import get_ollama_parallel_runtime_service
 
+_OPEN_LEASE_STATUSES = frozenset({"active", "queued"})
+_POOL_LEASE_TYPES = frozenset({"worker", "combined"})
+_RECONCILE_INTERVAL_SECONDS = 30.0
+
+PoolKey = str | None
+ModelKey = tuple[str, str]
+
+
+def _model_key(endpoint: str | None, model: str | None) -> ModelKey | None:
+    if not endpoint or not model:
+        return None
+    return (endpoint.strip().lower(), model.strip())
+
+
+class _LeaseIndex:
+    """In-memory view of open (active/queued) leases, counted per worker pool and per ollama model.
+
+    Kept write-through by the scheduler and rebuilt from the DB per pool on reconciliation,
+    so capacity checks are dict lookups instead of scans over the lease table.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._leases: dict[str, tuple[PoolKey, ModelKey | None, str]] = {}
+        self._pool_ids: dict[PoolKey, set[str]] = {}
+        self._pool_counts: dict[tuple[PoolKey, str], int] = {}
+        self._model_counts: dict[tuple[ModelKey, str], int] = {}
+
+    def put(self, lease: WorkerSlotLeaseDB) -> None:
+        with self._lock:
+            self._drop(lease.id)
+            self._add(lease)
+
+    def discard(self, lease_id: str) -> None:
+        with self._lock:
+            self._drop(lease_id)
+
+    def replace_pool(self, pool: PoolKey, leases: list[WorkerSlotLeaseDB]) -> None:
+        with self._lock:
+            for lease_id in list(self._pool_ids.get(pool, ())):
+                self._drop(lease_id)
+            for lease in leases:
+                self._drop(lease.id)
+                self._add(lease)
+
+    def pools(self) -> list[PoolKey]:
+        with self._lock:
+            return list(self._pool_ids)
+
+    def pool_count(self, pool: PoolKey, status: str) -> int:
+        return self._pool_counts.get((pool, status), 0)
+
+    def model_counts(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            payload: dict[str, dict[str, int]] = {}
+            for (key, status), count in self._model_counts.items():
+                bucket = payload.setdefault(f"{key[0]}::{key[1]}", {"active_count": 0, "queued_count": 0})
+                bucket[f"{status}_count"] = count
+            return payload
+
+    def _add(self, lease: WorkerSlotLeaseDB) -> None:
+        if lease.status not in _OPEN_LEASE_STATUSES or lease.lease_type not in _POOL_LEASE_TYPES:
+            return
+        pool = lease.worker_id
+        model = _model_key(lease.ollama_endpoint, lease.ollama_model)
+        self._leases[lease.id] = (pool, model, lease.status)
+        self._pool_ids.setdefault(pool, set()).add(lease.id)
+        self._pool_counts[(pool, lease.status)] = self._pool_counts.get((pool, lease.status), 0) + 1
+        if model is not None:
+            self._model_counts[(model, lease.status)] = self._model_counts.get((model, lease.status), 0) + 1
+
+    def _drop(self, lease_id: str) -> None:
+        entry = self._leases.pop(lease_id, None)
+        if entry is None:
+            return
+        pool, model, status = entry
+        self._pool_ids.get(pool, set()).discard(lease_id)
+        self._pool_counts[(pool, status)] -= 1
+        if model is not None:
+            self._model_counts[(model, status)] -= 1
+
 
 @dataclass(frozen=True)
 class WorkerSlotDecision:
@@ -28,8 +109,40 @@ class WorkerPoolSchedulerService:
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
+        self._pool_locks: dict[PoolKey, threading.Lock] = {}
+        self._index = _LeaseIndex()
+        self._reconciled_at = 0.0
         self._ollama = get_ollama_parallel_runtime_service()
 
+    def _pool_lock(self, worker_id: PoolKey) -> threading.Lock:
+        with self._lock:
+            lock = self._pool_locks.get(worker_id)
+            if lock is None:
+                lock = self._pool_locks[worker_id] = threading.Lock()
+            return lock
+
+    def _reload_pool(self, worker_id: PoolKey) -> None:
+        """Caller holds the pool lock."""
+        self._index.replace_pool(worker_id, worker_slot_lease_repo.list_open_for_worker(worker_id))
+
+    def reconcile_lease_index(self, *, force: bool = False) -> bool:
+        """Rebuild the in-memory lease counters from the DB, at most every _RECONCILE_INTERVAL_SECONDS.
+
+        Catches leases changed outside the scheduler (callbacks, other processes). Each pool is
+        reloaded under its own lock so concurrent acquisitions never see a half-built pool.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not force and self._reconciled_at and now - self._reconciled_at < _RECONCILE_INTERVAL_SECONDS:
+                return False
+            self._reconciled_at = now
+        pools = set(self._index.pools())
+        pools.update(lease.worker_id for lease in worker_slot_lease_repo.list_open())
+        for worker_id in pools:
+            with self._pool_lock(worker_id):
+                self._reload_pool(worker_id)
+        return True
+
     @staticmethod
     def compute_effective_concurrency_cap(
         security_policy_cap: int | None,
@@ -45,167 +158,174 @@ class WorkerPoolSchedulerService:
         return min(caps)
 
     def acquire_for_job(self, *, request: dict[str, Any]) -> WorkerSlotDecision:
-        with self._lock:
-            worker_id = str(request.get("selected_worker_id") or "").strip() or None
-            runtime_target_id = str(request.get("selected_runtime_target_id") or "").strip() or None
-            worker_kind = str(request.get("selected_worker_kind") or "").strip() or None
-            runtime_kind = str(request.get("selected_runtime_kind") or "").strip() or None
-            parent_task_id = str(request.get("parent_task_id") or "").strip() or None
-            worker_job_id = str(request.get("worker_job_id") or "").strip() or None
-            policy_decision_ref = str(request.get("policy_decision_ref") or "").strip() or None
-            policy_decision_hash = str(request.get("policy_decision_hash") or "").strip() or None
-            worker_capacity = max(1, int(request.get("worker_capacity") or 1))
-            runtime_capacity = max(1, int(request.get("runtime_capacity") or worker_capacity))
-            security_cap = request.get("security_policy_cap")
-            max_parallel = self.compute_effective_concurrency_cap(security_cap, worker_capacity, runtime_capacity, None)
-            now = time.time()
-            active_for_worker = [
-                lease
-                for lease in worker_slot_lease_repo.list_active()
-                if lease.worker_id == worker_id and lease.lease_type in {"worker", "combined"}
-            ]
-            queue_for_worker = [
-                lease
-                for lease in worker_slot_lease_repo.list_queued()
-                if lease.worker_id == worker_id and lease.lease_type in {"worker", "combined"}
-            ]
-            queue_limit = max(1, int(request.get("worker_queue_limit") or 32))
-
-            if len(active_for_worker) >= max_parallel:
-                if len(queue_for_worker) >= queue_limit:
-                    lease = worker_slot_lease_repo.save(WorkerSlotLeaseDB(
-                        lease_type="worker",
-                        status="rejected",
-                        worker_id=worker_id,
-                        worker_kind=worker_kind,
-                        runtime_target_id=runtime_target_id,
-                        runtime_kind=runtime_kind,
-                        parent_task_id=parent_task_id,
-                        worker_job_id=worker_job_id,
-                        reason_code="worker_queue_full",
-                        released_at=now,
-                        lease_metadata={
-                            "policy_decision_ref": policy_decision_ref,
-                            "policy_decision_hash": policy_decision_hash,
-                        },
-                    ))
-                    return WorkerSlotDecision(status="rejected", reason_code="worker_queue_full", slot_lease_id=lease.id)
-
-                queue_position = len(queue_for_worker) + 1
+        self.reconcile_lease_index()
+        worker_id = str(request.get("selected_worker_id") or "").strip() or None
+        with self._pool_lock(worker_id):
+            return self._acquire_for_pool(worker_id, request)
+
+    def _acquire_for_pool(self, worker_id: PoolKey, request: dict[str, Any]) -> WorkerSlotDecision:
+        runtime_target_id = str(request.get("selected_runtime_target_id") or "").strip() or None
+        worker_kind = str(request.get("selected_worker_kind") or "").strip() or None
+        runtime_kind = str(request.get("selected_runtime_kind") or "").strip() or None
+        parent_task_id = str(request.get("parent_task_id") or "").strip() or None
+        worker_job_id = str(request.get("worker_job_id") or "").strip() or None
+        policy_decision_ref = str(request.get("policy_decision_ref") or "").strip() or None
+        policy_decision_hash = str(request.get("policy_decision_hash") or "").strip() or None
+        worker_capacity = max(1, int(request.get("worker_capacity") or 1))
+        runtime_capacity = max(1, int(request.get("runtime_capacity") or worker_capacity))
+        security_cap = request.get("security_policy_cap")
+        max_parallel = self.compute_effective_concurrency_cap(security_cap, worker_capacity, runtime_capacity, None)
+        now = time.time()
+        active_count = self._index.pool_count(worker_id, "active")
+        queued_count = self._index.pool_count(worker_id, "queued")
+        queue_limit = max(1, int(request.get("worker_queue_limit") or 32))
+
+        if active_count >= max_parallel:
+            # Leases released outside the scheduler leave the counters too high; confirm
+            # with an indexed count before queueing or rejecting, reload only on drift.
+            db_counts = worker_slot_lease_repo.count_open_for_worker(worker_id)
+            if db_counts.get("active", 0) != active_count or db_counts.get("queued", 0) != queued_count:
+                self._reload_pool(worker_id)
+                active_count = self._index.pool_count(worker_id, "active")
+                queued_count = self._index.pool_count(worker_id, "queued")
+        if active_count >= max_parallel:
+            if queued_count >= queue_limit:
                 lease = worker_slot_lease_repo.save(WorkerSlotLeaseDB(
                     lease_type="worker",
-                    status="queued",
+                    status="rejected",
                     worker_id=worker_id,
                     worker_kind=worker_kind,
                     runtime_target_id=runtime_target_id,
                     runtime_kind=runtime_kind,
                     parent_task_id=parent_task_id,
                     worker_job_id=worker_job_id,
-                    queue_position=queue_position,
-                    reason_code="worker_parallel_capacity_exhausted",
-                    deadline_at=now + max(1, int(request.get("slot_lease_seconds") or 600)),
+                    reason_code="worker_queue_full",
+                    released_at=now,
                     lease_metadata={
                         "policy_decision_ref": policy_decision_ref,
                         "policy_decision_hash": policy_decision_hash,
                     },
                 ))
-                return WorkerSlotDecision(
-                    status="queued",
-                    reason_code="worker_parallel_capacity_exhausted",
-                    slot_lease_id=lease.id,
-                    queue_position=queue_position,
-                    selected_worker_id=worker_id,
-                    selected_runtime_target_id=runtime_target_id,
-                )
-
-            endpoint = str(request.get("ollama_endpoint") or "").strip()
-            model = str(request.get("ollama_model") or "").strip()
-            ollama_lease_id = None
-            if endpoint and model:
-                ollama_decision = self._ollama.acquire_slot(
-                    endpoint=endpoint,
-                    model=model,
-                    max_parallel_requests=max(1, int(request.get("ollama_max_parallel_requests") or 4)),
-                    queue_limit=max(1, int(request.get("ollama_queue_limit") or 64)),
-                    lease_seconds=max(1, int(request.get("slot_lease_seconds") or 600)),
-                    backpressure=str(request.get("ollama_backpressure") or "queue_then_reject"),
-                )
-                if ollama_decision.status == "rejected":
-                    return WorkerSlotDecision(
-                        status="rejected",
-                        reason_code=ollama_decision.reason_code,
-                        selected_worker_id=worker_id,
-                        selected_runtime_target_id=runtime_target_id,
-                        ollama_endpoint=endpoint,
-                        ollama_model=model,
-                    )
-                if ollama_decision.status == "queued":
-                    queue_position = ollama_decision.queue_position or 1
-                    lease = worker_slot_lease_repo.save(WorkerSlotLeaseDB(
-                        lease_type="combined",
-                        status="queued",
-                        worker_id=worker_id,
-                        worker_kind=worker_kind,
-                        runtime_target_id=runtime_target_id,
-                        runtime_kind=runtime_kind,
-                        ollama_endpoint=endpoint,
-                        ollama_model=model,
-                        parent_task_id=parent_task_id,
-                        worker_job_id=worker_job_id,
-                        queue_position=queue_position,
-                        reason_code=ollama_decision.reason_code,
-                        deadline_at=now + max(1, int(request.get("slot_lease_seconds") or 600)),
-                        lease_metadata={
-                            "ollama_lease_id": ollama_decision.lease_id,
-                            "policy_decision_ref": policy_decision_ref,
-                            "policy_decision_hash": policy_decision_hash,
-                        },
-                    ))
-                    return WorkerSlotDecision(
-                        status="queued",
-                        reason_code=ollama_decision.reason_code,
-                        slot_lease_id=lease.id,
-                        queue_position=queue_position,
-                        selected_worker_id=worker_id,
-                        selected_runtime_target_id=runtime_target_id,
-                        ollama_endpoint=endpoint,
-                        ollama_model=model,
-                    )
-                ollama_lease_id = ollama_decision.lease_id
+                return WorkerSlotDecision(status="rejected", reason_code="worker_queue_full", slot_lease_id=lease.id)
 
+            queue_position = queued_count + 1
             lease = worker_slot_lease_repo.save(WorkerSlotLeaseDB(
-                lease_type="combined" if (endpoint and model) else "worker",
-                status="active",
+                lease_type="worker",
+                status="queued",
                 worker_id=worker_id,
                 worker_kind=worker_kind,
                 runtime_target_id=runtime_target_id,
                 runtime_kind=runtime_kind,
-                ollama_endpoint=endpoint or None,
-                ollama_model=model or None,
                 parent_task_id=parent_task_id,
                 worker_job_id=worker_job_id,
-                reason_code="slot_acquired",
+                queue_position=queue_position,
+                reason_code="worker_parallel_capacity_exhausted",
                 deadline_at=now + max(1, int(request.get("slot_lease_seconds") or 600)),
-                lease_metadata={"ollama_lease_id": ollama_lease_id} if ollama_lease_id else {},
+                lease_metadata={
+                    "policy_decision_ref": policy_decision_ref,
+                    "policy_decision_hash": policy_decision_hash,
+                },
             ))
-            md = dict(lease.lease_metadata or {})
-            if policy_decision_ref:
-                md["policy_decision_ref"] = policy_decision_ref
-            if policy_decision_hash:
-                md["policy_decision_hash"] = policy_decision_hash
-            if md:
-                lease.lease_metadata = md
-                lease = worker_slot_lease_repo.save(lease)
+            self._index.put(lease)
             return WorkerSlotDecision(
-                status="active",
-                reason_code="slot_acquired",
+                status="queued",
+                reason_code="worker_parallel_capacity_exhausted",
                 slot_lease_id=lease.id,
+                queue_position=queue_position,
                 selected_worker_id=worker_id,
                 selected_runtime_target_id=runtime_target_id,
-                ollama_endpoint=endpoint or None,
-                ollama_model=model or None,
             )
 
+        endpoint = str(request.get("ollama_endpoint") or "").strip()
+        model = str(request.get("ollama_model") or "").strip()
+        ollama_lease_id = None
+        if endpoint and model:
+            ollama_decision = self._ollama.acquire_slot(
+                endpoint=endpoint,
+                model=model,
+                max_parallel_requests=max(1, int(request.get("ollama_max_parallel_requests") or 4)),
+                queue_limit=max(1, int(request.get("ollama_queue_limit") or 64)),
+                lease_seconds=max(1, int(request.get("slot_lease_seconds") or 600)),
+                backpressure=str(request.get("ollama_backpressure") or "queue_then_reject"),
+            )
+            if ollama_decision.status == "rejected":
+                return WorkerSlotDecision(
+                    status="rejected",
+                    reason_code=ollama_decision.reason_code,
+                    selected_worker_id=worker_id,
+                    selected_runtime_target_id=runtime_target_id,
+                    ollama_endpoint=endpoint,
+                    ollama_model=model,
+                )
+            if ollama_decision.status == "queued":
+                queue_position = ollama_decision.queue_position or 1
+                lease = worker_slot_lease_repo.save(WorkerSlotLeaseDB(
+                    lease_type="combined",
+                    status="queued",
+                    worker_id=worker_id,
+                    worker_kind=worker_kind,
+                    runtime_target_id=runtime_target_id,
+                    runtime_kind=runtime_kind,
+                    ollama_endpoint=endpoint,
+                    ollama_model=model,
+                    parent_task_id=parent_task_id,
+                    worker_job_id=worker_job_id,
+                    queue_position=queue_position,
+                    reason_code=ollama_decision.reason_code,
+                    deadline_at=now + max(1, int(request.get("slot_lease_seconds") or 600)),
+                    lease_metadata={
+                        "ollama_lease_id": ollama_decision.lease_id,
+                        "policy_decision_ref": policy_decision_ref,
+                        "policy_decision_hash": policy_decision_hash,
+                    },
+                ))
+                self._index.put(lease)
+                return WorkerSlotDecision(
+                    status="queued",
+                    reason_code=ollama_decision.reason_code,
+                    slot_lease_id=lease.id,
+                    queue_position=queue_position,
+                    selected_worker_id=worker_id,
+                    selected_runtime_target_id=runtime_target_id,
+                    ollama_endpoint=endpoint,
+                    ollama_model=model,
+                )
+            ollama_lease_id = ollama_decision.lease_id
+
+        lease = worker_slot_lease_repo.save(WorkerSlotLeaseDB(
+            lease_type="combined" if (endpoint and model) else "worker",
+            status="active",
+            worker_id=worker_id,
+            worker_kind=worker_kind,
+            runtime_target_id=runtime_target_id,
+            runtime_kind=runtime_kind,
+            ollama_endpoint=endpoint or None,
+            ollama_model=model or None,
+            parent_task_id=parent_task_id,
+            worker_job_id=worker_job_id,
+            reason_code="slot_acquired",
+            deadline_at=now + max(1, int(request.get("slot_lease_seconds") or 600)),
+            lease_metadata={"ollama_lease_id": ollama_lease_id} if ollama_lease_id else {},
+        ))
+        md = dict(lease.lease_metadata or {})
+        if policy_decision_ref:
+            md["policy_decision_ref"] = policy_decision_ref
+        if policy_decision_hash:
+            md["policy_decision_hash"] = policy_decision_hash
+        if md:
+            lease.lease_metadata = md
+            lease = worker_slot_lease_repo.save(lease)
+        self._index.put(lease)
+        return WorkerSlotDecision(
+            status="active",
+            reason_code="slot_acquired",
+            slot_lease_id=lease.id,
+            selected_worker_id=worker_id,
+            selected_runtime_target_id=runtime_target_id,
+            ollama_endpoint=endpoint or None,
+            ollama_model=model or None,
+        )
+
     def release_for_job(self, slot_lease_id: str | None) -> None:
         if not slot_lease_id:
             return
@@ -216,7 +336,9 @@ class WorkerPoolSchedulerService:
         ollama_lease_id = metadata.get("ollama_lease_id")
         if lease.ollama_endpoint and lease.ollama_model and ollama_lease_id:
             self._ollama.release_slot(endpoint=lease.ollama_endpoint, model=lease.ollama_model, lease_id=str(ollama_lease_id))
-        worker_slot_lease_repo.release(slot_lease_id)
+        with self._pool_lock(lease.worker_id):
+            worker_slot_lease_repo.release(slot_lease_id)
+            self._index.discard(slot_lease_id)
         try:
             request_autopilot_wake(
                 "worker_capacity_released",
@@ -236,7 +358,9 @@ class WorkerPoolSchedulerService:
                 ollama_lease_id = metadata.get("ollama_lease_id")
                 if ollama_lease_id:
                     self._ollama.release_slot(endpoint=lease.ollama_endpoint, model=lease.ollama_model, lease_id=str(ollama_lease_id))
-            worker_slot_lease_repo.release(lease.id, status="stale_released")
+            with self._pool_lock(lease.worker_id):
+                worker_slot_lease_repo.release(lease.id, status="stale_released")
+                self._index.discard(lease.id)
             cleaned += 1
         return cleaned
 
@@ -270,13 +394,13 @@ class WorkerPoolSchedulerService:
                 "old_decision_ref": old_ref,
                 "new_decision_ref": policy_decision_ref,
             }
-            worker_slot_lease_repo.save(lease)
+            self._index.put(worker_slot_lease_repo.save(lease))
             return WorkerSlotDecision(status="rejected", reason_code="stale_policy_decision", slot_lease_id=slot_lease_id)
         if not policy_allowed:
             lease.status = "rejected"
             lease.reason_code = "policy_denied_on_revalidation"
             lease.released_at = time.time()
-            worker_slot_lease_repo.save(lease)
+            self._index.put(worker_slot_lease_repo.save(lease))
             return WorkerSlotDecision(status="rejected", reason_code="policy_denied_on_revalidation", slot_lease_id=slot_lease_id)
         if not worker_online:
             return WorkerSlotDecision(status="queued", reason_code="worker_offline_requeue", slot_lease_id=slot_lease_id, queue_position=lease.queue_position)
@@ -287,7 +411,8 @@ class WorkerPoolSchedulerService:
         lease.reason_code = "queued_revalidated_and_started"
         lease.queue_position = None
         lease.acquired_at = time.time()
-        worker_slot_lease_repo.save(lease)
+        lease = worker_slot_lease_repo.save(lease)
+        self._index.put(lease)
         return WorkerSlotDecision(
             status="active",
             reason_code="queued_revalidated_and_started",
@@ -299,24 +424,15 @@ class WorkerPoolSchedulerService:
         )
 
     def get_scheduler_status(self) -> dict[str, Any]:
-        leases = worker_slot_lease_repo.list_all()
-        active = [x for x in leases if x.status == "active"]
-        queued = [x for x in leases if x.status == "queued"]
-        rejected = [x for x in leases if x.status == "rejected"]
-        stale = [x for x in leases if x.status == "stale_released"]
-
-        capacity_by_worker: dict[str, int] = {}
-        for lease in active:
-            if lease.worker_id:
-                capacity_by_worker[lease.worker_id] = capacity_by_worker.get(lease.worker_id, 0) + 1
-
+        counts = worker_slot_lease_repo.count_by_status()
         return {
-            "active_slots": len(active),
-            "queued_jobs": len(queued),
-            "rejected_jobs": len(rejected),
-            "stale_leases": len(stale),
-            "capacity_by_worker": capacity_by_worker,
+            "active_slots": counts.get("active", 0),
+            "queued_jobs": counts.get("queued", 0),
+            "rejected_jobs": counts.get("rejected", 0),
+            "stale_leases": counts.get("stale_released", 0),
+            "capacity_by_worker": worker_slot_lease_repo.count_active_by_worker(),
             "capacity_by_model": self._ollama.get_status(),
+            "open_leases_by_model": self._index.model_counts(),
         }
 
 
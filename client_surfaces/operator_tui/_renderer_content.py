@@ -34,6 +34,7 @@ from client_surfaces.operator_tui.chat_state import get_active_channel
 from client_surfaces.operator_tui.markdown_renderer import render_markdown_lines
 from client_surfaces.operator_tui.models import FocusPane, OperatorMode, OperatorState, PanelState
 from client_surfaces.operator_tui.read_models import build_goal_rows, build_inspection_detail, build_task_rows
+from client_surfaces.operator_tui.render_cache import default_panel_render_cache
 from client_surfaces.operator_tui.sections import SECTIONS, get_section
 from client_surfaces.operator_tui.audit_nav import grouped_audit_items, audit_nav_items
 from client_surfaces.operator_tui.template_nav import grouped_template_items, template_nav_items
@@ -183,21 +184,15 @@ def _content_lines(state: OperatorState, width: int, *, height: int | None = Non
         )
     )
     if section.id in {"kanban", "models"} and not global_overlay_active:
-        from client_surfaces.operator_tui.plugins import default_plugin_registry
-
-        plugin = default_plugin_registry().get(section.id)
-        if plugin is not None:
-            plugin_payload = dict(payload)
-            plugin_payload["_panel_state"] = panel_state.value
-            rendered = plugin.render(
-                plugin_payload,
-                width,
-                max(1, int(height or 24) - 1),
-                state.selected_index,
-            )
-            if rendered:
-                lines.extend(rendered)
-                return lines
+        plugin_height = max(1, int(height or 24) - 1)
+        rendered = default_panel_render_cache().lines(
+            f"content:{section.id}",
+            (payload, panel_state, width, plugin_height, state.selected_index),
+            lambda: _plugin_content_lines(section.id, payload, panel_state, width, plugin_height, state.selected_index),
+        )
+        if rendered:
+            lines.extend(rendered)
+            return lines
 
     if bool(game.get("shortcut_help_middle_open")):
         return _content_shortcut_lines(state, width)
@@ -229,7 +224,13 @@ def _content_lines(state: OperatorState, width: int, *, height: int | None = Non
         return lines
 
     if section.id == "dashboard":
-        lines.extend(_dashboard_content_lines(payload, state=state, width=width))
+        lines.extend(
+            default_panel_render_cache().lines(
+                "content:dashboard",
+                (payload, width),
+                lambda: _dashboard_content_lines(payload, state=state, width=width),
+            )
+        )
     elif section.id == "goals":
         items = payload.get("items") or []
         if not items:
@@ -261,7 +262,19 @@ def _content_lines(state: OperatorState, width: int, *, height: int | None = Non
     elif section.id == "audit":
         viewer = dict(game.get("audit_viewer") or {})
         if bool(viewer.get("active")):
-            lines.extend(_audit_viewer_content_lines(state, width, viewport_height=height))
+            # The viewer dict lives in the in-place mutated game state, so its
+            # fields are copied into the key instead of keying on the dict.
+            viewer_key = tuple(
+                viewer.get(field)
+                for field in ("title", "group", "mode", "text", "view_line_offset", "view_col_offset", "confirm_choice")
+            )
+            lines.extend(
+                default_panel_render_cache().lines(
+                    "content:audit_viewer",
+                    (viewer_key, width, height),
+                    lambda: _audit_viewer_content_lines(state, width, viewport_height=height),
+                )
+            )
         else:
             items = payload.get("items") or []
             if not items:
@@ -329,6 +342,18 @@ def _templates_content_lines(payload: dict, state: OperatorState, width: int) ->
 def _audit_viewer_content_lines(state: OperatorState, width: int, *, viewport_height: int | None = None) -> list[str]:
     return _rc_tpl_x._audit_viewer_content_lines(state, width, viewport_height=viewport_height)
 
+def _plugin_content_lines(
+    section_id: str, payload: dict, panel_state: PanelState, width: int, height: int, selected_index: int
+) -> list[str]:
+    from client_surfaces.operator_tui.plugins import default_plugin_registry
+
+    plugin = default_plugin_registry().get(section_id)
+    if plugin is None:
+        return []
+    plugin_payload = dict(payload)
+    plugin_payload["_panel_state"] = panel_state.value
+    return plugin.render(plugin_payload, width, height, selected_index)
+
 def _highlight_template_line(line: str) -> tuple[str, int]:
     return _rc_tpl_x._highlight_template_line(line)
 
@@ -18,6 +18,7 @@ from client_surfaces.operator_tui.chat_long_message import (
 from client_surfaces.operator_tui.keybindings_config import display_for_action, shortcut_tokens_for_area
 from client_surfaces.operator_tui.models import FocusPane, OperatorState
 from client_surfaces.operator_tui.read_models import build_inspection_detail
+from client_surfaces.operator_tui.render_cache import default_panel_render_cache
 from client_surfaces.operator_tui.sections import get_section
 from client_surfaces.operator_tui._renderer_utils import (
     _chat_channel_label,
@@ -55,12 +56,29 @@ def _detail_lines(state: OperatorState, width: int, *, height: int | None = None
 
 
 def _standard_detail_lines(state: OperatorState, width: int) -> list[str]:
-    section = get_section(state.section_id)
     lines = [_pane_title("DETAIL", state.focus == FocusPane.DETAIL)]
     runtime_lines = _runtime_detail_lines(state, width)
     if runtime_lines:
         lines.extend(runtime_lines)
-
+    key = (
+        state.section_id,
+        state.mode.value,
+        (state.section_payloads or {}).get(state.section_id),
+        state.selected_index,
+        dict(state.pending_action or {}),
+        dict(state.audit_context or {}),
+        state.browser_fallback_url,
+        width,
+    )
+    section_lines = default_panel_render_cache().lines(
+        "detail", key, lambda: _section_detail_lines(state, width)
+    )
+    return [*(_clip(line, width) for line in lines), *section_lines]
+
+
+def _section_detail_lines(state: OperatorState, width: int) -> list[str]:
+    section = get_section(state.section_id)
+    lines: list[str] = []
     if state.mode.value == "inspect":
         lines.append("")
         lines.append("  inspect:")
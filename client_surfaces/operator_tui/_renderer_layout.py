@@ -33,6 +33,7 @@ from client_surfaces.operator_tui.chat_long_message import (
 from client_surfaces.operator_tui.chat_state import get_active_channel
 from client_surfaces.operator_tui.markdown_renderer import render_markdown_lines
 from client_surfaces.operator_tui.models import FocusPane, OperatorMode, OperatorState, PanelState
+from client_surfaces.operator_tui.render_cache import default_panel_render_cache
 from client_surfaces.operator_tui.read_models import build_goal_rows, build_inspection_detail, build_task_rows
 from client_surfaces.operator_tui.sections import SECTIONS, get_section
 from client_surfaces.operator_tui.audit_nav import grouped_audit_items, audit_nav_items
@@ -216,7 +217,11 @@ def _render_persistent_header(state: OperatorState, width: int) -> list[str]:
             section=state.section_id,
         )
         from agent.cli.status_snapshot import format_status_lines
-        right_lines = format_status_lines(snapshot, color=color, width=right_width)
+        right_lines = default_panel_render_cache().lines(
+            "header:status",
+            (snapshot, color, right_width),
+            lambda: format_status_lines(snapshot, color=color, width=right_width),
+        )
 
     while len(right_lines) < COMPACT_HEADER_LINES:
         right_lines.append("")
@@ -416,8 +421,8 @@ def _render_splash_header(splash: SplashMachine, state: OperatorState, width: in
 
 
 def _navigation_lines(state: OperatorState) -> list[str]:
-    lines = [_pane_title("NAV", state.focus == FocusPane.NAVIGATION)]
     if _share_only_nav_mode():
+        lines = [_pane_title("NAV", state.focus == FocusPane.NAVIGATION)]
         panel_state = (state.panel_states or {}).get("share")
         cursor = DEFAULT_THEME.selected_prefix if state.section_id == "share" else DEFAULT_THEME.idle_prefix
         lines.append(f"{cursor}{state_prefix(panel_state)} Share / Teilnehmer")
@@ -429,6 +434,51 @@ def _navigation_lines(state: OperatorState) -> list[str]:
     ptr_target = str(ptr.get("target") or "") if ptr else ""
     ptr_blink = int(ptr.get("blink_frame", 0)) if ptr else 0
     ptr_visible = ptr_blink % 2 == 0  # blink: visible on even frames
+    # The section tree only changes with these inputs; the chat history below
+    # reads the in-place mutated game dict and is rebuilt every frame.
+    payloads = state.section_payloads or {}
+    key = (
+        nav_focused,
+        state.selected_index,
+        state.section_id,
+        tuple((state.panel_states or {}).get(section.id) for section in SECTIONS),
+        ptr_target if ptr_visible else "",
+        payloads.get("templates") if state.section_id == "templates" else None,
+        payloads.get("audit") if state.section_id == "audit" else None,
+    )
+    section_lines, history_base = default_panel_render_cache().lookup(
+        "navigation",
+        key,
+        lambda: _navigation_section_lines(state, nav_focused=nav_focused, pointer_target=key[4]),
+    )
+    lines = list(section_lines)
+    history_rows = long_message_history_rows(game)
+    if history_rows:
+        lines.append("")
+        lines.append("  Chat History")
+        current_channel = ""
+        for offset, entry in enumerate(history_rows):
+            channel = str(entry.get("channel_id") or "room:main")
+            if channel != current_channel:
+                current_channel = channel
+                lines.append(f"  ▸ {channel}")
+            row_index = history_base + offset
+            if nav_focused and row_index == state.selected_index:
+                cursor = DEFAULT_THEME.selected_prefix
+            else:
+                cursor = DEFAULT_THEME.idle_prefix
+            sender = str(entry.get("sender_kind") or "message")
+            preview = str(entry.get("preview") or entry.get("text") or "").replace("\n", " ")
+            preview = shorten(preview, width=42, placeholder="...")
+            lines.append(f"{cursor}  └─ [{sender}] {preview}")
+    return lines
+
+
+def _navigation_section_lines(
+    state: OperatorState, *, nav_focused: bool, pointer_target: str
+) -> tuple[tuple[str, ...], int]:
+    """Section list with template/audit trees, plus the row index where chat history starts."""
+    lines = [_pane_title("NAV", nav_focused)]
     template_payload = dict((state.section_payloads or {}).get("templates") or {})
     template_groups = grouped_template_items(template_payload) if state.section_id == "templates" else []
     template_flat = template_nav_items(template_payload) if state.section_id == "templates" else []
@@ -451,7 +501,7 @@ def _navigation_lines(state: OperatorState) -> list[str]:
         else:
             cursor = DEFAULT_THEME.selected_prefix if section.id == state.section_id else DEFAULT_THEME.idle_prefix
         pointer_suffix = ""
-        if ptr_target == section.id and ptr_visible:
+        if pointer_target == section.id:
             pointer_suffix = " \x1b[38;2;255;205;130m←\x1b[0m"
         lines.append(f"{cursor}{state_prefix(panel_state)} {section.title}{pointer_suffix}")
         if section.id == "templates" and template_groups:
@@ -484,26 +534,7 @@ def _navigation_lines(state: OperatorState) -> list[str]:
                     suffix = "" if not status or status == "ok" else " ⚠"
                     lines.append(f"{leaf_cursor}{child_prefix}{leaf_branch}─ {title}{suffix}")
                     audit_row_index += 1
-    history_rows = long_message_history_rows(game)
-    if history_rows:
-        lines.append("")
-        lines.append("  Chat History")
-        current_channel = ""
-        for offset, entry in enumerate(history_rows):
-            channel = str(entry.get("channel_id") or "room:main")
-            if channel != current_channel:
-                current_channel = channel
-                lines.append(f"  ▸ {channel}")
-            row_index = len(SECTIONS) + len(template_flat) + len(audit_flat) + offset
-            if nav_focused and row_index == state.selected_index:
-                cursor = DEFAULT_THEME.selected_prefix
-            else:
-                cursor = DEFAULT_THEME.idle_prefix
-            sender = str(entry.get("sender_kind") or "message")
-            preview = str(entry.get("preview") or entry.get("text") or "").replace("\n", " ")
-            preview = shorten(preview, width=42, placeholder="...")
-            lines.append(f"{cursor}  └─ [{sender}] {preview}")
-    return lines
+    return tuple(lines), len(SECTIONS) + len(template_flat) + len(audit_flat)
 
 
 
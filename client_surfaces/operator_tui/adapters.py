@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Iterable
 
-from client_surfaces.operator_tui.models import PanelState, SectionLoadResult
+from client_surfaces.operator_tui.models import PanelState, Section, SectionLoadResult
 from client_surfaces.operator_tui.sections import get_section
 
 SectionLoader = Callable[[str], SectionLoadResult]
@@ -23,6 +24,8 @@ class SectionAdapterRegistry:
         self._use_hub = bool(self._endpoint) and loader is None
         self._async_loaders: dict[str, AsyncSectionLoader] = {}
         self._async_results: dict[str, SectionLoadResult] = {}
+        # section_id → (result, monotonic fetch time) aus load_many, von load() einmal verbraucht.
+        self._prefetched: dict[str, tuple[SectionLoadResult, float]] = {}
 
     def register_async(self, section_id: str, loader: AsyncSectionLoader) -> None:
         candidate = str(section_id or "").strip().lower()
@@ -49,6 +52,40 @@ class SectionAdapterRegistry:
         self._async_results[candidate] = result
         return result
 
+    def load_many(self, section_ids: Iterable[str]) -> dict[str, SectionLoadResult]:
+        """Load several hub sections in one concurrent batch.
+
+        The results are kept for the next load() of each section as long as they
+        are younger than the section's refresh interval, so switching to a
+        prefetched tab costs no round trip.  Async-registered sections are
+        skipped; registries without a hub have nothing to batch and return {}.
+        """
+        if not self._use_hub:
+            return {}
+        sections: dict[str, Section] = {}
+        for section_id in section_ids:
+            candidate = str(section_id or "").strip().lower()
+            if candidate in self._async_loaders:
+                continue
+            section = get_section(candidate)
+            sections.setdefault(section.id, section)
+        if not sections:
+            return {}
+        from client_surfaces.operator_tui.hub_loader import fetch_hub_sections
+
+        timeout = max(section.timeout_seconds for section in sections.values())
+        fetched_at = time.monotonic()
+        try:
+            outcomes = fetch_hub_sections(list(sections), self._endpoint, self._token, timeout=timeout)
+        except Exception as exc:
+            outcomes = {section_id: exc for section_id in sections}
+        results: dict[str, SectionLoadResult] = {}
+        for section_id, section in sections.items():
+            result = _hub_result(section, outcomes.get(section_id))
+            self._prefetched[section_id] = (result, fetched_at)
+            results[section_id] = result
+        return results
+
     def load(self, section_id: str) -> SectionLoadResult:
         candidate = str(section_id or "").strip().lower()
         if candidate in self._async_loaders:
@@ -59,20 +96,17 @@ class SectionAdapterRegistry:
         section = get_section(section_id)
 
         if self._use_hub:
+            prefetched = self._prefetched.pop(section.id, None)
+            if prefetched is not None and time.monotonic() - prefetched[1] < section.refresh_interval_seconds:
+                return prefetched[0]
             try:
                 from client_surfaces.operator_tui.hub_loader import fetch_hub_section
-                result = fetch_hub_section(
+                outcome = fetch_hub_section(
                     section_id, self._endpoint, self._token, timeout=section.timeout_seconds
                 )
-                if result is not None:
-                    return result
-                return SectionLoadResult(section.id, PanelState.EMPTY, {}, "")
-            except PermissionError as exc:
-                return SectionLoadResult(section.id, PanelState.UNAUTHORIZED, {}, str(exc))
-            except (TimeoutError, OSError) as exc:
-                return SectionLoadResult(section.id, PanelState.DEGRADED, {}, f"Hub nicht erreichbar: {exc}")
             except Exception as exc:
-                return SectionLoadResult(section.id, PanelState.DEGRADED, {}, f"Hub-Fehler: {exc}")
+                outcome = exc
+            return _hub_result(section, outcome)
 
         if self._loader is not None:
             try:
@@ -87,6 +121,19 @@ class SectionAdapterRegistry:
         return SectionLoadResult(section.id, PanelState.EMPTY, {}, "kein Hub konfiguriert")
 
 
+def _hub_result(section: Section, outcome: SectionLoadResult | Exception | None) -> SectionLoadResult:
+    """Map a fetch_hub_section outcome (result, None or raised exception) to a load result."""
+    if isinstance(outcome, SectionLoadResult):
+        return outcome
+    if outcome is None:
+        return SectionLoadResult(section.id, PanelState.EMPTY, {}, "")
+    if isinstance(outcome, PermissionError):
+        return SectionLoadResult(section.id, PanelState.UNAUTHORIZED, {}, str(outcome))
+    if isinstance(outcome, (TimeoutError, OSError)):
+        return SectionLoadResult(section.id, PanelState.DEGRADED, {}, f"Hub nicht erreichbar: {outcome}")
+    return SectionLoadResult(section.id, PanelState.DEGRADED, {}, f"Hub-Fehler: {outcome}")
+
+
 def merge_section_result(state_payloads: dict[str, dict] | None, result: SectionLoadResult) -> dict[str, dict]:
     payloads = dict(state_payloads or {})
     payloads[result.section_id] = dict(result.payload)
@@ -11,6 +11,7 @@ from agent.cli.splash import SplashMachine
 from client_surfaces.operator_tui.adapters import SectionAdapterRegistry, merge_panel_state, merge_section_result
 from client_surfaces.operator_tui.capabilities import graphics_decision
 from client_surfaces.operator_tui.commands import execute_command
+from client_surfaces.operator_tui.damage_renderer import DamageTracker
 from client_surfaces.operator_tui.performance import PerformanceBudget, measure
 from client_surfaces.operator_tui.models import FocusPane, OperatorMode, OperatorState
 from client_surfaces.operator_tui.renderer import render_operator_shell
@@ -150,6 +151,12 @@ def build_initial_state(args: argparse.Namespace) -> OperatorState:
     )
 
 
+def prefetch_open_sections(state: OperatorState, registry: SectionAdapterRegistry) -> None:
+    """Batch-load the active section and every open section tab in one round."""
+    section_ids = [state.section_id, *(tab.section_id for tab in state.open_tabs if tab.kind == "section")]
+    registry.load_many(section_ids)
+
+
 def load_active_section(state: OperatorState, registry: SectionAdapterRegistry | None = None) -> OperatorState:
     adapters = registry or SectionAdapterRegistry()
     result = adapters.load(state.section_id)
@@ -189,7 +196,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
     dashboard_controller.register(registry)
     budget = PerformanceBudget()
-    state = load_active_section(build_initial_state(args), registry)
+    initial_state = build_initial_state(args)
+    prefetch_open_sections(initial_state, registry)
+    state = load_active_section(initial_state, registry)
     for command in args.command:
         result = execute_command(command, state)
         state = load_active_section(result.state.with_updates(status_message=result.message), registry)
@@ -280,9 +289,10 @@ def _play_splash_to_terminal(state: OperatorState) -> None:
         return
 
     interval = 1.0 / 24
+    tracker = DamageTracker(width=width, height=height)
     try:
         for frame in frames:
-            tty.write(f"\x1b[H{frame}")
+            tty.write(tracker.render(frame))
             tty.flush()
             time.sleep(interval)
     except KeyboardInterrupt:
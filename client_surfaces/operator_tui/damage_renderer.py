@@ -0,0 +1,254 @@
+"""Damage-tracked terminal output.
+
+``DamageTracker`` keeps the last emitted screen as rows of ``(char, sgr)``
+cells and turns each new frame into cursor moves plus SGR changes for the
+runs that actually changed. Mostly static screens then cost a few bytes per
+frame instead of a full repaint, which is what matters over SSH and in tmux.
+
+Rows containing wide or zero-width characters cannot be addressed by column
+reliably; when such a row changes it is repainted from column 1.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence
+
+_ESCAPE_RE = re.compile(r"\x1b(?:\[([0-?]*)([ -/]*[@-~])|[@-Z\\-_])")
+# A cursor move costs 6-8 bytes, so shorter unchanged gaps are rewritten.
+_RUN_MERGE_GAP = 6
+
+Cell = tuple[str, str]
+_BLANK: Cell = (" ", "")
+
+
+@dataclass(frozen=True)
+class FrameStats:
+    bytes_written: int
+    full_repaint_bytes: int
+    changed_rows: int
+    full_repaint: bool
+
+
+# SGR codes that switch an attribute off, mapped to the "on" codes they clear.
+_SGR_ATTR_OFF = {
+    "22": ("1", "2"),
+    "23": ("3",),
+    "24": ("4", "21"),
+    "25": ("5", "6"),
+    "27": ("7",),
+    "28": ("8",),
+    "29": ("9",),
+}
+
+
+@lru_cache(maxsize=4096)
+def _apply_sgr(style: str, params: str) -> str:
+    """Apply SGR ``params`` to the normalized ``style`` and return the new normalized style.
+
+    A style is the minimal SGR parameter string for (attributes, fg, bg):
+    attributes in numeric order, then foreground, then background. A new
+    colour replaces the old one, so runs of per-cell colour changes without a
+    reset keep a bounded style and equal-looking cells compare equal.
+    """
+    tokens = (f"{style};{params}" if style else params).split(";")
+    attrs: set[str] = set()
+    fg = bg = ""
+    index = 0
+    while index < len(tokens):
+        token = tokens[index].lstrip("0") or "0"
+        index += 1
+        if token == "0":
+            attrs.clear()
+            fg = bg = ""
+        elif token in ("38", "48"):
+            mode = tokens[index] if index < len(tokens) else ""
+            span = 2 if mode == "5" else 4 if mode == "2" else 0
+            if not span:
+                continue
+            colour = ";".join([token, *tokens[index : index + span]])
+            index += span
+            if token == "38":
+                fg = colour
+            else:
+                bg = colour
+        elif token == "39":
+            fg = ""
+        elif token == "49":
+            bg = ""
+        elif token.isdigit() and (30 <= int(token) <= 37 or 90 <= int(token) <= 97):
+            fg = token
+        elif token.isdigit() and (40 <= int(token) <= 47 or 100 <= int(token) <= 107):
+            bg = token
+        elif token in _SGR_ATTR_OFF:
+            attrs.difference_update(_SGR_ATTR_OFF[token])
+        else:
+            attrs.add(token)
+    ordered = sorted(attrs, key=lambda code: (len(code), code))
+    return ";".join(part for part in (*ordered, fg, bg) if part)
+
+
+def _is_narrow(text: str) -> bool:
+    if text.isascii():
+        return True
+    return not any(
+        unicodedata.east_asian_width(char) in ("W", "F") or unicodedata.combining(char)
+        for char in text
+    )
+
+
+def _char_width(char: str) -> int:
+    if char.isascii():
+        return 1
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def parse_frame(lines: Sequence[str], *, width: int, height: int) -> tuple[list[tuple[Cell, ...]], list[bool]]:
+    """Split ANSI text into per-row cells; SGR state carries across lines like on a terminal.
+
+    Returns the rows (padded/clipped to ``width`` x ``height``) and, per row,
+    whether every character is single-width.
+    """
+    rows: list[tuple[Cell, ...]] = []
+    narrow: list[bool] = []
+    style = ""
+    for line in list(lines)[:height]:
+        cells: list[Cell] = []
+        safe = True
+        position = 0
+        for match in _ESCAPE_RE.finditer(line):
+            if match.start() > position:
+                text = line[position : match.start()]
+                safe = safe and _is_narrow(text)
+                cells.extend((char, style) for char in text)
+            position = match.end()
+            if match.group(2) == "m":
+                style = _apply_sgr(style, match.group(1) or "")
+        if position < len(line):
+            text = line[position:]
+            safe = safe and _is_narrow(text)
+            cells.extend((char, style) for char in text)
+        if len(cells) < width:
+            cells.extend([_BLANK] * (width - len(cells)))
+        rows.append(tuple(cells[:width]))
+        narrow.append(safe)
+    blank_row = (_BLANK,) * width
+    while len(rows) < height:
+        rows.append(blank_row)
+        narrow.append(True)
+    return rows, narrow
+
+
+def _changed_runs(previous: tuple[Cell, ...], current: tuple[Cell, ...]) -> list[tuple[int, int]]:
+    runs: list[tuple[int, int]] = []
+    start = -1
+    last = -1
+    for x, (old, new) in enumerate(zip(previous, current)):
+        if old == new:
+            continue
+        if start < 0:
+            start = x
+        elif x - last > _RUN_MERGE_GAP:
+            runs.append((start, last + 1))
+            start = x
+        last = x
+    if start >= 0:
+        runs.append((start, last + 1))
+    return runs
+
+
+class DamageTracker:
+    """Turns full frames into minimal terminal updates against the last emitted frame."""
+
+    def __init__(self, *, width: int, height: int) -> None:
+        self._width = max(1, int(width))
+        self._height = max(1, int(height))
+        self._rows: list[tuple[Cell, ...]] | None = None
+        self._narrow: list[bool] = []
+        self.last_stats: FrameStats | None = None
+
+    def resize(self, width: int, height: int) -> None:
+        if (int(width), int(height)) != (self._width, self._height):
+            self._width = max(1, int(width))
+            self._height = max(1, int(height))
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force a full repaint on the next frame (after resize or a foreign write)."""
+        self._rows = None
+
+    def render(self, frame: str | Sequence[str]) -> str:
+        lines = frame.splitlines() if isinstance(frame, str) else list(frame)
+        rows, narrow = parse_frame(lines, width=self._width, height=self._height)
+        full_repaint = self._rows is None
+        if self._rows is None:
+            blank_row = (_BLANK,) * self._width
+            previous, previous_narrow = [blank_row] * self._height, [True] * self._height
+            out = ["\x1b[0m\x1b[2J"]
+        else:
+            previous, previous_narrow = self._rows, self._narrow
+            out = []
+        cursor = (-1, -1)
+        style = ""
+        changed_rows = 0
+        for y, row in enumerate(rows):
+            old = previous[y]
+            if row == old:
+                continue
+            changed_rows += 1
+            if not (narrow[y] and previous_narrow[y]):
+                style = self._repaint_row(out, y, row, style)
+                cursor = (-1, -1)
+                continue
+            for start, end in _changed_runs(old, row):
+                if cursor != (y, start):
+                    out.append(f"\x1b[{y + 1};{start + 1}H")
+                for char, cell_style in row[start:end]:
+                    if cell_style != style:
+                        out.append(f"\x1b[0;{cell_style}m" if cell_style else "\x1b[0m")
+                        style = cell_style
+                    out.append(char)
+                cursor = (y, end)
+        if style:
+            out.append("\x1b[0m")
+        self._rows = rows
+        self._narrow = narrow
+        payload = "".join(out)
+        self.last_stats = FrameStats(
+            bytes_written=len(payload.encode("utf-8")),
+            full_repaint_bytes=len(("\x1b[H" + "\n".join(lines)).encode("utf-8")),
+            changed_rows=changed_rows,
+            full_repaint=full_repaint,
+        )
+        return payload
+
+    def _repaint_row(self, out: list[str], y: int, row: tuple[Cell, ...], style: str) -> str:
+        """Rewrite a whole row by display width, so wide characters never wrap."""
+        out.append(f"\x1b[{y + 1};1H")
+        end = len(row)
+        while end and row[end - 1] == _BLANK:
+            end -= 1
+        column = 0
+        for char, cell_style in row[:end]:
+            char_width = _char_width(char)
+            if column + char_width > self._width:
+                break
+            if cell_style != style:
+                out.append(f"\x1b[0;{cell_style}m" if cell_style else "\x1b[0m")
+                style = cell_style
+            out.append(char)
+            column += char_width
+        if column < self._width:
+            if style:
+                out.append("\x1b[0m")
+                style = ""
+            out.append("\x1b[K")
+        return style
+
+
+__all__ = ["DamageTracker", "FrameStats", "parse_frame"]
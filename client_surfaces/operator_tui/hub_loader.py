@@ -1,6 +1,11 @@
 """Loads TUI section payloads from the live Ananta hub API.
 
-Uses stdlib urllib only — no extra deps.  Synchronous with per-call timeout.
+Uses the stdlib only — no extra deps.  Requests go through a small keep-alive
+connection pool (http.client, honouring HTTP(S)_PROXY/NO_PROXY) with per-call timeout; independent requests of a
+section (audit datasets, trace details, dashboard counters) run in parallel,
+bounded by _MAX_PARALLEL_REQUESTS.  Response bodies are cached per
+(base, path, token) together with their ETag and revalidated with
+If-None-Match, so an unchanged list costs a 304 instead of a re-download.
 Returns None for sections that have no hub backend (caller uses empty state).
 
 Auth: if the caller passes a plain password (ANANTA_PASSWORD) rather than a JWT
@@ -9,14 +14,18 @@ cached per (base, username) for its full TTL.
 """
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import threading
 import time
 import urllib.error
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Sequence
+from urllib.parse import unquote, urlsplit
 
 from client_surfaces.operator_tui.audit_cleanup import build_audit_cleanup_entries
 from client_surfaces.operator_tui.models import PanelState, SectionLoadResult
@@ -110,15 +119,204 @@ def resolve_token(
     return jwt_str
 
 
+# ── HTTP transport: keep-alive pool, bounded parallelism, ETag body cache ─────
+
+_MAX_PARALLEL_REQUESTS = 6
+_MAX_IDLE_PER_HOST = _MAX_PARALLEL_REQUESTS
+_BODY_CACHE_LIMIT = 256
+
+# Begrenzt die gleichzeitig laufenden Hub-Requests prozessweit; gehalten wird er
+# nur um den eigentlichen Request, daher können parallele Sections ihrerseits
+# parallele Detail-Requests starten, ohne sich gegenseitig zu blockieren.
+_request_slots = threading.BoundedSemaphore(_MAX_PARALLEL_REQUESTS)
+
+
+_PoolKey = tuple[str, str, int, str]
+
+
+def _proxy_for(scheme: str, host: str) -> str:
+    """Proxy URL from HTTP(S)_PROXY for this host, or "" (NO_PROXY honoured) — wie urllib."""
+    proxy = urllib.request.getproxies().get(scheme, "")
+    if not proxy or urllib.request.proxy_bypass(host):
+        return ""
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _proxy_authorization(proxy: str) -> dict[str, str]:
+    parts = urlsplit(proxy)
+    if parts.username is None:
+        return {}
+    import base64
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode()).decode("ascii")}
+
+
+class _HubConnectionPool:
+    """Idle keep-alive connections per (scheme, host, port, proxy)."""
+
+    def __init__(self, max_idle_per_host: int = _MAX_IDLE_PER_HOST) -> None:
+        self._max_idle = max(1, int(max_idle_per_host))
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, headers: dict[str, str], timeout: float) -> tuple[int, str, Any, bytes]:
+        """GET url; returns (status, reason, headers, body). Retries once on a stale idle socket.
+
+        HTTP(S)_PROXY/NO_PROXY gelten wie bei urllib: http geht mit absoluter URL an
+        den Proxy, https per CONNECT-Tunnel.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = _proxy_for(scheme, host)
+        key = (scheme, host, port, proxy)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        if proxy and scheme == "http":
+            target = f"http://{parts.netloc.rpartition('@')[2]}{target}"
+            headers = {**headers, **_proxy_authorization(proxy)}
+        conn, reused = self._acquire(key, timeout)
+        try:
+            return self._exchange(key, conn, target, headers, timeout)
+        except (ConnectionError, http.client.BadStatusLine):
+            if not reused:
+                raise
+        # Der Hub hat die Idle-Verbindung inzwischen geschlossen: einmal frisch versuchen.
+        conn = self._connect(key, timeout)
+        return self._exchange(key, conn, target, headers, timeout)
+
+    def clear(self) -> None:
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def _exchange(
+        self,
+        key: _PoolKey,
+        conn: http.client.HTTPConnection,
+        target: str,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, str, Any, bytes]:
+        try:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            conn.request("GET", target, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except BaseException:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return resp.status, resp.reason, resp.headers, body
+
+    def _acquire(self, key: _PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key, timeout), False
+
+    def _connect(self, key: _PoolKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port, proxy = key
+        if not proxy:
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=timeout)
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+        proxy_parts = urlsplit(proxy)
+        proxy_host = proxy_parts.hostname or ""
+        proxy_port = proxy_parts.port or 8080
+        if scheme != "https":
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+        conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout)
+        conn.set_tunnel(host, port, headers=_proxy_authorization(proxy))
+        return conn
+
+    def _release(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+
+_pool = _HubConnectionPool()
+
+# (base, path, token) → (etag, data); nur Antworten mit ETag landen hier.
+_body_cache: OrderedDict[tuple[str, str, str], tuple[str, Any]] = OrderedDict()
+_body_cache_lock = threading.Lock()
+
+
+def reset_hub_transport() -> None:
+    """Drop pooled connections and cached bodies (endpoint/token switch, tests)."""
+    _pool.clear()
+    with _body_cache_lock:
+        _body_cache.clear()
+
+
 def _hub_get(base: str, path: str, token: str, timeout: float) -> Any:
     url = f"{base}/{path.lstrip('/')}"
-    req = urllib.request.Request(
-        url,
-        headers={"Authorization": f"Bearer {token}", "Accept": "application/json"},
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = json.loads(resp.read())
-    return raw.get("data")
+    cache_key = (base, path, token)
+    with _body_cache_lock:
+        cached = _body_cache.get(cache_key)
+    headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+    try:
+        with _request_slots:
+            status, reason, resp_headers, body = _pool.get(url, headers, timeout)
+    except http.client.HTTPException as exc:
+        raise urllib.error.URLError(f"hub protocol error: {exc!r}") from exc
+    if status == 304 and cached is not None:
+        with _body_cache_lock:
+            if cache_key in _body_cache:
+                _body_cache.move_to_end(cache_key)
+        return cached[1]
+    if status >= 400:
+        raise urllib.error.HTTPError(url, status, reason, resp_headers, None)
+    data = json.loads(body).get("data")
+    etag = str(resp_headers.get("ETag") or "").strip()
+    with _body_cache_lock:
+        if etag:
+            _body_cache[cache_key] = (etag, data)
+            _body_cache.move_to_end(cache_key)
+            while len(_body_cache) > _BODY_CACHE_LIMIT:
+                _body_cache.popitem(last=False)
+        else:
+            _body_cache.pop(cache_key, None)
+    return data
+
+
+def _run_parallel(calls: Sequence[Callable[[], Any]]) -> list[tuple[Any, BaseException | None]]:
+    """Run independent calls concurrently; returns (value, error) per call, in order."""
+    if not calls:
+        return []
+
+    def _capture(call: Callable[[], Any]) -> tuple[Any, BaseException | None]:
+        try:
+            return call(), None
+        except Exception as exc:
+            return None, exc
+
+    if len(calls) == 1:
+        return [_capture(calls[0])]
+    workers = min(_MAX_PARALLEL_REQUESTS, len(calls))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tui-hub") as executor:
+        return list(executor.map(_capture, calls))
+
+
+def _get_many(base: str, token: str, requests: Sequence[tuple[str, float]]) -> list[tuple[Any, BaseException | None]]:
+    return _run_parallel([
+        (lambda path=path, per=per: _checked_get(base, path, token, per))
+        for path, per in requests
+    ])
 
 
 def _goal_title(g: dict) -> str:
@@ -191,6 +389,28 @@ def fetch_hub_section(
     return None
 
 
+def fetch_hub_sections(
+    section_ids: Sequence[str],
+    endpoint: str,
+    token: str,
+    timeout: float = 2.0,
+) -> dict[str, SectionLoadResult | None | Exception]:
+    """Fetch several sections concurrently (shared pool, shared request limit).
+
+    Maps each section id to what fetch_hub_section returned, or to the
+    exception it raised, so one failing section does not hide the others.
+    """
+    ids = list(dict.fromkeys(section_ids))
+    if ids:
+        # Login einmal vorab, nicht parallel pro Section.
+        resolve_token(endpoint.rstrip("/"), token)
+    outcomes = _run_parallel([
+        (lambda section_id=section_id: fetch_hub_section(section_id, endpoint, token, timeout))
+        for section_id in ids
+    ])
+    return {section_id: (error if error is not None else value) for section_id, (value, error) in zip(ids, outcomes)}
+
+
 # ── per-section fetchers ───────────────────────────────────────────────────────
 
 def _checked_get(base: str, path: str, token: str, timeout: float) -> Any:
@@ -227,7 +447,11 @@ def _fetch_goals(base: str, token: str, timeout: float) -> SectionLoadResult:
 
 def _fetch_tasks(base: str, token: str, timeout: float) -> SectionLoadResult:
     per = max(0.5, timeout / 2)
-    data = _checked_get(base, "/tasks?limit=50", token, per)
+    (data, error), (tl_data, tl_error) = _get_many(
+        base, token, [("/tasks?limit=50", per), ("/tasks/timeline?limit=10", per)]
+    )
+    if error is not None:
+        raise error
     tasks: list[dict] = data if isinstance(data, list) else []
     items = [
         {
@@ -239,18 +463,18 @@ def _fetch_tasks(base: str, token: str, timeout: float) -> SectionLoadResult:
         for t in tasks
     ]
     timeline: list[dict] = []
-    try:
-        tl_data = _checked_get(base, "/tasks/timeline?limit=10", token, per)
-        tl_items = (tl_data or {}).get("items") if isinstance(tl_data, dict) else []
-        timeline = [
-            {
-                "id": str(e.get("task_id") or e.get("id") or ""),
-                "summary": str(e.get("summary") or e.get("event_type") or "")[:80],
-            }
-            for e in (tl_items or [])
-        ]
-    except Exception:
-        pass
+    if tl_error is None:
+        try:
+            tl_items = (tl_data or {}).get("items") if isinstance(tl_data, dict) else []
+            timeline = [
+                {
+                    "id": str(e.get("task_id") or e.get("id") or ""),
+                    "summary": str(e.get("summary") or e.get("event_type") or "")[:80],
+                }
+                for e in (tl_items or [])
+            ]
+        except Exception:
+            pass
     payload: dict[str, Any] = {"items": items, "timeline": timeline}
     state = PanelState.HEALTHY if items else PanelState.EMPTY
     return SectionLoadResult("tasks", state, payload, f"hub: {len(items)} tasks")
@@ -273,8 +497,14 @@ def _fetch_artifacts(base: str, token: str, timeout: float) -> SectionLoadResult
 
 
 def _fetch_dashboard(base: str, token: str, timeout: float) -> SectionLoadResult:
-    per = max(0.5, timeout / 3)
-    health: dict = _checked_get(base, "/health", token, per) or {}
+    # Die drei Requests sind unabhängig; parallel darf jeder das halbe Budget nutzen.
+    per = max(0.5, timeout / 2)
+    (health_data, health_error), (goals_data, goals_error), (tasks_data, tasks_error) = _get_many(
+        base, token, [("/health", per), ("/goals", per), ("/tasks?limit=100", per)]
+    )
+    if health_error is not None:
+        raise health_error
+    health: dict = health_data or {}
     checks = health.get("checks") or {}
     llm_providers: dict = checks.get("llm_providers") or {}
     queue_info: dict = checks.get("queue") or {}
@@ -286,23 +516,21 @@ def _fetch_dashboard(base: str, token: str, timeout: float) -> SectionLoadResult
 
     goal_summary = ""
     task_summary = ""
-    try:
-        goals_data = _checked_get(base, "/goals", token, per)
-        goals: list = goals_data if isinstance(goals_data, list) else []
-        running = sum(1 for g in goals if _normalize_goal_status(str(g.get("status") or "")) == "running")
-        done = sum(1 for g in goals if _normalize_goal_status(str(g.get("status") or "")) == "done")
-        failed = sum(1 for g in goals if _normalize_goal_status(str(g.get("status") or "")) == "failed")
-        goal_summary = f"{running} running · {done} done · {failed} failed"
-    except Exception:
-        pass
-    try:
-        tasks_data = _checked_get(base, "/tasks?limit=100", token, per)
-        tasks: list = tasks_data if isinstance(tasks_data, list) else []
-        active = sum(1 for t in tasks if _normalize_task_status(str(t.get("status") or "")) == "running")
-        completed = sum(1 for t in tasks if _normalize_task_status(str(t.get("status") or "")) == "done")
-        task_summary = f"{active} active · {completed} completed"
-    except Exception:
-        pass
+    if goals_error is None:
+        try:
+            goal_counts = _status_counts(goals_data, _normalize_goal_status)
+            goal_summary = (
+                f"{goal_counts.get('running', 0)} running · {goal_counts.get('done', 0)} done"
+                f" · {goal_counts.get('failed', 0)} failed"
+            )
+        except Exception:
+            pass
+    if tasks_error is None:
+        try:
+            task_counts = _status_counts(tasks_data, _normalize_task_status)
+            task_summary = f"{task_counts.get('running', 0)} active · {task_counts.get('done', 0)} completed"
+        except Exception:
+            pass
 
     payload: dict[str, Any] = {
         "agents": agents_info,
@@ -314,21 +542,30 @@ def _fetch_dashboard(base: str, token: str, timeout: float) -> SectionLoadResult
     return SectionLoadResult("dashboard", PanelState.HEALTHY, payload, "hub: dashboard")
 
 
+def _status_counts(data: Any, normalize: Callable[[str], str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for row in data if isinstance(data, list) else []:
+        status = normalize(str(row.get("status") or ""))
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
 def _fetch_system(base: str, token: str, timeout: float) -> SectionLoadResult:
     per = max(0.5, timeout / 2)
-    health: dict = _checked_get(base, "/health", token, per) or {}
+    (health_data, health_error), (contracts_data, contracts_error) = _get_many(
+        base, token, [("/health", per), ("/contracts", per)]
+    )
+    if health_error is not None:
+        raise health_error
+    health: dict = health_data or {}
     checks = health.get("checks") or {}
     llm_providers: dict = checks.get("llm_providers") or {}
     queue_info: dict = checks.get("queue") or {}
     queue_counts: dict = queue_info.get("counts") or {}
 
     contracts: list[str] = []
-    try:
-        contracts_data = _checked_get(base, "/contracts", token, per)
-        if isinstance(contracts_data, list):
-            contracts = [str(c) for c in contracts_data]
-    except Exception:
-        pass
+    if contracts_error is None and isinstance(contracts_data, list):
+        contracts = [str(c) for c in contracts_data]
 
     agents_check: dict = checks.get("agents") or {}
     payload: dict[str, Any] = {
@@ -346,19 +583,11 @@ def _fetch_system(base: str, token: str, timeout: float) -> SectionLoadResult:
 def _fetch_templates(base: str, token: str, timeout: float) -> SectionLoadResult:
     per = max(0.5, timeout / 2)
 
-    blueprints_raw: list[dict] = []
-    try:
-        data = _checked_get(base, "/teams/blueprints", token, per)
-        blueprints_raw = data if isinstance(data, list) else []
-    except Exception:
-        pass
-
-    templates_raw: list[dict] = []
-    try:
-        data = _checked_get(base, "/templates", token, per)
-        templates_raw = data if isinstance(data, list) else []
-    except Exception:
-        pass
+    (bp_data, bp_error), (tpl_data, tpl_error) = _get_many(
+        base, token, [("/teams/blueprints", per), ("/templates", per)]
+    )
+    blueprints_raw: list[dict] = bp_data if bp_error is None and isinstance(bp_data, list) else []
+    templates_raw: list[dict] = tpl_data if tpl_error is None and isinstance(tpl_data, list) else []
 
     fallback_used = False
     if not blueprints_raw:
@@ -494,14 +723,13 @@ def _fetch_audit(base: str, token: str, timeout: float) -> SectionLoadResult:
     payload_datasets: dict[str, Any] = {}
     available_count = 0
 
-    for dataset_id, group, title, path in datasets:
+    fetched = _get_many(base, token, [(path, per) for _dataset_id, _group, _title, path in datasets])
+    for (dataset_id, group, title, path), (data, exc) in zip(datasets, fetched):
         status = "ok"
         error = ""
-        data: Any = None
-        try:
-            data = _checked_get(base, path, token, per)
+        if exc is None:
             available_count += 1
-        except Exception as exc:
+        else:
             status = "unavailable"
             error = str(exc)[:180] or "request failed"
             data = {"error": error, "path": path}
@@ -525,10 +753,15 @@ def _fetch_audit(base: str, token: str, timeout: float) -> SectionLoadResult:
     selected_traces = chat_like if chat_like else traces_all
     detail_limit = max(3, min(30, int(timeout * 6)))
     detail_timeout = max(0.35, timeout / 5)
-    for index, trace in enumerate(selected_traces[:detail_limit], start=1):
-        trace_id = str(trace.get("trace_id") or "").strip()
-        if not trace_id:
-            continue
+    detail_traces = [
+        (index, trace, str(trace.get("trace_id") or "").strip())
+        for index, trace in enumerate(selected_traces[:detail_limit], start=1)
+    ]
+    detail_traces = [entry for entry in detail_traces if entry[2]]
+    details = _get_many(
+        base, token, [(f"/debug/llm-requests/{trace_id}", detail_timeout) for _index, _trace, trace_id in detail_traces]
+    )
+    for (index, trace, trace_id), (detail, exc) in zip(detail_traces, details):
         dataset_id = f"llm.requests.chat_prompt.{trace_id}"
         request_kind = str(trace.get("request_kind") or "")
         model = str(trace.get("model") or "")
@@ -541,10 +774,7 @@ def _fetch_audit(base: str, token: str, timeout: float) -> SectionLoadResult:
             title += f" · {model}"
         status = "ok"
         error = ""
-        detail: Any = None
-        try:
-            detail = _checked_get(base, f"/debug/llm-requests/{trace_id}", token, detail_timeout)
-        except Exception as exc:
+        if exc is not None:
             status = "unavailable"
             error = str(exc)[:180] or "request failed"
             detail = {"trace_id": trace_id, "error": error}
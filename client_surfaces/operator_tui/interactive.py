@@ -64,7 +64,7 @@ from client_surfaces.operator_tui.ai_snake_training_store import (
 from client_surfaces.operator_tui.ai_snake_worker_client import AiSnakeWorkerClient, WorkerTask
 from client_surfaces.operator_tui.audit_cleanup import run_audit_cleanup_action
 from client_surfaces.operator_tui.artifact_intent import ArtifactIntent, ArtifactIntentDetector, IntentConfidence
-from client_surfaces.operator_tui.app import load_active_section
+from client_surfaces.operator_tui.app import load_active_section, prefetch_open_sections
 from client_surfaces.operator_tui.commands import execute_command
 from client_surfaces.operator_tui.chat_long_message import (
     configure_middle_view_for_message,
@@ -163,6 +163,7 @@ class InteractiveOperatorTui(SnakeTickMixin, SnakeHeuristicMixin, SnakeOpsMixin,
         self._intent_detector = ArtifactIntentDetector(
             dwell_seconds=float(os.environ.get("ANANTA_TUI_SNAKE_MOUSE_DWELL", "0.35"))
         )
+        prefetch_open_sections(state, self._registry)
         self.state = load_active_section(state, self._registry)
         term_graphics = dict(self.state.terminal_graphics or {})
         term_graphics["mouse_support"] = dict(self._mouse_capabilities)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Any
 
@@ -34,17 +35,96 @@ class RegionRect:
 
 
 class RegionIndex:
+    """Hit-testing over layered rects; later regions win where they overlap.
+
+    On first lookup every row is flattened into disjoint x-segments that carry
+    the topmost target, so a hover/drag event is a dict lookup plus a bisect
+    instead of a walk over all regions.
+    """
+
     def __init__(self, regions: list[RegionRect]) -> None:
         self._regions = list(regions)
+        self._rows: dict[int, tuple[list[int], list[RegionTarget | None]]] | None = None
 
     def get_target_at(self, x: int, y: int) -> RegionTarget | None:
-        for region in reversed(self._regions):
-            if region.contains(x, y):
-                return region.target
+        if self._rows is None:
+            self._rows = _row_segments(self._regions)
+        row = self._rows.get(y)
+        if row is None:
+            return None
+        starts, targets = row
+        slot = bisect_right(starts, x) - 1
+        return targets[slot] if slot >= 0 else None
+
+
+def _row_segments(regions: list[RegionRect]) -> dict[int, tuple[list[int], list[RegionTarget | None]]]:
+    by_row: dict[int, list[RegionRect]] = {}
+    for region in regions:
+        if region.x1 > region.x2:
+            continue
+        for y in range(region.y1, region.y2 + 1):
+            by_row.setdefault(y, []).append(region)
+    rows: dict[int, tuple[list[int], list[RegionTarget | None]]] = {}
+    for y, covering in by_row.items():
+        bounds = sorted({edge for region in covering for edge in (region.x1, region.x2 + 1)})
+        starts: list[int] = []
+        targets: list[RegionTarget | None] = []
+        for x in bounds:
+            target = next((region.target for region in reversed(covering) if region.x1 <= x <= region.x2), None)
+            if targets and targets[-1] is target:
+                continue
+            starts.append(x)
+            targets.append(target)
+        rows[y] = (starts, targets)
+    return rows
+
+
+# Letztes Layout: Maus-Events zwischen zwei State-Änderungen teilen sich den Index.
+_last_layout: tuple[Any, RegionIndex] | None = None
+
+
+def _layout_key(state: OperatorState, width: int, height: int) -> Any:
+    """Inputs that decide pane geometry and row targets; None when not cacheable.
+
+    ``section_payloads`` entries are replaced on update, so they go into the key
+    as-is; values from the in-place mutated game dict are copied.
+    """
+    game = state.header_logo_game if isinstance(state.header_logo_game, dict) else {}
+    if game.get("ai_snake_config_open"):
         return None
+    payloads = state.section_payloads or {}
+    history = tuple(
+        (str(entry.get("channel_id") or ""), str(entry.get("preview") or entry.get("text") or ""))
+        for entry in long_message_history_rows(game)
+    )
+    return (
+        max(72, int(width)),
+        max(18, int(height)),
+        state.section_id,
+        state.selected_index,
+        state.open_tabs,
+        state.tab_scroll_offset,
+        payloads.get(state.section_id),
+        payloads.get("templates") if state.section_id == "templates" else None,
+        payloads.get("audit") if state.section_id == "audit" else None,
+        history,
+    )
 
 
 def build_region_index(state: OperatorState, *, width: int, height: int) -> RegionIndex:
+    """Region index for the current layout, rebuilt only when its inputs change."""
+    global _last_layout
+    key = _layout_key(state, width, height)
+    cached = _last_layout
+    if key is not None and cached is not None and cached[0] == key:
+        return cached[1]
+    index = _build_region_index(state, width=width, height=height)
+    if key is not None:
+        _last_layout = (key, index)
+    return index
+
+
+def _build_region_index(state: OperatorState, *, width: int, height: int) -> RegionIndex:
     w = max(72, int(width))
     h = max(18, int(height))
     left_width = 22
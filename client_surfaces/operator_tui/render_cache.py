@@ -0,0 +1,61 @@
+"""Per-panel render memoisation for the operator shell.
+
+Every panel renders from a small slice of ``OperatorState``. The renderer
+builds a key from exactly that slice (payload, width, offsets, focus, ...)
+and ``PanelRenderCache`` hands back the previous lines while the key is
+unchanged, so a keystroke pays for the panels whose inputs moved instead of
+the whole UI.
+
+Keys may hold ``section_payloads`` entries directly: those are replaced, not
+mutated, on update, and tuple comparison checks identity before equality, so
+an unchanged payload costs a pointer compare. ``header_logo_game`` is mutated
+in place, so values read from it must go into the key as copies/scalars.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class PanelRenderCache:
+    """Holds the last (key, value) per panel; values must be treated as read-only."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[Any, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, panel: str, key: Any, render: Callable[[], T]) -> T:
+        entry = self._entries.get(panel)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        value = render()
+        self._entries[panel] = (key, value)
+        self.misses += 1
+        return value
+
+    def lines(self, panel: str, key: Any, render: Callable[[], list[str]]) -> list[str]:
+        """Like ``lookup`` for line lists; the caller gets a list it may extend."""
+        return list(self.lookup(panel, key, lambda: tuple(render())))
+
+    def invalidate(self, panel: str | None = None) -> None:
+        if panel is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(panel, None)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "panels": len(self._entries)}
+
+
+_DEFAULT_CACHE = PanelRenderCache()
+
+
+def default_panel_render_cache() -> PanelRenderCache:
+    return _DEFAULT_CACHE
+
+
+__all__ = ["PanelRenderCache", "default_panel_render_cache"]
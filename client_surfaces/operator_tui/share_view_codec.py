@@ -0,0 +1,194 @@
+"""SS05.02: Binäres, komprimiertes Frame-Format (Version 2) für den View-Stream.
+
+Version 1 schickt bei jedem Delta den kompletten Screen-Text. Version 2 schickt
+nur Zeilen-Runs gegen den letzten Stand des Empfängers:
+
+- COPY n          n Zeilen unverändert übernehmen
+- LINE text       Zeile komplett ersetzen (oder anhängen)
+- PATCH p s text  Zeile: p Zeichen vorne und s hinten behalten, Mitte ersetzen
+
+Der Body wird per raw deflate (zlib, keine Zusatz-Abhängigkeit) komprimiert,
+sobald das kleiner ist. Der Empfänger wendet die Runs direkt auf seine Zeilen
+an, ohne Zwischenobjekte pro Zelle.
+"""
+from __future__ import annotations
+
+import zlib
+from typing import Iterable
+
+FRAME_VERSION_TEXT = "1"
+FRAME_VERSION_BINARY = "2"
+SUPPORTED_FRAME_VERSIONS = (FRAME_VERSION_TEXT, FRAME_VERSION_BINARY)
+
+_FLAG_DEFLATE = 0x01
+_OP_COPY = 0
+_OP_LINE = 1
+_OP_PATCH = 2
+_MIN_DEFLATE_BYTES = 64
+_MAX_DECODED_BYTES = 4 * 1024 * 1024  # Schutz gegen Deflate-Bomben
+# Unterhalb dieser gemeinsamen Länge lohnt PATCH (zwei Varints) nicht.
+_MIN_PATCH_KEEP = 4
+
+
+class FrameCodecError(ValueError):
+    """Frame ist beschädigt oder passt nicht zum Basis-Text."""
+
+
+def negotiate_frame_version(offered: Iterable[str]) -> str:
+    """Höchste Version, die beide Seiten können; ohne Angebot bleibt es bei Version 1."""
+    peer = {str(version) for version in offered}
+    common = [version for version in SUPPORTED_FRAME_VERSIONS if version in peer]
+    return max(common, key=int) if common else FRAME_VERSION_TEXT
+
+
+def encode_snapshot(text: str) -> bytes:
+    return _finish(text.encode())
+
+
+def decode_snapshot(payload: bytes) -> str:
+    try:
+        return _open(payload).decode()
+    except UnicodeDecodeError as exc:
+        raise FrameCodecError("snapshot_not_utf8") from exc
+
+
+def encode_delta(base_text: str, new_text: str) -> bytes:
+    base = base_text.split("\n")
+    new = new_text.split("\n")
+    body = bytearray()
+    _put_varint(body, len(new))
+    index = 0
+    while index < len(new):
+        run = 0
+        while index + run < len(new) and index + run < len(base) and base[index + run] == new[index + run]:
+            run += 1
+        if run:
+            body.append(_OP_COPY)
+            _put_varint(body, run)
+            index += run
+            continue
+        line = new[index]
+        old = base[index] if index < len(base) else ""
+        prefix, suffix = _common_affixes(old, line)
+        if index < len(base) and prefix + suffix >= _MIN_PATCH_KEEP:
+            body.append(_OP_PATCH)
+            _put_varint(body, prefix)
+            _put_varint(body, suffix)
+            _put_text(body, line[prefix : len(line) - suffix])
+        else:
+            body.append(_OP_LINE)
+            _put_text(body, line)
+        index += 1
+    return _finish(bytes(body))
+
+
+def apply_delta(base_text: str, payload: bytes) -> str:
+    base = base_text.split("\n")
+    data = _open(payload)
+    count, pos = _get_varint(data, 0)
+    lines: list[str] = []
+    while len(lines) < count:
+        if pos >= len(data):
+            raise FrameCodecError("delta_truncated")
+        op = data[pos]
+        pos += 1
+        if op == _OP_COPY:
+            run, pos = _get_varint(data, pos)
+            start = len(lines)
+            if run == 0 or start + run > len(base) or start + run > count:
+                raise FrameCodecError("delta_copy_out_of_range")
+            lines.extend(base[start : start + run])
+        elif op == _OP_LINE:
+            text, pos = _get_text(data, pos)
+            lines.append(text)
+        elif op == _OP_PATCH:
+            prefix, pos = _get_varint(data, pos)
+            suffix, pos = _get_varint(data, pos)
+            middle, pos = _get_text(data, pos)
+            if len(lines) >= len(base):
+                raise FrameCodecError("delta_patch_out_of_range")
+            old = base[len(lines)]
+            if prefix + suffix > len(old):
+                raise FrameCodecError("delta_patch_out_of_range")
+            lines.append(old[:prefix] + middle + old[len(old) - suffix :])
+        else:
+            raise FrameCodecError("delta_unknown_op")
+    if pos != len(data):
+        raise FrameCodecError("delta_trailing_bytes")
+    return "\n".join(lines)
+
+
+def _common_affixes(old: str, new: str) -> tuple[int, int]:
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _finish(body: bytes) -> bytes:
+    if len(body) >= _MIN_DEFLATE_BYTES:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        packed = compressor.compress(body) + compressor.flush()
+        if len(packed) < len(body):
+            return bytes([_FLAG_DEFLATE]) + packed
+    return b"\x00" + body
+
+
+def _open(payload: bytes) -> bytes:
+    if not payload:
+        raise FrameCodecError("frame_empty")
+    flags, body = payload[0], payload[1:]
+    if flags & ~_FLAG_DEFLATE:
+        raise FrameCodecError("frame_flags_unknown")
+    if not flags & _FLAG_DEFLATE:
+        return body
+    decompressor = zlib.decompressobj(-15)
+    try:
+        data = decompressor.decompress(body, _MAX_DECODED_BYTES)
+    except zlib.error as exc:
+        raise FrameCodecError("frame_deflate_invalid") from exc
+    if decompressor.unconsumed_tail or decompressor.unused_data or not decompressor.eof:
+        raise FrameCodecError("frame_deflate_too_large")
+    return data
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data) or shift > 35:
+            raise FrameCodecError("varint_invalid")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _put_text(out: bytearray, text: str) -> None:
+    raw = text.encode()
+    _put_varint(out, len(raw))
+    out += raw
+
+
+def _get_text(data: bytes, pos: int) -> tuple[str, int]:
+    size, pos = _get_varint(data, pos)
+    end = pos + size
+    if end > len(data):
+        raise FrameCodecError("delta_truncated")
+    try:
+        return data[pos:end].decode(), end
+    except UnicodeDecodeError as exc:
+        raise FrameCodecError("delta_not_utf8") from exc
@@ -4,6 +4,7 @@
 - Empfänger rekonstruiert Snapshot + Deltas lokal
 - Hash-Mismatch löst Resync per Full Snapshot aus
 - Stream läuft nicht im Render-Hotpath
+- Frame-Version 2 (SS05.02) überträgt Deltas binär und komprimiert, siehe share_view_codec
 """
 from __future__ import annotations
 
@@ -27,6 +28,16 @@ from client_surfaces.operator_tui.share_crypto import (
     DecryptionFailedError,
     SessionKeyPair,
 )
+from client_surfaces.operator_tui.share_view_codec import (
+    FRAME_VERSION_BINARY,
+    FRAME_VERSION_TEXT,
+    SUPPORTED_FRAME_VERSIONS,
+    FrameCodecError,
+    apply_delta,
+    decode_snapshot,
+    encode_delta,
+    encode_snapshot,
+)
 
 
 _SNAPSHOT_INTERVAL = 5.0   # Sekunden zwischen initialen Snapshots
@@ -45,10 +56,11 @@ class ViewFrame:
     new_hash: str
     text: str  # Klartext (wird vor dem Versand verschlüsselt)
     sent_at: float = field(default_factory=time.time)
+    version: str = FRAME_VERSION_TEXT
 
     def to_wire_dict(self, encrypted_payload: dict[str, Any]) -> dict[str, Any]:
         return {
-            "version": "1",
+            "version": self.version,
             "session_id": self.session_id,
             "message_id": self.message_id,
             "kind": self.kind,
@@ -74,12 +86,17 @@ class ViewStreamSender:
         shared_key: bytes,
         policy: ViewSharePolicy | None = None,
         on_frame: Callable[[dict[str, Any]], None] | None = None,
+        frame_version: str = FRAME_VERSION_TEXT,
     ) -> None:
+        if frame_version not in SUPPORTED_FRAME_VERSIONS:
+            raise ValueError(f"unsupported view frame version: {frame_version}")
         self._session_id = session_id
         self._shared_key = shared_key
         self._policy = policy or build_default_policy()
         self._on_frame = on_frame
+        self._frame_version = frame_version
         self._last_snapshot_hash = ""
+        self._last_text = ""
         self._last_snapshot_time = 0.0
         self._last_delta_time = 0.0
         self._lock = threading.Lock()
@@ -121,25 +138,34 @@ class ViewStreamSender:
             base_hash=self._last_snapshot_hash,
             new_hash=new_hash,
             text=redacted,
+            version=self._frame_version,
         )
-        self._last_snapshot_hash = new_hash
-        if not is_delta:
-            self._last_snapshot_time = t
-        payload_bytes = redacted.encode()
+        if self._frame_version == FRAME_VERSION_BINARY:
+            payload_bytes = encode_delta(self._last_text, redacted) if is_delta else encode_snapshot(redacted)
+        else:
+            payload_bytes = redacted.encode()
         if len(payload_bytes) > _MAX_PAYLOAD_BYTES:
-            return  # zu groß
+            return  # zu groß — Basis bleibt der zuletzt gesendete Stand
         try:
             encrypted = encrypt_view(payload_bytes, self._shared_key, frame.message_id)
             wire = frame.to_wire_dict(encrypted.to_dict())
             if self._on_frame:
                 self._on_frame(wire)
         except Exception:
-            pass
+            return
+        # Erst nach dem Versand fortschreiben: ein verworfener Frame darf die
+        # Delta-Basis nicht verschieben, sonst erzwingt der nächste Delta einen Resync.
+        self._last_snapshot_hash = new_hash
+        self._last_text = redacted
+        if not is_delta:
+            self._last_snapshot_time = t
 
 
 class ViewStreamReceiver:
     """Empfänger-Seite: rekonstruiert Snapshots aus Frames."""
 
+    supported_versions = SUPPORTED_FRAME_VERSIONS
+
     def __init__(self, shared_key: bytes) -> None:
         self._shared_key = shared_key
         self._current_text = ""
@@ -168,17 +194,20 @@ class ViewStreamReceiver:
         enc_dict = wire.get("encrypted_payload")
         if not enc_dict:
             return False
+        version = str(wire.get("version") or FRAME_VERSION_TEXT)
+        if version not in SUPPORTED_FRAME_VERSIONS:
+            return False
         from client_surfaces.operator_tui.share_crypto import EncryptedPayload
         try:
             payload = EncryptedPayload.from_dict(enc_dict)
-            text_bytes = decrypt_view(payload, self._shared_key)
-            new_text = text_bytes.decode()
+            payload_bytes = decrypt_view(payload, self._shared_key)
+            if version == FRAME_VERSION_TEXT:
+                new_text = payload_bytes.decode()
         except DecryptionFailedError:
             return False
         except Exception:
             return False
 
-        new_hash = _text_hash(new_text)
         base_hash = str(wire.get("base_hash") or "")
         kind = str(wire.get("kind") or "snapshot")
 
@@ -186,6 +215,19 @@ class ViewStreamReceiver:
             if kind == "delta" and base_hash and base_hash != self._current_hash:
                 self._stale = True
                 return False  # Hash-Mismatch → Resync nötig
+            if version == FRAME_VERSION_BINARY:
+                try:
+                    if kind == "delta":
+                        new_text = apply_delta(self._current_text, payload_bytes)
+                    else:
+                        new_text = decode_snapshot(payload_bytes)
+                except FrameCodecError:
+                    self._stale = True
+                    return False
+            new_hash = _text_hash(new_text)
+            if version == FRAME_VERSION_BINARY and new_hash != str(wire.get("new_hash") or ""):
+                self._stale = True
+                return False  # rekonstruierter Stand weicht ab → Resync
             self._current_text = new_text
             self._current_hash = new_hash
             self._stale = False
@@ -5,14 +5,56 @@ Ermöglicht deterministische Hashing und semantische Analyse des TUI-Screens.
 from __future__ import annotations
 
 import hashlib
-import json
 import re
 import time
+import zlib
+from array import array
 from dataclasses import dataclass, field
 from typing import Any
 
 _ANSI_STRIP = re.compile(r'\x1b(?:[@-Z\\-_]|\[[0-9;]*[ -/]*[@-~])')
 
+# Gepackter Stil pro Zelle: fg (Bits 0–23), bg (24–47), bold, inverse, fg/bg gesetzt.
+_STYLE_BOLD = 1 << 48
+_STYLE_INVERSE = 1 << 49
+_STYLE_HAS_FG = 1 << 50
+_STYLE_HAS_BG = 1 << 51
+
+PackedRow = tuple[array, array]
+
+
+def _rgb(color: tuple[int, int, int]) -> int:
+    r, g, b = color
+    return (int(r) & 0xFF) << 16 | (int(g) & 0xFF) << 8 | (int(b) & 0xFF)
+
+
+def _cell_code(char: str) -> int:
+    """Codepoint der Zelle; Mehrzeichen-Cluster (Combining) bekommen einen CRC außerhalb von Unicode."""
+    return ord(char) if len(char) == 1 else (1 << 32) | zlib.crc32(char.encode())
+
+
+def _cell_style(cell: "Cell") -> int:
+    style = 0
+    if cell.fg:
+        style |= _STYLE_HAS_FG | _rgb(cell.fg)
+    if cell.bg:
+        style |= _STYLE_HAS_BG | _rgb(cell.bg) << 24
+    if cell.bold:
+        style |= _STYLE_BOLD
+    if cell.inverse:
+        style |= _STYLE_INVERSE
+    return style
+
+
+def pack_row(row: list["Cell"]) -> PackedRow:
+    """Zeile als ``(codepoints, styles)``-Arrays; Vergleich per memcmp statt Zelle für Zelle."""
+    return array("Q", [_cell_code(c.char) for c in row]), array("Q", [_cell_style(c) for c in row])
+
+
+def row_digest(packed: PackedRow) -> str:
+    codes, styles = packed
+    return hashlib.blake2b(codes.tobytes() + styles.tobytes(), digest_size=8).hexdigest()
+
 
 @dataclass
 class Cell:
@@ -44,17 +86,33 @@ class CellGrid:
     cells: list[list[Cell]]  # cells[y][x]
     timestamp: float = field(default_factory=time.monotonic)
     screen_hash: str = ""
+    # Kompakte Form und Zeilen-Digests werden einmal pro Grid gebaut und über
+    # Delta-Ticks hinweg wiederverwendet (ein Grid ist erst curr, dann prev).
+    # Wie screen_hash gelten sie für die Zellen zum Konstruktionszeitpunkt.
+    _packed: list[PackedRow] | None = field(default=None, init=False, repr=False, compare=False)
+    _digests: list[str] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.screen_hash:
             self.screen_hash = self._compute_hash()
 
     def _compute_hash(self) -> str:
-        canonical = json.dumps(
-            [[c.to_dict() for c in row] for row in self.cells],
-            sort_keys=True, separators=(",", ":"),
-        )
-        return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+        digest = hashlib.sha256(f"{self.width}x{self.height}".encode())
+        for codes, styles in self.packed_rows():
+            digest.update(len(codes).to_bytes(4, "little"))
+            digest.update(codes.tobytes())
+            digest.update(styles.tobytes())
+        return digest.hexdigest()[:32]
+
+    def packed_rows(self) -> list[PackedRow]:
+        if self._packed is None:
+            self._packed = [pack_row(row) for row in self.cells]
+        return self._packed
+
+    def row_digests(self) -> list[str]:
+        if self._digests is None:
+            self._digests = [row_digest(packed) for packed in self.packed_rows()]
+        return self._digests
 
     def get_cell(self, x: int, y: int) -> Cell | None:
         if 0 <= y < self.height and 0 <= x < self.width:
@@ -1,12 +1,13 @@
 """TUI Snapshot Delta — effiziente Delta-Kodierung zwischen CellGrid-Snapshots."""
 from __future__ import annotations
 
-import hashlib
-import json
+from array import array
 from dataclasses import dataclass, field
 from typing import Any
 
-from client_surfaces.operator_tui.snapshot import Cell, CellGrid
+from client_surfaces.operator_tui.snapshot import Cell, CellGrid, pack_row, row_digest
+
+_EMPTY_ROW = array("Q")
 
 
 @dataclass
@@ -43,16 +44,7 @@ class TuiDelta:
 
 
 def _line_hash(row: list[Cell]) -> str:
-    s = "".join(c.char for c in row)
-    return hashlib.md5(s.encode()).hexdigest()[:16]
-
-
-def _block_hash(grid: CellGrid, bx: int, by: int, bw: int, bh: int) -> str:
-    chars = []
-    for y in range(by, min(by + bh, grid.height)):
-        for x in range(bx, min(bx + bw, grid.width)):
-            chars.append(grid.cells[y][x].char)
-    return hashlib.md5("".join(chars).encode()).hexdigest()[:16]
+    return row_digest(pack_row(row))
 
 
 class DeltaEncoder:
@@ -66,28 +58,26 @@ class DeltaEncoder:
         if prev.screen_hash == curr.screen_hash:
             return delta
 
-        # Line-hashing für schnellen Vergleich
-        prev_lh = [_line_hash(prev.cells[y]) for y in range(prev.height)] if prev.cells else []
-        curr_lh = [_line_hash(curr.cells[y]) for y in range(curr.height)] if curr.cells else []
-        delta.line_hashes = curr_lh
-
-        changed_rows = set()
-        for y in range(curr.height):
-            ph = prev_lh[y] if y < len(prev_lh) else ""
-            ch = curr_lh[y] if y < len(curr_lh) else ""
-            if ph != ch:
-                changed_rows.add(y)
+        # Zeilenvergleich über die gepackten Arrays (memcmp); Digests sind pro
+        # Grid gecacht, ein Grid wird also nur einmal gepackt und gehasht.
+        prev_rows = prev.packed_rows()
+        curr_rows = curr.packed_rows()
+        delta.line_hashes = list(curr.row_digests())
 
+        changed_rows = {
+            y for y in range(curr.height) if y >= len(prev_rows) or prev_rows[y] != curr_rows[y]
+        }
         delta.changed_lines = sorted(changed_rows)
 
-        # Zellenweise Vergleich nur in geänderten Zeilen
-        for y in changed_rows:
-            pw = prev.width if prev.cells else 0
+        # Zellenweise Vergleich nur in geänderten Zeilen (Zeichen und Stil)
+        for y in delta.changed_lines:
+            prev_codes, prev_styles = prev_rows[y] if y < len(prev_rows) else (_EMPTY_ROW, _EMPTY_ROW)
+            curr_codes, curr_styles = curr_rows[y]
+            known = min(len(prev_codes), curr.width)
+            row = curr.cells[y]
             for x in range(curr.width):
-                prev_cell = prev.cells[y][x] if y < prev.height and x < pw else None
-                curr_cell = curr.cells[y][x]
-                if prev_cell is None or prev_cell.char != curr_cell.char:
-                    delta.changed_cells.append(curr_cell.to_dict())
+                if x >= known or prev_codes[x] != curr_codes[x] or prev_styles[x] != curr_styles[x]:
+                    delta.changed_cells.append(row[x].to_dict())
 
         # Dirty regions aus benachbarten geänderten Zeilen
         delta.dirty_regions = _compute_dirty_regions(changed_rows, curr.width)
@@ -0,0 +1,101 @@
+"""Add the append-only task_events log and backfill it from task histories.
+
+Revision ID: b7c8d9e0f1a2
+Revises: e5a7b9d1f3c6
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+revision: str = "b7c8d9e0f1a2"
+down_revision: str | Sequence[str] | None = "e5a7b9d1f3c6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_BACKFILL_BATCH = 500
+
+
+def _event_row(task_id: str, seq: int, event) -> dict:
+    # Same mapping as agent.repositories.tasks._log_task_history.
+    payload = event if isinstance(event, dict) else {"value": event}
+    try:
+        timestamp = float(payload.get("timestamp") or time.time())
+    except (TypeError, ValueError):
+        timestamp = time.time()
+    return {
+        "task_id": task_id,
+        "seq": seq,
+        "event_type": str(payload.get("event_type") or payload.get("type") or "") or None,
+        "timestamp": timestamp,
+        "payload": payload,
+    }
+
+
+def _backfill(table_name: str, task_events: sa.Table) -> None:
+    """Copy full row histories before the save path starts trimming them."""
+    bind = op.get_bind()
+    source = sa.table(table_name, sa.column("id", sa.String()), sa.column("history", sa.JSON()))
+    logged = set(bind.execute(sa.select(task_events.c.task_id).distinct()).scalars())
+    last_id = ""
+    while True:
+        rows = bind.execute(
+            sa.select(source.c.id, source.c.history)
+            .where(source.c.id > last_id)
+            .order_by(source.c.id)
+            .limit(_BACKFILL_BATCH)
+        ).all()
+        if not rows:
+            return
+        events = []
+        for task_id, history in rows:
+            if isinstance(history, str):
+                try:
+                    history = json.loads(history)
+                except ValueError:
+                    history = []
+            if task_id in logged or not isinstance(history, list):
+                continue
+            logged.add(task_id)
+            events.extend(_event_row(task_id, seq, event) for seq, event in enumerate(history, start=1))
+        if events:
+            bind.execute(task_events.insert(), events)
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    existing = set(inspect(op.get_bind()).get_table_names())
+    if "task_events" not in existing:
+        op.create_table(
+            "task_events",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("task_id", sa.String(length=191), nullable=False),
+            sa.Column("seq", sa.Integer(), nullable=False),
+            sa.Column("event_type", sa.String(), nullable=True),
+            sa.Column("timestamp", sa.Float(), nullable=False),
+            sa.Column("payload", sa.JSON(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("task_id", "seq", name="uq_task_events_task_seq"),
+        )
+    task_events = sa.table(
+        "task_events",
+        sa.column("task_id", sa.String()),
+        sa.column("seq", sa.Integer()),
+        sa.column("event_type", sa.String()),
+        sa.column("timestamp", sa.Float()),
+        sa.column("payload", sa.JSON()),
+    )
+    for table_name in ("tasks", "archived_tasks"):
+        if table_name in existing:
+            _backfill(table_name, task_events)
+
+
+def downgrade() -> None:
+    op.drop_table("task_events")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Wikitext cleaner benchmark: current cleaner vs. the former uncompiled re.sub chain.
+
+Run against a real dump sample, e.g.
+``scripts/benchmark/wiki_markup_cleaner.py --dump dewiki-latest-pages-articles-multistream.xml.bz2
+--index dewiki-latest-pages-articles-multistream-index.txt.bz2 --pages 5000``.
+Without ``--dump`` a small synthetic article set is used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent.services.wiki_markup_cleaner import clean_wiki_markup  # noqa: E402
+from agent.services.wiki_mediawiki_xml_parser import MediaWikiXmlDumpParser  # noqa: E402
+
+
+def legacy_clean_wiki_markup(raw_text: str) -> str:
+    """The cleaner as it was before precompiled passes and nested templates (baseline)."""
+    text = str(raw_text or "")
+    if not text:
+        return ""
+    text = re.sub(r"\{\{[^{}]{0,4000}\}\}", " ", text)
+    text = re.sub(r"\[\[Kategorie:[^\]]+\]\]", " ", text, flags=re.IGNORECASE)
+    text = re.sub(r"\[\[Datei:[^\]]+\]\]", " ", text, flags=re.IGNORECASE)
+    text = re.sub(r"\[\[([^|\]]+)\|([^\]]+)\]\]", r"\2", text)
+    text = re.sub(r"\[\[([^\]]+)\]\]", r"\1", text)
+    text = re.sub(r"\[https?://[^\s\]]+\s+([^\]]+)\]", r"\1", text)
+    text = re.sub(r"<ref[^>/]*>.*?</ref>", " ", text, flags=re.IGNORECASE | re.DOTALL)
+    text = re.sub(r"<ref[^>]*/>", " ", text, flags=re.IGNORECASE)
+    text = re.sub(r"<[^>]+>", " ", text)
+    text = re.sub(r"==+\s*([^=\n]+?)\s*==+", r" \1 ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
+def synthetic_pages(count: int) -> list[str]:
+    article = (
+        "{{Infobox Ort|Name=Beispielstadt|Einwohner={{formatnum:12345}}|Karte={{Lageplan|lat=1|lon=2}}}}\n"
+        "'''Beispielstadt''' ist eine [[Stadt]] in [[Deutschland|DE]].<ref name=\"a\">{{Literatur|Titel=X}}</ref>\n"
+        "== Geschichte ==\n"
+        "[[Datei:Wappen.svg|mini|Das [[Wappen]] der Stadt]] Die Stadt wurde 1200 gegründet.<ref>Chronik</ref>\n"
+        "Mehr unter [https://example.org Beispiel].<!-- Kommentar --><br/>\n"
+        "[[Kategorie:Ort]]\n"
+    )
+    return [article * (1 + index % 8) for index in range(count)]
+
+
+def dump_pages(dump: Path, index: Path | None, limit: int) -> list[str]:
+    parser = MediaWikiXmlDumpParser()
+    pages = (item for item in parser.iter_items(corpus_path=dump, index_path=index) if item.get("text"))
+    return [str(item["text"]) for item in islice(pages, limit)]
+
+
+def _time(cleaner, pages: list[str], repeat: int) -> tuple[float, list[str]]:
+    timings: list[float] = []
+    output: list[str] = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        output = [cleaner(page) for page in pages]
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), output
+
+
+def run_benchmark(pages: list[str], *, repeat: int = 3, source: str = "synthetic") -> dict[str, object]:
+    legacy_seconds, legacy_out = _time(legacy_clean_wiki_markup, pages, repeat)
+    current_seconds, current_out = _time(clean_wiki_markup, pages, repeat)
+    input_chars = sum(len(page) for page in pages)
+    return {
+        "schema": "wiki_markup_cleaner_benchmark_result.v1",
+        "source": source,
+        "pages": len(pages),
+        "input_chars": input_chars,
+        "legacy": {
+            "seconds": round(legacy_seconds, 6),
+            "pages_per_second": round(len(pages) / max(legacy_seconds, 1e-9), 1),
+            "output_chars": sum(len(text) for text in legacy_out),
+            "residual_template_markers": sum(text.count("{{") + text.count("}}") for text in legacy_out),
+        },
+        "current": {
+            "seconds": round(current_seconds, 6),
+            "pages_per_second": round(len(pages) / max(current_seconds, 1e-9), 1),
+            "output_chars": sum(len(text) for text in current_out),
+            "residual_template_markers": sum(text.count("{{") + text.count("}}") for text in current_out),
+        },
+        "speedup": round(legacy_seconds / max(current_seconds, 1e-9), 3),
+        "identical_pages": sum(1 for left, right in zip(legacy_out, current_out) if left == right),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dump", type=Path, help="MediaWiki XML dump (.xml, .xml.bz2, multistream)")
+    parser.add_argument("--index", type=Path, help="multistream index for --dump")
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+    if args.dump:
+        pages = dump_pages(args.dump, args.index, args.pages)
+        source = args.dump.name
+    else:
+        pages = synthetic_pages(args.pages)
+        source = "synthetic"
+    report = run_benchmark(pages, repeat=args.repeat, source=source)
+    rendered = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered, encoding="utf-8")
+    print(rendered, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,12 @@
 """SimulationModelAdapter interface (SIM-015)."""
 from __future__ import annotations
 
+import socket
+import threading
+import urllib.request
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 from simulation.models.action import ActionProposal
 
@@ -28,8 +31,16 @@ class SimulationModelAdapter(ABC):
 
     Implementations must be stateless between calls; all context arrives
     in `messages`. No LLM calls happen at import time.
+
+    `max_concurrency` caps parallel `generate` calls issued by a concurrent
+    TickRunner (None = runner default); the runner applies it per
+    provider/model, shared by every agent using that model. Callers may pass
+    a `cancel_event` (threading.Event or CancelEvent) kwarg; HTTP adapters
+    use `urlopen_cancellable` so setting it aborts the in-flight request.
     """
 
+    max_concurrency: int | None = None
+
     @abstractmethod
     def generate(self, messages: list[dict[str, str]],
                   agent_id: str, **kwargs: Any) -> AdapterResponse:
@@ -44,3 +55,93 @@ class SimulationModelAdapter(ABC):
     @abstractmethod
     def model_id(self) -> str:
         """Fully qualified model identifier."""
+
+
+class CancelEvent(threading.Event):
+    """threading.Event that also runs abort callbacks when it is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._callbacks: list[Callable[[], None]] = []
+        self._callbacks_lock = threading.Lock()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` on set(); immediately if the event is already set."""
+        with self._callbacks_lock:
+            if not self.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def set(self) -> None:
+        with self._callbacks_lock:
+            super().set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+
+class CallCancelled(RuntimeError):
+    """The cancel_event was set before or during an adapter call."""
+
+
+def _cancellable_connection(http_class: type, cancel_event: CancelEvent) -> type:
+    class _Connection(http_class):  # type: ignore[misc, valid-type]
+        def connect(self) -> None:
+            super().connect()
+            cancel_event.add_callback(self._abort)
+
+        def _abort(self) -> None:
+            sock = self.sock
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    return _Connection
+
+
+class _CancellableHandlerMixin:
+    _cancel_event: CancelEvent
+
+    def do_open(self, http_class, req, **http_conn_args):  # type: ignore[no-untyped-def]
+        return super().do_open(  # type: ignore[misc]
+            _cancellable_connection(http_class, self._cancel_event), req, **http_conn_args)
+
+
+class _CancellableHTTPHandler(_CancellableHandlerMixin, urllib.request.HTTPHandler):
+    pass
+
+
+class _CancellableHTTPSHandler(_CancellableHandlerMixin, urllib.request.HTTPSHandler):
+    pass
+
+
+def urlopen_cancellable(req: urllib.request.Request, *, timeout: float,
+                         cancel_event: threading.Event | None = None) -> Any:
+    """urlopen that raises CallCancelled once ``cancel_event`` is set.
+
+    With a CancelEvent the request's socket is shut down when the event
+    fires, so a blocked call returns at once instead of after ``timeout``.
+    Proxy handling is the regular urllib opener chain.
+    """
+    if cancel_event is None:
+        return urllib.request.urlopen(req, timeout=timeout)
+    if cancel_event.is_set():
+        raise CallCancelled("cancelled before request")
+    if not isinstance(cancel_event, CancelEvent):
+        return urllib.request.urlopen(req, timeout=timeout)
+    http_handler = _CancellableHTTPHandler()
+    https_handler = _CancellableHTTPSHandler()
+    http_handler._cancel_event = https_handler._cancel_event = cancel_event
+    opener = urllib.request.build_opener(http_handler, https_handler)
+    try:
+        return opener.open(req, timeout=timeout)
+    except OSError as exc:
+        if cancel_event.is_set():
+            raise CallCancelled("cancelled during request") from exc
+        raise
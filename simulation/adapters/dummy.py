@@ -24,6 +24,9 @@ class DummyModelAdapter(SimulationModelAdapter):
         seed: Random seed for reproducibility.
     """
 
+    # Script cursor and RNG are per-instance state: keep calls ordered.
+    max_concurrency = 1
+
     def __init__(
         self,
         script: list[dict[str, Any]] | None = None,
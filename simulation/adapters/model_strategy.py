@@ -24,7 +24,7 @@ class ModelStrategyResolver:
     def __init__(self, scenario: ScenarioConfig,
                   adapter_factory: "AdapterFactory | None" = None) -> None:
         self._strategy = scenario.model_strategy
-        self._factory = adapter_factory or _DefaultAdapterFactory()
+        self._factory = adapter_factory or _DefaultAdapterFactory(seed=scenario.seed)
         self._cache: dict[str, SimulationModelAdapter] = {}
 
     def resolve(self, agent_id: str) -> SimulationModelAdapter:
@@ -54,27 +54,33 @@ class AdapterFactory:
 
 
 class _DefaultAdapterFactory(AdapterFactory):
-    """Builds adapters for known providers; falls back to Dummy."""
+    """Builds adapters for known providers; falls back to Dummy.
+
+    Dummy adapters are seeded from the scenario seed so seed sweeps differ.
+    """
+
+    def __init__(self, seed: int = 42) -> None:
+        self._seed = seed
 
     def build(self, entry: ModelStrategyEntry) -> SimulationModelAdapter:
         provider = entry.provider.lower()
 
         if provider == "dummy":
-            return DummyModelAdapter()
+            return DummyModelAdapter(seed=self._seed)
 
         if provider == "ollama":
             try:
                 from simulation.adapters.ollama import OllamaAdapter
                 return OllamaAdapter(model=entry.model)
             except ImportError:
-                return DummyModelAdapter()
+                return DummyModelAdapter(seed=self._seed)
 
         if provider == "openrouter":
             try:
                 from simulation.adapters.openrouter import OpenRouterAdapter
                 return OpenRouterAdapter(model=entry.model)
             except ImportError:
-                return DummyModelAdapter()
+                return DummyModelAdapter(seed=self._seed)
 
         # Unknown provider — safe fallback
-        return DummyModelAdapter()
+        return DummyModelAdapter(seed=self._seed)
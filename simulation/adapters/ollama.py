@@ -8,7 +8,7 @@ import json
 import time
 from typing import Any
 
-from simulation.adapters.base import AdapterResponse, SimulationModelAdapter
+from simulation.adapters.base import AdapterResponse, SimulationModelAdapter, urlopen_cancellable
 from simulation.models.action import ActionProposal
 
 
@@ -45,7 +45,8 @@ class OllamaAdapter(SimulationModelAdapter):
                 headers={"Content-Type": "application/json"},
             )
             t0 = time.monotonic()
-            with urllib.request.urlopen(req, timeout=self._timeout) as resp:
+            with urlopen_cancellable(req, timeout=self._timeout,
+                                      cancel_event=kwargs.get("cancel_event")) as resp:
                 body = json.loads(resp.read())
             latency_ms = (time.monotonic() - t0) * 1000
 
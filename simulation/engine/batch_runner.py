@@ -1,19 +1,26 @@
 """Batch Experiment Runner (SIM-031)."""
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import queue as queue_mod
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from typing import Any, Callable, Iterator
 
 from simulation.adapters.model_strategy import ModelStrategyResolver
-from simulation.engine.budget_guard import BudgetGuard
+from simulation.engine.budget_guard import BudgetGuard, BudgetViolation
 from simulation.engine.tick_runner import TickResult, TickRunner
-from simulation.metrics.core_metrics import MetricsCollector
+from simulation.metrics.core_metrics import MetricsCollector, TickSnapshot
 from simulation.metrics.report_generator import ReportGenerator
 from simulation.models.scenario import ScenarioConfig
 from simulation.models.world_state import AgentState, LocationState, LawState, WorldState
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class BatchRunResult:
@@ -23,6 +30,8 @@ class BatchRunResult:
     ticks_run: int
     elapsed_seconds: float
     error: str | None = None
+    seed: int = 0
+    attempts: int = 1
 
 
 def _build_world(scenario: ScenarioConfig) -> WorldState:
@@ -62,8 +71,76 @@ def _build_world(scenario: ScenarioConfig) -> WorldState:
     return state
 
 
+def expand_seed_sweep(scenarios: list[ScenarioConfig], seeds: list[int]) -> list[ScenarioConfig]:
+    """One scenario copy per (scenario, seed), scenario-major order."""
+    return [sc.model_copy(update={"seed": int(seed)}) for sc in scenarios for seed in seeds]
+
+
+# ── process-pool worker side ─────────────────────────────────────────────────
+
+_WORKER_QUEUE: Any = None
+
+
+def _init_batch_worker(tick_queue: Any) -> None:
+    global _WORKER_QUEUE
+    _WORKER_QUEUE = tick_queue
+
+
+def _run_in_worker(scenario: ScenarioConfig, run_id: str, generation: int,
+                    decision_concurrency: int) -> dict[str, Any]:
+    """Run one scenario in a pool worker, streaming per-tick metrics.
+
+    Each tick posts ``(run_id, generation, snapshot, TickResult)`` to the
+    shared queue; the parent aggregates metrics and builds the report.
+    """
+    state = _build_world(scenario)
+    runner = TickRunner(strategy_resolver=ModelStrategyResolver(scenario),
+                        max_concurrency=decision_concurrency)
+    budget = BudgetGuard(scenario.budget)
+    violation: BudgetViolation | None = None
+    ticks_run = 0
+    while True:
+        snapshot = MetricsCollector.snapshot_of(state)
+        result = runner.run_tick(state, budget)
+        ticks_run += 1
+        _WORKER_QUEUE.put((run_id, generation, snapshot.as_dict(), result))
+        if result.budget_violation:
+            violation = result.budget_violation
+            break
+    return {
+        "ticks_run": ticks_run,
+        "final_state_hash": state.state_hash(),
+        "final_tick": state.tick,
+        "budget_usage": budget.usage.as_dict(),
+        "budget_remaining": budget.remaining(),
+        "violation": violation,
+    }
+
+
+@dataclass
+class _PoolRun:
+    index: int
+    scenario: ScenarioConfig
+    run_id: str
+    attempt: int = 1
+    generation: int = 0   # bumped per submission; filters stale tick messages
+    started: float = field(default_factory=time.monotonic)
+    metrics: MetricsCollector = field(default_factory=MetricsCollector)
+    ticks_received: int = 0
+
+
 class BatchRunner:
-    """Runs multiple scenarios or multiple seeds of the same scenario."""
+    """Runs multiple scenarios or multiple seeds of the same scenario.
+
+    ``decision_concurrency`` is forwarded to each TickRunner as
+    ``max_concurrency`` (see TickRunner for the two-phase tick semantics).
+    """
+
+    # How long run_parallel waits for a finished run's tick messages.
+    TICK_DRAIN_TIMEOUT_SECONDS = 10.0
+
+    def __init__(self, decision_concurrency: int = 1) -> None:
+        self.decision_concurrency = decision_concurrency
 
     def run(
         self,
@@ -76,12 +153,140 @@ class BatchRunner:
             results.append(result)
         return results
 
+    def run_parallel(
+        self,
+        scenarios: list[ScenarioConfig],
+        seeds: list[int] | None = None,
+        max_workers: int | None = None,
+        max_retries: int = 1,
+        on_tick: Callable[[str, TickResult], None] | None = None,
+    ) -> list[BatchRunResult]:
+        """Fan scenarios (× seeds) out over a process pool.
+
+        Every worker builds its own world via ``_build_world``. Tick metrics
+        stream back while runs are in flight, so ``on_tick`` fires and
+        MetricsCollectors grow incrementally in the parent. A run that raises
+        (or whose worker dies) is retried up to ``max_retries`` times and is
+        then reported with ``error`` set; other runs are unaffected. Results
+        are returned in input order.
+        """
+        if seeds:
+            scenarios = expand_seed_sweep(scenarios, seeds)
+        if not scenarios:
+            return []
+        ctx = multiprocessing.get_context()
+        tick_queue = ctx.Queue()
+        workers = max(1, min(max_workers or ctx.cpu_count() or 1, len(scenarios)))
+        runs = [_PoolRun(index=i, scenario=sc, run_id=f"run-{uuid.uuid4().hex[:8]}")
+                for i, sc in enumerate(scenarios)]
+        by_run_id = {run.run_id: run for run in runs}
+        results: list[BatchRunResult | None] = [None] * len(runs)
+
+        def new_pool() -> ProcessPoolExecutor:
+            return ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                       initializer=_init_batch_worker, initargs=(tick_queue,))
+
+        def drain(block_for: _PoolRun | None = None, expected: int = 0) -> None:
+            # Queue delivery is asynchronous: a finished future may still have
+            # tick messages in flight, so block until its count is complete.
+            deadline = time.monotonic() + self.TICK_DRAIN_TIMEOUT_SECONDS
+            while True:
+                waiting = block_for is not None and block_for.ticks_received < expected
+                try:
+                    if waiting:
+                        message = tick_queue.get(timeout=0.5)
+                    else:
+                        message = tick_queue.get_nowait()
+                except queue_mod.Empty:
+                    if waiting and time.monotonic() < deadline:
+                        continue
+                    return
+                run_id, generation, snap, tick_result = message
+                run = by_run_id.get(run_id)
+                if run is None or generation != run.generation:
+                    continue  # late message from a failed attempt
+                run.metrics.add_snapshot(TickSnapshot(**snap))
+                run.ticks_received += 1
+                if on_tick:
+                    on_tick(run_id, tick_result)
+
+        pool = new_pool()
+        pending: dict[Future, _PoolRun] = {}
+
+        def submit(run: _PoolRun) -> None:
+            run.generation += 1
+            run.metrics = MetricsCollector()
+            run.ticks_received = 0
+            future = pool.submit(_run_in_worker, run.scenario, run.run_id, run.generation,
+                                 self.decision_concurrency)
+            pending[future] = run
+
+        try:
+            for run in runs:
+                submit(run)
+            while pending:
+                done, _ = wait(list(pending), timeout=0.1, return_when=FIRST_COMPLETED)
+                drain()
+                for future in done:
+                    run = pending.pop(future, None)
+                    if run is None:
+                        continue  # already resubmitted after a pool failure
+                    try:
+                        outcome = future.result()
+                    except Exception as exc:
+                        if isinstance(exc, BrokenProcessPool):
+                            # A dead worker breaks the whole pool; restart it and
+                            # resubmit innocent runs without charging an attempt.
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            pool = new_pool()
+                            for other_future, other in list(pending.items()):
+                                pending.pop(other_future)
+                                submit(other)
+                        if run.attempt <= max_retries:
+                            logger.warning("batch run %s failed (attempt %s), retrying: %s",
+                                           run.run_id, run.attempt, exc)
+                            run.attempt += 1
+                            submit(run)
+                            continue
+                        results[run.index] = BatchRunResult(
+                            run_id=run.run_id, scenario_name=run.scenario.name,
+                            report={"error": str(exc)}, ticks_run=run.ticks_received,
+                            elapsed_seconds=time.monotonic() - run.started,
+                            error=str(exc), seed=run.scenario.seed, attempts=run.attempt)
+                        continue
+                    ticks_run = int(outcome["ticks_run"])
+                    drain(block_for=run, expected=ticks_run)
+                    error = None
+                    if run.ticks_received != ticks_run:
+                        error = f"tick_metrics_incomplete:{run.ticks_received}/{ticks_run}"
+                        logger.warning("batch run %s: received %s of %s tick snapshots; metrics are incomplete",
+                                       run.run_id, run.ticks_received, ticks_run)
+                    gen = ReportGenerator(run.run_id, run.scenario.name)
+                    report = gen.generate_from_parts(
+                        run.metrics,
+                        final_state_hash=outcome["final_state_hash"],
+                        final_tick=outcome["final_tick"],
+                        budget_usage=outcome["budget_usage"],
+                        budget_remaining=outcome["budget_remaining"],
+                        budget_violation=outcome["violation"],
+                    )
+                    results[run.index] = BatchRunResult(
+                        run_id=run.run_id, scenario_name=run.scenario.name,
+                        report=report, ticks_run=ticks_run,
+                        elapsed_seconds=time.monotonic() - run.started,
+                        error=error, seed=run.scenario.seed, attempts=run.attempt)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            tick_queue.close()
+        return [r for r in results if r is not None]
+
     def _run_one(self, scenario: ScenarioConfig,
                   on_tick: Callable[[str, TickResult], None] | None) -> BatchRunResult:
         run_id = f"run-{uuid.uuid4().hex[:8]}"
         state = _build_world(scenario)
         resolver = ModelStrategyResolver(scenario)
-        runner = TickRunner(strategy_resolver=resolver)
+        runner = TickRunner(strategy_resolver=resolver,
+                            max_concurrency=self.decision_concurrency)
         budget = BudgetGuard(scenario.budget)
         metrics = MetricsCollector()
         t0 = time.monotonic()
@@ -103,10 +308,11 @@ class BatchRunner:
             return BatchRunResult(run_id=run_id, scenario_name=scenario.name,
                                    report=report, ticks_run=ticks_run,
                                    elapsed_seconds=time.monotonic() - t0,
-                                   error=str(exc))
+                                   error=str(exc), seed=scenario.seed)
 
         gen = ReportGenerator(run_id, scenario.name)
         report = gen.generate(metrics, state, budget, violation)
         return BatchRunResult(run_id=run_id, scenario_name=scenario.name,
                                report=report, ticks_run=ticks_run,
-                               elapsed_seconds=time.monotonic() - t0)
+                               elapsed_seconds=time.monotonic() - t0,
+                               seed=scenario.seed)
@@ -51,6 +51,24 @@ class BudgetGuard:
 
         return self._check(state)
 
+    def check_in_flight(self, tokens_used: int = 0,
+                         cost_usd: float = 0.0) -> BudgetViolation | None:
+        """Check limits against usage of the tick still in progress.
+
+        Nothing is recorded; the tick is charged later via ``record_tick``.
+        Used to abort outstanding adapter calls once a limit is already
+        certain to be hit.
+        """
+        cfg = self.config
+        u = self.usage
+        if time.monotonic() - self._start_time >= cfg.max_wall_seconds:
+            return BudgetViolation("wall_seconds", f"wall time {cfg.max_wall_seconds}s exceeded")
+        if u.tokens + tokens_used >= cfg.max_tokens:
+            return BudgetViolation("tokens", f"token limit {cfg.max_tokens} reached")
+        if u.cost_usd + cost_usd >= cfg.max_cost_usd:
+            return BudgetViolation("cost_usd", f"cost limit ${cfg.max_cost_usd} exceeded")
+        return None
+
     def _check(self, state: WorldState) -> BudgetViolation | None:
         cfg = self.config
         u = self.usage
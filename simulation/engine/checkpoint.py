@@ -1,6 +1,16 @@
-"""Checkpointing/Resume (SIM-022)."""
+"""Checkpointing/Resume (SIM-022).
+
+Checkpoints are written as gzip-compressed compact JSON. Every
+``full_every``-th save is a full base snapshot; saves in between are deltas
+holding only the agents/locations/laws/institutions that changed since the
+previous save, the appended events and any replaced top-level sections.
+A JSONL sidecar (``index.jsonl``) records file, tick, hash and base per
+checkpoint so listing never re-reads snapshots. Plain ``*.json`` checkpoints
+from older runs still load and list.
+"""
 from __future__ import annotations
 
+import gzip
 import json
 import time
 from pathlib import Path
@@ -8,40 +18,225 @@ from typing import Any
 
 from simulation.models.world_state import WorldState
 
+_ENTITY_SECTIONS = ("agents", "locations", "laws", "institutions")
+_REPLACED_SECTIONS = ("relationships", "metadata", "scenario_name")
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    blob = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return gzip.compress(blob, compresslevel=6, mtime=0)
+
+
+def _decode(path: Path) -> dict[str, Any]:
+    raw = path.read_bytes()
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _world_delta(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    delta: dict[str, Any] = {"tick": current["tick"]}
+    for section in _ENTITY_SECTIONS:
+        before = previous.get(section) or {}
+        after = current.get(section) or {}
+        changed = {key: value for key, value in after.items() if before.get(key) != value}
+        removed = [key for key in before if key not in after]
+        if changed or removed:
+            delta[section] = {"changed": changed, "removed": removed}
+    for section in _REPLACED_SECTIONS:
+        if previous.get(section) != current.get(section):
+            delta[section] = current.get(section)
+    before_events = previous.get("events") or []
+    after_events = current.get("events") or []
+    if after_events[:len(before_events)] == before_events:
+        if len(after_events) > len(before_events):
+            delta["events_appended"] = after_events[len(before_events):]
+    else:
+        delta["events"] = after_events
+    return delta
+
+
+def _apply_delta(world: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    world["tick"] = delta["tick"]
+    for section in _ENTITY_SECTIONS:
+        change = delta.get(section)
+        if not change:
+            continue
+        entities = dict(world.get(section) or {})
+        for key in change.get("removed") or []:
+            entities.pop(key, None)
+        entities.update(change.get("changed") or {})
+        world[section] = entities
+    for section in _REPLACED_SECTIONS:
+        if section in delta:
+            world[section] = delta[section]
+    if "events" in delta:
+        world["events"] = list(delta["events"])
+    elif delta.get("events_appended"):
+        world["events"] = list(world.get("events") or []) + list(delta["events_appended"])
+    return world
+
 
 class CheckpointManager:
     """Saves/loads WorldState snapshots to disk."""
 
-    def __init__(self, run_dir: str | Path) -> None:
+    INDEX_NAME = "index.jsonl"
+    SUFFIX = ".ckpt.gz"
+
+    def __init__(self, run_dir: str | Path, full_every: int = 20) -> None:
         self.run_dir = Path(run_dir)
         self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.full_every = max(1, int(full_every))
+        self._last_world: dict[str, Any] | None = None
+        self._last_file: str | None = None
+        self._base_file: str | None = None
+        self._since_base = 0
+        self._indexed: set[str] | None = None
+
+    @property
+    def _index_path(self) -> Path:
+        return self.run_dir / self.INDEX_NAME
 
     def save(self, state: WorldState, label: str | None = None) -> Path:
         label = label or f"tick_{state.tick:06d}"
-        path = self.run_dir / f"{label}.json"
-        payload = {
-            "saved_at": time.time(),
-            "state_hash": state.state_hash(),
-            "world": state.to_dict(),
-        }
-        path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+        path = self.run_dir / f"{label}{self.SUFFIX}"
+        world = state.to_dict()
+        state_hash = state.state_hash()
+        saved_at = time.time()
+        full = self._last_world is None or self._since_base + 1 >= self.full_every
+        if path.name in self._indexed_files():
+            # Overwriting a file other deltas may hang off: detach them first
+            # and write this one whole, so no chain can loop back onto itself.
+            self._detach_dependents(path.name)
+            full = True
+        if full:
+            payload = {"kind": "full", "saved_at": saved_at, "state_hash": state_hash, "world": world}
+            base = path.name
+        else:
+            payload = {
+                "kind": "delta",
+                "saved_at": saved_at,
+                "state_hash": state_hash,
+                "base": self._base_file,
+                "parent": self._last_file,
+                "delta": _world_delta(self._last_world or {}, world),
+            }
+            base = self._base_file
+        path.write_bytes(_encode(payload))
+        entry = {"file": path.name, "tick": state.tick, "hash": state_hash, "saved_at": saved_at,
+                 "kind": payload["kind"], "base": base, "parent": payload.get("parent")}
+        self._write_index_entry(entry)
+        self._last_world = world
+        self._last_file = path.name
+        if full:
+            self._base_file = path.name
+            self._since_base = 0
+        else:
+            self._since_base += 1
         return path
 
+    def _indexed_files(self) -> set[str]:
+        if self._indexed is None:
+            self._indexed = {e["file"] for e in self._read_index()}
+        return self._indexed
+
+    def _write_index(self, entries: list[dict[str, Any]]) -> None:
+        tmp = self._index_path.with_suffix(".jsonl.tmp")
+        tmp.write_text("".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries), encoding="utf-8")
+        tmp.replace(self._index_path)
+
+    def _write_index_entry(self, entry: dict[str, Any]) -> None:
+        """Append ``entry``; a re-saved label replaces its previous line instead."""
+        if entry["file"] not in self._indexed_files():
+            with self._index_path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._indexed_files().add(entry["file"])
+            return
+        self._write_index([e for e in self._read_index() if e["file"] != entry["file"]] + [entry])
+
+    def _detach_dependents(self, name: str) -> None:
+        """Rewrite every delta whose chain runs through ``name`` as a full snapshot."""
+        entries = self._read_index()
+        through = {name}
+        grew = True
+        while grew:
+            grew = False
+            for entry in entries:
+                if entry["file"] in through or entry.get("kind") != "delta":
+                    continue
+                if entry.get("parent") in through or entry.get("base") in through:
+                    through.add(entry["file"])
+                    grew = True
+        through.discard(name)
+        if not through:
+            return
+        # Replay every dependent before rewriting any of them; the chains share files.
+        worlds = {file: self.load(self.run_dir / file).to_dict() for file in through}
+        for entry in entries:
+            file = entry["file"]
+            if file not in worlds:
+                continue
+            payload = {"kind": "full", "saved_at": entry.get("saved_at"),
+                       "state_hash": entry.get("hash"), "world": worlds[file]}
+            (self.run_dir / file).write_bytes(_encode(payload))
+            entry.update(kind="full", base=file, parent=None)
+        self._write_index(entries)
+        if self._base_file in through or self._base_file == name:
+            self._base_file = self._last_file
+
     def load(self, path: str | Path) -> WorldState:
-        data = json.loads(Path(path).read_text(encoding="utf-8"))
-        return WorldState.from_dict(data["world"])
+        path = Path(path)
+        data = _decode(path)
+        if "world" in data:
+            return WorldState.from_dict(data["world"])
+        # Delta: walk parent links back to the base, then replay forward.
+        chain = [data]
+        current = data
+        while "world" not in current:
+            parent = current.get("parent") or current.get("base")
+            if not parent:
+                raise ValueError(f"checkpoint {path.name} has no base")
+            current = _decode(path.parent / parent)
+            chain.append(current)
+        world = dict(chain[-1]["world"])
+        for item in reversed(chain[:-1]):
+            world = _apply_delta(world, item["delta"])
+        return WorldState.from_dict(world)
+
+    def _read_index(self) -> list[dict[str, Any]]:
+        if not self._index_path.exists():
+            return []
+        entries: list[dict[str, Any]] = []
+        for line in self._index_path.read_text(encoding="utf-8").splitlines():
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+        return entries
 
     def latest(self) -> Path | None:
+        entries = [e for e in self._read_index() if (self.run_dir / e["file"]).exists()]
+        if entries:
+            return self.run_dir / max(entries, key=lambda e: (e.get("tick") or 0, e.get("saved_at") or 0))["file"]
         checkpoints = sorted(self.run_dir.glob("tick_*.json"))
         return checkpoints[-1] if checkpoints else None
 
     def list_checkpoints(self) -> list[dict[str, Any]]:
         result = []
+        indexed = set()
+        for entry in self._read_index():
+            indexed.add(entry["file"])
+            result.append({"file": entry["file"], "tick": entry.get("tick"),
+                            "hash": entry.get("hash"), "saved_at": entry.get("saved_at"),
+                            "kind": entry.get("kind"), "base": entry.get("base")})
         for p in sorted(self.run_dir.glob("*.json")):
+            if p.name in indexed:
+                continue
             try:
                 meta = json.loads(p.read_text(encoding="utf-8"))
                 result.append({"file": p.name, "tick": meta.get("world", {}).get("tick"),
-                                "hash": meta.get("state_hash"), "saved_at": meta.get("saved_at")})
+                                "hash": meta.get("state_hash"), "saved_at": meta.get("saved_at"),
+                                "kind": "full", "base": p.name})
             except Exception:
                 pass
-        return result
+        return sorted(result, key=lambda item: item["file"])
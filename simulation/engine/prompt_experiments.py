@@ -84,8 +84,17 @@ class PromptExperimentRunner:
         scenario_factory: Callable[[], Any],
         experiment: ExperimentConfig,
         tick_limit: int = 20,
+        max_workers: int = 1,
+        seeds: list[int] | None = None,
     ) -> dict[str, Any]:
-        from simulation.engine.batch_runner import BatchRunner
+        """Run baseline vs. intervention.
+
+        With ``max_workers > 1`` or a seed sweep, both conditions (× seeds)
+        run on a process pool via ``BatchRunner.run_parallel``; the first
+        run of each condition is reported as before and all runs are listed
+        under ``seed_runs``.
+        """
+        from simulation.engine.batch_runner import BatchRunner, expand_seed_sweep
         from simulation.models.scenario import BudgetConfig
 
         # Baseline run
@@ -93,18 +102,31 @@ class PromptExperimentRunner:
         baseline_patched = baseline_scenario.model_copy(
             update={"budget": BudgetConfig(max_ticks=tick_limit)}
         )
-        runner = BatchRunner()
-        baseline_results = runner.run([baseline_patched])
-
         # Intervention run (same scenario, different prompts applied separately)
         # For now, returns both result sets for comparison
         intervention_scenario = scenario_factory()
         intervention_patched = intervention_scenario.model_copy(
             update={"budget": BudgetConfig(max_ticks=tick_limit)}
         )
-        intervention_results = runner.run([intervention_patched])
-
-        return {
+        runner = BatchRunner()
+        seed_runs: dict[str, list[dict[str, Any]]] | None = None
+        if max_workers > 1 or seeds:
+            baseline_runs = expand_seed_sweep([baseline_patched], seeds) if seeds else [baseline_patched]
+            intervention_runs = (expand_seed_sweep([intervention_patched], seeds)
+                                 if seeds else [intervention_patched])
+            results = runner.run_parallel([*baseline_runs, *intervention_runs],
+                                          max_workers=max_workers)
+            baseline_results = results[:len(baseline_runs)]
+            intervention_results = results[len(baseline_runs):]
+            seed_runs = {
+                "baseline": [{"seed": r.seed, "report": r.report} for r in baseline_results],
+                "intervention": [{"seed": r.seed, "report": r.report} for r in intervention_results],
+            }
+        else:
+            baseline_results = runner.run([baseline_patched])
+            intervention_results = runner.run([intervention_patched])
+
+        comparison = {
             "experiment": experiment.name,
             "baseline": baseline_results[0].report,
             "intervention": intervention_results[0].report,
@@ -113,3 +135,6 @@ class PromptExperimentRunner:
                 for iv in experiment.interventions
             ],
         }
+        if seed_runs is not None:
+            comparison["seed_runs"] = seed_runs
+        return comparison
@@ -27,6 +27,7 @@ class ReplayTrace:
     def record(self, result: TickResult) -> None:
         self._ticks.append({
             "tick": result.tick,
+            "decision_mode": result.decision_mode,
             "decisions": {
                 aid: d.get("proposal", {}).get("action_type", "noop")
                 for aid, d in result.agent_decisions.items()
@@ -45,15 +46,28 @@ class ReplayTrace:
     def actions_for_agent(self, agent_id: str) -> list[str]:
         return [t["decisions"].get(agent_id, "noop") for t in self._ticks]
 
+    @property
+    def decision_mode(self) -> str:
+        """Mode the live run decided in; traces without it were sequential."""
+        modes = {t.get("decision_mode", "sequential") for t in self._ticks}
+        return "two_phase" if "two_phase" in modes else "sequential"
+
 
 class ReplayRunner:
-    """Runs a simulation replay from a checkpoint + trace."""
+    """Runs a simulation replay from a checkpoint + trace.
+
+    ``max_concurrency=None`` replays in the decision mode recorded in the
+    trace; any value > 1 gives the same two-phase results.
+    """
 
     def __init__(self, checkpoint: WorldState, trace: ReplayTrace,
-                  scenario: ScenarioConfig) -> None:
+                  scenario: ScenarioConfig, max_concurrency: int | None = None) -> None:
         self._initial_state = checkpoint.snapshot()
         self._trace = trace
         self._scenario = scenario
+        if max_concurrency is None:
+            max_concurrency = 2 if trace.decision_mode == "two_phase" else 1
+        self._max_concurrency = max_concurrency
 
     def run(self) -> Iterator[TickResult]:
         state = self._initial_state.snapshot()
@@ -79,7 +93,8 @@ class ReplayRunner:
             def resolve(self, agent_id: str):
                 return agent_adapters.get(agent_id, ScriptedAdapter(["noop"]))
 
-        runner = TickRunner(strategy_resolver=_PerAgentResolver())  # type: ignore[arg-type]
+        runner = TickRunner(strategy_resolver=_PerAgentResolver(),  # type: ignore[arg-type]
+                            max_concurrency=self._max_concurrency)
         budget = BudgetGuard(self._scenario.budget)
 
         while True:
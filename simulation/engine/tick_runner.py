@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
-from simulation.adapters.base import AdapterResponse, SimulationModelAdapter
+from simulation.adapters.base import AdapterResponse, CancelEvent, SimulationModelAdapter
 from simulation.adapters.model_strategy import ModelStrategyResolver
 from simulation.engine.budget_guard import BudgetGuard, BudgetViolation
 from simulation.engine.economy import ResourceRegenSystem
@@ -13,7 +15,7 @@ from simulation.engine.prompt_renderer import PromptRenderer, RenderedPrompt
 from simulation.engine.survival import SurvivalSystem
 from simulation.models.action import ActionProposal
 from simulation.models.memory import MemoryStore
-from simulation.models.world_state import SimEvent, WorldState
+from simulation.models.world_state import AgentState, SimEvent, WorldState
 from simulation.policies.governance import GovernanceSystem
 from simulation.policies.policy_engine import PolicyEngine
 
@@ -30,6 +32,16 @@ class TickResult:
     failures: int = 0
     budget_violation: BudgetViolation | None = None
     state_hash: str = ""
+    aborted_calls: int = 0
+    decision_mode: str = "sequential"   # or "two_phase"; recorded in replay traces
+
+
+@dataclass
+class _Decision:
+    agent: AgentState
+    adapter: SimulationModelAdapter
+    response: AdapterResponse | None = None
+    aborted: bool = False
 
 
 class TickRunner:
@@ -42,6 +54,21 @@ class TickRunner:
       4. SurvivalSystem.tick()
       5. MemoryStore.flush_all()
       6. state.advance_tick()
+
+    With ``max_concurrency > 1`` step 2 runs in two phases: every living
+    agent decides against the same pre-decision state (prompts rendered and
+    adapters called on a thread pool), then proposals are validated and
+    applied in stable agent order. Results do not depend on the pool size or
+    on call completion order, so ``state_hash`` and replays are identical for
+    any ``max_concurrency > 1``. They differ from ``max_concurrency=1``, where
+    each agent decides against the state left by the agents before it, and
+    they are not reproducible across a budget abort, since which calls were
+    cut off depends on timing. Concurrency limits apply per provider/model
+    (``adapter_concurrency`` keys may be a model id such as
+    ``"ollama/llama3"`` or a provider such as ``"ollama"``), shared by all
+    agents on that model. A limit of 1 calls the group sequentially in agent
+    order on a single lane so stateful adapters (e.g. seeded dummies) stay
+    reproducible.
     """
 
     def __init__(
@@ -55,6 +82,8 @@ class TickRunner:
         resource_regen: ResourceRegenSystem | None = None,
         profile_loader: Any = None,   # AgentProfileLoader — optional
         on_event: Callable[[SimEvent], None] | None = None,
+        max_concurrency: int = 1,
+        adapter_concurrency: dict[str, int] | None = None,
     ) -> None:
         self.strategy_resolver = strategy_resolver
         self.policy = policy_engine or PolicyEngine()
@@ -65,6 +94,9 @@ class TickRunner:
         self.regen = resource_regen or ResourceRegenSystem()
         self._profile_loader = profile_loader
         self._on_event = on_event
+        self.max_concurrency = max(1, int(max_concurrency))
+        # model id or provider → max parallel calls; overrides SimulationModelAdapter.max_concurrency
+        self.adapter_concurrency = dict(adapter_concurrency or {})
 
     def run_tick(self, state: WorldState, budget_guard: BudgetGuard) -> TickResult:
         result = TickResult(tick=state.tick)
@@ -73,42 +105,15 @@ class TickRunner:
         self.regen.tick(state)
 
         # 2. Agent decisions
-        for agent in state.living_agents():
-            profile = None
-            if self._profile_loader and agent.profile_id:
-                try:
-                    profile = self._profile_loader.load_dict({"id": agent.profile_id,
-                                                               "name": agent.name})
-                except Exception:
-                    pass
-
-            memory = self.memory_store.get(agent.id)
-            prompt = self.renderer.render(state, agent, profile, memory)
-            adapter = self.strategy_resolver.resolve(agent.id)
-
-            resp = self._call_adapter(adapter, prompt, agent.id)
-            result.tokens_used += resp.tokens_used
-            result.cost_usd += resp.cost_usd
-
-            if not resp.ok:
-                result.failures += 1
-                proposal = ActionProposal.invalid_fallback(agent.id, resp.raw_text)
-            else:
-                proposal = resp.proposal  # type: ignore[assignment]
-
-            validation = self.policy.validate(state, proposal)
-            self.policy.apply(state, proposal, validation)
-
-            result.agent_decisions[agent.id] = {
-                "proposal": proposal.model_dump(),
-                "decision": validation.decision,
-                "reason": validation.reason,
-            }
-
-            # Perceive own outcome
-            memory.perceive(state.tick, "outcome",
-                             f"I did {proposal.action_type}: {validation.decision}",
-                             importance=0.6)
+        if self.max_concurrency > 1:
+            result.decision_mode = "two_phase"
+            self._run_decisions_two_phase(state, budget_guard, result)
+        else:
+            for agent in state.living_agents():
+                prompt = self._render_prompt(state, agent)
+                adapter = self.strategy_resolver.resolve(agent.id)
+                resp = self._call_adapter(adapter, prompt, agent.id)
+                self._apply_response(state, agent, resp, result)
 
         # 3. Governance
         gov_events = self.governance.tick(state)
@@ -143,10 +148,125 @@ class TickRunner:
 
         return result
 
+    def _render_prompt(self, state: WorldState, agent: AgentState) -> RenderedPrompt:
+        profile = None
+        if self._profile_loader and agent.profile_id:
+            try:
+                profile = self._profile_loader.load_dict({"id": agent.profile_id,
+                                                           "name": agent.name})
+            except Exception:
+                pass
+        memory = self.memory_store.get(agent.id)
+        return self.renderer.render(state, agent, profile, memory)
+
+    def _apply_response(self, state: WorldState, agent: AgentState,
+                         resp: AdapterResponse, result: TickResult) -> None:
+        result.tokens_used += resp.tokens_used
+        result.cost_usd += resp.cost_usd
+
+        if not resp.ok:
+            result.failures += 1
+            proposal = ActionProposal.invalid_fallback(agent.id, resp.raw_text)
+        else:
+            proposal = resp.proposal  # type: ignore[assignment]
+
+        validation = self.policy.validate(state, proposal)
+        self.policy.apply(state, proposal, validation)
+
+        result.agent_decisions[agent.id] = {
+            "proposal": proposal.model_dump(),
+            "decision": validation.decision,
+            "reason": validation.reason,
+        }
+
+        # Perceive own outcome
+        self.memory_store.get(agent.id).perceive(
+            state.tick, "outcome",
+            f"I did {proposal.action_type}: {validation.decision}",
+            importance=0.6)
+
+    @staticmethod
+    def _limit_key(adapter: SimulationModelAdapter) -> tuple[str, str]:
+        # Per-agent adapter instances of one model share its provider limit.
+        return adapter.provider, adapter.model_id
+
+    def _adapter_limit(self, adapter: SimulationModelAdapter) -> int:
+        for key in (adapter.model_id, adapter.provider):
+            if key in self.adapter_concurrency:
+                return max(1, int(self.adapter_concurrency[key]))
+        declared = getattr(adapter, "max_concurrency", None)
+        return max(1, int(declared)) if declared else self.max_concurrency
+
+    def _run_decisions_two_phase(self, state: WorldState, budget_guard: BudgetGuard,
+                                  result: TickResult) -> None:
+        decisions = [
+            _Decision(agent=agent, adapter=self.strategy_resolver.resolve(agent.id))
+            for agent in state.living_agents()
+        ]
+        for decision in decisions:
+            self.memory_store.get(decision.agent.id)  # create stores before threads read them
+
+        # Phase 1: split each provider/model's agents into round-robin lanes; a
+        # lane calls its agents sequentially so the limit holds without extra
+        # locking, and a limit of 1 keeps stateful adapters in order.
+        by_model: dict[tuple[str, str], list[_Decision]] = {}
+        for decision in decisions:
+            by_model.setdefault(self._limit_key(decision.adapter), []).append(decision)
+        lanes: list[list[_Decision]] = []
+        for group in by_model.values():
+            lane_count = min(len(group), self._adapter_limit(group[0].adapter))
+            lanes.extend(group[i::lane_count] for i in range(lane_count))
+
+        cancel = CancelEvent()
+        usage_lock = threading.Lock()
+        in_flight = {"tokens": 0, "cost_usd": 0.0}
+
+        def run_lane(lane: list[_Decision]) -> None:
+            for decision in lane:
+                if cancel.is_set():
+                    decision.aborted = True
+                    continue
+                prompt = self._render_prompt(state, decision.agent)
+                resp = self._call_adapter(decision.adapter, prompt, decision.agent.id,
+                                          cancel_event=cancel)
+                if cancel.is_set() and not resp.ok:
+                    # Cut off by the abort rather than a genuine model failure.
+                    decision.aborted = True
+                    continue
+                decision.response = resp
+                with usage_lock:
+                    in_flight["tokens"] += resp.tokens_used
+                    in_flight["cost_usd"] += resp.cost_usd
+                    violation = budget_guard.check_in_flight(
+                        tokens_used=in_flight["tokens"], cost_usd=in_flight["cost_usd"])
+                if violation is not None and not cancel.is_set():
+                    logger.info("aborting outstanding agent calls at tick %s: %s",
+                                state.tick, violation.message)
+                    cancel.set()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, max(1, len(lanes))),
+                                thread_name_prefix="sim-decide") as pool:
+            for future in [pool.submit(run_lane, lane) for lane in lanes]:
+                future.result()
+
+        # Phase 2: deterministic validate/apply in stable agent order.
+        for decision in decisions:
+            if decision.aborted or decision.response is None:
+                result.aborted_calls += 1
+                resp = AdapterResponse(
+                    raw_text="",
+                    proposal=ActionProposal.invalid_fallback(decision.agent.id, "budget_aborted"),
+                    model_id=decision.adapter.model_id,
+                )
+                self._apply_response(state, decision.agent, resp, result)
+                continue
+            self._apply_response(state, decision.agent, decision.response, result)
+
     def _call_adapter(self, adapter: SimulationModelAdapter,
-                       prompt: RenderedPrompt, agent_id: str) -> AdapterResponse:
+                       prompt: RenderedPrompt, agent_id: str,
+                       **kwargs: Any) -> AdapterResponse:
         try:
-            return adapter.generate(prompt.as_messages(), agent_id=agent_id)
+            return adapter.generate(prompt.as_messages(), agent_id=agent_id, **kwargs)
         except Exception as exc:
             logger.warning("adapter error for %s: %s", agent_id, exc)
             from simulation.adapters.base import AdapterResponse
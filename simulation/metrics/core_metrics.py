@@ -33,13 +33,22 @@ class MetricsCollector:
         self._deaths_by_tick: dict[int, int] = {}
 
     def record_tick(self, state: WorldState) -> TickSnapshot:
+        return self.add_snapshot(self.snapshot_of(state))
+
+    def add_snapshot(self, snap: TickSnapshot) -> TickSnapshot:
+        """Append a snapshot taken elsewhere (e.g. streamed from a batch worker)."""
+        self._snapshots.append(snap)
+        return snap
+
+    @staticmethod
+    def snapshot_of(state: WorldState) -> TickSnapshot:
         living = state.living_agents()
         n = len(living) or 1
 
         crimes = sum(1 for e in state.events if e.kind == "crime" and e.tick == state.tick - 1)
         deaths = sum(1 for e in state.events if e.kind == "death" and e.tick == state.tick - 1)
 
-        snap = TickSnapshot(
+        return TickSnapshot(
             tick=state.tick,
             living_count=len(living),
             avg_health=sum(a.health for a in living) / n,
@@ -51,8 +60,6 @@ class MetricsCollector:
             total_deaths=deaths,
             state_hash=state.state_hash(),
         )
-        self._snapshots.append(snap)
-        return snap
 
     def summary(self) -> dict[str, Any]:
         if not self._snapshots:
@@ -28,6 +28,28 @@ class ReportGenerator:
         budget_violation: BudgetViolation | None,
         extra: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
+        return self.generate_from_parts(
+            metrics,
+            final_state_hash=final_state.state_hash(),
+            final_tick=final_state.tick,
+            budget_usage=budget_guard.usage.as_dict(),
+            budget_remaining=budget_guard.remaining(),
+            budget_violation=budget_violation,
+            extra=extra,
+        )
+
+    def generate_from_parts(
+        self,
+        metrics: MetricsCollector,
+        *,
+        final_state_hash: str,
+        final_tick: int,
+        budget_usage: dict[str, Any],
+        budget_remaining: dict[str, Any],
+        budget_violation: BudgetViolation | None,
+        extra: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Build the report without live engine objects (used by batch workers)."""
         summary = metrics.summary()
         failure = self._classifier.classify(metrics, budget_violation)
 
@@ -45,12 +67,12 @@ class ReportGenerator:
                 "violation": {"kind": budget_violation.kind,
                                "message": budget_violation.message}
                               if budget_violation else None,
-                "usage": budget_guard.usage.as_dict(),
-                "remaining": budget_guard.remaining(),
+                "usage": budget_usage,
+                "remaining": budget_remaining,
             },
             "metrics": summary,
-            "final_state_hash": final_state.state_hash(),
-            "final_tick": final_state.tick,
+            "final_state_hash": final_state_hash,
+            "final_tick": final_tick,
         }
         if extra:
             report["extra"] = extra
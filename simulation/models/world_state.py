@@ -8,8 +8,151 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
+class _TrackedDict(dict):
+    """dict that bumps its owning entity's version on every in-place change."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "_VersionedEntity", items: Any = ()) -> None:
+        super().__init__()
+        self._owner = owner
+        for key, value in dict(items).items():
+            dict.__setitem__(self, key, _track(value, owner))
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        dict.__setitem__(self, key, _track(value, self._owner))
+        self._owner._touch()
+
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        self._owner._touch()
+
+    def __ior__(self, other: Any) -> "_TrackedDict":
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, key, _track(value, self._owner))
+        self._owner._touch()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def pop(self, *args: Any) -> Any:
+        value = dict.pop(self, *args)
+        self._owner._touch()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = dict.popitem(self)
+        self._owner._touch()
+        return item
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._owner._touch()
+
+
+class _TrackedList(list):
+    """list that bumps its owning entity's version on every in-place change."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "_VersionedEntity", items: Any = ()) -> None:
+        super().__init__(_track(value, owner) for value in items)
+        self._owner = owner
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def _changed(self, result: Any = None) -> Any:
+        self._owner._touch()
+        return result
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = [_track(item, self._owner) for item in value]
+        else:
+            value = _track(value, self._owner)
+        self._changed(list.__setitem__(self, index, value))
+
+    def __delitem__(self, index: Any) -> None:
+        self._changed(list.__delitem__(self, index))
+
+    def __iadd__(self, other: Any) -> "_TrackedList":
+        self.extend(other)
+        return self
+
+    def __imul__(self, factor: int) -> "_TrackedList":
+        list.__imul__(self, factor)
+        return self._changed(self)
+
+    def append(self, value: Any) -> None:
+        self._changed(list.append(self, _track(value, self._owner)))
+
+    def extend(self, values: Any) -> None:
+        self._changed(list.extend(self, [_track(value, self._owner) for value in values]))
+
+    def insert(self, index: int, value: Any) -> None:
+        self._changed(list.insert(self, index, _track(value, self._owner)))
+
+    def pop(self, *args: Any) -> Any:
+        return self._changed(list.pop(self, *args))
+
+    def remove(self, value: Any) -> None:
+        self._changed(list.remove(self, value))
+
+    def clear(self) -> None:
+        self._changed(list.clear(self))
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._changed(list.sort(self, *args, **kwargs))
+
+    def reverse(self) -> None:
+        self._changed(list.reverse(self))
+
+
+def _track(value: Any, owner: "_VersionedEntity") -> Any:
+    if isinstance(value, (_TrackedDict, _TrackedList)):
+        if value._owner is owner:
+            return value
+        value = dict(value) if isinstance(value, dict) else list(value)
+    if type(value) is dict:
+        return _TrackedDict(owner, value)
+    if type(value) is list:
+        return _TrackedList(owner, value)
+    return value
+
+
+class _VersionedEntity:
+    """Dirty tracking for hashed entities: ``_version`` rises on every change,
+    including edits inside dict/list fields, so state_hash() re-serialises
+    only entities that actually changed."""
+
+    _version = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, _track(value, self))
+        self._touch()
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # copy/pickle hand back plain dict/list fields; re-wrap them so edits
+        # on the copy keep bumping its version.
+        for name, value in state.items():
+            object.__setattr__(self, name, _track(value, self))
+
+    def _touch(self) -> None:
+        self.__dict__["_version"] = self.__dict__.get("_version", 0) + 1
+
+
 @dataclass
-class AgentState:
+class AgentState(_VersionedEntity):
     id: str
     name: str
     role: str
@@ -48,7 +191,7 @@ class AgentState:
 
 
 @dataclass
-class LocationState:
+class LocationState(_VersionedEntity):
     id: str
     name: str
     resources: dict[str, float] = field(default_factory=dict)
@@ -78,7 +221,7 @@ class SimEvent:
 
 
 @dataclass
-class LawState:
+class LawState(_VersionedEntity):
     id: str
     description: str
     forbidden_actions: list[str] = field(default_factory=list)
@@ -129,6 +272,10 @@ class WorldState:
         self.events: list[SimEvent] = events or []
         self.relationships: RelationshipGraph = relationships or RelationshipGraph()
         self.metadata: dict[str, Any] = metadata or {}
+        # Merkle hash cache: (kind, id) → (entity, entity version, digest) and
+        # kind → (sorted (id, digest) tuple, kind root).
+        self._entity_digests: dict[tuple[str, str], tuple[Any, int, str]] = {}
+        self._kind_roots: dict[str, tuple[tuple[tuple[str, str], ...], str]] = {}
 
     # ── mutation API ──────────────────────────────────────────────────────────
 
@@ -186,16 +333,48 @@ class WorldState:
         ws.metadata = d.get("metadata") or {}
         return ws
 
+    _HASHED_KINDS = ("agents", "locations", "laws")
+
+    def _entity_digest(self, kind: str, entity_id: str, entity: Any) -> str:
+        # Entities (and direct mutations that bypass apply_*) are only
+        # re-serialised when their version moved since the last hash.
+        version = entity._version
+        cached = self._entity_digests.get((kind, entity_id))
+        if cached is not None and cached[0] is entity and cached[1] == version:
+            return cached[2]
+        blob = json.dumps(entity.as_dict(), sort_keys=True, default=str).encode()
+        digest = hashlib.sha256(blob).hexdigest()
+        self._entity_digests[(kind, entity_id)] = (entity, version, digest)
+        return digest
+
     def state_hash(self) -> str:
-        """Deterministic hash of the world state (excludes events for perf)."""
-        payload = {
-            "tick": self.tick,
-            "agents": {k: v.as_dict() for k, v in sorted(self.agents.items())},
-            "locations": {k: v.as_dict() for k, v in sorted(self.locations.items())},
-            "laws": {k: v.as_dict() for k, v in sorted(self.laws.items())},
-        }
-        blob = json.dumps(payload, sort_keys=True, default=str).encode()
-        return hashlib.sha256(blob).hexdigest()[:16]
+        """Deterministic Merkle hash of the world state (excludes events for perf).
+
+        Leaves are per-entity SHA-256 digests of agents, locations and laws;
+        only entities whose content changed since the previous call are
+        re-hashed, and an unchanged kind reuses its cached subtree root.
+        """
+        roots: list[str] = []
+        for kind in self._HASHED_KINDS:
+            entities: dict[str, Any] = getattr(self, kind)
+            leaves = tuple(
+                (entity_id, self._entity_digest(kind, entity_id, entity))
+                for entity_id, entity in sorted(entities.items())
+            )
+            cached = self._kind_roots.get(kind)
+            if cached is not None and cached[0] == leaves:
+                roots.append(cached[1])
+                continue
+            kind_root = hashlib.sha256(
+                "\n".join(f"{entity_id}:{digest}" for entity_id, digest in leaves).encode()
+            ).hexdigest()
+            self._kind_roots[kind] = (leaves, kind_root)
+            roots.append(kind_root)
+        if len(self._entity_digests) > 2 * sum(len(getattr(self, k)) for k in self._HASHED_KINDS) + 64:
+            live = {(k, i) for k in self._HASHED_KINDS for i in getattr(self, k)}
+            self._entity_digests = {key: v for key, v in self._entity_digests.items() if key in live}
+        header = f"tick:{self.tick}|" + "|".join(roots)
+        return hashlib.sha256(header.encode()).hexdigest()[:16]
 
     def snapshot(self) -> "WorldState":
         """Deep-copy for checkpointing."""
@@ -13,3 +13,54 @@ def test_performance_comparator_marks_small_delta_inconclusive():
     cand = {"run_id": "c", "duration_seconds": 0.99, "metrics": {"wall_time": {"samples": [0.99]}}}
     result = PerformanceComparatorService().compare(baseline_run=base, candidate_run=cand)
     assert result["pass_fail"] == "inconclusive"
+
+
+def _samples(seed: int, mean: float, rel_sd: float, count: int = 20) -> list[float]:
+    import random
+
+    rng = random.Random(seed)
+    return [rng.gauss(mean, mean * rel_sd) for _ in range(count)]
+
+
+def _runs(base_samples: list[float], cand_samples: list[float]) -> tuple[dict, dict]:
+    base = {"run_id": "b", "metrics": {"wall_time": {"samples": base_samples}}}
+    cand = {"run_id": "c", "metrics": {"wall_time": {"samples": cand_samples}}}
+    return base, cand
+
+
+def test_performance_comparator_detects_small_regression_in_quiet_samples():
+    base, cand = _runs(_samples(1, 1.0, 0.005), _samples(2, 1.02, 0.005))
+    result = PerformanceComparatorService().compare(baseline_run=base, candidate_run=cand)
+    assert result["pass_fail"] == "rejected"
+    assert result["reason_code"] == "performance_regressed"
+    stats = result["metric_deltas"]["wall_time"]
+    assert stats["p_value"] < 0.05
+    assert stats["ci_relative_delta_percent"][0] > 0
+
+
+def test_performance_comparator_reports_significant_improvement():
+    base, cand = _runs(_samples(3, 1.0, 0.01), _samples(4, 0.85, 0.01))
+    result = PerformanceComparatorService().compare(baseline_run=base, candidate_run=cand)
+    assert result["pass_fail"] == "passed"
+    assert result["metric_deltas"]["wall_time"]["ci_relative_delta_percent"][1] <= -5.0
+
+
+def test_performance_comparator_noisy_samples_are_inconclusive_not_flapping():
+    verdicts = set()
+    for seed in range(10):
+        base, cand = _runs(_samples(100 + seed, 1.0, 0.25, count=8), _samples(200 + seed, 0.96, 0.25, count=8))
+        result = PerformanceComparatorService().compare(baseline_run=base, candidate_run=cand)
+        verdicts.add((result["pass_fail"], result["reason_code"]))
+        assert result["metric_deltas"]["wall_time"]["mde_percent"] > 5.0
+    assert verdicts == {("inconclusive", "variance_too_high")}
+
+
+def test_performance_comparator_reports_statistics_per_shared_metric():
+    base, cand = _runs(_samples(5, 1.0, 0.01), _samples(6, 1.0, 0.01))
+    base["metrics"]["rss_mb"] = _samples(7, 100.0, 0.01)
+    cand["metrics"]["rss_mb"] = _samples(8, 100.0, 0.01)
+    result = PerformanceComparatorService().compare(baseline_run=base, candidate_run=cand)
+    assert set(result["metric_deltas"]) == {"wall_time", "rss_mb"}
+    assert result["pass_fail"] == "inconclusive"
+    assert result["reason_code"] == "no_significant_delta"
+    assert result["noise_estimate"]["method"] == "bootstrap_median_ci"
@@ -9,3 +9,51 @@ def test_performance_hotspot_service_maps_profile_observation(tmp_path):
     )
     assert report["status"] == "completed"
     assert report["hotspots"][0]["affected_files"] == ["slow_func.py"]
+
+
+def test_performance_hotspot_service_prefers_codecompass_symbols(tmp_path):
+    import json
+
+    details = tmp_path / "rag-helper" / "out" / "details_by_kind"
+    details.mkdir(parents=True)
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "engine.py").write_text("def tokenize(): pass\n", encoding="utf-8")
+    (details / "python_function.jsonl").write_text(
+        json.dumps({"id": "f1", "file": "pkg/engine.py", "name": "tokenize", "line": 1}) + "\n",
+        encoding="utf-8",
+    )
+
+    report = PerformanceHotspotService().resolve_hotspots(
+        profile_observation={"hotspots": [{"symbol": "engine.tokenize", "score": 1.0}]},
+        workspace_dir=tmp_path,
+    )
+
+    assert report["source_index"] == "codecompass"
+    assert report["hotspots"][0]["affected_files"][0] == "pkg/engine.py"
+
+
+def test_performance_hotspot_service_walks_the_tree_once_for_many_hotspots(tmp_path, monkeypatch):
+    import os
+
+    from agent.services import performance_hotspot_service
+
+    for package in range(40):
+        folder = tmp_path / f"pkg_{package}"
+        folder.mkdir()
+        for module in range(50):
+            (folder / f"module_{package}_{module}.py").write_text("", encoding="utf-8")
+    performance_hotspot_service.clear_hotspot_scan_cache()
+    walks = []
+    real_walk = os.walk
+    monkeypatch.setattr(performance_hotspot_service.os, "walk", lambda *a, **kw: walks.append(a) or real_walk(*a, **kw))
+
+    hotspots = [{"symbol": f"module_{i}_{i}", "score": 1.0} for i in range(40)]
+    report = PerformanceHotspotService().resolve_hotspots(
+        profile_observation={"hotspots": hotspots},
+        workspace_dir=tmp_path,
+        max_hotspots=40,
+    )
+
+    assert len(walks) == 1
+    assert len(report["hotspots"]) == 40
+    assert report["hotspots"][7]["affected_files"][0] == os.path.join("pkg_7", "module_7_7.py")
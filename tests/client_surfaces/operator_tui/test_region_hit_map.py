@@ -75,3 +75,50 @@ def test_ai_snake_config_combobox_option_rows_are_clickable() -> None:
     assert hit is not None
     assert hit.pane == "content"
     assert str(hit.payload.get("ai_snake_combo_option_value") or "") in {"AN", "AUS"}
+
+
+def _linear_hit(index, x: int, y: int):
+    for region in reversed(index._regions):
+        if region.contains(x, y):
+            return region.target
+    return None
+
+
+def _audit_state(count: int, **updates) -> OperatorState:
+    values = {
+        "endpoint": "http://localhost:5000",
+        "section_id": "audit",
+        "section_payloads": {
+            "audit": {"items": [{"id": f"a-{i}", "group": f"G{i % 5}", "title": f"Dataset {i}"} for i in range(count)]}
+        },
+    }
+    values.update(updates)
+    return OperatorState(**values)
+
+
+def test_bucketed_lookup_matches_layered_scan_everywhere() -> None:
+    from client_surfaces.operator_tui.models import TuiTab
+
+    state = _audit_state(
+        400,
+        open_tabs=(
+            TuiTab(id="t1", kind="section", section_id="audit", label="audit"),
+            TuiTab(id="t2", kind="section", section_id="tasks", label="tasks"),
+        ),
+        header_logo_game={"chat_long_message_history": [{"channel_id": "room:main", "preview": "hi", "created_at": 1}]},
+    )
+    index = build_region_index(state, width=160, height=60)
+    for y in range(-1, 61):
+        for x in range(-1, 161):
+            assert index.get_target_at(x, y) is _linear_hit(index, x, y), (x, y)
+
+
+def test_region_index_is_reused_until_layout_inputs_change() -> None:
+    state = _audit_state(50)
+    index = build_region_index(state, width=140, height=50)
+
+    assert build_region_index(state.with_updates(status_message="tick"), width=140, height=50) is index
+    assert build_region_index(state.with_updates(selected_index=3), width=140, height=50) is not index
+    assert build_region_index(state, width=150, height=50) is not index
+    resized = build_region_index(state, width=150, height=50)
+    assert build_region_index(_audit_state(51), width=150, height=50) is not resized
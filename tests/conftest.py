@@ -1,6 +1,7 @@
 import base64
 import json
 import os
+import shutil
 import sys
 import types
 from pathlib import Path
@@ -23,11 +24,18 @@ os.environ.setdefault(
     "VOICE_DELETION_LEDGER_PATH",
     f"/tmp/ananta-voice-deletion-ledger-pytest-{os.getpid()}.jsonl",
 )
+# Keep retrieval caches out of the checkout's .rag/ directory (see _PYTEST_RAG_DIR).
+os.environ.setdefault("RAG_SEMANTIC_PERSIST_DIR", f"/tmp/ananta-rag-pytest-{os.getpid()}/llamaindex")
+os.environ.setdefault(
+    "RAG_REPOSITORY_MAP_CACHE_PATH",
+    f"/tmp/ananta-rag-pytest-{os.getpid()}/repository_map/parse_cache.json",
+)
 os.environ.setdefault("INITIAL_ADMIN_USER", "admin")
 os.environ.setdefault("INITIAL_ADMIN_PASSWORD", "admin")
 
 from tests_support import admin_login_token, reset_auth_state
 
+_PYTEST_RAG_DIR = Path(f"/tmp/ananta-rag-pytest-{os.getpid()}")
 _TEST_DB_READY = False
 
 
@@ -46,6 +54,11 @@ def pytest_collection_modifyitems(config, items):
 _INTEGRATION_OPT_IN_ENV = "RUN_INTEGRATION_TESTS"
 
 
+def pytest_sessionfinish(session, exitstatus):
+    del session, exitstatus
+    shutil.rmtree(_PYTEST_RAG_DIR, ignore_errors=True)
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item):
     """Skip integration-marked tests unless RUN_INTEGRATION_TESTS is set.
@@ -335,6 +348,7 @@ def _db_runtime() -> dict[str, Any]:
         SpeechReconciliationJobDB,
         StatsSnapshotDB,
         TaskDB,
+        TaskEventDB,
         TeamBlueprintDB,
         TeamDB,
         TeamMemberDB,
@@ -453,6 +467,7 @@ def _db_runtime() -> dict[str, Any]:
             TeamTypeRoleLink,
             ScheduledTaskDB,
             ArchivedTaskDB,
+            TaskEventDB,
             TaskDB,
             PlanNodeDB,
             PlanDB,
@@ -764,6 +779,8 @@ def cleanup_db_and_runtime():
             "data_test/refresh_tokens.json",
             "data_test/llm_model_history.json",
             "data_test/llm_model_benchmarks.json",
+            "data_test/llm_model_benchmarks.sqlite3",
+            "data_test/llm_model_benchmarks.sqlite3-journal",
         ):
             try:
                 Path(rel).unlink(missing_ok=True)
@@ -64,3 +64,9 @@ def test_load_config_success(tmp_path):
     cfg = load_llm_interceptor_config(path)
     assert cfg.listen.prefix == "/v1"
 
+
+def test_schema_rejects_unknown_fallback_upstream():
+    raw = _valid_config()
+    raw["routing"]["rules"] = [{"when": {}, "upstream": "local", "fallback_upstreams": ["missing"]}]
+    with pytest.raises(Exception):
+        LlmInterceptorConfig.model_validate(raw)
@@ -36,7 +36,7 @@ def test_e2e_non_stream_redacts_before_upstream():
             "model": payload["model"],
             "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
             "usage": {},
-        }
+        }, server.cfg.upstreams[0], payload["model"]
 
     server._router.forward_chat = _fake_forward_chat
     client = app.test_client()
@@ -55,7 +55,11 @@ def test_e2e_non_stream_redacts_before_upstream():
 def test_e2e_streaming_variant():
     server = OpenAICompatInterceptorServer(_cfg())
     app = server.create_app()
-    server._router.forward_chat_stream = lambda **_kwargs: iter(["data: {\"id\":\"x\"}\n\n", "data: [DONE]\n\n"])
+    server._router.forward_chat_stream = lambda **_kwargs: (
+        iter(["data: {\"id\":\"x\"}\n\n", "data: [DONE]\n\n"]),
+        server.cfg.upstreams[0],
+        "intercepted-coder",
+    )
     client = app.test_client()
     resp = client.post(
         "/v1/chat/completions",
@@ -56,7 +56,7 @@ def test_context_gate_failure_drops_context_not_request():
             "model": "intercepted-coder",
             "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
             "usage": {},
-        }
+        }, server.cfg.upstreams[0], payload["model"]
 
     server._context_gate.gate = lambda **_kwargs: (_ for _ in ()).throw(RuntimeError("boom"))
     server._router.forward_chat = _fake_forward_chat
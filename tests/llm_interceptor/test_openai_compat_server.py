@@ -64,14 +64,14 @@ def test_chat_completions_rejects_missing_messages_or_model():
 def test_chat_completions_accepts_valid_body_and_returns_openai_shape():
     server = OpenAICompatInterceptorServer(_cfg())
     app = server.create_app()
-    server._router.forward_chat = lambda **_kwargs: {
+    server._router.forward_chat = lambda **_kwargs: ({
         "id": "chatcmpl-1",
         "object": "chat.completion",
         "created": 1,
         "model": "intercepted-coder",
         "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
         "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
-    }
+    }, server.cfg.upstreams[0], "intercepted-coder")
     client = app.test_client()
     resp = client.post(
         "/v1/chat/completions",
@@ -90,7 +90,11 @@ def test_chat_completions_accepts_valid_body_and_returns_openai_shape():
 def test_streaming_passthrough_returns_sse():
     server = OpenAICompatInterceptorServer(_cfg())
     app = server.create_app()
-    server._router.forward_chat_stream = lambda **_kwargs: iter(["data: {\"id\":\"1\"}\n\n", "data: [DONE]\n\n"])
+    server._router.forward_chat_stream = lambda **_kwargs: (
+        iter(["data: {\"id\":\"1\"}\n\n", "data: [DONE]\n\n"]),
+        server.cfg.upstreams[0],
+        "intercepted-coder",
+    )
     client = app.test_client()
     resp = client.post(
         "/v1/chat/completions",
@@ -105,7 +109,11 @@ def test_streaming_passthrough_returns_sse():
 def test_streaming_invalid_chunk_gets_safe_terminal_error():
     server = OpenAICompatInterceptorServer(_cfg())
     app = server.create_app()
-    server._router.forward_chat_stream = lambda **_kwargs: iter(["{\"bad\":1}\n\n"])
+    server._router.forward_chat_stream = lambda **_kwargs: (
+        iter(["{\"bad\":1}\n\n"]),
+        server.cfg.upstreams[0],
+        "intercepted-coder",
+    )
     client = app.test_client()
     resp = client.post(
         "/v1/chat/completions",
@@ -119,7 +127,11 @@ def test_streaming_invalid_chunk_gets_safe_terminal_error():
 def test_non_stream_invalid_upstream_response_repaired_once():
     server = OpenAICompatInterceptorServer(_cfg())
     app = server.create_app()
-    server._router.forward_chat = lambda **_kwargs: {"text": "hello from malformed"}
+    server._router.forward_chat = lambda **_kwargs: (
+        {"text": "hello from malformed"},
+        server.cfg.upstreams[0],
+        "intercepted-coder",
+    )
     client = app.test_client()
     resp = client.post(
         "/v1/chat/completions",
@@ -129,3 +141,33 @@ def test_non_stream_invalid_upstream_response_repaired_once():
     body = resp.get_json()
     assert body["object"] == "chat.completion"
     assert body["choices"][0]["message"]["content"] == "hello from malformed"
+
+
+def test_audit_records_upstream_that_served_after_failover():
+    raw = _cfg().model_dump()
+    raw["upstreams"].append(dict(raw["upstreams"][0], id="local-backup", base_url="http://127.0.0.1:1235/v1"))
+    server = OpenAICompatInterceptorServer(LlmInterceptorConfig.model_validate(raw))
+    app = server.create_app()
+    backup = server.cfg.upstreams[1]
+    audited = {}
+    build_event = server._audit.build_event
+
+    def _capture(**kwargs):
+        audited.update(kwargs)
+        return build_event(**kwargs)
+
+    server._audit.build_event = _capture
+    server._router.forward_chat = lambda **_kwargs: ({
+        "id": "x",
+        "object": "chat.completion",
+        "created": 1,
+        "model": "intercepted-coder",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
+        "usage": {},
+    }, backup, "intercepted-coder")
+    resp = app.test_client().post(
+        "/v1/chat/completions",
+        json={"model": "intercepted-coder", "messages": [{"role": "user", "content": "hello"}]},
+    )
+    assert resp.status_code == 200
+    assert audited["upstream_id"] == "local-backup"
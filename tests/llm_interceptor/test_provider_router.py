@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
 from agent.services.llm_interceptor.config_schema import LlmInterceptorConfig
@@ -14,6 +18,9 @@ class _Resp:
     def json(self):
         return self._payload
 
+    def close(self):
+        pass
+
 
 def _cfg() -> LlmInterceptorConfig:
     return LlmInterceptorConfig.model_validate(
@@ -35,27 +42,188 @@ def _cfg() -> LlmInterceptorConfig:
 def test_forward_chat_posts_body(monkeypatch):
     captured = {}
 
-    def _fake_post(url, json=None, headers=None, timeout=None, **_kwargs):
+    def _fake_post(self, url, json=None, headers=None, timeout=None, **_kwargs):
         captured["url"] = url
         captured["json"] = json
         return _Resp(200, {"id": "x", "object": "chat.completion", "choices": []})
 
-    monkeypatch.setattr("agent.services.llm_interceptor.provider_router.requests.post", _fake_post)
-    out = ProviderRouter(_cfg()).forward_chat(payload={"model": "m-local", "messages": [{"role": "user", "content": "hi"}]}, envelope={})
+    monkeypatch.setattr("requests.Session.post", _fake_post)
+    out, upstream, model = ProviderRouter(_cfg()).forward_chat(
+        payload={"model": "m-local", "messages": [{"role": "user", "content": "hi"}]}, envelope={}
+    )
     assert captured["url"].endswith("/chat/completions")
     assert captured["json"]["model"] == "m-local"
     assert out["object"] == "chat.completion"
+    assert (upstream.id, model) == ("local", "m-local")
 
 
 def test_disallowed_model_rejected():
-    out = ProviderRouter(_cfg()).resolve_route(payload={"model": "m-cloud", "messages": [{"role": "user", "content": "hi"}]}, envelope={})
+    out = ProviderRouter(_cfg()).resolve_route(
+        payload={"model": "m-cloud", "messages": [{"role": "user", "content": "hi"}]}, envelope={}
+    )
     assert out[1] == "m-local"
 
 
 def test_upstream_error_mapped(monkeypatch):
     monkeypatch.setattr(
-        "agent.services.llm_interceptor.provider_router.requests.post",
+        "requests.Session.post",
         lambda *args, **kwargs: _Resp(500, {"error": "x"}),
     )
     with pytest.raises(ValueError):
-        ProviderRouter(_cfg()).forward_chat(payload={"model": "m-local", "messages": [{"role": "user", "content": "hi"}]}, envelope={})
+        ProviderRouter(_cfg()).forward_chat(
+            payload={"model": "m-local", "messages": [{"role": "user", "content": "hi"}]}, envelope={}
+        )
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    ports: set[int] = set()
+    auth: list[str] = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        type(self).ports.add(self.client_address[1])
+        type(self).auth.append(str(self.headers.get("Authorization") or ""))
+        if self.path.endswith("/chat/completions") and "stream" in self.server.mode:
+            body = b'data: {"id":"s","choices":[]}\n\ndata: [DONE]\n\n'
+            content_type = "text/event-stream"
+        else:
+            body = b'{"id":"x","object":"chat.completion","choices":[]}'
+            content_type = "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def stub_upstream():
+    _StubHandler.ports = set()
+    _StubHandler.auth = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.mode = "json"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _two_upstream_cfg(primary_url: str, fallback_url: str) -> LlmInterceptorConfig:
+    return LlmInterceptorConfig.model_validate(
+        {
+            "upstreams": [
+                {
+                    "id": "primary",
+                    "type": "openai_compatible",
+                    "base_url": primary_url,
+                    "api_key_env": "STUB_UPSTREAM_KEY",
+                    "allowed_models": ["m-local"],
+                },
+                {
+                    "id": "fallback",
+                    "type": "openai_compatible",
+                    "base_url": fallback_url,
+                    "api_key_env": "STUB_UPSTREAM_KEY",
+                    "allowed_models": ["m-local"],
+                },
+            ],
+            "routing": {
+                "default_upstream": "primary",
+                "default_model": "m-local",
+                "rules": [{"when": {}, "upstream": "primary", "fallback_upstreams": ["fallback"]}],
+            },
+        }
+    )
+
+
+def test_forward_chat_reuses_pooled_connection(stub_upstream, monkeypatch):
+    monkeypatch.setenv("STUB_UPSTREAM_KEY", "k1")
+    url = f"http://127.0.0.1:{stub_upstream.server_address[1]}/v1"
+    router = ProviderRouter(_two_upstream_cfg(url, url))
+    payload = {"model": "m-local", "messages": [{"role": "user", "content": "hi"}]}
+    for _ in range(5):
+        assert router.forward_chat(payload=payload, envelope={})[0]["object"] == "chat.completion"
+    router.close()
+    assert len(_StubHandler.ports) == 1
+    assert _StubHandler.auth == ["Bearer k1"] * 5
+
+
+def test_forward_chat_fails_over_to_healthy_upstream(stub_upstream, monkeypatch):
+    monkeypatch.setenv("STUB_UPSTREAM_KEY", "k1")
+    dead = f"http://127.0.0.1:{_closed_port()}/v1"
+    live = f"http://127.0.0.1:{stub_upstream.server_address[1]}/v1"
+    router = ProviderRouter(_two_upstream_cfg(dead, live))
+    payload = {"model": "m-local", "messages": [{"role": "user", "content": "hi"}]}
+    assert [u.id for u, _m in router.route_candidates(payload=payload, envelope={})] == ["primary", "fallback"]
+    for _ in range(3):
+        result, upstream, _model = router.forward_chat(payload=payload, envelope={})
+        assert (result["id"], upstream.id) == ("x", "fallback")
+    assert router.upstream_health() == {"primary": False, "fallback": True}
+    # Unhealthy primary is now tried last, so requests go straight to the fallback.
+    assert router.forward_chat(payload=payload, envelope={})[1].id == "fallback"
+    router.close()
+
+
+def test_forward_chat_stream_passthrough_relays_raw_bytes(stub_upstream):
+    stub_upstream.mode = "stream"
+    url = f"http://127.0.0.1:{stub_upstream.server_address[1]}/v1"
+    router = ProviderRouter(_two_upstream_cfg(url, url))
+    payload = {"model": "m-local", "messages": [{"role": "user", "content": "hi"}], "stream": True}
+    stream, _upstream, _model = router.forward_chat_stream(payload=payload, envelope={}, passthrough=True)
+    out = b"".join(stream)
+    assert out == b'data: {"id":"s","choices":[]}\n\ndata: [DONE]\n\n'
+    router.close()
+
+
+def test_saturated_primary_fails_over(monkeypatch):
+    cfg = _two_upstream_cfg("http://primary/v1", "http://fallback/v1")
+    cfg.upstreams[0].max_concurrency = 1
+    router = ProviderRouter(cfg)
+    seen = []
+
+    def _fake_post(self, url, **_kwargs):
+        seen.append(url)
+        return _Resp(200, {"id": "x"})
+
+    monkeypatch.setattr("requests.Session.post", _fake_post)
+    assert router._transport(cfg.upstreams[0]).acquire(wait=False)
+    router.forward_chat(payload={"model": "m-local", "messages": []}, envelope={})
+    assert seen == ["http://fallback/v1/chat/completions"]
+
+
+def test_stream_closed_before_first_chunk_releases_slot(monkeypatch):
+    cfg = _cfg()
+    cfg.upstreams[0].max_concurrency = 1
+    router = ProviderRouter(cfg)
+    closed = []
+
+    class _OpenStream(_Resp):
+        def iter_lines(self, decode_unicode=True):
+            yield "data: [DONE]"
+
+        def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr("requests.Session.post", lambda self, url, **_kwargs: _OpenStream(200))
+    payload = {"model": "m-local", "messages": [], "stream": True}
+    stream, _upstream, _model = router.forward_chat_stream(payload=payload, envelope={})
+    stream.close()
+    # Dropping an unstarted stream (client gone before the first chunk) frees it too.
+    router.forward_chat_stream(payload=payload, envelope={})
+    list(router.forward_chat_stream(payload=payload, envelope={})[0])
+    assert closed == [True, True, True]
+    assert router._transport(cfg.upstreams[0]).acquire(wait=False)
@@ -33,14 +33,14 @@ def test_prompt_text_cannot_disable_redaction_or_policy():
     injections = _fixture("prompt_injection_samples.json")["cases"]
     server = OpenAICompatInterceptorServer(_cfg_cloud())
     app = server.create_app()
-    server._router.forward_chat = lambda **_kwargs: {
+    server._router.forward_chat = lambda **_kwargs: ({
         "id": "x",
         "object": "chat.completion",
         "created": 1,
         "model": "intercepted-coder",
         "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
         "usage": {},
-    }
+    }, server.cfg.upstreams[0], "intercepted-coder")
     client = app.test_client()
     for text in injections:
         resp = client.post("/v1/chat/completions", json={"model": "intercepted-coder", "messages": [{"role": "user", "content": text}]})
@@ -63,7 +63,7 @@ def test_cloud_never_receives_blocked_local_context():
             "model": "intercepted-coder",
             "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
             "usage": {},
-        }
+        }, server.cfg.upstreams[0], payload["model"]
 
     server._router.forward_chat = _fake_forward_chat
     client = app.test_client()
@@ -84,14 +84,14 @@ def test_provider_key_never_in_response_or_audit_shape():
     samples = _fixture("secret_samples.json")["cases"]
     server = OpenAICompatInterceptorServer(_cfg_cloud())
     app = server.create_app()
-    server._router.forward_chat = lambda **_kwargs: {
+    server._router.forward_chat = lambda **_kwargs: ({
         "id": "x",
         "object": "chat.completion",
         "created": 1,
         "model": "intercepted-coder",
         "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
         "usage": {},
-    }
+    }, server.cfg.upstreams[0], "intercepted-coder")
     client = app.test_client()
     for item in samples:
         resp = client.post("/v1/chat/completions", json={"model": "intercepted-coder", "messages": [{"role": "user", "content": item["text"]}]})
@@ -14,6 +14,9 @@ class _StreamResp:
         for line in self._lines:
             yield line
 
+    def close(self):
+        pass
+
 
 def _cfg() -> LlmInterceptorConfig:
     return LlmInterceptorConfig.model_validate(
@@ -34,10 +37,13 @@ def _cfg() -> LlmInterceptorConfig:
 
 def test_forward_chat_stream_preserves_order(monkeypatch):
     monkeypatch.setattr(
-        "agent.services.llm_interceptor.provider_router.requests.post",
+        "requests.Session.post",
         lambda *args, **kwargs: _StreamResp(lines=["data: {\"a\":1}", "data: [DONE]"]),
     )
-    out = list(ProviderRouter(_cfg()).forward_chat_stream(payload={"model": "m-local", "messages": [{"role": "user", "content": "h"}], "stream": True}))
+    stream, _upstream, _model = ProviderRouter(_cfg()).forward_chat_stream(
+        payload={"model": "m-local", "messages": [{"role": "user", "content": "h"}], "stream": True}
+    )
+    out = list(stream)
     assert out[0].startswith("data: ")
     assert "DONE" in out[-1]
 
@@ -126,3 +126,95 @@ def test_text_hash_deterministic():
     assert h1 == h2
     h3 = _text_hash("different text")
     assert h1 != h3
+
+
+def _screen(tick: int) -> str:
+    rows = [f"row {y:02d} " + "status ok " * 20 for y in range(70)]
+    rows[3] = f"clock 12:00:{tick:02d} " + "x" * 150
+    return "\n".join(rows)
+
+
+def test_binary_frames_round_trip_with_smaller_deltas():
+    from client_surfaces.operator_tui.share_view_codec import FRAME_VERSION_BINARY
+
+    key = make_test_key()
+    policy = ViewSharePolicy(view_share_enabled=True, redact_secrets=False, redact_notes=False)
+    text_frames: list[dict] = []
+    binary_frames: list[dict] = []
+    text_sender = ViewStreamSender("sess-1", key, policy, on_frame=text_frames.append)
+    binary_sender = ViewStreamSender(
+        "sess-1", key, policy, on_frame=binary_frames.append, frame_version=FRAME_VERSION_BINARY
+    )
+    receiver = ViewStreamReceiver(key)
+    for sender in (text_sender, binary_sender):
+        sender.start()
+        for tick in range(4):
+            sender.tick(_screen(tick), width=240, height=70, now=100.0 + tick)
+
+    for tick, frame in enumerate(binary_frames):
+        assert frame["version"] == "2"
+        assert receiver.handle_frame(frame)
+        assert receiver.current_text == _screen(tick)
+    assert [frame["kind"] for frame in binary_frames] == ["snapshot", "delta", "delta", "delta"]
+    text_delta = len(text_frames[1]["encrypted_payload"]["ciphertext"])
+    binary_delta = len(binary_frames[1]["encrypted_payload"]["ciphertext"])
+    assert binary_delta * 20 < text_delta
+
+
+def test_binary_delta_on_wrong_base_takes_resync_path():
+    from client_surfaces.operator_tui.share_view_codec import FRAME_VERSION_BINARY
+
+    key = make_test_key()
+    policy = ViewSharePolicy(view_share_enabled=True, redact_secrets=False, redact_notes=False)
+    frames: list[dict] = []
+    sender = ViewStreamSender("sess-1", key, policy, on_frame=frames.append, frame_version=FRAME_VERSION_BINARY)
+    sender.start()
+    for tick in range(3):
+        sender.tick(_screen(tick), width=240, height=70, now=100.0 + tick)
+    sender.tick(_screen(9), width=240, height=70, now=106.0)
+
+    receiver = ViewStreamReceiver(key)
+    assert receiver.handle_frame(frames[0])
+    assert not receiver.handle_frame(frames[2])  # Delta 1 fehlt → Basis passt nicht
+    assert receiver.needs_resync()
+    assert receiver.handle_frame(frames[3])  # periodischer Snapshot heilt
+    assert not receiver.needs_resync()
+    assert receiver.current_text == _screen(9)
+
+
+def test_dropped_oversize_frame_keeps_delta_base(monkeypatch):
+    import client_surfaces.operator_tui.share_view_stream as stream
+
+    key = make_test_key()
+    policy = ViewSharePolicy(view_share_enabled=True, redact_secrets=False, redact_notes=False)
+    frames: list[dict] = []
+    sender = ViewStreamSender("sess-1", key, policy, on_frame=frames.append)
+    sender.start()
+    monkeypatch.setattr(stream, "_MAX_PAYLOAD_BYTES", 64)
+    sender.tick("small", width=80, height=24, now=100.0)
+    sender.tick("x" * 500, width=80, height=24, now=101.0)
+    sender.tick("small 2", width=80, height=24, now=102.0)
+
+    receiver = ViewStreamReceiver(key)
+    assert [frame["kind"] for frame in frames] == ["snapshot", "delta"]
+    assert all(receiver.handle_frame(frame) for frame in frames)
+    assert receiver.current_text == "small 2"
+
+
+def test_frame_version_negotiation_and_corrupt_binary_delta():
+    from client_surfaces.operator_tui.share_view_codec import (
+        FrameCodecError,
+        apply_delta,
+        encode_delta,
+        negotiate_frame_version,
+    )
+
+    assert negotiate_frame_version(ViewStreamReceiver.supported_versions) == "2"
+    assert negotiate_frame_version(["1"]) == "1"
+    assert negotiate_frame_version([]) == "1"
+    payload = encode_delta("a\nbbbb\nc", "a\nbbXbb\nc\nd")
+    assert apply_delta("a\nbbbb\nc", payload) == "a\nbbXbb\nc\nd"
+    with pytest.raises(FrameCodecError):
+        apply_delta("a", payload)
+    with pytest.raises(FrameCodecError):
+        apply_delta("a\nbbbb\nc", payload[:-2])
@@ -0,0 +1,99 @@
+"""Tests für DamageTracker: minimale Ausgabe, Bildschirm-Äquivalenz, Budget."""
+from __future__ import annotations
+
+from client_surfaces.operator_tui.ansi_replay import AnsiReplayState
+from client_surfaces.operator_tui.damage_renderer import DamageTracker, parse_frame
+from client_surfaces.operator_tui.performance import PerformanceBudget, measure
+
+WIDTH, HEIGHT = 120, 40
+
+
+def _dashboard(tick: int) -> list[str]:
+    lines = [f"\x1b[1;32m Ananta Operator \x1b[0m status: \x1b[33mrunning\x1b[0m  tick={tick:05d}"]
+    for row in range(1, HEIGHT - 1):
+        lines.append(f"\x1b[36m│\x1b[0m task-{row:03d} {'done' if row % 3 else 'open':<6} " + "·" * 60)
+    lines.append(f"clock 12:00:{tick % 60:02d}")
+    return lines
+
+
+def _screen(state: AnsiReplayState) -> list[str]:
+    grid = state.to_cell_grid()
+    return ["".join(cell.char for cell in row).rstrip() for row in grid.cells]
+
+
+def _expected(lines: list[str]) -> list[str]:
+    state = AnsiReplayState(WIDTH, HEIGHT)
+    state.apply_chunk("\x1b[2J\x1b[H" + "\r\n".join(lines))
+    return _screen(state)
+
+
+def test_incremental_frames_reproduce_the_full_frame_on_screen() -> None:
+    tracker = DamageTracker(width=WIDTH, height=HEIGHT)
+    screen = AnsiReplayState(WIDTH, HEIGHT)
+    frames = [_dashboard(1), _dashboard(2), ["short"] + _dashboard(3)[1:], _dashboard(4)]
+    for frame in frames:
+        screen.apply_chunk(tracker.render(frame))
+        assert _screen(screen) == _expected(frame)
+
+
+def test_static_dashboard_frame_costs_a_fraction_of_a_repaint() -> None:
+    tracker = DamageTracker(width=WIDTH, height=HEIGHT)
+    first = tracker.render(_dashboard(1))
+    assert first.startswith("\x1b[0m\x1b[2J")
+    assert tracker.last_stats.full_repaint is True
+
+    update = tracker.render(_dashboard(2))
+    stats = tracker.last_stats
+    assert stats.changed_rows == 2
+    assert stats.bytes_written * 20 < stats.full_repaint_bytes
+    assert update.count("\x1b[") <= 6
+    assert tracker.render(_dashboard(2)) == ""
+
+
+def test_style_only_change_and_wide_rows_are_repainted() -> None:
+    tracker = DamageTracker(width=20, height=2)
+    tracker.render(["plain text", "漢字 row"])
+
+    restyled = tracker.render(["\x1b[31mplain\x1b[0m text", "漢字 row!"])
+
+    assert "\x1b[1;1H\x1b[0;31mplain" in restyled
+    assert restyled.endswith("\x1b[2;1H\x1b[0m漢字 row!\x1b[K")
+
+    tracker.resize(30, 2)
+    assert tracker.render(["plain text", "漢字 row!"]).startswith("\x1b[0m\x1b[2J")
+
+
+def test_per_cell_colour_changes_without_reset_keep_styles_bounded() -> None:
+    def gradient(shift: int) -> list[str]:
+        return [
+            "\x1b[1m" + "".join(f"\x1b[38;2;{(x + shift) % 256};{y};0m#" for x in range(WIDTH))
+            for y in range(HEIGHT)
+        ]
+
+    rows, _ = parse_frame(gradient(0), width=WIDTH, height=HEIGHT)
+    assert rows[0][WIDTH - 1] == ("#", f"1;38;2;{WIDTH - 1};0;0")
+    assert parse_frame(["\x1b[31m\x1b[1mA\x1b[0;1;31mB\x1b[22;39mC"], width=3, height=1)[0][0] == (
+        ("A", "1;31"),
+        ("B", "1;31"),
+        ("C", ""),
+    )
+
+    tracker = DamageTracker(width=WIDTH, height=HEIGHT)
+    screen = AnsiReplayState(WIDTH, HEIGHT)
+    screen.apply_chunk(tracker.render(gradient(0)))
+    assert tracker.last_stats.bytes_written < 2 * tracker.last_stats.full_repaint_bytes
+
+    assert tracker.render(gradient(0)) == ""
+    screen.apply_chunk(tracker.render(gradient(1)))
+    assert tracker.last_stats.bytes_written < 2 * tracker.last_stats.full_repaint_bytes
+    assert _screen(screen) == _expected(gradient(1))
+
+
+def test_damage_frame_stays_within_command_render_budget() -> None:
+    tracker = DamageTracker(width=240, height=70)
+    tracker.render(["\x1b[32m0000\x1b[0m " + "x" * 230 for _ in range(70)])
+    frame = ["\x1b[32m0001\x1b[0m " + "x" * 230 for _ in range(70)]
+
+    measurement = measure("damage_frame", PerformanceBudget().command_render_ms, lambda: tracker.render(frame))
+
+    assert measurement.ok, measurement
@@ -0,0 +1,94 @@
+"""Tests für PanelRenderCache: Wiederverwendung unveränderter Panels, Invalidierung, Budget."""
+from __future__ import annotations
+
+from client_surfaces.operator_tui.models import FocusPane, OperatorState, PanelState
+from client_surfaces.operator_tui.performance import PerformanceBudget, measure
+from client_surfaces.operator_tui.render_cache import PanelRenderCache, default_panel_render_cache
+from client_surfaces.operator_tui.renderer import _navigation_lines, render_operator_shell
+from client_surfaces.operator_tui.sections import SECTIONS
+
+
+def _audit_payload(count: int) -> dict:
+    return {
+        "items": [
+            {
+                "id": f"audit.{i}",
+                "group": f"Group {i % 12}",
+                "title": f"Dataset {i}",
+                "status": "ok" if i % 7 else "warn",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def _audit_state(payload: dict, **updates) -> OperatorState:
+    values = {
+        "endpoint": "http://localhost:5000",
+        "section_id": "audit",
+        "focus": FocusPane.NAVIGATION,
+        "selected_index": len(SECTIONS),
+        "section_payloads": {"audit": payload},
+        "panel_states": {"audit": PanelState.HEALTHY},
+    }
+    values.update(updates)
+    return OperatorState(**values)
+
+
+def test_cache_reuses_value_until_key_changes() -> None:
+    cache = PanelRenderCache()
+    calls: list[int] = []
+    payload = {"items": [1, 2]}
+
+    def render() -> list[str]:
+        calls.append(1)
+        return ["a", "b"]
+
+    first = cache.lines("nav", (payload, 80), render)
+    first.append("mutated by caller")
+    assert cache.lines("nav", (payload, 80), render) == ["a", "b"]
+    assert cache.lines("nav", (payload, 100), render) == ["a", "b"]
+    assert len(calls) == 2
+    assert cache.stats() == {"hits": 1, "misses": 2, "panels": 1}
+
+    cache.invalidate("nav")
+    cache.lines("nav", (payload, 100), render)
+    assert len(calls) == 3
+
+
+def test_navigation_reflects_selection_and_replaced_payload() -> None:
+    payload = _audit_payload(3)
+    base = _navigation_lines(_audit_state(payload))
+
+    moved = _navigation_lines(_audit_state(payload, selected_index=len(SECTIONS) + 1))
+    assert moved != base
+
+    replaced = dict(payload, items=[*payload["items"], {"id": "audit.new", "group": "Group 0", "title": "Fresh"}])
+    assert any("Fresh" in line for line in _navigation_lines(_audit_state(replaced)))
+
+
+def test_navigation_history_is_not_served_from_cache() -> None:
+    game: dict = {}
+    state = _audit_state(_audit_payload(3), header_logo_game=game)
+    _navigation_lines(state)
+
+    game["chat_long_message_history"] = [
+        {"channel_id": "room:main", "sender_kind": "ai", "preview": "neu", "created_at": 1}
+    ]
+    assert any("[ai] neu" in line for line in _navigation_lines(state))
+
+
+def test_repeat_frame_on_large_audit_payload_hits_the_cache_within_budget() -> None:
+    state = _audit_state(_audit_payload(4000))
+    render_operator_shell(state, width=140, height=40)
+    cache = default_panel_render_cache()
+    hits_before = cache.hits
+
+    measurement = measure(
+        "audit_repeat_frame",
+        PerformanceBudget().command_render_ms,
+        lambda: render_operator_shell(state.with_updates(status_message="tick"), width=140, height=40),
+    )
+
+    assert measurement.ok, measurement
+    assert cache.hits - hits_before >= 2
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import pytest
 
-from client_surfaces.operator_tui.snapshot import CellGrid
+from client_surfaces.operator_tui.performance import PerformanceBudget, measure
+from client_surfaces.operator_tui.snapshot import Cell, CellGrid
 from client_surfaces.operator_tui.snapshot_delta import DeltaEncoder, DirtyRegion, TuiDelta, _compute_dirty_regions
 
 
@@ -97,6 +98,45 @@ class TestDeltaApply:
         assert result_line1.startswith("CHANGED")
 
 
+class TestDeltaPackedRows:
+    def test_style_only_change_is_encoded_and_applied(self) -> None:
+        prev = CellGrid.from_rendered_lines(["abc"])
+        cells = [
+            [Cell(x=c.x, y=c.y, char=c.char, fg=(255, 0, 0) if c.x == 1 else None) for c in row]
+            for row in prev.cells
+        ]
+        curr = CellGrid(width=prev.width, height=prev.height, cells=cells)
+        enc = DeltaEncoder()
+        delta = enc.encode(prev, curr)
+        assert [(c["x"], c.get("fg")) for c in delta.changed_cells] == [(1, [255, 0, 0])]
+        assert enc.apply(prev, delta).screen_hash == curr.screen_hash
+
+    def test_packed_rows_and_digests_are_built_once_per_grid(self) -> None:
+        grid = CellGrid.from_rendered_lines(["row0", "row1"])
+        assert grid.packed_rows() is grid.packed_rows()
+        assert grid.row_digests() is grid.row_digests()
+        enc = DeltaEncoder()
+        delta = enc.encode(CellGrid.from_rendered_lines(["row0", "XXXX"]), grid)
+        assert delta.line_hashes == grid.row_digests()
+
+    def test_share_tick_delta_on_wide_terminal_stays_within_budget(self) -> None:
+        base = [f"{y:03d} " + "status " * 33 + "x" for y in range(70)]
+        grids = []
+        for tick in range(11):
+            lines = list(base)
+            lines[tick] = f"tick {tick:04d}".ljust(240, ".")
+            grids.append(CellGrid.from_rendered_lines(lines))
+        enc = DeltaEncoder()
+
+        measurement = measure(
+            "share_delta_ticks",
+            PerformanceBudget().command_render_ms,
+            lambda: [enc.encode(prev, curr) for prev, curr in zip(grids, grids[1:])],
+        )
+
+        assert measurement.ok, measurement
+
+
 class TestDeltaToDictSchema:
     def test_to_dict_has_required_keys(self) -> None:
         prev = CellGrid.from_rendered_lines(["a"])
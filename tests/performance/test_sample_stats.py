@@ -0,0 +1,27 @@
+from agent.performance.sample_stats import (
+    bootstrap_relative_delta_ci,
+    mann_whitney_u,
+    minimum_detectable_effect_percent,
+)
+
+
+def test_mann_whitney_exact_small_samples():
+    assert mann_whitney_u([1.0, 2.0, 3.0], [4.0, 5.0, 6.0]) == (0.0, 0.1)
+    u, p = mann_whitney_u([1.0, 2.0, 3.0, 7.0], [4.0, 5.0, 6.0, 8.0, 9.0])
+    assert u == 3.0
+    assert abs(p - 1 / 9) < 1e-12
+
+
+def test_mann_whitney_with_ties_uses_normal_approximation():
+    u, p = mann_whitney_u([1.0, 1.0, 2.0, 2.0] * 5, [1.0, 2.0, 2.0, 3.0] * 5)
+    assert 0.0 < p < 1.0
+    assert u < 200
+
+
+def test_bootstrap_ci_is_seeded_and_mde_shrinks_with_samples():
+    base = [1.0, 1.02, 0.98, 1.01, 0.99, 1.0]
+    cand = [1.1, 1.12, 1.08, 1.11, 1.09, 1.1]
+    assert bootstrap_relative_delta_ci(base, cand, seed=3) == bootstrap_relative_delta_ci(base, cand, seed=3)
+    low, high = bootstrap_relative_delta_ci(base, cand)
+    assert 5.0 < low <= high < 15.0
+    assert minimum_detectable_effect_percent(base * 4, cand * 4) < minimum_detectable_effect_percent(base, cand)
@@ -66,6 +66,33 @@ def test_turboquant_mse_experimental_is_visible_and_deterministic():
     assert "TurboQuant-inspired" in encoded_a.diagnostics["experimental_warning"]
 
 
+@pytest.mark.parametrize(
+    "mode",
+    ["off", "float32", "float16", "int8", "symmetric4bit", "turboquant_mse_experimental"],
+)
+def test_batch_codec_matches_scalar_encode_and_decode(mode):
+    encoder = VectorEncoder(VectorEncodingProfile(mode=mode, seed=123))
+    vectors = [
+        [((index * 37 + dim * 11) % 97) / 48.5 - 1.0 for dim in range(dims)]
+        for index, dims in enumerate([5, 5, 8, 8, 8, 384, 384])
+    ]
+    vectors += [[0.5, -1.5, 2.5, 0.0, -0.5], [0.0, 0.0, 0.0], [], [1, 2, 3]]
+
+    batch = [item.as_dict() for item in encoder.encode_many(vectors)]
+
+    assert batch == [encoder.encode(vector).as_dict() for vector in vectors]
+    assert encoder.decode_many(batch) == [encoder.decode(item) for item in batch]
+
+
+def test_batch_encode_keeps_scalar_errors():
+    encoder = VectorEncoder(VectorEncodingProfile(mode="float16", target_bits=16))
+
+    with pytest.raises(VectorEncodingError):
+        encoder.encode_many([[1.0, 2.0], [1.0, float("nan")]])
+    with pytest.raises((VectorEncodingError, OverflowError)):
+        encoder.encode_many([[1.0, 2.0], [1.0, 1.0e6]])
+
+
 def test_vector_store_rebuild_with_int8_encoding(tmp_path):
     store = CodeCompassVectorStore(index_path=tmp_path / "cc_vector_index.json")
     provider = FakeEmbeddingProvider(model_version="fake-v2", dimensions=5)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import text
+
+import agent.database as database
+
+
+@pytest.fixture
+def sqlite_engines(tmp_path, monkeypatch):
+    monkeypatch.setattr(database.settings, "sqlite_writer_pool_size", 1)
+    monkeypatch.setattr(database.settings, "sqlite_reader_pool_size", 2)
+    monkeypatch.setattr(database.settings, "sqlite_pool_timeout_seconds", 5.0)
+    monkeypatch.setattr(database.settings, "sqlite_mmap_size_bytes", 1 << 20)
+    monkeypatch.setattr(database.settings, "sqlite_cache_size_kib", 2048)
+    writer, reader = database.create_sqlite_engines(f"sqlite:///{tmp_path / 'pool.db'}")
+    yield writer, reader
+    writer.dispose()
+    reader.dispose()
+
+
+def test_pragmas_run_once_per_pooled_connection(sqlite_engines, monkeypatch):
+    writer, _reader = sqlite_engines
+    calls: list[bool] = []
+    original = database.configure_sqlite_connection
+
+    def _counting(dbapi_connection, **kwargs):
+        calls.append(kwargs.get("read_only", False))
+        original(dbapi_connection, **kwargs)
+
+    monkeypatch.setattr(database, "configure_sqlite_connection", _counting)
+    for _ in range(5):
+        with writer.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    assert calls == [False]
+    with writer.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        assert connection.exec_driver_sql("PRAGMA cache_size").scalar() == -2048
+
+
+def test_reader_pool_is_query_only_and_sees_committed_writes(sqlite_engines):
+    writer, reader = sqlite_engines
+    with writer.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        connection.execute(text("INSERT INTO items (name) VALUES ('alpha')"))
+
+    with reader.connect() as connection:
+        assert connection.execute(text("SELECT name FROM items")).scalar() == "alpha"
+        with pytest.raises(Exception) as excinfo:
+            connection.execute(text("INSERT INTO items (name) VALUES ('beta')"))
+    assert isinstance(excinfo.value.orig, sqlite3.OperationalError)
+
+
+def test_writer_checkouts_are_serialized_and_wait_time_is_recorded(sqlite_engines):
+    writer, _reader = sqlite_engines
+    before = database.pool_wait_stats().get("sqlite_writer", {}).get("checkouts", 0)
+    held = writer.connect()
+    released = threading.Event()
+
+    def _second_writer():
+        with writer.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        released.set()
+
+    thread = threading.Thread(target=_second_writer)
+    thread.start()
+    assert not released.wait(0.2)
+    held.close()
+    thread.join(timeout=5)
+
+    stats = database.pool_wait_stats()["sqlite_writer"]
+    assert released.is_set()
+    assert stats["checkouts"] >= before + 2
+    assert stats["wait_seconds_max"] >= 0.15
+
+
+def test_reader_engine_falls_back_to_primary_engine_outside_pooled_mode():
+    assert database.read_engine is None
+    assert database.reader_engine() is database.engine
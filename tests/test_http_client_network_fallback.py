@@ -1,16 +1,19 @@
 import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
 
 import pytest
 import requests
 
-from agent.common import http as http_module
 from agent.common.http import (
     HttpClient,
+    HttpTransportCancelled,
     HttpTransportDeadlineExceeded,
     HttpTransportResponseLost,
 )
 from agent.common.lmstudio_request_registry import (
+    cancel_task,
     clear_thread_context,
     set_thread_context,
 )
@@ -85,8 +88,7 @@ def test_tracked_post_transport_error_is_not_resent_untracked(monkeypatch):
         def close(self):
             return None
 
-    session = FailingSession()
-    monkeypatch.setattr(http_module.requests, "Session", lambda: session)
+    monkeypatch.setattr(client, "guarded_session", FailingSession())
     set_thread_context(None, "tracked-task")
     try:
         result = client.post(
@@ -103,72 +105,156 @@ def test_tracked_post_transport_error_is_not_resent_untracked(monkeypatch):
     ]
 
 
-def test_post_header_wait_obeys_absolute_deadline(monkeypatch):
-    client = HttpClient()
-
-    class SlowSession:
-        def __init__(self):
-            self.closed = False
-
-        def post(self, _url, **_kwargs):
-            time.sleep(1.0)
-            return _JsonResponse({"ok": True})
+class _StallingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    release = threading.Event()
+    client_ports: list[int] = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        type(self).client_ports.append(self.client_address[1])
+        # Proxied requests carry an absolute URI.
+        self.path = urlsplit(self.path).path
+        if self.path.startswith("/stall"):
+            type(self).release.wait(timeout=2)
+        if self.path.startswith("/trickle"):
+            # Every read finishes well within the socket timeout; only the
+            # total deadline can stop this body.
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "40")
+            self.end_headers()
+            try:
+                for _ in range(40):
+                    if type(self).release.wait(timeout=0.02):
+                        return
+                    self.wfile.write(b" ")
+                    self.wfile.flush()
+            except OSError:
+                pass
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def stalling_server():
+    _StallingHandler.release = threading.Event()
+    _StallingHandler.client_ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StallingHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        _StallingHandler.release.set()
+        server.shutdown()
+        server.server_close()
 
-        def close(self):
-            self.closed = True
 
-    session = SlowSession()
-    monkeypatch.setattr(http_module.requests, "Session", lambda: session)
+def test_post_header_wait_obeys_absolute_deadline(stalling_server):
+    client = HttpClient()
     started = time.monotonic()
 
     with pytest.raises(HttpTransportDeadlineExceeded):
         client.post(
-            "http://worker:5001/tasks/deadline/step/execute",
+            f"{stalling_server}/stall/tasks/deadline/step/execute",
             data={"task_id": "deadline"},
             timeout=(0.01, 1.0),
             deadline_monotonic=time.monotonic() + 0.05,
         )
 
     assert time.monotonic() - started < 0.5
-    assert session.closed is True
 
 
-def test_post_deadline_closes_response_that_arrives_after_abort(
-    monkeypatch,
-):
+def test_post_deadline_aborts_trickling_body(stalling_server):
     client = HttpClient()
-    release_response = threading.Event()
-    response_closed = threading.Event()
+    started = time.monotonic()
 
-    class LateResponse(_JsonResponse):
-        def close(self):
-            response_closed.set()
+    with pytest.raises(HttpTransportDeadlineExceeded):
+        client.post(
+            f"{stalling_server}/trickle/tasks/deadline/step/execute",
+            data={"task_id": "deadline"},
+            timeout=5,
+            deadline_monotonic=time.monotonic() + 0.2,
+        )
 
-    response = LateResponse({"ok": True})
+    assert time.monotonic() - started < 0.6
 
-    class SlowSession:
-        def post(self, _url, **_kwargs):
-            release_response.wait(timeout=1)
-            return response
 
-        def close(self):
-            return None
+def test_tracked_post_cancellation_aborts_in_flight_request(stalling_server):
+    client = HttpClient()
+    timer = threading.Timer(0.1, cancel_task, args=("cancel-me",))
+    set_thread_context(None, "cancel-me")
+    started = time.monotonic()
+    timer.start()
+    try:
+        with pytest.raises(HttpTransportCancelled):
+            client.post(
+                f"{stalling_server}/stall/tasks/cancel-me/step/execute",
+                data={"task_id": "cancel-me"},
+                timeout=5,
+                raise_on_transport_error=True,
+            )
+    finally:
+        timer.cancel()
+        clear_thread_context()
 
-    monkeypatch.setattr(
-        http_module.requests,
-        "Session",
-        lambda: SlowSession(),
-    )
+    assert time.monotonic() - started < 1.0
 
-    with pytest.raises(HttpTransportDeadlineExceeded):
-        client.post(
-            "http://worker:5001/tasks/deadline/step/execute",
-            data={"task_id": "deadline"},
-            deadline_monotonic=time.monotonic() + 0.05,
-        )
 
-    release_response.set()
-    assert response_closed.wait(timeout=1)
+def test_tracked_post_cancellation_aborts_request_sent_through_http_proxy(
+    stalling_server, monkeypatch
+):
+    monkeypatch.setenv("HTTP_PROXY", stalling_server)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+    client = HttpClient()
+    timer = threading.Timer(0.1, cancel_task, args=("via-proxy",))
+    set_thread_context(None, "via-proxy")
+    started = time.monotonic()
+    timer.start()
+    try:
+        with pytest.raises(HttpTransportCancelled):
+            client.post(
+                "http://worker.invalid:5001/stall/tasks/via-proxy/step/execute",
+                data={"task_id": "via-proxy"},
+                timeout=5,
+                raise_on_transport_error=True,
+            )
+    finally:
+        timer.cancel()
+        clear_thread_context()
+
+    assert time.monotonic() - started < 1.0
+
+
+def test_tracked_posts_reuse_pooled_connection(stalling_server):
+    client = HttpClient()
+    threads_before = threading.active_count()
+    set_thread_context("goal-pool", "task-pool")
+    try:
+        for _ in range(5):
+            assert client.post(
+                f"{stalling_server}/tasks/task-pool/step/execute",
+                data={"task_id": "task-pool"},
+                deadline_monotonic=time.monotonic() + 5,
+            ) == {"ok": True}
+    finally:
+        clear_thread_context()
+
+    assert len(set(_StallingHandler.client_ports)) == 1
+    # At most the shared deadline watcher, never one thread per request.
+    assert threading.active_count() <= threads_before + 1
 
 
 def test_deadline_governed_post_never_retargets_host_gateway(
@@ -187,11 +273,7 @@ def test_deadline_governed_post_never_retargets_host_gateway(
         def close(self):
             return None
 
-    monkeypatch.setattr(
-        http_module.requests,
-        "Session",
-        lambda: FailingSession(),
-    )
+    monkeypatch.setattr(client, "guarded_session", FailingSession())
     gateway_calls = []
     monkeypatch.setattr(
         "agent.utils.get_host_gateway_ip",
@@ -296,6 +296,40 @@ def test_ingestion_service_import_wiki_multistream_uses_index(tmp_path):
     assert report["records"][0]["article_title"] == "Multistream article"
 
 
+def test_ingestion_service_import_wiki_multistream_parallel_matches_sequential(tmp_path):
+    def _import(directory: Path, workers: int) -> str:
+        directory.mkdir()
+        corpus = directory / "dewiki-multistream.xml.bz2"
+        blob = b""
+        index_lines = []
+        for block in range(5):
+            fragment = "".join(
+                f"<page><title>Artikel {block}-{page}</title><ns>0</ns>"
+                f"<revision><text>Inhalt {block} {page}. Mehr Text zum Block.</text></revision></page>"
+                for page in range(4)
+            )
+            index_lines.append(f"{len(blob)}:{block}:Artikel {block}-0")
+            blob += bz2.compress(fragment.encode("utf-8"))
+        corpus.write_bytes(blob)
+        index = directory / "dewiki-multistream-index.txt"
+        index.write_text("\n".join(index_lines) + "\n", encoding="utf-8")
+        report = IngestionService().import_wiki_xml(
+            corpus_path=str(corpus),
+            index_path=str(index),
+            source_id="dewiki-parallel",
+            default_language="de",
+            parallel_workers=workers,
+        )
+        assert report["stats"]["input_pages"] == 20
+        return Path(str(report["jsonl_cache_path"])).read_text(encoding="utf-8")
+
+    sequential = _import(tmp_path / "sequential", 1)
+    parallel = _import(tmp_path / "parallel", 3)
+
+    assert parallel == sequential
+    assert sequential.count("\n") == 20
+
+
 def test_ingestion_service_import_wiki_corpus_dispatches_by_extension(tmp_path):
     corpus = tmp_path / "simplewiki.xml"
     corpus.write_text(
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from agent.services.jmap_client_service import JmapClient
+from agent.services.jmap_contract_service import (
+    JMAP_CORE_CAPABILITY,
+    JMAP_MAIL_CAPABILITY,
+    JmapCoreLimits,
+    JmapSessionDocument,
+)
+from agent.services.jmap_sync_service import JmapSyncService
+from agent.services.mail_provider_ports import MailProviderSession, MailSyncCursor
+from agent.services.mail_sync_state_store import JmapSyncCheckpoint, query_fingerprint
+
+_SORT = ({"property": "receivedAt", "isAscending": False},)
+
+
+def _email(email_id: str) -> dict:
+    return {
+        "id": email_id,
+        "threadId": "T1",
+        "mailboxIds": {"M1": True},
+        "keywords": {},
+        "size": 12,
+        "receivedAt": "2026-07-25T10:00:00Z",
+        "messageId": [f"{email_id}@example.com"],
+        "from": [{"email": "alice@example.com"}],
+        "to": [{"email": "bob@example.com"}],
+        "subject": f"Subject {email_id}",
+        "bodyStructure": {"type": "text/plain"},
+    }
+
+
+class _StandInJmapServer:
+    """In-memory JMAP API endpoint that resolves result references per RFC 8620 section 3.7."""
+
+    def __init__(self) -> None:
+        self.emails = {email_id: _email(email_id) for email_id in ("E1", "E3", "E4")}
+        self.email_changes = {
+            "e1": {"created": ["E3"], "updated": ["E1"], "destroyed": [], "newState": "e1b", "hasMoreChanges": True},
+            "e1b": {"created": [], "updated": ["E3"], "destroyed": ["E2"], "newState": "e2", "hasMoreChanges": False},
+        }
+        self.requests: list[list[str]] = []
+
+    def request_json(self, *, payload, **_kwargs):
+        self.requests.append([call[0] for call in payload["methodCalls"]])
+        results: dict[str, tuple[str, dict]] = {}
+        responses = []
+        for name, arguments, call_id in payload["methodCalls"]:
+            values = dict(arguments)
+            for key in [key for key in values if key.startswith("#")]:
+                reference = values.pop(key)
+                source_name, source = results[reference["resultOf"]]
+                assert source_name == reference["name"]
+                values[key[1:]] = source[reference["path"].lstrip("/")]
+            result = self._handle(name, values)
+            results[call_id] = (name, result)
+            responses.append([name, result, call_id])
+        return {"methodResponses": responses}, object()
+
+    def _handle(self, name: str, arguments: dict) -> dict:
+        if name == "Email/changes":
+            return dict(self.email_changes[arguments["sinceState"]], oldState=arguments["sinceState"])
+        if name == "Email/get":
+            ids = list(arguments["ids"])
+            return {
+                "state": "e2",
+                "list": [self.emails[value] for value in ids if value in self.emails],
+                "notFound": [value for value in ids if value not in self.emails],
+            }
+        if name == "Email/queryChanges":
+            return {"newQueryState": "q2", "added": [{"id": "E4", "index": 0}], "removed": [], "total": 3}
+        if name == "Mailbox/changes":
+            return {"newState": "m2", "created": [], "updated": [], "destroyed": [], "hasMoreChanges": False}
+        raise AssertionError(name)
+
+
+class _StateStore:
+    def __init__(self) -> None:
+        self.committed = None
+
+    def load(self, **_scope):
+        return JmapSyncCheckpoint(
+            account_id="acc-1",
+            provider_account_id="A1",
+            scope="default",
+            mailbox_state="m1",
+            email_state="e1",
+            query_state="q1",
+            query_fingerprint=query_fingerprint(filters={}, sort=_SORT),
+        )
+
+    def apply_and_commit(self, **kwargs):
+        self.committed = kwargs
+        return True
+
+
+def _sync(maximum_calls_per_request: int):
+    server = _StandInJmapServer()
+    session = JmapSessionDocument(
+        session_url="https://mail.example.com/.well-known/jmap",
+        api_url="https://mail.example.com/api",
+        download_url_template="",
+        upload_url_template="",
+        event_source_url_template="",
+        provider_account_id="A1",
+        server_capabilities=frozenset({JMAP_CORE_CAPABILITY, JMAP_MAIL_CAPABILITY}),
+        account_capabilities=frozenset({JMAP_MAIL_CAPABILITY}),
+        limits=JmapCoreLimits(100000, 4, maximum_calls_per_request, 50, 20),
+        state="s1",
+        trusted_origin="https://mail.example.com:443",
+    )
+    client = JmapClient(session=session, transport=server, authorization_headers={"Authorization": "Bearer x"})
+    service = JmapSyncService(client=client, local_account_id="acc-1", state_store=_StateStore())
+    result = service.sync(
+        MailProviderSession(session_id="s", account_id="acc-1", protocol="jmap", provider_account_id="A1"),
+        MailSyncCursor(account_id="acc-1", protocol="jmap", email_state="e1"),
+        "manual",
+    )
+    assert result.ok is True, result.reason_code
+    return result.value, server.requests
+
+
+def _summary(delta) -> tuple:
+    return (
+        [message.metadata.subject for message in delta.created],
+        [message.metadata.subject for message in delta.updated],
+        len(delta.destroyed_mail_ref_ids),
+        (delta.cursor.email_state, delta.cursor.query_state, delta.cursor.mailbox_state),
+    )
+
+
+def test_incremental_sync_chains_changes_and_get_in_one_request_per_page() -> None:
+    delta, requests = _sync(maximum_calls_per_request=16)
+
+    assert requests == [
+        ["Email/changes", "Email/get", "Email/get", "Email/queryChanges", "Mailbox/changes"],
+        ["Email/changes", "Email/get", "Email/get"],
+        ["Email/get"],
+    ]
+    assert _summary(delta) == (["Subject E3"], ["Subject E1", "Subject E4"], 1, ("e2", "q2", "m2"))
+
+
+def test_incremental_sync_without_room_for_references_falls_back_to_single_calls() -> None:
+    batched, _ = _sync(maximum_calls_per_request=16)
+    delta, requests = _sync(maximum_calls_per_request=1)
+
+    assert requests == [
+        ["Email/changes"],
+        ["Email/changes"],
+        ["Email/queryChanges"],
+        ["Email/get"],
+        ["Mailbox/changes"],
+    ]
+    assert _summary(delta) == _summary(batched)
@@ -40,7 +40,7 @@ def test_record_benchmark_sample_tracks_cost_units_in_bucket_and_timeseries(tmp_
 
     assert result["recorded"] is True
 
-    db = load_benchmarks(str(tmp_path))
+    db = load_benchmarks(str(tmp_path), include_samples=True)
     bucket = db["models"]["lmstudio:model-a"]["task_kinds"]["coding"]
     scored = score_bucket(bucket)
     points = timeseries_from_samples(bucket["samples"])
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+
+from agent.llm_benchmark_store import BenchmarkSampleStore, latency_bucket, sketch_quantile
+from agent.llm_benchmarks import (
+    benchmark_rows,
+    load_benchmarks,
+    recommend_models_for_context,
+    record_benchmark_sample,
+)
+
+DAY = 86400
+
+
+def _record(store: BenchmarkSampleStore, *, now: int, latency_ms: int = 1000, success: bool = True, **kwargs):
+    store.record(
+        provider=kwargs.pop("provider", "lmstudio"),
+        model=kwargs.pop("model", "model-a"),
+        task_kind=kwargs.pop("task_kind", "coding"),
+        success=success,
+        quality_passed=success,
+        latency_ms=latency_ms,
+        tokens_total=100,
+        cost_units=0.5,
+        now=now,
+        **kwargs,
+    )
+
+
+def test_aggregates_fold_segments_and_filter_by_context(tmp_path):
+    store = BenchmarkSampleStore(str(tmp_path))
+    start = 100 * DAY
+    _record(store, now=start, context={"role_name": "coder"})
+    _record(store, now=start + DAY, success=False, context={"role_name": "coder"})
+    _record(store, now=start + DAY, context={"role_name": "reviewer"})
+
+    overall = store.aggregates("model", task_kind="coding")["lmstudio:model-a"]
+    coder = store.aggregates("model", task_kind="coding", role_name="coder")["lmstudio:model-a"]
+
+    assert (overall["total"], overall["success"], overall["cost_units_total"]) == (3, 2, 1.5)
+    assert (coder["total"], coder["success"]) == (2, 1)
+    assert len(store.samples("model", "lmstudio:model-a", role_name="reviewer")) == 1
+
+
+def test_retention_drops_whole_expired_and_overflowing_segments(tmp_path):
+    store = BenchmarkSampleStore(str(tmp_path))
+    start = 100 * DAY
+    for day in range(4):
+        for _ in range(3):
+            _record(store, now=start + day * DAY + 60)
+
+    store.prune(now=start + 3 * DAY + 60, retention={"max_days": 2, "max_samples": 4})
+
+    samples = store.samples("model", "lmstudio:model-a")
+    # Day 0 expired; days 1-3 hold 9 samples, so day 1 is dropped as a whole
+    # segment while days 2-3 (6 samples) still cover max_samples.
+    assert sorted({sample["ts"] // DAY for sample in samples}) == [102, 103]
+    assert store.aggregates("model")["lmstudio:model-a"]["total"] == 6
+
+
+def test_latency_sketch_quantile_is_an_upper_bound_capped_at_max():
+    sketch: dict[str, int] = {}
+    for latency in (10_000, 12_000, 18_000, 25_000, 30_000):
+        key = str(latency_bucket(latency))
+        sketch[key] = sketch.get(key, 0) + 1
+
+    p50 = sketch_quantile(sketch, 0.5)
+    assert 18_000 <= p50 <= 18_000 * 2 ** (1 / 8)
+    assert sketch_quantile(sketch, 0.95, max_value=30_000) == 30_000
+
+
+def test_legacy_json_is_imported_and_reimported_without_losing_native_samples(tmp_path):
+    legacy = {
+        "models": {
+            "openai:gpt-4o-mini": {
+                "provider": "openai",
+                "model": "gpt-4o-mini",
+                "task_kinds": {"analysis": {"samples": [{"ts": 200 * DAY, "success": True, "latency_ms": 400}]}},
+            }
+        },
+        "updated_at": 200 * DAY,
+    }
+    path = tmp_path / "llm_model_benchmarks.json"
+    path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    record_benchmark_sample(
+        data_dir=str(tmp_path),
+        agent_cfg={},
+        provider="lmstudio",
+        model="model-a",
+        task_kind="analysis",
+        success=True,
+        quality_gate_passed=True,
+        latency_ms=900,
+        tokens_total=10,
+    )
+    legacy["models"]["openai:gpt-4o-mini"]["task_kinds"]["analysis"]["samples"].append(
+        {"ts": 200 * DAY + 5, "success": False, "latency_ms": 500}
+    )
+    path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    ranked = recommend_models_for_context(data_dir=str(tmp_path), task_kind="analysis", min_samples=1, limit=5)
+    counts = {item["model"]: item["sample_count"] for item in ranked}
+    assert counts == {"gpt-4o-mini": 2, "model-a": 1}
+
+    db = load_benchmarks(str(tmp_path), include_samples=True)
+    imported = db["models"]["openai:gpt-4o-mini"]["task_kinds"]["analysis"]["samples"]
+    assert "quality_passed" not in imported[0]
+    assert db["models"]["openai:gpt-4o-mini"]["overall"]["samples"] == imported
+    totals = load_benchmarks(str(tmp_path))["models"]["openai:gpt-4o-mini"]["task_kinds"]["analysis"]
+    assert (totals["total"], totals["failed"], "samples" in totals) == (2, 1, False)
+    rows, meta = benchmark_rows(data_dir=str(tmp_path), task_kind="analysis")
+    assert {row["id"] for row in rows} == {"openai:gpt-4o-mini", "lmstudio:model-a"}
+    assert meta["updated_at"] is not None
+
+    # Once imported, the samples belong to the store and outlive the JSON file.
+    path.unlink()
+    ranked = recommend_models_for_context(data_dir=str(tmp_path), task_kind="analysis", min_samples=1, limit=5)
+    assert {item["model"]: item["sample_count"] for item in ranked} == {"gpt-4o-mini": 2, "model-a": 1}
@@ -247,6 +247,7 @@ def test_migration_hashes_alias_scope_and_real_restore(tmp_path: Path) -> None:
     assert restored.status == "restored"
     assert json.loads(command.target_accounts_path.read_text(encoding="utf-8")) == original_target
     assert not command.target_metadata_path.exists()
+    assert not command.target_metadata_path.with_suffix(".sqlite3").exists()
     assert not grant_path.exists()
 
 
@@ -267,3 +268,20 @@ def test_restore_rejects_tampered_backup(tmp_path: Path) -> None:
         approval_ref="approval",
     )
     assert restored.reason_code == "backup_content_hash_mismatch"
+
+
+def test_migration_matches_sqlite_rows_and_restore_rolls_back_database(tmp_path: Path) -> None:
+    command = _legacy_command(tmp_path)
+    store = MailMetadataStore(store_path=command.target_metadata_path)
+    synced = _record(uid=7, message_id="<one>", content_hash="h", size=10)
+    store.upsert_message(message_ref=synced.message_ref, metadata=synced.metadata)
+    assert not command.target_metadata_path.exists()
+    report = MailMigrationService().execute(command)
+    assert report.status == "complete"
+    assert (report.matched, report.unmatched) == (1, 0)
+    assert [item["message_ref"]["mail_ref_id"] for item in store.list_messages()] == [synced.message_ref.mail_ref_id]
+    extra = _record(uid=8, message_id="<two>")
+    store.upsert_message(message_ref=extra.message_ref, metadata=extra.metadata)
+    restored = MailMigrationService().restore(command, migration_id=report.migration_id, approval_ref="approval")
+    assert restored.status == "restored"
+    assert [item["message_ref"]["mail_ref_id"] for item in store.list_messages()] == [synced.message_ref.mail_ref_id]
@@ -76,3 +76,100 @@ def test_metadata_store_uses_opaque_id_and_requires_verified_access_for_body(tmp
     cursor = MailSyncCursor(account_id="a", protocol="imap", email_state="s1")
     store.save_sync_cursor(cursor)
     assert store.get_sync_cursor(account_id="a", protocol="imap") == cursor
+
+
+def _message(uid: int, **metadata) -> tuple[MailMessageRefV2, MailMessageMetadata]:
+    mail_ref_id = stable_mail_ref_id(account_id="a", protocol="imap", stable_identity=f"uid-{uid}")
+    ref = MailMessageRefV2(mail_ref_id, "a", "imap", {"mailbox": "INBOX", "uid": uid}, 1)
+    return ref, MailMessageMetadata.from_mapping(metadata)
+
+
+def test_metadata_store_bulk_upsert_and_sql_search(tmp_path) -> None:
+    store = MailMetadataStore(store_path=tmp_path / "metadata.json")
+    batch = [
+        _message(1, subject="Build 50% done", **{"from": "CI@example.test"}, keywords=["$seen"],
+                 mailbox_ref_ids=["inbox"], date="2029-01-02T10:00:00Z"),
+        _message(2, subject="Build failed", **{"from": "ci@example.test"}, keywords=["$flagged"],
+                 mailbox_ref_ids=["inbox", "alerts"], date="2029-01-05T10:00:00Z"),
+        _message(3, subject="Lunch", **{"from": "bob@example.test"}, to=["Team@example.test"], date="not-a-date"),
+    ]
+    assert store.upsert_many(batch) == 3
+    store.upsert_many(batch[:1])
+    assert [row["metadata"]["subject"] for row in store.list_messages(account_id="a")] == [
+        "Build failed",
+        "Lunch",
+        "Build 50% done",
+    ]
+
+    def subjects(**kwargs) -> list[str]:
+        return [item["metadata"]["subject"] for item in search_mail_metadata(store=store, **kwargs)["results"]]
+
+    assert subjects(filters={"from": "ci@", "unread": True}) == ["Build failed"]
+    assert subjects(filters={"subject": "50%"}) == ["Build 50% done"]
+    assert subjects(filters={"mailbox": "alerts", "starred": True}) == ["Build failed"]
+    assert subjects(filters={"to": "team@"}) == ["Lunch"]
+    assert subjects(filters={"date_from": "2029-01-03T00:00:00Z"}) == ["Build failed", "Lunch"]
+
+    ref, _metadata = batch[1]
+    store.store_body(mail_ref_id=ref.mail_ref_id, text_body="Stack TRACE here", html_body="",
+                     access=_access(ref.mail_ref_id))
+    assert subjects(body_contains="stack trace") == []
+    assert subjects(body_contains="stack trace", include_body_search=True) == ["Build failed"]
+    assert store.delete_many([ref.mail_ref_id, "missing"]) == 1
+    assert subjects(body_contains="stack trace", include_body_search=True) == []
+    assert len(store.list_locator_aliases(account_id="a")) == 3
+
+
+def test_metadata_store_imports_json_store_written_by_migration(tmp_path) -> None:
+    path = tmp_path / "metadata.json"
+    ref, metadata = _message(7, subject="Imported")
+    path.write_text(
+        json.dumps(
+            {
+                "schema": "mail_metadata_store.v2",
+                "messages": [
+                    {
+                        "message_ref": ref.to_dict(),
+                        "metadata": metadata.to_dict(),
+                        "stale": True,
+                        "body": {},
+                        "body_scope": "metadata_only",
+                        "attachments": [],
+                        "updated_at": "2029-01-01T00:00:00Z",
+                    }
+                ],
+                "sync_cursors": [{"account_id": "a", "protocol": "imap", "scope": "default", "email_state": "s9"}],
+                "locator_aliases": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    store = MailMetadataStore(store_path=path)
+
+    assert store.get_by_mail_ref_id(ref.mail_ref_id)["stale"] is True
+    assert store.get_sync_cursor(account_id="a", protocol="imap").email_state == "s9"
+    assert store.database_path == tmp_path / "metadata.sqlite3"
+    path.write_text(json.dumps({"schema": "mail_metadata_store.v1"}), encoding="utf-8")
+    with pytest.raises(ValueError, match="schema_unsupported"):
+        store.list_messages()
+
+
+def test_undated_json_row_never_overwrites_stored_body(tmp_path) -> None:
+    path = tmp_path / "metadata.json"
+    ref, metadata = _message(8, subject="Undated")
+
+    def write_json(subject: str) -> None:
+        row = {"message_ref": ref.to_dict(), "metadata": {**metadata.to_dict(), "subject": subject}}
+        payload = {"schema": "mail_metadata_store.v2", "messages": [row], "sync_cursors": [], "locator_aliases": []}
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+    write_json("Undated")
+    store = MailMetadataStore(store_path=path)
+    assert store.get_by_mail_ref_id(ref.mail_ref_id)["metadata"]["subject"] == "Undated"
+    store.store_body(mail_ref_id=ref.mail_ref_id, text_body="kept body", html_body="", access=_access(ref.mail_ref_id))
+
+    write_json("Undated again")
+    row = store.get_by_mail_ref_id(ref.mail_ref_id)
+
+    assert row["body_scope"] == "body_excerpt"
+    assert row["metadata"]["subject"] == "Undated"
@@ -148,3 +148,178 @@ def test_resolve_token_prefers_process_env_username_over_dotenv(monkeypatch) ->
     _ = hub_loader.resolve_token("http://hub.local", "pw123")
 
     assert calls["username"] == "bob"
+
+
+class _StubHub:
+    """Local HTTP/1.1 hub with per-request latency, keep-alive and ETags."""
+
+    def __init__(self, routes: dict, *, delay: float = 0.0) -> None:
+        import http.server
+        import threading
+
+        self.routes = routes
+        self.delay = delay
+        self.requests: list[tuple[str, str]] = []
+        self.proxied: list[tuple[str, str]] = []
+        self.connections: set[tuple] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+        stub = self
+
+        class _Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                import hashlib
+                import json
+                import time
+
+                if self.path.startswith("http://"):
+                    # Als Forward-Proxy angesprochen: absolute URL auf den Pfad kürzen.
+                    stub.proxied.append((self.path, self.headers.get("Proxy-Authorization") or ""))
+                    self.path = "/" + self.path.split("://", 1)[1].partition("/")[2]
+                with lock:
+                    stub.requests.append((self.path, self.headers.get("If-None-Match") or ""))
+                    stub.connections.add(self.client_address)
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.delay)
+                    if self.path not in stub.routes:
+                        self.send_response(404)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    body = json.dumps({"data": stub.routes[self.path]}).encode()
+                    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with lock:
+                        stub.in_flight -= 1
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "_StubHub":
+        from client_surfaces.operator_tui import hub_loader
+
+        hub_loader.reset_hub_transport()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        from client_surfaces.operator_tui import hub_loader
+
+        hub_loader.reset_hub_transport()
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def test_fetch_audit_parallelizes_datasets_and_trace_details() -> None:
+    import time
+
+    from client_surfaces.operator_tui import hub_loader
+
+    traces = [{"trace_id": f"trace-{i}", "request_kind": "chat.ask"} for i in range(12)]
+    routes: dict = {"/debug/llm-requests?limit=120": {"traces": traces}, "/api/system/stats": {"uptime_seconds": 1}}
+    routes.update({f"/debug/llm-requests/trace-{i}": {"final_prompt_redacted": f"prompt {i}"} for i in range(12)})
+
+    with _StubHub(routes, delay=0.1) as hub:
+        started = time.perf_counter()
+        result = hub_loader._fetch_audit(hub.base, "jwt.token.sig", 2.0)
+        elapsed = time.perf_counter() - started
+
+    datasets = dict((result.payload or {}).get("datasets") or {})
+    assert datasets["llm.requests.chat_prompt.trace-11"]["final_prompt_redacted"] == "prompt 11"
+    assert result.payload["available_count"] == 2
+    # 9 Datasets + 12 Details = 21 Requests à 100 ms: sequenziell > 2 s.
+    assert len(hub.requests) == 21
+    assert elapsed < 1.2
+    assert hub.max_in_flight <= hub_loader._MAX_PARALLEL_REQUESTS
+    assert len(hub.connections) <= hub_loader._MAX_PARALLEL_REQUESTS
+
+
+def test_hub_get_revalidates_cached_bodies_with_etag() -> None:
+    from client_surfaces.operator_tui import hub_loader
+
+    goals = [{"id": "g1", "status": "running", "summary": "Ship it"}]
+    with _StubHub({"/goals": goals}) as hub:
+        first = hub_loader.fetch_hub_section("goals", hub.base, "jwt.token.sig")
+        second = hub_loader.fetch_hub_section("goals", hub.base, "jwt.token.sig")
+        hub.routes["/goals"] = [*goals, {"id": "g2", "status": "done"}]
+        third = hub_loader.fetch_hub_section("goals", hub.base, "jwt.token.sig")
+
+    assert first.payload == second.payload
+    assert len(third.payload["items"]) == 2
+    assert [bool(etag) for _path, etag in hub.requests] == [False, True, True]
+    assert len(hub.connections) == 1
+
+
+def test_fetch_hub_sections_loads_sections_concurrently() -> None:
+    import time
+
+    from client_surfaces.operator_tui import hub_loader
+
+    routes = {"/goals": [{"id": "g1", "status": "done"}], "/artifacts": [{"id": "a1"}]}
+    with _StubHub(routes, delay=0.3) as hub:
+        started = time.perf_counter()
+        results = hub_loader.fetch_hub_sections(["goals", "artifacts", "unknown"], hub.base, "jwt.token.sig")
+        elapsed = time.perf_counter() - started
+
+    assert results["goals"].state is PanelState.HEALTHY
+    assert results["artifacts"].payload["items"][0]["id"] == "a1"
+    assert results["unknown"] is None
+    assert elapsed < 0.55
+
+
+def test_hub_requests_go_through_http_proxy_from_environment(monkeypatch) -> None:
+    from client_surfaces.operator_tui import hub_loader
+
+    for name in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    goals = [{"id": "g1", "status": "running", "summary": "Ship it"}]
+    with _StubHub({"/goals": goals}) as proxy:
+        monkeypatch.setenv("HTTP_PROXY", proxy.base.replace("http://", "http://ops:s3cret@"))
+        result = hub_loader.fetch_hub_section("goals", "http://hub.invalid:5000", "jwt.token.sig")
+        monkeypatch.setenv("NO_PROXY", "hub.invalid")
+        assert hub_loader._proxy_for("http", "hub.invalid") == ""
+
+    assert result.payload["items"][0]["id"] == "g1"
+    assert proxy.proxied == [("http://hub.invalid:5000/goals", "Basic b3BzOnMzY3JldA==")]
+
+
+def test_registry_load_many_batches_hub_sections_and_serves_next_load() -> None:
+    from client_surfaces.operator_tui.adapters import SectionAdapterRegistry
+
+    routes = {"/goals": [{"id": "g1", "status": "done"}], "/artifacts": [{"id": "a1"}]}
+    with _StubHub(routes) as hub:
+        registry = SectionAdapterRegistry(endpoint=hub.base, token="jwt.token.sig")
+        results = registry.load_many(["goals", "artifacts", "goals"])
+        prefetched = registry.load("artifacts")
+        reloaded = registry.load("artifacts")
+
+    assert set(results) == {"goals", "artifacts"}
+    assert prefetched is results["artifacts"]
+    assert reloaded.payload == prefetched.payload
+    # Zwei Requests aus dem Batch, einer für das zweite load() (Prefetch wird nur einmal verbraucht).
+    assert sorted(path for path, _etag in hub.requests) == ["/artifacts", "/artifacts", "/goals"]
@@ -179,6 +179,43 @@ def test_upsert_skips_unchanged_source_hash_and_is_idempotent() -> None:
     assert client.calls["upsert"] == upsert_calls
 
 
+def test_multi_batch_upsert_overlaps_next_diff_with_current_write() -> None:
+    class _OverlapClient(FakeQdrantClient):
+        def __init__(self):
+            super().__init__()
+            self.armed_retrieves = -1
+            self.write_started = threading.Event()
+            self.next_diff_done = threading.Event()
+            self.overlapped = False
+
+        def retrieve(self, collection_name, point_ids):
+            if self.armed_retrieves >= 0:
+                self.armed_retrieves += 1
+                if self.armed_retrieves == 2:
+                    # Diff of the second batch: only completes while the first write is in flight.
+                    self.write_started.wait(5.0)
+                    self.next_diff_done.set()
+            return super().retrieve(collection_name, point_ids)
+
+        def upsert(self, collection_name, points):
+            if self.armed_retrieves >= 0 and not self.write_started.is_set():
+                self.write_started.set()
+                self.overlapped = self.next_diff_done.wait(5.0)
+            super().upsert(collection_name, points)
+
+    client, store = _store(client=_OverlapClient())
+    seed = [_point(f"p{index}", (1.0, 0.0, 0.0)) for index in range(6)]
+    store.rebuild(seed[:3], compatibility=_compatibility())
+    points = [replace(point, source_hash=f"new-{point.record_id}") for point in seed[:2]] + seed[2:]
+    client.armed_retrieves = 0
+
+    result = store.upsert(points, batch_size=2)
+
+    assert client.overlapped is True
+    assert result.status == "ok"
+    assert (result.upserted, result.skipped, result.failed) == (5, 1, 0)
+
+
 def test_direct_collection_upsert_rejects_cross_scope_points() -> None:
     client, store = _store()
     collection = store.prepare_collection(
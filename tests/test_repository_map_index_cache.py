@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import time
+
+from agent.repository_map_engine import RepositoryMapEngine
+from agent.repository_map_index import RepositoryMapParseCache, SymbolTrigramIndex
+
+
+def _write_sources(root, count: int) -> list:
+    paths = []
+    for index in range(count):
+        path = root / "agent" / f"module_{index}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"def handler_{index}():\n    pass\n\nclass Widget{index}:\n    pass\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_trigram_index_returns_superset_of_substring_matches():
+    index = SymbolTrigramIndex()
+    index.update("agent/task_queue.py", ["TaskQueue", "enqueue_task"])
+    index.update("agent/scheduler.py", ["Scheduler.tick"])
+    index.update("worker/retrieval/codecompass_budgeting.py", ["resolve_codecompass_budget"])
+
+    assert index.candidates("queue") == {"agent/task_queue.py"}
+    assert index.candidates("codecompass") == {"worker/retrieval/codecompass_budgeting.py"}
+    assert index.candidates("tick") == {"agent/scheduler.py"}
+    assert index.candidates("missing") == set()
+
+    index.remove("agent/task_queue.py")
+    assert index.candidates("queue") == set()
+
+
+def test_search_only_scores_indexed_candidates_and_follows_graph_swaps():
+    engine = RepositoryMapEngine(repo_root="/tmp/ananta-repository-map-index", max_files=10)
+    engine._symbol_graph = {
+        "agent/task_queue.py": ["TaskQueue"],
+        "agent/scheduler.py": ["Scheduler"],
+    }
+    assert [chunk.source for chunk in engine.search("queue handling")] == ["agent/task_queue.py"]
+
+    engine._symbol_graph = {"agent/scheduler.py": ["Scheduler", "QueuePolicy"]}
+    assert [chunk.source for chunk in engine.search("queue handling")] == ["agent/scheduler.py"]
+
+
+def test_parse_cache_survives_restart_and_skips_unchanged_files(tmp_path, monkeypatch):
+    sources = _write_sources(tmp_path, 3)
+    cache_path = tmp_path / ".rag" / "repository_map" / "parse_cache.json"
+    first = RepositoryMapEngine(tmp_path, cache_path=cache_path, parse_workers=1)
+    monkeypatch.setattr(first, "_tracked_files", lambda: list(sources))
+    first.build(force=True)
+    assert cache_path.exists()
+
+    second = RepositoryMapEngine(tmp_path, cache_path=cache_path, parse_workers=1)
+    monkeypatch.setattr(second, "_tracked_files", lambda: list(sources))
+    parsed: list[str] = []
+    original = second._parse_file
+
+    def _counting_parse(file_path, rel, state):
+        parsed.append(rel)
+        return original(file_path, rel, state)
+
+    monkeypatch.setattr(second, "_parse_file", _counting_parse)
+    second.build()
+
+    assert parsed == []
+    assert second._symbol_graph == first._symbol_graph
+    assert [chunk.source for chunk in second.search("handler_1")] == ["agent/module_1.py"]
+
+    sources[0].write_text("def renamed_entrypoint():\n    pass\n", encoding="utf-8")
+    second._last_scan_ts = 0.0
+    second.build()
+    assert parsed == ["agent/module_0.py"]
+    assert second._symbol_graph["agent/module_0.py"] == ["renamed_entrypoint"]
+
+
+def test_parse_cache_discards_entries_from_other_parser_versions(tmp_path):
+    cache_path = tmp_path / "parse_cache.json"
+    cache_path.write_text(
+        json.dumps({"parser_version": "0:80", "entries": {"a.py": [1.0, 10, ["old"]]}}),
+        encoding="utf-8",
+    )
+
+    cache = RepositoryMapParseCache(cache_path, parser_version="1:80")
+
+    assert cache.get("a.py", (1.0, 10)) is None
+    assert len(cache) == 0
+
+
+def test_parallel_initial_parse_matches_sequential_parse(tmp_path, monkeypatch):
+    sources = _write_sources(tmp_path, 24)
+    sequential = RepositoryMapEngine(tmp_path, parse_workers=1)
+    monkeypatch.setattr(sequential, "_tracked_files", lambda: list(sources))
+    sequential.build(force=True)
+
+    parallel = RepositoryMapEngine(tmp_path, parse_workers=2)
+    monkeypatch.setattr(parallel, "PARALLEL_PARSE_MIN_FILES", 1)
+    monkeypatch.setattr(parallel, "_effective_parse_workers", lambda pending_count: 2)
+    monkeypatch.setattr(parallel, "_tracked_files", lambda: list(sources))
+    parallel.build(force=True)
+
+    assert parallel._symbol_graph == sequential._symbol_graph
+
+
+def test_search_rescans_only_on_git_index_or_worktree_probe_or_invalidate(tmp_path, monkeypatch):
+    sources = _write_sources(tmp_path, 2)
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "index").write_bytes(b"DIRC-1")
+    engine = RepositoryMapEngine(tmp_path, parse_workers=1, worktree_probe_interval_seconds=0)
+    sweeps: list[int] = []
+    monkeypatch.setattr(engine, "_tracked_files", lambda: sweeps.append(1) or list(sources))
+
+    assert [chunk.source for chunk in engine.search("handler_1")] == ["agent/module_1.py"]
+    engine.search("handler_0")
+    assert len(sweeps) == 1
+
+    sources[0].write_text("def staged_entrypoint():\n    pass\n", encoding="utf-8")
+    (git_dir / "index").write_bytes(b"DIRC-22")
+    assert [chunk.source for chunk in engine.search("staged_entrypoint")] == ["agent/module_0.py"]
+    assert len(sweeps) == 2
+
+    # Unstaged edits are found by the off-query probe, not by search() itself.
+    sources[1].write_text("def unstaged_entrypoint():\n    return 1\n", encoding="utf-8")
+    assert engine.search("unstaged_entrypoint") == []
+    assert len(sweeps) == 2
+    assert engine.probe_worktree() is True
+    assert [chunk.source for chunk in engine.search("unstaged_entrypoint")] == ["agent/module_1.py"]
+    assert len(sweeps) == 3
+    assert engine.probe_worktree() is False
+    engine.search("unstaged_entrypoint")
+    assert len(sweeps) == 3
+
+    engine.invalidate()
+    engine.search("handler_1")
+    assert len(sweeps) == 4
+
+    engine._last_scan_ts -= engine.rescan_interval_seconds
+    engine.search("handler_1")
+    assert len(sweeps) == 5
+
+
+def test_background_worktree_probe_marks_unstaged_edits_stale(tmp_path):
+    sources = _write_sources(tmp_path, 2)
+    engine = RepositoryMapEngine(tmp_path, parse_workers=1, worktree_probe_interval_seconds=0.02)
+    engine.search("handler_1")
+    assert engine._stale is False
+
+    sources[0].write_text("def edited_outside_git():\n    pass\n", encoding="utf-8")
+    deadline = time.monotonic() + 5
+    while not engine._stale and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert engine._stale is True
+    assert [chunk.source for chunk in engine.search("edited_outside_git")] == ["agent/module_0.py"]
@@ -46,3 +46,19 @@ def test_csp_swagger_policy_allows_inline(client):
     csp = response.headers.get("Content-Security-Policy", "")
     assert "script-src 'self' 'unsafe-inline';" in csp
     assert "style-src 'self' 'unsafe-inline';" in csp
+
+
+def test_json_get_responses_carry_etag_and_revalidate(client, admin_auth_header):
+    first = client.get("/goals", headers=admin_auth_header)
+    etag = first.headers.get("ETag")
+    assert first.status_code == 200
+    assert etag
+
+    revalidated = client.get("/goals", headers={**admin_auth_header, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert revalidated.headers.get("ETag") == etag
+
+    changed = client.get("/goals", headers={**admin_auth_header, "If-None-Match": '"stale"'})
+    assert changed.status_code == 200
+    assert changed.get_json() == first.get_json()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+
+from agent.semantic_fallback_index import Bm25FallbackIndex, split_chunks
+from agent.semantic_search_engine import SemanticSearchEngine
+
+
+def _doc(root, name: str, text: str):
+    path = root / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_bm25_ranks_rare_terms_and_returns_best_chunk_per_source(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    files = [
+        _doc(
+            docs, "worker.md", "The worker retries timeout errors.\n" + "filler text " * 400 + "\nworker timeout budget"
+        ),
+        _doc(docs, "hub.md", "The hub schedules tasks for every worker."),
+        _doc(docs, "notes.md", "Unrelated notes about gardening."),
+    ]
+    index = Bm25FallbackIndex(tmp_path / "bm25", chunk_chars=400)
+
+    assert index.sync(files) == 3
+    hits = index.search(["timeout", "worker"], top_k=5)
+
+    assert [hit.source for hit in hits] == [str(files[0]), str(files[1])]
+    assert "timeout" in hits[0].content
+    assert len(index) > 3
+
+
+def test_sync_only_retokenizes_changed_files_and_drops_removed_ones(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    first = _doc(docs, "a.md", "alpha retrieval pipeline")
+    second = _doc(docs, "b.md", "beta ingestion manifest")
+    index_dir = tmp_path / "bm25"
+    assert Bm25FallbackIndex(index_dir).sync([first, second]) == 2
+
+    reopened = Bm25FallbackIndex(index_dir)
+    assert reopened.sync([first, second]) == 0
+    assert [hit.source for hit in reopened.search(["manifest"])] == [str(second)]
+
+    second.write_text("beta ingestion changed", encoding="utf-8")
+    os.utime(second, (1_000_000, 1_000_000))
+    reopened.close()
+    assert reopened.sync([first, second]) == 1
+    assert reopened.search(["manifest"]) == []
+
+    assert reopened.sync([first]) == 0
+    assert reopened.search(["ingestion"]) == []
+    assert [hit.source for hit in reopened.search(["alpha"])] == [str(first)]
+
+
+def test_incremental_sync_merges_only_the_runs_the_tier_policy_selects(tmp_path, monkeypatch):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    files = [_doc(docs, f"{name}.md", f"{name} shared corpus words") for name in "abcdefgh"]
+    index = Bm25FallbackIndex(tmp_path / "bm25")
+    assert index.sync(files) == 8
+
+    read: list[list[str]] = []
+    iter_segments = Bm25FallbackIndex._iter_segments
+
+    def recording(self, sources):
+        read.append(sorted(sources))
+        return iter_segments(self, sources)
+
+    monkeypatch.setattr(Bm25FallbackIndex, "_iter_segments", recording)
+    for step, path in enumerate(files[:4], start=1):
+        path.write_text(f"{path.stem} rewritten corpus words", encoding="utf-8")
+        os.utime(path, (2_000_000 + step, 2_000_000 + step))
+        assert index.sync(files) == 1
+
+    changed = sorted(str(path) for path in files[:4])
+    assert read == [[changed[0]], [changed[1]], [changed[2]], [changed[3]], changed]
+    assert len(list((tmp_path / "bm25" / "runs").iterdir())) == 2
+    assert len(index) == 8
+    assert sorted(hit.source for hit in index.search(["rewritten"], top_k=10)) == changed
+    assert len(index.search(["shared"], top_k=10)) == 4
+
+
+def test_split_chunks_respects_size_and_keeps_text():
+    text = "\n".join(f"line {index} with some words" for index in range(200))
+    chunks = split_chunks(text, 300)
+
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert "".join(chunks).replace("\n", "") == text.replace("\n", "")
+
+
+def test_semantic_search_engine_serves_fallback_from_persisted_index(tmp_path, monkeypatch):
+    monkeypatch.delenv("ANANTA_ENABLE_LLAMAINDEX_EMBEDDINGS", raising=False)
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    _doc(docs, "README.md", "Local fallback retrieval content.")
+
+    engine = SemanticSearchEngine([docs], persist_dir=tmp_path / ".rag" / "llamaindex")
+    chunks = engine.search("fallback retrieval")
+
+    assert [chunk.source for chunk in chunks] == [str(docs / "README.md")]
+    assert chunks[0].metadata["ranking"] == "bm25"
+    assert (tmp_path / ".rag" / "llamaindex" / "fallback_bm25" / "index.json").exists()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import time
 import pytest
 from copy import deepcopy
 
@@ -102,6 +103,58 @@ class TestWorldState:
         assert ws.agents["a1"].inventory["food"] == pytest.approx(7.0)
 
 
+# ── SIM-003: WorldState Merkle hash ──────────────────────────────────────────
+
+class TestStateHashCache:
+    def test_state_hash_reuses_unchanged_entity_digests(self):
+        ws = _make_world(agents=3)
+        h1 = ws.state_hash()
+        cached = dict(ws._entity_digests)
+        ws.agents["a2"].inventory["food"] = 5.0
+        h2 = ws.state_hash()
+        assert h2 != h1
+        assert ws._entity_digests[("agents", "a1")] is cached[("agents", "a1")]
+        assert ws._entity_digests[("agents", "a2")] != cached[("agents", "a2")]
+        ws.agents["a2"].inventory["food"] = 2.0
+        assert ws.state_hash() == h1
+
+    def test_state_hash_matches_after_roundtrip(self):
+        from simulation.models.world_state import WorldState
+        ws = _make_world(agents=2)
+        ws.state_hash()
+        ws.agents["a1"].health = 0.3
+        assert WorldState.from_dict(ws.to_dict()).state_hash() == ws.state_hash()
+
+    def test_state_hash_reserialises_only_dirty_entities(self, monkeypatch):
+        from simulation.models.world_state import AgentState
+        ws = _make_world(agents=3)
+        ws.state_hash()
+        calls = []
+        original = AgentState.as_dict
+        monkeypatch.setattr(AgentState, "as_dict", lambda self: calls.append(self.id) or original(self))
+        ws.state_hash()
+        assert calls == []
+        ws.agents["a3"].short_term_memory.append({"tick": 1, "text": "saw smoke"})
+        h = ws.state_hash()
+        assert calls == ["a3"]
+        ws.agents["a3"].short_term_memory[0]["text"] = "saw fire"
+        assert ws.state_hash() != h
+
+
+    def test_state_hash_tracks_edits_on_copied_and_unpickled_worlds(self):
+        import copy
+        import pickle
+
+        from simulation.models.world_state import WorldState
+        ws = _make_world(agents=2)
+        h = ws.state_hash()
+        for clone in (copy.deepcopy(ws), pickle.loads(pickle.dumps(ws))):
+            assert clone.state_hash() == h
+            clone.agents["a1"].inventory["food"] = 99.0
+            assert clone.state_hash() != h
+            assert clone.state_hash() == WorldState.from_dict(clone.to_dict()).state_hash()
+        assert ws.state_hash() == h
+
 # ── SIM-011: RelationshipGraph ────────────────────────────────────────────────
 
 class TestRelationshipGraph:
@@ -515,6 +568,31 @@ class TestAdapters:
         from simulation.adapters.dummy import DummyModelAdapter
         assert DummyModelAdapter().provider == "dummy"
 
+    def test_http_adapter_call_is_interrupted_by_cancel_event(self):
+        import socket
+        import threading
+
+        from simulation.adapters.base import CancelEvent
+        from simulation.adapters.ollama import OllamaAdapter
+
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        accepted = []
+        threading.Thread(target=lambda: accepted.append(listener.accept()), daemon=True).start()
+        try:
+            adapter = OllamaAdapter(base_url=f"http://127.0.0.1:{listener.getsockname()[1]}", timeout=10)
+            cancel = CancelEvent()
+            threading.Timer(0.2, cancel.set).start()
+            started = time.monotonic()
+            resp = adapter.generate([{"role": "user", "content": "act"}], agent_id="a1", cancel_event=cancel)
+            assert time.monotonic() - started < 5
+            assert "cancelled" in resp.parse_error
+        finally:
+            for conn, _ in accepted:
+                conn.close()
+            listener.close()
+
 
 # ── SIM-019: ModelStrategyResolver ───────────────────────────────────────────
 
@@ -578,6 +656,61 @@ class TestBudgetGuard:
         assert v is None
 
 
+# ── SIM-022: Checkpointing ───────────────────────────────────────────────────
+
+class TestCheckpointManager:
+    def test_delta_chain_restores_every_tick(self, tmp_path):
+        from simulation.engine.checkpoint import CheckpointManager
+        ws = _make_world(agents=3)
+        mgr = CheckpointManager(tmp_path, full_every=3)
+        expected = {}
+        for tick in range(7):
+            ws.agents["a1"].health = 1.0 - tick * 0.1
+            if tick == 4:
+                del ws.agents["a3"]
+            path = mgr.save(ws)
+            expected[path.name] = (ws.to_dict(), ws.state_hash())
+            ws.advance_tick()
+
+        kinds = [c["kind"] for c in mgr.list_checkpoints()]
+        assert kinds == ["full", "delta", "delta", "full", "delta", "delta", "full"]
+        for name, (world, state_hash) in expected.items():
+            restored = mgr.load(tmp_path / name)
+            assert restored.to_dict() == world
+            assert restored.state_hash() == state_hash
+
+    def test_resaving_a_label_replaces_its_index_entry(self, tmp_path):
+        from simulation.engine.checkpoint import CheckpointManager
+        ws = _make_world()
+        mgr = CheckpointManager(tmp_path)
+        mgr.save(ws, label="latest")
+        ws.advance_tick()
+        mgr.save(ws, label="other")
+        ws.advance_tick()
+        saved = mgr.save(ws, label="latest")
+
+        lines = (tmp_path / "index.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["file"] for line in lines] == ["other.ckpt.gz", saved.name]
+        assert [c["tick"] for c in CheckpointManager(tmp_path).list_checkpoints()] == [2, 1]
+        assert mgr.load(saved).tick == 2
+        assert mgr.load(tmp_path / "other.ckpt.gz").tick == 1
+
+    def test_list_checkpoints_reads_sidecar_and_legacy_files(self, tmp_path):
+        from simulation.engine.checkpoint import CheckpointManager
+        ws = _make_world()
+        legacy = {"saved_at": 1.0, "state_hash": "abc", "world": ws.to_dict()}
+        (tmp_path / "tick_000000.json").write_text(json.dumps(legacy), encoding="utf-8")
+        mgr = CheckpointManager(tmp_path)
+        ws.advance_tick()
+        saved = mgr.save(ws)
+
+        listing = mgr.list_checkpoints()
+        assert [c["file"] for c in listing] == ["tick_000000.json", saved.name]
+        assert listing[1]["tick"] == 1
+        assert mgr.latest() == saved
+        assert mgr.load(tmp_path / "tick_000000.json").tick == 0
+
+
 # ── SIM-021: TickRunner (integration) ────────────────────────────────────────
 
 class TestTickRunner:
@@ -616,6 +749,190 @@ class TestTickRunner:
         runner.run_tick(ws, budget)
         assert ws.state_hash() != h0
 
+    def _run_ticks(self, max_concurrency, ticks=4, agents=6):
+        from simulation.adapters.model_strategy import ModelStrategyResolver
+        from simulation.engine.budget_guard import BudgetGuard
+        from simulation.engine.tick_runner import TickRunner
+        from simulation.models.scenario import BudgetConfig, ScenarioConfig
+
+        ws = _make_world(agents=agents)
+        runner = TickRunner(strategy_resolver=ModelStrategyResolver(ScenarioConfig(name="t")),
+                            max_concurrency=max_concurrency)
+        budget = BudgetGuard(BudgetConfig(max_ticks=100))
+        hashes = [runner.run_tick(ws, budget).state_hash for _ in range(ticks)]
+        return hashes, ws
+
+    def test_two_phase_tick_is_independent_of_pool_size(self):
+        hashes_two, ws_two = self._run_ticks(max_concurrency=2)
+        for max_concurrency in (3, 4, 6, 8, 16):
+            hashes, ws = self._run_ticks(max_concurrency=max_concurrency)
+            assert hashes == hashes_two
+            assert ws.to_dict() == ws_two.to_dict()
+
+    def test_two_phase_tick_calls_adapters_concurrently(self):
+        import threading
+
+        from simulation.adapters.base import AdapterResponse, SimulationModelAdapter
+        from simulation.engine.budget_guard import BudgetGuard
+        from simulation.engine.tick_runner import TickRunner
+        from simulation.models.action import ActionProposal
+        from simulation.models.scenario import BudgetConfig
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        class _BarrierAdapter(SimulationModelAdapter):
+            provider = "barrier"
+            model_id = "barrier-v1"
+
+            def generate(self, messages, agent_id, **kwargs):
+                barrier.wait()  # deadlocks (and times out) unless 4 calls overlap
+                return AdapterResponse(raw_text="{}", model_id=self.model_id,
+                                       proposal=ActionProposal(agent_id=agent_id, action_type="rest"))
+
+        adapter = _BarrierAdapter()
+
+        class _Resolver:
+            def resolve(self, agent_id):
+                return adapter
+
+        ws = _make_world(agents=4)
+        runner = TickRunner(strategy_resolver=_Resolver(), max_concurrency=4)
+        result = runner.run_tick(ws, BudgetGuard(BudgetConfig(max_ticks=10)))
+        assert result.failures == 0
+        assert list(result.agent_decisions) == ["a1", "a2", "a3", "a4"]
+
+    def test_budget_violation_aborts_outstanding_calls(self):
+        from simulation.adapters.base import AdapterResponse, SimulationModelAdapter
+        from simulation.engine.budget_guard import BudgetGuard
+        from simulation.engine.tick_runner import TickRunner
+        from simulation.models.action import ActionProposal
+        from simulation.models.scenario import BudgetConfig
+
+        calls = []
+
+        class _ExpensiveAdapter(SimulationModelAdapter):
+            provider = "expensive"
+            model_id = "expensive-v1"
+            max_concurrency = 1
+
+            def generate(self, messages, agent_id, **kwargs):
+                calls.append(agent_id)
+                return AdapterResponse(raw_text="{}", tokens_used=60, model_id=self.model_id,
+                                       proposal=ActionProposal(agent_id=agent_id, action_type="rest"))
+
+        adapter = _ExpensiveAdapter()
+
+        class _Resolver:
+            def resolve(self, agent_id):
+                return adapter
+
+        ws = _make_world(agents=5)
+        runner = TickRunner(strategy_resolver=_Resolver(), max_concurrency=4)
+        result = runner.run_tick(ws, BudgetGuard(BudgetConfig(max_ticks=10, max_tokens=100)))
+        assert calls == ["a1", "a2"]
+        assert result.aborted_calls == 3
+        assert result.budget_violation is not None
+        assert result.budget_violation.kind == "tokens"
+        assert result.agent_decisions["a5"]["proposal"]["action_type"] == "noop"
+
+    def test_budget_violation_interrupts_concurrent_calls(self):
+        from simulation.adapters.base import AdapterResponse, SimulationModelAdapter
+        from simulation.engine.budget_guard import BudgetGuard
+        from simulation.engine.tick_runner import TickRunner
+        from simulation.models.action import ActionProposal
+        from simulation.models.scenario import BudgetConfig
+
+        class _SlowAdapter(SimulationModelAdapter):
+            provider = "slow"
+            model_id = "slow-v1"
+            max_concurrency = 4
+
+            def generate(self, messages, agent_id, **kwargs):
+                if agent_id != "a1":
+                    # Stands in for an HTTP call; only the abort ends it early.
+                    if kwargs["cancel_event"].wait(5):
+                        return AdapterResponse(raw_text="", model_id=self.model_id, parse_error="cancelled",
+                                               proposal=ActionProposal.invalid_fallback(agent_id, "cancelled"))
+                return AdapterResponse(raw_text="{}", tokens_used=150, model_id=self.model_id,
+                                       proposal=ActionProposal(agent_id=agent_id, action_type="rest"))
+
+        adapter = _SlowAdapter()
+
+        class _Resolver:
+            def resolve(self, agent_id):
+                return adapter
+
+        ws = _make_world(agents=4)
+        runner = TickRunner(strategy_resolver=_Resolver(), max_concurrency=4)
+        started = time.monotonic()
+        result = runner.run_tick(ws, BudgetGuard(BudgetConfig(max_ticks=10, max_tokens=100)))
+        assert time.monotonic() - started < 2
+        assert result.aborted_calls == 3
+        assert result.budget_violation is not None
+        assert result.agent_decisions["a1"]["proposal"]["action_type"] == "rest"
+
+    def test_concurrency_cap_applies_across_per_agent_adapters(self):
+        import threading
+
+        from simulation.adapters.base import AdapterResponse, SimulationModelAdapter
+        from simulation.engine.budget_guard import BudgetGuard
+        from simulation.engine.tick_runner import TickRunner
+        from simulation.models.action import ActionProposal
+        from simulation.models.scenario import BudgetConfig
+
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        class _CountingAdapter(SimulationModelAdapter):
+            provider = "capped"
+            model_id = "capped-v1"
+            max_concurrency = 2
+
+            def generate(self, messages, agent_id, **kwargs):
+                with lock:
+                    active["now"] += 1
+                    active["peak"] = max(active["peak"], active["now"])
+                time.sleep(0.05)
+                with lock:
+                    active["now"] -= 1
+                return AdapterResponse(raw_text="{}", model_id=self.model_id,
+                                       proposal=ActionProposal(agent_id=agent_id, action_type="rest"))
+
+        adapters: dict[str, _CountingAdapter] = {}
+
+        class _Resolver:
+            def resolve(self, agent_id):
+                return adapters.setdefault(agent_id, _CountingAdapter())
+
+        ws = _make_world(agents=6)
+        runner = TickRunner(strategy_resolver=_Resolver(), max_concurrency=8)
+        runner.run_tick(ws, BudgetGuard(BudgetConfig(max_ticks=10)))
+        assert active["peak"] == 2
+
+        active["peak"] = 0
+        runner = TickRunner(strategy_resolver=_Resolver(), max_concurrency=8,
+                            adapter_concurrency={"capped-v1": 1})
+        runner.run_tick(ws, BudgetGuard(BudgetConfig(max_ticks=10)))
+        assert active["peak"] == 1
+
+    def test_replay_uses_recorded_decision_mode(self):
+        from simulation.adapters.model_strategy import ModelStrategyResolver
+        from simulation.engine.budget_guard import BudgetGuard
+        from simulation.engine.replay import ReplayRunner, ReplayTrace
+        from simulation.engine.tick_runner import TickRunner
+        from simulation.models.scenario import BudgetConfig, ScenarioConfig
+
+        scenario = ScenarioConfig(name="t")
+        checkpoint = _make_world(agents=3)
+        for max_concurrency, mode in ((1, "sequential"), (4, "two_phase")):
+            runner = TickRunner(strategy_resolver=ModelStrategyResolver(scenario),
+                                max_concurrency=max_concurrency)
+            trace = ReplayTrace()
+            trace.record(runner.run_tick(checkpoint.snapshot(), BudgetGuard(BudgetConfig(max_ticks=10))))
+            assert trace.decision_mode == mode
+            replayed = next(iter(ReplayRunner(checkpoint, trace, scenario).run()))
+            assert replayed.decision_mode == mode
+
 
 # ── SIM-043/SIM-045: Mini-simulation integration ──────────────────────────────
 
@@ -661,6 +978,78 @@ class TestMiniSimulation:
         assert len(results) == len(scenarios)
         assert all(r.error is None for r in results)
 
+    def test_parallel_batch_matches_sequential_reports(self):
+        from simulation.engine.batch_runner import BatchRunner
+        from simulation.models.scenario import BudgetConfig
+        from simulation.scenarios.standard_scenarios import get_scenario
+
+        scenario = get_scenario("survival_island").model_copy(
+            update={"budget": BudgetConfig(max_ticks=3)})
+        streamed = []
+        runner = BatchRunner()
+        parallel = runner.run_parallel([scenario], seeds=[1, 2], max_workers=2,
+                                       on_tick=lambda run_id, result: streamed.append(run_id))
+        sequential = runner.run([scenario.model_copy(update={"seed": 1}),
+                                 scenario.model_copy(update={"seed": 2})])
+
+        assert [r.seed for r in parallel] == [1, 2]
+        assert len(streamed) == sum(r.ticks_run for r in parallel)
+        for par, seq in zip(parallel, sequential):
+            assert par.error is None
+            assert par.report["final_state_hash"] == seq.report["final_state_hash"]
+            assert par.report["metrics"]["timeline"] == seq.report["metrics"]["timeline"]
+
+    def test_parallel_batch_isolates_failed_runs(self):
+        from simulation.engine.batch_runner import BatchRunner
+        from simulation.models.scenario import BudgetConfig, ScenarioConfig
+        from simulation.scenarios.standard_scenarios import get_scenario
+
+        good = get_scenario("survival_island").model_copy(
+            update={"budget": BudgetConfig(max_ticks=2)})
+        # An agent without locations makes _build_world raise inside the worker.
+        broken = ScenarioConfig(name="broken", agents=[{"id": "x"}])
+        results = BatchRunner().run_parallel([broken, good], max_workers=2, max_retries=1)
+
+        assert [r.scenario_name for r in results] == ["broken", "survival_island"]
+        assert results[0].error is not None
+        assert results[0].attempts == 2
+        assert results[1].error is None
+
+    def test_parallel_batch_flags_runs_with_missing_tick_metrics(self, monkeypatch):
+        from simulation.engine import batch_runner
+        from simulation.models.scenario import BudgetConfig
+        from simulation.scenarios.standard_scenarios import get_scenario
+
+        scenario = get_scenario("survival_island").model_copy(
+            update={"budget": BudgetConfig(max_ticks=2)})
+        monkeypatch.setattr(batch_runner, "_init_batch_worker", _init_batch_worker_losing_first_tick)
+        monkeypatch.setattr(batch_runner.BatchRunner, "TICK_DRAIN_TIMEOUT_SECONDS", 0.2)
+
+        [result] = batch_runner.BatchRunner().run_parallel([scenario], max_workers=1)
+
+        assert result.ticks_run == 2
+        assert result.error == "tick_metrics_incomplete:1/2"
+        assert len(result.report["metrics"]["timeline"]) == 1
+
+
+class _QueueLosingFirstMessage:
+    def __init__(self, queue):
+        self._queue = queue
+        self._lost = False
+
+    def put(self, message):
+        if not self._lost:
+            self._lost = True
+            return
+        self._queue.put(message)
+
+
+def _init_batch_worker_losing_first_tick(tick_queue):
+    # Module level so the pool can pickle it as its initializer.
+    from simulation.engine import batch_runner
+
+    batch_runner._WORKER_QUEUE = _QueueLosingFirstMessage(tick_queue)
+
 
 # ── SIM-046: Security regression tests ───────────────────────────────────────
 
@@ -1,10 +1,11 @@
-import json
 import os
 import types
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from agent.llm_benchmarks import load_benchmarks
+
 
 @pytest.fixture(autouse=True)
 def _disable_snake_chat_background_threads(monkeypatch):
@@ -63,10 +64,8 @@ def test_task_execute_auto_records_llm_benchmark(client, app, tmp_path, admin_au
         assert execute_res.status_code == 200
         assert execute_res.json["data"]["status"] == "completed"
 
-    bench_path = os.path.join(str(tmp_path), "llm_model_benchmarks.json")
-    assert os.path.exists(bench_path)
-    with open(bench_path, "r", encoding="utf-8") as fh:
-        db = json.load(fh)
+    assert os.path.exists(os.path.join(str(tmp_path), "llm_model_benchmarks.sqlite3"))
+    db = load_benchmarks(str(tmp_path))
 
     model_entry = (db.get("models") or {}).get("aider:gpt-4o-mini")
     assert model_entry is not None
@@ -98,9 +97,7 @@ def test_task_execute_benchmark_fallback_uses_config_defaults(client, app, tmp_p
         assert execute_res.status_code == 200
         assert execute_res.json["data"]["status"] == "completed"
 
-    bench_path = os.path.join(str(tmp_path), "llm_model_benchmarks.json")
-    with open(bench_path, "r", encoding="utf-8") as fh:
-        db = json.load(fh)
+    db = load_benchmarks(str(tmp_path))
     model_entry = (db.get("models") or {}).get("lmstudio:model-fallback")
     assert model_entry is not None
 
@@ -133,9 +130,7 @@ def test_task_execute_benchmark_precedence_can_prefer_defaults_over_llm_config(c
         assert execute_res.status_code == 200
         assert execute_res.json["data"]["status"] == "completed"
 
-    bench_path = os.path.join(str(tmp_path), "llm_model_benchmarks.json")
-    with open(bench_path, "r", encoding="utf-8") as fh:
-        db = json.load(fh)
+    db = load_benchmarks(str(tmp_path))
     model_entry = (db.get("models") or {}).get("lmstudio:model-default-preferred")
     assert model_entry is not None
 
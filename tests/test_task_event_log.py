@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import importlib
+import json
+import threading
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import inspect
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, create_engine, select
+
+from agent.db_models import TASK_HISTORY_PROJECTION_LIMIT, TaskDB, TaskEventDB
+from agent.repositories.tasks import _log_task_history
+from agent.repository import task_repo
+
+
+def _event(index: int) -> dict:
+    return {"event_type": "tool_call", "timestamp": 1000.0 + index, "index": index}
+
+
+def test_save_appends_only_new_history_events(client):
+    task_repo.save(TaskDB(id="evt-task-1", title="t", status="todo", history=[_event(0), _event(1)]))
+
+    task = task_repo.get_by_id("evt-task-1")
+    task.history = list(task.history) + [_event(2)]
+    task_repo.save(task)
+    task_repo.save(task_repo.get_by_id("evt-task-1"))
+
+    events = task_repo.list_events("evt-task-1")
+    assert [event.seq for event in events] == [1, 2, 3]
+    assert [event.payload["index"] for event in events] == [0, 1, 2]
+    assert events[0].event_type == "tool_call"
+
+
+def test_history_projection_is_bounded_while_event_log_keeps_everything(client):
+    total = TASK_HISTORY_PROJECTION_LIMIT + 50
+    task_repo.save(TaskDB(id="evt-task-2", title="t", status="todo", history=[]))
+    for index in range(total):
+        task = task_repo.get_by_id("evt-task-2")
+        task.history = list(task.history) + [_event(index)]
+        task_repo.save(task)
+
+    projection = task_repo.get_by_id("evt-task-2").history
+    assert len(projection) == TASK_HISTORY_PROJECTION_LIMIT
+    assert projection[-1]["index"] == total - 1
+    assert task_repo.last_event_seq("evt-task-2") == total
+
+
+def test_events_endpoint_pages_by_seq(client, admin_auth_header):
+    task_repo.save(TaskDB(id="evt-task-3", title="t", status="todo", history=[_event(i) for i in range(5)]))
+
+    first = client.get("/tasks/evt-task-3/events?limit=3", headers=admin_auth_header).get_json()["data"]
+    assert [item["seq"] for item in first["items"]] == [1, 2, 3]
+    assert first["has_more"] is True
+
+    second = client.get(
+        f"/tasks/evt-task-3/events?after_seq={first['next_after_seq']}&limit=3", headers=admin_auth_header
+    ).get_json()["data"]
+    assert [item["index"] for item in second["items"]] == [3, 4]
+    assert second["has_more"] is False
+
+    task_repo.delete("evt-task-3")
+    assert len(task_repo.list_events("evt-task-3")) == 5
+    assert task_repo.purge_events("evt-task-3") == 5
+    assert task_repo.list_events("evt-task-3") == []
+
+
+def test_archiving_keeps_full_event_log_until_archive_is_purged(client, admin_auth_header):
+    total = TASK_HISTORY_PROJECTION_LIMIT + 30
+    task_repo.save(TaskDB(id="evt-task-5", title="t", status="completed", history=[_event(i) for i in range(total)]))
+
+    archived = client.post("/tasks/archive/batch", json={"task_ids": ["evt-task-5"]}, headers=admin_auth_header)
+    assert archived.status_code == 200
+    assert task_repo.get_by_id("evt-task-5") is None
+    assert task_repo.last_event_seq("evt-task-5") == total
+    page = client.get("/tasks/evt-task-5/events?limit=1000", headers=admin_auth_header).get_json()["data"]
+    assert [item["index"] for item in page["items"]] == list(range(total))
+
+    deleted = client.delete("/tasks/archived/evt-task-5", headers=admin_auth_header)
+    assert deleted.status_code == 200
+    assert task_repo.list_events("evt-task-5") == []
+
+
+def test_concurrent_event_appends_get_distinct_seqs(tmp_path):
+    # File-backed engine with one connection per thread, so concurrent appenders
+    # really race on seq allocation (task_repo.save serialises per task).
+    db = create_engine(
+        f"sqlite:///{tmp_path / 'events.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        poolclass=NullPool,
+    )
+    TaskEventDB.__table__.create(db)
+    start = threading.Barrier(4)
+    errors: list[BaseException] = []
+
+    def _append(offset: int) -> None:
+        try:
+            start.wait()
+            for index in range(5):
+                task = TaskDB(id="evt-task-4", title="t", status="todo", history=[_event(offset * 100 + index)])
+                with Session(db) as session:
+                    _log_task_history(session, "evt-task-4", [], task)
+                    session.commit()
+        except BaseException as exc:  # noqa: BLE001 - surfaced by the assert below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_append, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with Session(db) as session:
+        seqs = session.exec(select(TaskEventDB.seq).order_by(TaskEventDB.seq)).all()
+    assert seqs == list(range(1, 21))
+
+
+def test_task_events_migration_backfills_full_histories(monkeypatch):
+    db = create_engine("sqlite://")
+    migration = importlib.import_module("migrations.versions.b7c8d9e0f1a2_add_task_events")
+    history = [_event(index) for index in range(TASK_HISTORY_PROJECTION_LIMIT + 25)]
+    with db.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE tasks (id VARCHAR PRIMARY KEY, history JSON)"))
+        connection.execute(
+            sa.text("INSERT INTO tasks (id, history) VALUES ('legacy', :history), ('empty', '[]')"),
+            {"history": json.dumps(history)},
+        )
+        monkeypatch.setattr(migration, "op", Operations(MigrationContext.configure(connection)))
+        migration.upgrade()
+        migration.upgrade()
+        reflected = {item["name"] for item in inspect(connection).get_columns("task_events")}
+        assert reflected == {column.name for column in TaskEventDB.__table__.columns}
+        rows = connection.execute(
+            sa.text("SELECT seq, event_type, timestamp FROM task_events WHERE task_id = 'legacy' ORDER BY seq")
+        ).all()
+        assert [row[0] for row in rows] == list(range(1, len(history) + 1))
+        assert rows[0][1] == "tool_call" and rows[-1][2] == history[-1]["timestamp"]
+        migration.downgrade()
+        assert "task_events" not in inspect(connection).get_table_names()
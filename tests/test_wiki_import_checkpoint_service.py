@@ -17,3 +17,10 @@ def test_checkpoint_service_roundtrip(tmp_path):
     assert loaded["items_processed"] == 5
     raw = json.loads(path.read_text(encoding="utf-8"))
     assert raw["source_format"] == "xml"
+
+
+def test_next_block_index_prefers_completed_blocks_and_reads_legacy_block_index():
+    assert WikiImportCheckpointService.next_block_index(None) == 0
+    assert WikiImportCheckpointService.next_block_index({"completed_blocks": 1, "block_index": 0}) == 1
+    assert WikiImportCheckpointService.next_block_index({"block_index": 4}) == 5
+    assert WikiImportCheckpointService.next_block_index({"block_index": 0}) == 0
@@ -1,3 +1,5 @@
+import time
+
 from agent.services.wiki_markup_cleaner import clean_wiki_markup
 
 
@@ -8,3 +10,25 @@ def test_clean_wiki_markup_removes_basic_markup():
     assert "Alpha" in cleaned
     assert "Intro" in cleaned
 
+
+def test_clean_wiki_markup_strips_nested_templates_and_file_captions():
+    raw = (
+        "{{Infobox Ort|Name={{lang|de|Berlin}}|Karte={{Lageplan|lat=1}}}} Berlin ist die [[Hauptstadt]]."
+        "<ref name=\"a\">{{Literatur|Titel=X}}</ref> [[Datei:Wappen.svg|mini|Das [[Wappen]]]] Mehr"
+        "<ref name=b/> <!-- Kommentar --> [https://example.org Beispiel]"
+    )
+    cleaned = clean_wiki_markup(raw)
+    assert cleaned == "Berlin ist die Hauptstadt. Mehr Beispiel"
+
+
+def test_clean_wiki_markup_keeps_unbalanced_markup_and_comparisons():
+    assert clean_wiki_markup("Stray }} and {{ open") == "Stray }} and {{ open"
+    assert clean_wiki_markup("a < b and c > d") == "a < b and c > d"
+
+
+def test_clean_wiki_markup_unclosed_file_link_does_not_backtrack():
+    raw = "[[Datei:Foo.jpg|mini|Ein Bild ohne Ende] und weiter text hier " * 20 + "[[Datei:" + "a" * 200 + "["
+    started = time.monotonic()
+    cleaned = clean_wiki_markup(raw)
+    assert time.monotonic() - started < 1.0
+    assert "weiter text hier" in cleaned
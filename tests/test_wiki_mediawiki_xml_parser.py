@@ -17,3 +17,42 @@ def test_iter_mediawiki_pages_parses_bz2(tmp_path):
     assert pages[0]["title"] == "A"
     assert pages[0]["namespace"] == 0
     assert pages[1]["is_redirect"] is True
+
+
+def _write_multistream(tmp_path, block_count: int):
+    corpus = tmp_path / "wiki-multistream.xml.bz2"
+    index_lines = []
+    blob = b""
+    for block in range(block_count):
+        fragment = "".join(
+            f"<page><title>P{block}-{page}</title><ns>0</ns>"
+            f"<revision><text>Body {block} {page}</text></revision></page>"
+            for page in range(3)
+        )
+        index_lines.append(f"{len(blob)}:{block}:P{block}-0")
+        blob += bz2.compress(fragment.encode("utf-8"))
+    corpus.write_bytes(blob)
+    index = tmp_path / "wiki-multistream-index.txt"
+    index.write_text("\n".join(index_lines) + "\n", encoding="utf-8")
+    return corpus, index
+
+
+def test_parallel_blocks_are_reassembled_in_block_order(tmp_path):
+    corpus, index = _write_multistream(tmp_path, 8)
+    parser = MediaWikiXmlDumpParser()
+
+    sequential = [
+        (block, page["title"])
+        for block, page in parser.iter_pages_with_block(corpus_path=corpus, index_path=index)
+    ]
+    parallel = [
+        (block, page["title"])
+        for block, pages in parser.iter_blocks_parallel(
+            corpus_path=corpus, index_path=index, max_workers=3, max_in_flight=3
+        )
+        for page in pages
+    ]
+
+    assert parallel == sequential
+    resumed = parser.iter_blocks_parallel(corpus_path=corpus, index_path=index, resume_block_index=6, max_workers=2)
+    assert [block for block, _pages in resumed] == [6, 7]
@@ -135,6 +135,76 @@ def _build_zim(
     return result
 
 
+def _build_clustered_zim(
+    clusters: list[list[tuple[str, str, str]]],  # per cluster: (namespace, title, html_content)
+    *,
+    compress: int = 4,
+) -> bytes:
+    """
+    Build a ZIM file with several clusters whose articles interleave in URL order.
+
+    URL order is round-robin over the clusters, so a URL-order reader jumps
+    between clusters on every entry.
+    """
+    import zstandard
+
+    placed: list[tuple[str, str, int, int]] = []
+    for blob in range(max(len(cluster) for cluster in clusters)):
+        for number, cluster in enumerate(clusters):
+            if blob < len(cluster):
+                ns, title, _ = cluster[blob]
+                placed.append((ns, title, number, blob))
+
+    mime_bytes = b"text/html\x00\x00"
+    mime_list_pos = _HEADER.size
+    url_ptr_pos = mime_list_pos + len(mime_bytes)
+    title_ptr_pos = url_ptr_pos + len(placed) * 8
+    entries_start = title_ptr_pos + len(placed) * 4
+
+    entry_bytes_list = []
+    for ns, title, number, blob in placed:
+        url = f"{ns}/{title.replace(' ', '_')}"
+        entry_bytes_list.append(
+            struct.pack("<HBBI", 0, 0, ord(ns), 0)
+            + struct.pack("<II", number, blob)
+            + url.encode("utf-8") + b"\x00" + title.encode("utf-8") + b"\x00"
+        )
+    entry_offsets = []
+    pos = entries_start
+    for eb in entry_bytes_list:
+        entry_offsets.append(pos)
+        pos += len(eb)
+
+    cluster_ptr_pos = pos
+    cluster_blobs = []
+    for cluster in clusters:
+        raw = _build_uncompressed_cluster([content.encode("utf-8") for _, _, content in cluster])[1:]
+        cluster_blobs.append(bytes([compress]) + (zstandard.ZstdCompressor().compress(raw) if compress == 4 else raw))
+    cluster_offsets = []
+    pos = cluster_ptr_pos + len(clusters) * 8
+    for blob in cluster_blobs:
+        cluster_offsets.append(pos)
+        pos += len(blob)
+
+    header = _HEADER.pack(
+        _ZIM_MAGIC, 5, 0, bytes(16),
+        len(placed), len(clusters),
+        url_ptr_pos, title_ptr_pos, cluster_ptr_pos, mime_list_pos,
+        0xFFFFFFFF, 0xFFFFFFFF,
+        pos,
+    )
+    return (
+        header
+        + mime_bytes
+        + struct.pack(f"<{len(placed)}Q", *entry_offsets)
+        + struct.pack(f"<{len(placed)}I", *range(len(placed)))
+        + b"".join(entry_bytes_list)
+        + struct.pack(f"<{len(clusters)}Q", *cluster_offsets)
+        + b"".join(cluster_blobs)
+        + bytes(16)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -339,3 +409,95 @@ def test_zim_parser_issues_reset_between_calls(tmp_path: Path):
     items = list(parser.iter_items(corpus_path=good_file))
     assert len(items) == 1
     assert parser.issues == []
+
+
+def test_zim_parser_decompresses_each_cluster_once(tmp_path: Path, monkeypatch):
+    pytest.importorskip("zstandard")
+    clusters = [
+        [("A", f"Article {number}-{blob}", f"<p>Body of cluster {number} blob {blob}.</p>") for blob in range(5)]
+        for number in range(3)
+    ]
+    zim_file = tmp_path / "clustered.zim"
+    zim_file.write_bytes(_build_clustered_zim(clusters))
+    parser = ZimParser()
+    loads: list[int] = []
+    load_cluster = parser._load_cluster
+
+    def counting_load(f, cluster_offset, next_cluster_offset):
+        loads.append(cluster_offset)
+        return load_cluster(f, cluster_offset, next_cluster_offset)
+
+    monkeypatch.setattr(parser, "_load_cluster", counting_load)
+
+    pairs = list(parser.iter_items_with_cluster(corpus_path=zim_file))
+
+    assert len(loads) == 3
+    assert [number for number, _ in pairs] == sorted(number for number, _ in pairs)
+    assert [item["title"] for _, item in pairs[:5]] == [f"Article 0-{blob}" for blob in range(5)]
+    assert pairs[7][1]["text"] == "Body of cluster 1 blob 2."
+    assert parser.issues == []
+
+
+def test_zim_parser_cluster_cache_is_bounded():
+    from agent.services.wiki_zim_parser import _Cluster, _ClusterCache
+
+    cache = _ClusterCache(max_clusters=2, max_bytes=100)
+    cache.put(0, _Cluster((0, 40), data=b"x" * 40))
+    cache.put(1, _Cluster((0, 40), data=b"y" * 40))
+    assert cache.get(0) is not None
+    cache.put(2, _Cluster((0, 40), data=b"z" * 40))
+
+    assert cache.get(1) is None
+    assert cache.get(0) is not None and cache.get(2) is not None
+    cache.put(3, _Cluster((0, 500), data=b"w" * 500))
+    assert cache.get(3) is not None and cache.get(0) is None
+
+
+def test_ingestion_service_imports_zim_corpus(tmp_path: Path):
+    pytest.importorskip("zstandard")
+    from agent.services.ingestion_service import IngestionService
+
+    clusters = [
+        [("A", "Ananta", "<p>Ananta is a multi-agent task orchestration system built for developers.</p>")],
+        [("A", "Hub", "<p>The hub plans goals and delegates tasks to workers over HTTP.</p>")],
+    ]
+    zim_file = tmp_path / "wiki_mini.zim"
+    zim_file.write_bytes(_build_clustered_zim(clusters))
+
+    report = IngestionService().import_wiki_corpus(corpus_path=str(zim_file), source_id="zim-e2e")
+
+    assert report["format"] == "zim"
+    assert report["parser_issues"] == []
+    assert {record["article_title"] for record in report["records"]} == {"Ananta", "Hub"}
+    assert all(record["import_metadata"]["format"] == "zim" for record in report["records"])
+    assert Path(str(report["jsonl_cache_path"])).read_text(encoding="utf-8").count("\n") == 2
+
+
+def test_concurrent_zim_imports_on_one_service_keep_their_own_clusters(tmp_path: Path):
+    pytest.importorskip("zstandard")
+    from concurrent.futures import ThreadPoolExecutor
+
+    from agent.services.ingestion_service import IngestionService
+
+    files = {}
+    for name in ("left", "right"):
+        clusters = [
+            [("A", f"{name} {number}-{blob}", f"<p>{name} body of cluster {number} blob {blob}.</p>")
+             for blob in range(3)]
+            for number in range(20)
+        ]
+        files[name] = tmp_path / f"{name}.zim"
+        files[name].write_bytes(_build_clustered_zim(clusters))
+    service = IngestionService()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        reports = dict(zip(files, pool.map(
+            lambda name: service.import_wiki_corpus(corpus_path=str(files[name]), source_id=f"zim-{name}"),
+            files,
+        )))
+
+    for name, report in reports.items():
+        assert report["parser_issues"] == []
+        assert len(report["records"]) == 60
+        assert all(record["article_title"].startswith(name) for record in report["records"])
+        assert all(record["content"].startswith(name) for record in report["records"])
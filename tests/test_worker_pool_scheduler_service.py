@@ -1,3 +1,5 @@
+import threading
+
 from agent.repository import worker_slot_lease_repo
 from agent.services.worker_pool_scheduler_service import WorkerPoolSchedulerService
 
@@ -93,3 +95,70 @@ def test_scheduler_revalidation_blocks_stale_policy_decision():
     assert reval.status == "rejected"
     assert reval.reason_code == "stale_policy_decision"
     svc.release_for_job(decision.slot_lease_id)
+
+
+def _locked(lock, fn, *args, **kwargs):
+    with lock:
+        return fn(*args, **kwargs)
+
+
+def _burst_request(worker_id: str) -> dict:
+    return {
+        "selected_worker_id": worker_id,
+        "selected_worker_kind": "native_ananta_worker",
+        "selected_runtime_target_id": f"rt-{worker_id}",
+        "selected_runtime_kind": "docker_container",
+        "worker_capacity": 3,
+        "runtime_capacity": 3,
+        "worker_queue_limit": 10,
+        "slot_lease_seconds": 60,
+    }
+
+
+def test_scheduler_concurrent_burst_uses_lease_index_without_table_scans(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    svc = WorkerPoolSchedulerService()
+    svc.reconcile_lease_index(force=True)
+
+    def _no_scan(*_args, **_kwargs):
+        raise AssertionError("acquire_for_job must not scan the lease table")
+
+    monkeypatch.setattr(worker_slot_lease_repo, "list_active", _no_scan)
+    monkeypatch.setattr(worker_slot_lease_repo, "list_queued", _no_scan)
+    monkeypatch.setattr(worker_slot_lease_repo, "list_all", _no_scan)
+    # The in-memory test DB shares one sqlite connection; serialize DB calls like a single writer would.
+    db_lock = threading.Lock()
+    for name in ("save", "get_by_id", "count_open_for_worker", "list_open_for_worker"):
+        original = getattr(worker_slot_lease_repo, name)
+        monkeypatch.setattr(worker_slot_lease_repo, name, lambda *a, _fn=original, **kw: _locked(db_lock, _fn, *a, **kw))
+
+    pools = [f"w-burst-{i}" for i in range(4)]
+    requests = [_burst_request(pool) for pool in pools for _ in range(40)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        decisions = list(executor.map(lambda req: (req["selected_worker_id"], svc.acquire_for_job(request=req)), requests))
+
+    for pool in pools:
+        statuses = [decision.status for worker_id, decision in decisions if worker_id == pool]
+        assert statuses.count("active") == 3
+        assert statuses.count("queued") == 10
+        assert statuses.count("rejected") == 27
+        queue_positions = sorted(d.queue_position for w, d in decisions if w == pool and d.status == "queued")
+        assert queue_positions == list(range(1, 11))
+
+    status = svc.get_scheduler_status()
+    assert status["active_slots"] == 12
+    assert status["queued_jobs"] == 40
+    assert all(status["capacity_by_worker"][pool] == 3 for pool in pools)
+
+
+def test_scheduler_counts_leases_released_outside_the_scheduler():
+    svc = WorkerPoolSchedulerService()
+    first = svc.acquire_for_job(request=_burst_request("w-drift"))
+    for _ in range(2):
+        svc.acquire_for_job(request=_burst_request("w-drift"))
+
+    worker_slot_lease_repo.release(str(first.slot_lease_id))
+
+    decision = svc.acquire_for_job(request=_burst_request("w-drift"))
+    assert decision.status == "active"
@@ -102,9 +102,10 @@ class CodeCompassVectorStore:
         encoded_bytes = 0
         original_bytes = 0
         max_abs_error = 0.0
-        for doc, vector in zip(list(documents or []), vectors, strict=False):
-            raw_vector = [float(item) for item in list(vector or [])]
-            encoded = encoder.encode(raw_vector)
+        document_list = list(documents or [])
+        raw_vectors = [[float(item) for item in list(vector or [])] for vector in list(vectors)[: len(document_list)]]
+        encoded_vectors = encoder.encode_many(raw_vectors)
+        for doc, raw_vector, encoded in zip(document_list, raw_vectors, encoded_vectors, strict=False):
             original_bytes += int(encoded.diagnostics.get("bytes_original_float32") or len(raw_vector) * 4)
             encoded_bytes += int(encoded.diagnostics.get("bytes_encoded_payload") or 0)
             max_abs_error = max(max_abs_error, float(encoded.diagnostics.get("max_abs_error") or 0.0))
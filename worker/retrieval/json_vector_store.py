@@ -208,8 +208,8 @@ class JsonVectorStore:
         original_bytes = 0
         encoded_bytes = 0
         max_abs_error = 0.0
-        for point in point_list:
-            encoded = encoder.encode(list(point.vector))
+        encoded_vectors = encoder.encode_many([list(point.vector) for point in point_list])
+        for point, encoded in zip(point_list, encoded_vectors, strict=True):
             original_bytes += int(encoded.diagnostics.get("bytes_original_float32") or len(point.vector) * 4)
             encoded_bytes += int(encoded.diagnostics.get("bytes_encoded_payload") or 0)
             max_abs_error = max(max_abs_error, float(encoded.diagnostics.get("max_abs_error") or 0.0))
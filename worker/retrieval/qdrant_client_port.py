@@ -588,7 +588,8 @@ class QdrantClientAdapter:
                 collection_name=collection_name,
                 ids=list(point_ids),
                 with_payload=True,
-                with_vectors=True,
+                # Callers only diff and scope-check payloads; vectors would dominate the transfer.
+                with_vectors=False,
             ),
         )
         return tuple(
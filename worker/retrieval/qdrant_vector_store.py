@@ -3,11 +3,13 @@ from __future__ import annotations
 import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import replace
 from typing import Any, Callable, Mapping, Sequence
 
 from worker.retrieval.qdrant_client_port import (
     COLLECTION_MISSING,
+    ClientPoint,
     QdrantClientAdapter,
     QdrantClientError,
     QdrantClientPort,
@@ -354,65 +356,42 @@ class QdrantVectorStore:
         failure_batches: list[dict[str, int | str]] = []
         total_failure_batches = 0
         max_failure_diagnostics = 32
-        for batch_index, offset in enumerate(range(0, len(points), size)):
-            batch = list(points[offset : offset + size])
-            try:
-                client_points = [
-                    to_client_point(
-                        point,
-                        compatibility,
-                        store_embedding_text=self._store_embedding_text,
-                    )
-                    for point in batch
-                ]
-                existing = {
-                    point.point_id: point
-                    for point in self._client.retrieve(
-                        collection_name,
-                        [point.point_id for point in client_points],
-                    )
-                }
-                changed = []
-                for point in client_points:
-                    current = existing.get(point.point_id)
-                    incoming_source_hash = str(
-                        point.payload.get("source_hash") or ""
-                    ).strip()
-                    if not incoming_source_hash:
-                        raise QdrantSchemaError("missing_source_hash")
-                    current_source_hash = (
-                        str(current.payload.get("source_hash") or "").strip()
-                        if current is not None
-                        else ""
-                    )
-                    current_embedding_text = (
-                        current.payload.get("embedding_text")
-                        if current is not None
-                        else None
-                    )
-                    incoming_embedding_text = point.payload.get("embedding_text")
-                    if current and current_source_hash and (
-                        current_source_hash == incoming_source_hash
-                        and current_embedding_text == incoming_embedding_text
-                    ):
-                        skipped += 1
-                    else:
-                        changed.append(point)
-                if changed:
-                    self._client.upsert(collection_name, changed)
-                upserted += len(changed)
-            except (QdrantSchemaError, QdrantClientError) as exc:
-                failed += len(batch)
-                reason_code = bounded_vector_store_reason(exc.reason)
-                reasons.append(reason_code)
-                total_failure_batches += 1
-                if len(failure_batches) < max_failure_diagnostics:
-                    failure_batches.append(
-                        {
-                            "batch_index": batch_index,
-                            "reason_code": reason_code,
-                        }
-                    )
+        batches = [list(points[offset : offset + size]) for offset in range(0, len(points), size)]
+        # Retrieve/diff of batch N+1 overlaps the upsert of batch N. Point ids are
+        # unique across the request, so the prefetch never reads a pending write.
+        prefetch = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="qdrant-upsert-diff") if len(batches) > 1 else None
+        )
+        try:
+            pending = self._submit_plan(prefetch, collection_name, batches[0], compatibility) if batches else None
+            for batch_index, batch in enumerate(batches):
+                planned = pending
+                pending = (
+                    self._submit_plan(prefetch, collection_name, batches[batch_index + 1], compatibility)
+                    if batch_index + 1 < len(batches)
+                    else None
+                )
+                try:
+                    changed, unchanged = planned.result()
+                    if changed:
+                        self._client.upsert(collection_name, changed)
+                    skipped += unchanged
+                    upserted += len(changed)
+                except (QdrantSchemaError, QdrantClientError) as exc:
+                    failed += len(batch)
+                    reason_code = bounded_vector_store_reason(exc.reason)
+                    reasons.append(reason_code)
+                    total_failure_batches += 1
+                    if len(failure_batches) < max_failure_diagnostics:
+                        failure_batches.append(
+                            {
+                                "batch_index": batch_index,
+                                "reason_code": reason_code,
+                            }
+                        )
+        finally:
+            if prefetch is not None:
+                prefetch.shutdown(wait=True)
         status = "ok" if failed == 0 else ("partial" if upserted or skipped else "failed")
         reason = "upserted" if failed == 0 else reasons[0]
         return IndexWriteResult(
@@ -437,6 +416,72 @@ class QdrantVectorStore:
             accepted=len(points),
         )
 
+    def _submit_plan(
+        self,
+        executor: ThreadPoolExecutor | None,
+        collection_name: str,
+        batch: list[PreparedVectorPoint],
+        compatibility: CompatibilitySpec,
+    ) -> Future:
+        if executor is not None:
+            return executor.submit(self._plan_batch, collection_name, batch, compatibility)
+        future: Future = Future()
+        try:
+            future.set_result(self._plan_batch(collection_name, batch, compatibility))
+        except (QdrantSchemaError, QdrantClientError) as exc:
+            future.set_exception(exc)
+        return future
+
+    def _plan_batch(
+        self,
+        collection_name: str,
+        batch: list[PreparedVectorPoint],
+        compatibility: CompatibilitySpec,
+    ) -> tuple[list[ClientPoint], int]:
+        """Return the points of one batch that need writing and the unchanged count."""
+        client_points = [
+            to_client_point(
+                point,
+                compatibility,
+                store_embedding_text=self._store_embedding_text,
+            )
+            for point in batch
+        ]
+        existing = {
+            point.point_id: point
+            for point in self._client.retrieve(
+                collection_name,
+                [point.point_id for point in client_points],
+            )
+        }
+        changed = []
+        for point in client_points:
+            current = existing.get(point.point_id)
+            incoming_source_hash = str(
+                point.payload.get("source_hash") or ""
+            ).strip()
+            if not incoming_source_hash:
+                raise QdrantSchemaError("missing_source_hash")
+            current_source_hash = (
+                str(current.payload.get("source_hash") or "").strip()
+                if current is not None
+                else ""
+            )
+            current_embedding_text = (
+                current.payload.get("embedding_text")
+                if current is not None
+                else None
+            )
+            incoming_embedding_text = point.payload.get("embedding_text")
+            if not (
+                current
+                and current_source_hash
+                and current_source_hash == incoming_source_hash
+                and current_embedding_text == incoming_embedding_text
+            ):
+                changed.append(point)
+        return changed, len(client_points) - len(changed)
+
     def upsert(
         self,
         points: Sequence[PreparedVectorPoint],
@@ -7,8 +7,14 @@ import math
 import os
 import struct
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional accelerator
+    np = None
+
 _ALLOWED_MODES = {
     "off",
     "float32",
@@ -18,6 +24,12 @@ _ALLOWED_MODES = {
     "turboquant_mse_experimental",
 }
 _EXPERIMENTAL_MODES = {"symmetric4bit", "turboquant_mse_experimental"}
+_EXPERIMENTAL_WARNINGS = {
+    "symmetric4bit": "symmetric4bit may change retrieval ranking; keep fallback diagnostics enabled",
+    "turboquant_mse_experimental": (
+        "TurboQuant-inspired seam only: deterministic rotation + 4bit scalar quantization, not full TurboQuant_prod"
+    ),
+}
 
 
 class VectorEncodingError(ValueError):
@@ -161,7 +173,144 @@ class VectorEncoder:
         raise VectorEncodingError(f"unsupported_vector_encoding_mode:{mode}")
 
     def encode_many(self, vectors: list[list[float]]) -> list[EncodedVector]:
-        return [self.encode(vector) for vector in vectors]
+        """Encode a batch; byte-identical to calling ``encode`` per vector.
+
+        With NumPy available, vectors of equal dimension are quantized as one
+        matrix. Rows the batch path cannot represent exactly (empty, non-finite,
+        float16 overflow) go through ``encode`` so errors stay the same.
+        """
+        rows = list(vectors or [])
+        if np is None or len(rows) < 2:
+            return [self.encode(vector) for vector in rows]
+        results: list[EncodedVector | None] = [None] * len(rows)
+        for indices, matrix in _group_rows(rows):
+            # Out-of-range casts become inf and are routed back to ``encode``.
+            with np.errstate(over="ignore"):
+                batch = self._encode_matrix(matrix)
+            for index, encoded in zip(indices, batch, strict=True):
+                results[index] = encoded
+        return [item if item is not None else self.encode(rows[index]) for index, item in enumerate(results)]
+
+    def decode_many(self, items: list[EncodedVector | dict[str, Any]]) -> list[list[float]]:
+        """Decode a batch; same values as calling ``decode`` per item."""
+        encoded = [
+            item if isinstance(item, EncodedVector) else EncodedVector.from_dict(dict(item or {}))
+            for item in list(items or [])
+        ]
+        if np is None or len(encoded) < 2:
+            return [self.decode(item) for item in encoded]
+        results: list[list[float] | None] = [None] * len(encoded)
+        groups: dict[tuple[str, int, int], list[tuple[int, bytes, float]]] = {}
+        for index, item in enumerate(encoded):
+            key = self._batch_decode_key(item)
+            if key is None:
+                continue
+            raw = base64.b64decode(item.payload.encode("ascii"))
+            if len(raw) != _encoded_size(key[0], item.dimensions):
+                continue
+            groups.setdefault(key, []).append((index, raw, float(item.metadata.get("scale") or 1.0)))
+        for (mode, dimensions, seed), members in groups.items():
+            decoded = _decode_matrix(mode, dimensions, seed, members)
+            for (index, _, _), values in zip(members, decoded, strict=True):
+                results[index] = values
+        return [values if values is not None else self.decode(encoded[index]) for index, values in enumerate(results)]
+
+    def _batch_decode_key(self, item: EncodedVector) -> tuple[str, int, int] | None:
+        mode = str(item.mode or "off").lower()
+        if mode not in _ALLOWED_MODES or item.dimensions <= 0 or not item.payload:
+            return None
+        seed = int(item.metadata.get("seed") or self.profile.seed) if mode == "turboquant_mse_experimental" else 0
+        return mode, int(item.dimensions), seed
+
+    def _encode_matrix(self, matrix: Any) -> list[EncodedVector | None]:
+        mode = self.profile.mode
+        float32_rows = matrix.astype("<f4")
+        if not np.isfinite(float32_rows).all():
+            # struct raises for values beyond float32 range; keep that path.
+            return [None] * len(matrix)
+        meta_rows = [
+            {
+                "profile": self.profile.as_dict(),
+                "profile_hash": self.profile.config_hash(),
+                "checksum": hashlib.sha256(row.tobytes()).hexdigest()[:24],
+            }
+            for row in float32_rows
+        ]
+        if mode in {"off", "float32"}:
+            return self._encoded_rows(mode, matrix, float32_rows, matrix, meta_rows, {}, None)
+        if mode == "float16":
+            packed = matrix.astype("<f2")
+            finite = np.isfinite(packed).all(axis=1)
+            encoded = self._encoded_rows(mode, matrix, packed, packed.astype(np.float64), meta_rows, {}, None)
+            return [item if ok else None for item, ok in zip(encoded, finite, strict=True)]
+        if mode == "int8":
+            scales = _matrix_scales(matrix, levels=127)
+            quants = np.clip(np.rint(matrix / scales[:, None]), -127, 127)
+            extra = {"zero_point": 0, "levels": 127}
+            return self._encoded_rows(
+                mode, matrix, quants.astype(np.int8), quants * scales[:, None], meta_rows, extra, scales
+            )
+        if mode == "symmetric4bit":
+            scales = _matrix_scales(matrix, levels=7)
+            quants = np.clip(np.rint(matrix / scales[:, None]), -7, 7)
+            extra = {"zero_point": 0, "levels": 7}
+            return self._encoded_rows(
+                mode, matrix, _pack_4bit_matrix(quants), quants * scales[:, None], meta_rows, extra, scales
+            )
+        if mode == "turboquant_mse_experimental":
+            signs = _rotation_signs_array(self.profile.seed, matrix.shape[1])
+            rotated = matrix * signs
+            scales = _matrix_scales(rotated, levels=7)
+            quants = np.clip(np.rint(rotated / scales[:, None]), -7, 7)
+            decoded = (quants * scales[:, None]) * signs
+            extra = {
+                "zero_point": 0,
+                "levels": 7,
+                "rotation": "deterministic_sign_rotation",
+                "seed": self.profile.seed,
+            }
+            return self._encoded_rows(mode, matrix, _pack_4bit_matrix(quants), decoded, meta_rows, extra, scales)
+        raise VectorEncodingError(f"unsupported_vector_encoding_mode:{mode}")
+
+    def _encoded_rows(
+        self,
+        mode: str,
+        matrix: Any,
+        packed: Any,
+        decoded: Any,
+        meta_rows: list[dict[str, Any]],
+        extra: dict[str, Any],
+        scales: Any,
+    ) -> list[EncodedVector]:
+        dimensions = int(matrix.shape[1])
+        original_bytes = dimensions * 4
+        errors = np.max(np.abs(matrix - decoded), axis=1) if mode not in {"off", "float32"} else np.zeros(len(matrix))
+        warning = _EXPERIMENTAL_WARNINGS.get(mode)
+        encoded: list[EncodedVector] = []
+        for row, raw in enumerate(packed):
+            payload = raw.tobytes()
+            meta = meta_rows[row]
+            if scales is not None:
+                meta = {**meta, "scale": float(scales[row]), **extra}
+            diagnostics = {
+                "bytes_original_float32": original_bytes,
+                "bytes_encoded_payload": len(payload),
+                "compression_ratio_vs_float32": round(float(original_bytes) / float(max(1, len(payload))), 4),
+                "max_abs_error": float(errors[row]),
+                "experimental": self.profile.experimental,
+            }
+            if warning:
+                diagnostics["experimental_warning"] = warning
+            encoded.append(
+                EncodedVector(
+                    mode=mode,
+                    dimensions=dimensions,
+                    payload=base64.b64encode(payload).decode("ascii"),
+                    metadata=meta,
+                    diagnostics=diagnostics,
+                )
+            )
+        return encoded
 
     def _base_meta(self, vector: list[float]) -> dict[str, Any]:
         return {
@@ -233,7 +382,7 @@ class VectorEncoder:
             metadata=meta,
             diagnostics={
                 **self._diagnostics(vector, raw, max_abs_error=_max_abs_error(vector, decoded)),
-                "experimental_warning": "symmetric4bit may change retrieval ranking; keep fallback diagnostics enabled",
+                "experimental_warning": _EXPERIMENTAL_WARNINGS["symmetric4bit"],
             },
         )
 
@@ -268,7 +417,7 @@ class VectorEncoder:
             metadata=meta,
             diagnostics={
                 **self._diagnostics(vector, raw, max_abs_error=_max_abs_error(vector, decoded)),
-                "experimental_warning": "TurboQuant-inspired seam only: deterministic rotation + 4bit scalar quantization, not full TurboQuant_prod",
+                "experimental_warning": _EXPERIMENTAL_WARNINGS["turboquant_mse_experimental"],
             },
         )
 
@@ -379,9 +528,94 @@ def _max_abs_error(left: list[float], right: list[float]) -> float:
 
 
 def _deterministic_sign_rotation(vector: list[float], seed: int) -> list[float]:
-    rotated: list[float] = []
-    for idx, value in enumerate(vector):
+    signs = _rotation_signs(int(seed), len(vector))
+    return [float(value) * sign for value, sign in zip(vector, signs, strict=True)]
+
+
+@lru_cache(maxsize=32)
+def _rotation_signs(seed: int, dimensions: int) -> tuple[float, ...]:
+    signs = []
+    for idx in range(dimensions):
         digest = hashlib.sha256(f"{seed}:{idx}".encode("utf-8")).digest()
-        sign = -1.0 if digest[0] & 1 else 1.0
-        rotated.append(float(value) * sign)
-    return rotated
+        signs.append(-1.0 if digest[0] & 1 else 1.0)
+    return tuple(signs)
+
+
+# --- NumPy batch path (optional; results match the scalar functions above) ---
+
+
+@lru_cache(maxsize=32)
+def _rotation_signs_array(seed: int, dimensions: int) -> Any:
+    signs = np.array(_rotation_signs(seed, dimensions), dtype=np.float64)
+    signs.setflags(write=False)
+    return signs
+
+
+def _group_rows(rows: list[Any]) -> list[tuple[list[int], Any]]:
+    """Stack rows of equal dimension into float64 matrices of finite values only."""
+    by_dimension: dict[int, list[int]] = {}
+    for index, row in enumerate(rows):
+        try:
+            size = len(row)
+        except TypeError:
+            continue
+        if size:
+            by_dimension.setdefault(size, []).append(index)
+    groups: list[tuple[list[int], Any]] = []
+    for indices in by_dimension.values():
+        try:
+            matrix = np.array([rows[index] for index in indices], dtype=np.float64)
+        except (TypeError, ValueError):
+            continue
+        if matrix.ndim != 2:
+            continue
+        finite = np.isfinite(matrix).all(axis=1)
+        if not finite.all():
+            indices = [index for index, ok in zip(indices, finite, strict=True) if ok]
+            matrix = matrix[finite]
+        if indices:
+            groups.append((indices, matrix))
+    return groups
+
+
+def _matrix_scales(matrix: Any, *, levels: int) -> Any:
+    max_abs = np.max(np.abs(matrix), axis=1)
+    return np.where(max_abs <= 1e-12, 1.0, max_abs / float(levels))
+
+
+def _pack_4bit_matrix(quants: Any) -> Any:
+    nibbles = ((quants.astype(np.int16) + 8) & 0x0F).astype(np.uint8)
+    if nibbles.shape[1] % 2:
+        nibbles = np.concatenate([nibbles, np.full((nibbles.shape[0], 1), 8, dtype=np.uint8)], axis=1)
+    return (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+
+
+def _encoded_size(mode: str, dimensions: int) -> int:
+    if mode in {"off", "float32"}:
+        return dimensions * 4
+    if mode == "float16":
+        return dimensions * 2
+    if mode == "int8":
+        return dimensions
+    return (dimensions + 1) // 2
+
+
+def _decode_matrix(mode: str, dimensions: int, seed: int, members: list[tuple[int, bytes, float]]) -> list[list[float]]:
+    raw = b"".join(item[1] for item in members)
+    rows = len(members)
+    if mode in {"off", "float32"}:
+        return np.frombuffer(raw, dtype="<f4").reshape(rows, dimensions).astype(np.float64).tolist()
+    if mode == "float16":
+        return np.frombuffer(raw, dtype="<f2").reshape(rows, dimensions).astype(np.float64).tolist()
+    scales = np.array([item[2] for item in members], dtype=np.float64)[:, None]
+    if mode == "int8":
+        quants = np.frombuffer(raw, dtype=np.int8).reshape(rows, dimensions).astype(np.float64)
+        return (quants * scales).tolist()
+    packed = np.frombuffer(raw, dtype=np.uint8).reshape(rows, -1)
+    nibbles = np.empty((rows, packed.shape[1] * 2), dtype=np.float64)
+    nibbles[:, 0::2] = (packed >> 4) & 0x0F
+    nibbles[:, 1::2] = packed & 0x0F
+    values = (nibbles[:, :dimensions] - 8.0) * scales
+    if mode == "turboquant_mse_experimental":
+        values = values * _rotation_signs_array(seed, dimensions)
+    return values.tolist()